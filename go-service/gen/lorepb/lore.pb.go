@@ -1,7 +1,7 @@
 // Code generated by protoc-gen-go. DO NOT EDIT.
 // versions:
 // 	protoc-gen-go v1.36.9
-// 	protoc        v3.12.4
+// 	protoc        v3.21.12
 // source: lore.proto
 
 package lorepb
@@ -1185,6 +1185,114 @@ func (x *AllResponse) GetRelics() []*LorePiece {
 	return nil
 }
 
+type AllStreamResponse struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// Types that are valid to be assigned to Response:
+	//
+	//	*AllStreamResponse_Progress
+	//	*AllStreamResponse_Piece
+	//	*AllStreamResponse_Final
+	Response isAllStreamResponse_Response `protobuf_oneof:"response"`
+	// With `piece`: its position in the final list. Events and relics share
+	// the index of the setting they were generated for.
+	PieceIndex    int32 `protobuf:"varint,4,opt,name=piece_index,json=pieceIndex,proto3" json:"piece_index,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *AllStreamResponse) Reset() {
+	*x = AllStreamResponse{}
+	mi := &file_lore_proto_msgTypes[19]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *AllStreamResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AllStreamResponse) ProtoMessage() {}
+
+func (x *AllStreamResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[19]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use AllStreamResponse.ProtoReflect.Descriptor instead.
+func (*AllStreamResponse) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{19}
+}
+
+func (x *AllStreamResponse) GetResponse() isAllStreamResponse_Response {
+	if x != nil {
+		return x.Response
+	}
+	return nil
+}
+
+func (x *AllStreamResponse) GetProgress() *GenerationProgress {
+	if x != nil {
+		if x, ok := x.Response.(*AllStreamResponse_Progress); ok {
+			return x.Progress
+		}
+	}
+	return nil
+}
+
+func (x *AllStreamResponse) GetPiece() *LorePiece {
+	if x != nil {
+		if x, ok := x.Response.(*AllStreamResponse_Piece); ok {
+			return x.Piece
+		}
+	}
+	return nil
+}
+
+func (x *AllStreamResponse) GetFinal() *AllResponse {
+	if x != nil {
+		if x, ok := x.Response.(*AllStreamResponse_Final); ok {
+			return x.Final
+		}
+	}
+	return nil
+}
+
+func (x *AllStreamResponse) GetPieceIndex() int32 {
+	if x != nil {
+		return x.PieceIndex
+	}
+	return 0
+}
+
+type isAllStreamResponse_Response interface {
+	isAllStreamResponse_Response()
+}
+
+type AllStreamResponse_Progress struct {
+	Progress *GenerationProgress `protobuf:"bytes,1,opt,name=progress,proto3,oneof"`
+}
+
+type AllStreamResponse_Piece struct {
+	Piece *LorePiece `protobuf:"bytes,2,opt,name=piece,proto3,oneof"` // Sent as soon as it's generated, `type` says which list
+}
+
+type AllStreamResponse_Final struct {
+	Final *AllResponse `protobuf:"bytes,3,opt,name=final,proto3,oneof"`
+}
+
+func (*AllStreamResponse_Progress) isAllStreamResponse_Response() {}
+
+func (*AllStreamResponse_Piece) isAllStreamResponse_Response() {}
+
+func (*AllStreamResponse_Final) isAllStreamResponse_Response() {}
+
 type SelectedLorePieces struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Character     *LorePiece             `protobuf:"bytes,1,opt,name=character,proto3" json:"character,omitempty"`
@@ -1198,7 +1306,7 @@ type SelectedLorePieces struct {
 
 func (x *SelectedLorePieces) Reset() {
 	*x = SelectedLorePieces{}
-	mi := &file_lore_proto_msgTypes[19]
+	mi := &file_lore_proto_msgTypes[20]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1210,7 +1318,7 @@ func (x *SelectedLorePieces) String() string {
 func (*SelectedLorePieces) ProtoMessage() {}
 
 func (x *SelectedLorePieces) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[19]
+	mi := &file_lore_proto_msgTypes[20]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1223,7 +1331,7 @@ func (x *SelectedLorePieces) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SelectedLorePieces.ProtoReflect.Descriptor instead.
 func (*SelectedLorePieces) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{19}
+	return file_lore_proto_rawDescGZIP(), []int{20}
 }
 
 func (x *SelectedLorePieces) GetCharacter() *LorePiece {
@@ -1273,7 +1381,7 @@ type FullStory struct {
 
 func (x *FullStory) Reset() {
 	*x = FullStory{}
-	mi := &file_lore_proto_msgTypes[20]
+	mi := &file_lore_proto_msgTypes[21]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1285,7 +1393,7 @@ func (x *FullStory) String() string {
 func (*FullStory) ProtoMessage() {}
 
 func (x *FullStory) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[20]
+	mi := &file_lore_proto_msgTypes[21]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1298,7 +1406,7 @@ func (x *FullStory) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use FullStory.ProtoReflect.Descriptor instead.
 func (*FullStory) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{20}
+	return file_lore_proto_rawDescGZIP(), []int{21}
 }
 
 func (x *FullStory) GetContent() string {
@@ -1339,7 +1447,7 @@ type FullStoryRequest struct {
 
 func (x *FullStoryRequest) Reset() {
 	*x = FullStoryRequest{}
-	mi := &file_lore_proto_msgTypes[21]
+	mi := &file_lore_proto_msgTypes[22]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1351,7 +1459,7 @@ func (x *FullStoryRequest) String() string {
 func (*FullStoryRequest) ProtoMessage() {}
 
 func (x *FullStoryRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[21]
+	mi := &file_lore_proto_msgTypes[22]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1364,7 +1472,7 @@ func (x *FullStoryRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use FullStoryRequest.ProtoReflect.Descriptor instead.
 func (*FullStoryRequest) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{21}
+	return file_lore_proto_rawDescGZIP(), []int{22}
 }
 
 func (x *FullStoryRequest) GetPieces() *SelectedLorePieces {
@@ -1390,7 +1498,7 @@ type FullStoryResponse struct {
 
 func (x *FullStoryResponse) Reset() {
 	*x = FullStoryResponse{}
-	mi := &file_lore_proto_msgTypes[22]
+	mi := &file_lore_proto_msgTypes[23]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1402,7 +1510,7 @@ func (x *FullStoryResponse) String() string {
 func (*FullStoryResponse) ProtoMessage() {}
 
 func (x *FullStoryResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[22]
+	mi := &file_lore_proto_msgTypes[23]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1415,7 +1523,7 @@ func (x *FullStoryResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use FullStoryResponse.ProtoReflect.Descriptor instead.
 func (*FullStoryResponse) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{22}
+	return file_lore_proto_rawDescGZIP(), []int{23}
 }
 
 func (x *FullStoryResponse) GetStory() *FullStory {
@@ -1434,7 +1542,7 @@ type EmbeddingRequest struct {
 
 func (x *EmbeddingRequest) Reset() {
 	*x = EmbeddingRequest{}
-	mi := &file_lore_proto_msgTypes[23]
+	mi := &file_lore_proto_msgTypes[24]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1446,7 +1554,7 @@ func (x *EmbeddingRequest) String() string {
 func (*EmbeddingRequest) ProtoMessage() {}
 
 func (x *EmbeddingRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[23]
+	mi := &file_lore_proto_msgTypes[24]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1459,7 +1567,7 @@ func (x *EmbeddingRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use EmbeddingRequest.ProtoReflect.Descriptor instead.
 func (*EmbeddingRequest) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{23}
+	return file_lore_proto_rawDescGZIP(), []int{24}
 }
 
 func (x *EmbeddingRequest) GetText() string {
@@ -1478,7 +1586,7 @@ type EmbeddingResponse struct {
 
 func (x *EmbeddingResponse) Reset() {
 	*x = EmbeddingResponse{}
-	mi := &file_lore_proto_msgTypes[24]
+	mi := &file_lore_proto_msgTypes[25]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1490,7 +1598,7 @@ func (x *EmbeddingResponse) String() string {
 func (*EmbeddingResponse) ProtoMessage() {}
 
 func (x *EmbeddingResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[24]
+	mi := &file_lore_proto_msgTypes[25]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1503,7 +1611,7 @@ func (x *EmbeddingResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use EmbeddingResponse.ProtoReflect.Descriptor instead.
 func (*EmbeddingResponse) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{24}
+	return file_lore_proto_rawDescGZIP(), []int{25}
 }
 
 func (x *EmbeddingResponse) GetEmbedding() []float32 {
@@ -1526,7 +1634,7 @@ type WorldResult struct {
 
 func (x *WorldResult) Reset() {
 	*x = WorldResult{}
-	mi := &file_lore_proto_msgTypes[25]
+	mi := &file_lore_proto_msgTypes[26]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1538,7 +1646,7 @@ func (x *WorldResult) String() string {
 func (*WorldResult) ProtoMessage() {}
 
 func (x *WorldResult) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[25]
+	mi := &file_lore_proto_msgTypes[26]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1551,7 +1659,7 @@ func (x *WorldResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use WorldResult.ProtoReflect.Descriptor instead.
 func (*WorldResult) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{25}
+	return file_lore_proto_rawDescGZIP(), []int{26}
 }
 
 func (x *WorldResult) GetTitle() string {
@@ -1600,7 +1708,7 @@ type RerankSearchRequest struct {
 
 func (x *RerankSearchRequest) Reset() {
 	*x = RerankSearchRequest{}
-	mi := &file_lore_proto_msgTypes[26]
+	mi := &file_lore_proto_msgTypes[27]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1612,7 +1720,7 @@ func (x *RerankSearchRequest) String() string {
 func (*RerankSearchRequest) ProtoMessage() {}
 
 func (x *RerankSearchRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[26]
+	mi := &file_lore_proto_msgTypes[27]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1625,7 +1733,7 @@ func (x *RerankSearchRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use RerankSearchRequest.ProtoReflect.Descriptor instead.
 func (*RerankSearchRequest) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{26}
+	return file_lore_proto_rawDescGZIP(), []int{27}
 }
 
 func (x *RerankSearchRequest) GetQuery() string {
@@ -1658,7 +1766,7 @@ type RerankSearchResponse struct {
 
 func (x *RerankSearchResponse) Reset() {
 	*x = RerankSearchResponse{}
-	mi := &file_lore_proto_msgTypes[27]
+	mi := &file_lore_proto_msgTypes[28]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1670,7 +1778,7 @@ func (x *RerankSearchResponse) String() string {
 func (*RerankSearchResponse) ProtoMessage() {}
 
 func (x *RerankSearchResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[27]
+	mi := &file_lore_proto_msgTypes[28]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1683,7 +1791,7 @@ func (x *RerankSearchResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use RerankSearchResponse.ProtoReflect.Descriptor instead.
 func (*RerankSearchResponse) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{27}
+	return file_lore_proto_rawDescGZIP(), []int{28}
 }
 
 func (x *RerankSearchResponse) GetRerankedWorlds() []*WorldResult {
@@ -1705,7 +1813,7 @@ type UploadImageRequest struct {
 
 func (x *UploadImageRequest) Reset() {
 	*x = UploadImageRequest{}
-	mi := &file_lore_proto_msgTypes[28]
+	mi := &file_lore_proto_msgTypes[29]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1717,7 +1825,7 @@ func (x *UploadImageRequest) String() string {
 func (*UploadImageRequest) ProtoMessage() {}
 
 func (x *UploadImageRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[28]
+	mi := &file_lore_proto_msgTypes[29]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1730,7 +1838,7 @@ func (x *UploadImageRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use UploadImageRequest.ProtoReflect.Descriptor instead.
 func (*UploadImageRequest) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{28}
+	return file_lore_proto_rawDescGZIP(), []int{29}
 }
 
 func (x *UploadImageRequest) GetImageBase64() string {
@@ -1764,13 +1872,14 @@ func (x *UploadImageRequest) GetImageType() string {
 type UploadImageResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	ImageUrl      string                 `protobuf:"bytes,1,opt,name=image_url,json=imageUrl,proto3" json:"image_url,omitempty"`
+	VariantUrls   map[string]string      `protobuf:"bytes,2,rep,name=variant_urls,json=variantUrls,proto3" json:"variant_urls,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"` // e.g. "webp", "webp_256" -> URL
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
 func (x *UploadImageResponse) Reset() {
 	*x = UploadImageResponse{}
-	mi := &file_lore_proto_msgTypes[29]
+	mi := &file_lore_proto_msgTypes[30]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1782,7 +1891,7 @@ func (x *UploadImageResponse) String() string {
 func (*UploadImageResponse) ProtoMessage() {}
 
 func (x *UploadImageResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[29]
+	mi := &file_lore_proto_msgTypes[30]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1795,7 +1904,7 @@ func (x *UploadImageResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use UploadImageResponse.ProtoReflect.Descriptor instead.
 func (*UploadImageResponse) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{29}
+	return file_lore_proto_rawDescGZIP(), []int{30}
 }
 
 func (x *UploadImageResponse) GetImageUrl() string {
@@ -1805,6 +1914,320 @@ func (x *UploadImageResponse) GetImageUrl() string {
 	return ""
 }
 
+func (x *UploadImageResponse) GetVariantUrls() map[string]string {
+	if x != nil {
+		return x.VariantUrls
+	}
+	return nil
+}
+
+// Client-streaming upload: first message carries metadata, the rest raw image bytes
+type UploadImageChunk struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// Types that are valid to be assigned to Payload:
+	//
+	//	*UploadImageChunk_Metadata
+	//	*UploadImageChunk_Data
+	Payload       isUploadImageChunk_Payload `protobuf_oneof:"payload"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *UploadImageChunk) Reset() {
+	*x = UploadImageChunk{}
+	mi := &file_lore_proto_msgTypes[31]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *UploadImageChunk) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UploadImageChunk) ProtoMessage() {}
+
+func (x *UploadImageChunk) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[31]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UploadImageChunk.ProtoReflect.Descriptor instead.
+func (*UploadImageChunk) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{31}
+}
+
+func (x *UploadImageChunk) GetPayload() isUploadImageChunk_Payload {
+	if x != nil {
+		return x.Payload
+	}
+	return nil
+}
+
+func (x *UploadImageChunk) GetMetadata() *UploadImageMetadata {
+	if x != nil {
+		if x, ok := x.Payload.(*UploadImageChunk_Metadata); ok {
+			return x.Metadata
+		}
+	}
+	return nil
+}
+
+func (x *UploadImageChunk) GetData() []byte {
+	if x != nil {
+		if x, ok := x.Payload.(*UploadImageChunk_Data); ok {
+			return x.Data
+		}
+	}
+	return nil
+}
+
+type isUploadImageChunk_Payload interface {
+	isUploadImageChunk_Payload()
+}
+
+type UploadImageChunk_Metadata struct {
+	Metadata *UploadImageMetadata `protobuf:"bytes,1,opt,name=metadata,proto3,oneof"`
+}
+
+type UploadImageChunk_Data struct {
+	Data []byte `protobuf:"bytes,2,opt,name=data,proto3,oneof"`
+}
+
+func (*UploadImageChunk_Metadata) isUploadImageChunk_Payload() {}
+
+func (*UploadImageChunk_Data) isUploadImageChunk_Payload() {}
+
+type UploadImageMetadata struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	WorldId       int64                  `protobuf:"varint,1,opt,name=world_id,json=worldId,proto3" json:"world_id,omitempty"`
+	CharacterId   string                 `protobuf:"bytes,2,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	ImageType     string                 `protobuf:"bytes,3,opt,name=image_type,json=imageType,proto3" json:"image_type,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *UploadImageMetadata) Reset() {
+	*x = UploadImageMetadata{}
+	mi := &file_lore_proto_msgTypes[32]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *UploadImageMetadata) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UploadImageMetadata) ProtoMessage() {}
+
+func (x *UploadImageMetadata) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[32]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UploadImageMetadata.ProtoReflect.Descriptor instead.
+func (*UploadImageMetadata) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{32}
+}
+
+func (x *UploadImageMetadata) GetWorldId() int64 {
+	if x != nil {
+		return x.WorldId
+	}
+	return 0
+}
+
+func (x *UploadImageMetadata) GetCharacterId() string {
+	if x != nil {
+		return x.CharacterId
+	}
+	return ""
+}
+
+func (x *UploadImageMetadata) GetImageType() string {
+	if x != nil {
+		return x.ImageType
+	}
+	return ""
+}
+
+type UploadImagesBatchRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Images        []*UploadImageRequest  `protobuf:"bytes,1,rep,name=images,proto3" json:"images,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *UploadImagesBatchRequest) Reset() {
+	*x = UploadImagesBatchRequest{}
+	mi := &file_lore_proto_msgTypes[33]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *UploadImagesBatchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UploadImagesBatchRequest) ProtoMessage() {}
+
+func (x *UploadImagesBatchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[33]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UploadImagesBatchRequest.ProtoReflect.Descriptor instead.
+func (*UploadImagesBatchRequest) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{33}
+}
+
+func (x *UploadImagesBatchRequest) GetImages() []*UploadImageRequest {
+	if x != nil {
+		return x.Images
+	}
+	return nil
+}
+
+type UploadImageResult struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	CharacterId   string                 `protobuf:"bytes,1,opt,name=character_id,json=characterId,proto3" json:"character_id,omitempty"`
+	ImageType     string                 `protobuf:"bytes,2,opt,name=image_type,json=imageType,proto3" json:"image_type,omitempty"`
+	ImageUrl      string                 `protobuf:"bytes,3,opt,name=image_url,json=imageUrl,proto3" json:"image_url,omitempty"`
+	Error         string                 `protobuf:"bytes,4,opt,name=error,proto3" json:"error,omitempty"`
+	VariantUrls   map[string]string      `protobuf:"bytes,5,rep,name=variant_urls,json=variantUrls,proto3" json:"variant_urls,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *UploadImageResult) Reset() {
+	*x = UploadImageResult{}
+	mi := &file_lore_proto_msgTypes[34]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *UploadImageResult) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UploadImageResult) ProtoMessage() {}
+
+func (x *UploadImageResult) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[34]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UploadImageResult.ProtoReflect.Descriptor instead.
+func (*UploadImageResult) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{34}
+}
+
+func (x *UploadImageResult) GetCharacterId() string {
+	if x != nil {
+		return x.CharacterId
+	}
+	return ""
+}
+
+func (x *UploadImageResult) GetImageType() string {
+	if x != nil {
+		return x.ImageType
+	}
+	return ""
+}
+
+func (x *UploadImageResult) GetImageUrl() string {
+	if x != nil {
+		return x.ImageUrl
+	}
+	return ""
+}
+
+func (x *UploadImageResult) GetError() string {
+	if x != nil {
+		return x.Error
+	}
+	return ""
+}
+
+func (x *UploadImageResult) GetVariantUrls() map[string]string {
+	if x != nil {
+		return x.VariantUrls
+	}
+	return nil
+}
+
+type UploadImagesBatchResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Results       []*UploadImageResult   `protobuf:"bytes,1,rep,name=results,proto3" json:"results,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *UploadImagesBatchResponse) Reset() {
+	*x = UploadImagesBatchResponse{}
+	mi := &file_lore_proto_msgTypes[35]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *UploadImagesBatchResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UploadImagesBatchResponse) ProtoMessage() {}
+
+func (x *UploadImagesBatchResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[35]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UploadImagesBatchResponse.ProtoReflect.Descriptor instead.
+func (*UploadImagesBatchResponse) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{35}
+}
+
+func (x *UploadImagesBatchResponse) GetResults() []*UploadImageResult {
+	if x != nil {
+		return x.Results
+	}
+	return nil
+}
+
 type GenerateWorldImageRequest struct {
 	state              protoimpl.MessageState `protogen:"open.v1"`
 	WorldTitle         string                 `protobuf:"bytes,1,opt,name=world_title,json=worldTitle,proto3" json:"world_title,omitempty"`
@@ -1812,13 +2235,14 @@ type GenerateWorldImageRequest struct {
 	Theme              string                 `protobuf:"bytes,3,opt,name=theme,proto3" json:"theme,omitempty"`
 	SettingDescription string                 `protobuf:"bytes,4,opt,name=setting_description,json=settingDescription,proto3" json:"setting_description,omitempty"`
 	UseReplicate       bool                   `protobuf:"varint,5,opt,name=use_replicate,json=useReplicate,proto3" json:"use_replicate,omitempty"`
+	WorldId            int64                  `protobuf:"varint,6,opt,name=world_id,json=worldId,proto3" json:"world_id,omitempty"` // EnqueueWorldImage only: upload to R2 and return the URL
 	unknownFields      protoimpl.UnknownFields
 	sizeCache          protoimpl.SizeCache
 }
 
 func (x *GenerateWorldImageRequest) Reset() {
 	*x = GenerateWorldImageRequest{}
-	mi := &file_lore_proto_msgTypes[30]
+	mi := &file_lore_proto_msgTypes[36]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1830,7 +2254,7 @@ func (x *GenerateWorldImageRequest) String() string {
 func (*GenerateWorldImageRequest) ProtoMessage() {}
 
 func (x *GenerateWorldImageRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[30]
+	mi := &file_lore_proto_msgTypes[36]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1843,7 +2267,7 @@ func (x *GenerateWorldImageRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GenerateWorldImageRequest.ProtoReflect.Descriptor instead.
 func (*GenerateWorldImageRequest) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{30}
+	return file_lore_proto_rawDescGZIP(), []int{36}
 }
 
 func (x *GenerateWorldImageRequest) GetWorldTitle() string {
@@ -1881,6 +2305,13 @@ func (x *GenerateWorldImageRequest) GetUseReplicate() bool {
 	return false
 }
 
+func (x *GenerateWorldImageRequest) GetWorldId() int64 {
+	if x != nil {
+		return x.WorldId
+	}
+	return 0
+}
+
 type GenerateWorldImageResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	ImageBase64   string                 `protobuf:"bytes,1,opt,name=image_base64,json=imageBase64,proto3" json:"image_base64,omitempty"`
@@ -1890,7 +2321,7 @@ type GenerateWorldImageResponse struct {
 
 func (x *GenerateWorldImageResponse) Reset() {
 	*x = GenerateWorldImageResponse{}
-	mi := &file_lore_proto_msgTypes[31]
+	mi := &file_lore_proto_msgTypes[37]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1902,7 +2333,7 @@ func (x *GenerateWorldImageResponse) String() string {
 func (*GenerateWorldImageResponse) ProtoMessage() {}
 
 func (x *GenerateWorldImageResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_lore_proto_msgTypes[31]
+	mi := &file_lore_proto_msgTypes[37]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1915,7 +2346,7 @@ func (x *GenerateWorldImageResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GenerateWorldImageResponse.ProtoReflect.Descriptor instead.
 func (*GenerateWorldImageResponse) Descriptor() ([]byte, []int) {
-	return file_lore_proto_rawDescGZIP(), []int{31}
+	return file_lore_proto_rawDescGZIP(), []int{37}
 }
 
 func (x *GenerateWorldImageResponse) GetImageBase64() string {
@@ -1925,6 +2356,134 @@ func (x *GenerateWorldImageResponse) GetImageBase64() string {
 	return ""
 }
 
+type WorldImageJobRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	JobId         string                 `protobuf:"bytes,1,opt,name=job_id,json=jobId,proto3" json:"job_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *WorldImageJobRequest) Reset() {
+	*x = WorldImageJobRequest{}
+	mi := &file_lore_proto_msgTypes[38]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *WorldImageJobRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*WorldImageJobRequest) ProtoMessage() {}
+
+func (x *WorldImageJobRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[38]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use WorldImageJobRequest.ProtoReflect.Descriptor instead.
+func (*WorldImageJobRequest) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{38}
+}
+
+func (x *WorldImageJobRequest) GetJobId() string {
+	if x != nil {
+		return x.JobId
+	}
+	return ""
+}
+
+type WorldImageJob struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	JobId         string                 `protobuf:"bytes,1,opt,name=job_id,json=jobId,proto3" json:"job_id,omitempty"`
+	Status        string                 `protobuf:"bytes,2,opt,name=status,proto3" json:"status,omitempty"`                        // queued, running, completed, failed
+	ImageData     []byte                 `protobuf:"bytes,3,opt,name=image_data,json=imageData,proto3" json:"image_data,omitempty"` // Set when completed without a world_id
+	ImageUrl      string                 `protobuf:"bytes,4,opt,name=image_url,json=imageUrl,proto3" json:"image_url,omitempty"`    // Set when completed with a world_id
+	VariantUrls   map[string]string      `protobuf:"bytes,5,rep,name=variant_urls,json=variantUrls,proto3" json:"variant_urls,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
+	Error         string                 `protobuf:"bytes,6,opt,name=error,proto3" json:"error,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *WorldImageJob) Reset() {
+	*x = WorldImageJob{}
+	mi := &file_lore_proto_msgTypes[39]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *WorldImageJob) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*WorldImageJob) ProtoMessage() {}
+
+func (x *WorldImageJob) ProtoReflect() protoreflect.Message {
+	mi := &file_lore_proto_msgTypes[39]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use WorldImageJob.ProtoReflect.Descriptor instead.
+func (*WorldImageJob) Descriptor() ([]byte, []int) {
+	return file_lore_proto_rawDescGZIP(), []int{39}
+}
+
+func (x *WorldImageJob) GetJobId() string {
+	if x != nil {
+		return x.JobId
+	}
+	return ""
+}
+
+func (x *WorldImageJob) GetStatus() string {
+	if x != nil {
+		return x.Status
+	}
+	return ""
+}
+
+func (x *WorldImageJob) GetImageData() []byte {
+	if x != nil {
+		return x.ImageData
+	}
+	return nil
+}
+
+func (x *WorldImageJob) GetImageUrl() string {
+	if x != nil {
+		return x.ImageUrl
+	}
+	return ""
+}
+
+func (x *WorldImageJob) GetVariantUrls() map[string]string {
+	if x != nil {
+		return x.VariantUrls
+	}
+	return nil
+}
+
+func (x *WorldImageJob) GetError() string {
+	if x != nil {
+		return x.Error
+	}
+	return ""
+}
+
 var File_lore_proto protoreflect.FileDescriptor
 
 const file_lore_proto_rawDesc = "" +
@@ -2008,7 +2567,15 @@ const file_lore_proto_rawDesc = "" +
 	"\bfactions\x18\x02 \x03(\v2\x0f.lore.LorePieceR\bfactions\x12+\n" +
 	"\bsettings\x18\x03 \x03(\v2\x0f.lore.LorePieceR\bsettings\x12'\n" +
 	"\x06events\x18\x04 \x03(\v2\x0f.lore.LorePieceR\x06events\x12'\n" +
-	"\x06relics\x18\x05 \x03(\v2\x0f.lore.LorePieceR\x06relics\"\xe7\x01\n" +
+	"\x06relics\x18\x05 \x03(\v2\x0f.lore.LorePieceR\x06relics\"\xcc\x01\n" +
+	"\x11AllStreamResponse\x126\n" +
+	"\bprogress\x18\x01 \x01(\v2\x18.lore.GenerationProgressH\x00R\bprogress\x12'\n" +
+	"\x05piece\x18\x02 \x01(\v2\x0f.lore.LorePieceH\x00R\x05piece\x12)\n" +
+	"\x05final\x18\x03 \x01(\v2\x11.lore.AllResponseH\x00R\x05final\x12\x1f\n" +
+	"\vpiece_index\x18\x04 \x01(\x05R\n" +
+	"pieceIndexB\n" +
+	"\n" +
+	"\bresponse\"\xe7\x01\n" +
 	"\x12SelectedLorePieces\x12-\n" +
 	"\tcharacter\x18\x01 \x01(\v2\x0f.lore.LorePieceR\tcharacter\x12)\n" +
 	"\afaction\x18\x02 \x01(\v2\x0f.lore.LorePieceR\afaction\x12)\n" +
@@ -2051,9 +2618,36 @@ const file_lore_proto_rawDesc = "" +
 	"\bworld_id\x18\x02 \x01(\x03R\aworldId\x12!\n" +
 	"\fcharacter_id\x18\x03 \x01(\tR\vcharacterId\x12\x1d\n" +
 	"\n" +
-	"image_type\x18\x04 \x01(\tR\timageType\"2\n" +
+	"image_type\x18\x04 \x01(\tR\timageType\"\xc1\x01\n" +
 	"\x13UploadImageResponse\x12\x1b\n" +
-	"\timage_url\x18\x01 \x01(\tR\bimageUrl\"\xc7\x01\n" +
+	"\timage_url\x18\x01 \x01(\tR\bimageUrl\x12M\n" +
+	"\fvariant_urls\x18\x02 \x03(\v2*.lore.UploadImageResponse.VariantUrlsEntryR\vvariantUrls\x1a>\n" +
+	"\x10VariantUrlsEntry\x12\x10\n" +
+	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"l\n" +
+	"\x10UploadImageChunk\x127\n" +
+	"\bmetadata\x18\x01 \x01(\v2\x19.lore.UploadImageMetadataH\x00R\bmetadata\x12\x14\n" +
+	"\x04data\x18\x02 \x01(\fH\x00R\x04dataB\t\n" +
+	"\apayload\"r\n" +
+	"\x13UploadImageMetadata\x12\x19\n" +
+	"\bworld_id\x18\x01 \x01(\x03R\aworldId\x12!\n" +
+	"\fcharacter_id\x18\x02 \x01(\tR\vcharacterId\x12\x1d\n" +
+	"\n" +
+	"image_type\x18\x03 \x01(\tR\timageType\"L\n" +
+	"\x18UploadImagesBatchRequest\x120\n" +
+	"\x06images\x18\x01 \x03(\v2\x18.lore.UploadImageRequestR\x06images\"\x95\x02\n" +
+	"\x11UploadImageResult\x12!\n" +
+	"\fcharacter_id\x18\x01 \x01(\tR\vcharacterId\x12\x1d\n" +
+	"\n" +
+	"image_type\x18\x02 \x01(\tR\timageType\x12\x1b\n" +
+	"\timage_url\x18\x03 \x01(\tR\bimageUrl\x12\x14\n" +
+	"\x05error\x18\x04 \x01(\tR\x05error\x12K\n" +
+	"\fvariant_urls\x18\x05 \x03(\v2(.lore.UploadImageResult.VariantUrlsEntryR\vvariantUrls\x1a>\n" +
+	"\x10VariantUrlsEntry\x12\x10\n" +
+	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"N\n" +
+	"\x19UploadImagesBatchResponse\x121\n" +
+	"\aresults\x18\x01 \x03(\v2\x17.lore.UploadImageResultR\aresults\"\xe2\x01\n" +
 	"\x19GenerateWorldImageRequest\x12\x1f\n" +
 	"\vworld_title\x18\x01 \x01(\tR\n" +
 	"worldTitle\x12\x1d\n" +
@@ -2061,21 +2655,40 @@ const file_lore_proto_rawDesc = "" +
 	"full_story\x18\x02 \x01(\tR\tfullStory\x12\x14\n" +
 	"\x05theme\x18\x03 \x01(\tR\x05theme\x12/\n" +
 	"\x13setting_description\x18\x04 \x01(\tR\x12settingDescription\x12#\n" +
-	"\ruse_replicate\x18\x05 \x01(\bR\fuseReplicate\"?\n" +
+	"\ruse_replicate\x18\x05 \x01(\bR\fuseReplicate\x12\x19\n" +
+	"\bworld_id\x18\x06 \x01(\x03R\aworldId\"?\n" +
 	"\x1aGenerateWorldImageResponse\x12!\n" +
-	"\fimage_base64\x18\x01 \x01(\tR\vimageBase642\xa7\x06\n" +
+	"\fimage_base64\x18\x01 \x01(\tR\vimageBase64\"-\n" +
+	"\x14WorldImageJobRequest\x12\x15\n" +
+	"\x06job_id\x18\x01 \x01(\tR\x05jobId\"\x99\x02\n" +
+	"\rWorldImageJob\x12\x15\n" +
+	"\x06job_id\x18\x01 \x01(\tR\x05jobId\x12\x16\n" +
+	"\x06status\x18\x02 \x01(\tR\x06status\x12\x1d\n" +
+	"\n" +
+	"image_data\x18\x03 \x01(\fR\timageData\x12\x1b\n" +
+	"\timage_url\x18\x04 \x01(\tR\bimageUrl\x12G\n" +
+	"\fvariant_urls\x18\x05 \x03(\v2$.lore.WorldImageJob.VariantUrlsEntryR\vvariantUrls\x12\x14\n" +
+	"\x05error\x18\x06 \x01(\tR\x05error\x1a>\n" +
+	"\x10VariantUrlsEntry\x12\x10\n" +
+	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x012\x93\t\n" +
 	"\vLoreService\x12O\n" +
 	"\x12GenerateCharacters\x12\x17.lore.CharactersRequest\x1a\x1e.lore.CharactersStreamResponse0\x01\x12I\n" +
 	"\x10GenerateFactions\x12\x15.lore.FactionsRequest\x1a\x1c.lore.FactionsStreamResponse0\x01\x12I\n" +
 	"\x10GenerateSettings\x12\x15.lore.SettingsRequest\x1a\x1c.lore.SettingsStreamResponse0\x01\x12C\n" +
 	"\x0eGenerateEvents\x12\x13.lore.EventsRequest\x1a\x1a.lore.EventsStreamResponse0\x01\x12C\n" +
 	"\x0eGenerateRelics\x12\x13.lore.RelicsRequest\x1a\x1a.lore.RelicsStreamResponse0\x01\x122\n" +
-	"\vGenerateAll\x12\x10.lore.AllRequest\x1a\x11.lore.AllResponse\x12D\n" +
+	"\vGenerateAll\x12\x10.lore.AllRequest\x1a\x11.lore.AllResponse\x12@\n" +
+	"\x11GenerateAllStream\x12\x10.lore.AllRequest\x1a\x17.lore.AllStreamResponse0\x01\x12D\n" +
 	"\x11GenerateFullStory\x12\x16.lore.FullStoryRequest\x1a\x17.lore.FullStoryResponse\x12D\n" +
 	"\x11GenerateEmbedding\x12\x16.lore.EmbeddingRequest\x1a\x17.lore.EmbeddingResponse\x12F\n" +
 	"\rRerankResults\x12\x19.lore.RerankSearchRequest\x1a\x1a.lore.RerankSearchResponse\x12F\n" +
-	"\x0fUploadImageToR2\x12\x18.lore.UploadImageRequest\x1a\x19.lore.UploadImageResponse\x12W\n" +
-	"\x12GenerateWorldImage\x12\x1f.lore.GenerateWorldImageRequest\x1a .lore.GenerateWorldImageResponseB\fZ\n" +
+	"\x0fUploadImageToR2\x12\x18.lore.UploadImageRequest\x1a\x19.lore.UploadImageResponse\x12T\n" +
+	"\x11UploadImagesBatch\x12\x1e.lore.UploadImagesBatchRequest\x1a\x1f.lore.UploadImagesBatchResponse\x12B\n" +
+	"\vUploadImage\x12\x16.lore.UploadImageChunk\x1a\x19.lore.UploadImageResponse(\x01\x12W\n" +
+	"\x12GenerateWorldImage\x12\x1f.lore.GenerateWorldImageRequest\x1a .lore.GenerateWorldImageResponse\x12I\n" +
+	"\x11EnqueueWorldImage\x12\x1f.lore.GenerateWorldImageRequest\x1a\x13.lore.WorldImageJob\x12C\n" +
+	"\x10GetWorldImageJob\x12\x1a.lore.WorldImageJobRequest\x1a\x13.lore.WorldImageJobB\fZ\n" +
 	"gen/lorepbb\x06proto3"
 
 var (
@@ -2090,7 +2703,7 @@ func file_lore_proto_rawDescGZIP() []byte {
 	return file_lore_proto_rawDescData
 }
 
-var file_lore_proto_msgTypes = make([]protoimpl.MessageInfo, 34)
+var file_lore_proto_msgTypes = make([]protoimpl.MessageInfo, 45)
 var file_lore_proto_goTypes = []any{
 	(*CharactersRequest)(nil),          // 0: lore.CharactersRequest
 	(*FactionsRequest)(nil),            // 1: lore.FactionsRequest
@@ -2111,27 +2724,38 @@ var file_lore_proto_goTypes = []any{
 	(*RelicsStreamResponse)(nil),       // 16: lore.RelicsStreamResponse
 	(*AllRequest)(nil),                 // 17: lore.AllRequest
 	(*AllResponse)(nil),                // 18: lore.AllResponse
-	(*SelectedLorePieces)(nil),         // 19: lore.SelectedLorePieces
-	(*FullStory)(nil),                  // 20: lore.FullStory
-	(*FullStoryRequest)(nil),           // 21: lore.FullStoryRequest
-	(*FullStoryResponse)(nil),          // 22: lore.FullStoryResponse
-	(*EmbeddingRequest)(nil),           // 23: lore.EmbeddingRequest
-	(*EmbeddingResponse)(nil),          // 24: lore.EmbeddingResponse
-	(*WorldResult)(nil),                // 25: lore.WorldResult
-	(*RerankSearchRequest)(nil),        // 26: lore.RerankSearchRequest
-	(*RerankSearchResponse)(nil),       // 27: lore.RerankSearchResponse
-	(*UploadImageRequest)(nil),         // 28: lore.UploadImageRequest
-	(*UploadImageResponse)(nil),        // 29: lore.UploadImageResponse
-	(*GenerateWorldImageRequest)(nil),  // 30: lore.GenerateWorldImageRequest
-	(*GenerateWorldImageResponse)(nil), // 31: lore.GenerateWorldImageResponse
-	nil,                                // 32: lore.LorePiece.DetailsEntry
-	nil,                                // 33: lore.FullStory.QuestEntry
+	(*AllStreamResponse)(nil),          // 19: lore.AllStreamResponse
+	(*SelectedLorePieces)(nil),         // 20: lore.SelectedLorePieces
+	(*FullStory)(nil),                  // 21: lore.FullStory
+	(*FullStoryRequest)(nil),           // 22: lore.FullStoryRequest
+	(*FullStoryResponse)(nil),          // 23: lore.FullStoryResponse
+	(*EmbeddingRequest)(nil),           // 24: lore.EmbeddingRequest
+	(*EmbeddingResponse)(nil),          // 25: lore.EmbeddingResponse
+	(*WorldResult)(nil),                // 26: lore.WorldResult
+	(*RerankSearchRequest)(nil),        // 27: lore.RerankSearchRequest
+	(*RerankSearchResponse)(nil),       // 28: lore.RerankSearchResponse
+	(*UploadImageRequest)(nil),         // 29: lore.UploadImageRequest
+	(*UploadImageResponse)(nil),        // 30: lore.UploadImageResponse
+	(*UploadImageChunk)(nil),           // 31: lore.UploadImageChunk
+	(*UploadImageMetadata)(nil),        // 32: lore.UploadImageMetadata
+	(*UploadImagesBatchRequest)(nil),   // 33: lore.UploadImagesBatchRequest
+	(*UploadImageResult)(nil),          // 34: lore.UploadImageResult
+	(*UploadImagesBatchResponse)(nil),  // 35: lore.UploadImagesBatchResponse
+	(*GenerateWorldImageRequest)(nil),  // 36: lore.GenerateWorldImageRequest
+	(*GenerateWorldImageResponse)(nil), // 37: lore.GenerateWorldImageResponse
+	(*WorldImageJobRequest)(nil),       // 38: lore.WorldImageJobRequest
+	(*WorldImageJob)(nil),              // 39: lore.WorldImageJob
+	nil,                                // 40: lore.LorePiece.DetailsEntry
+	nil,                                // 41: lore.FullStory.QuestEntry
+	nil,                                // 42: lore.UploadImageResponse.VariantUrlsEntry
+	nil,                                // 43: lore.UploadImageResult.VariantUrlsEntry
+	nil,                                // 44: lore.WorldImageJob.VariantUrlsEntry
 }
 var file_lore_proto_depIdxs = []int32{
 	5,  // 0: lore.EventsRequest.selected_setting:type_name -> lore.LorePiece
 	5,  // 1: lore.RelicsRequest.selected_setting:type_name -> lore.LorePiece
 	5,  // 2: lore.RelicsRequest.selected_event:type_name -> lore.LorePiece
-	32, // 3: lore.LorePiece.details:type_name -> lore.LorePiece.DetailsEntry
+	40, // 3: lore.LorePiece.details:type_name -> lore.LorePiece.DetailsEntry
 	5,  // 4: lore.CharactersResponse.characters:type_name -> lore.LorePiece
 	5,  // 5: lore.FactionsResponse.factions:type_name -> lore.LorePiece
 	5,  // 6: lore.SettingsResponse.settings:type_name -> lore.LorePiece
@@ -2152,44 +2776,63 @@ var file_lore_proto_depIdxs = []int32{
 	5,  // 21: lore.AllResponse.settings:type_name -> lore.LorePiece
 	5,  // 22: lore.AllResponse.events:type_name -> lore.LorePiece
 	5,  // 23: lore.AllResponse.relics:type_name -> lore.LorePiece
-	5,  // 24: lore.SelectedLorePieces.character:type_name -> lore.LorePiece
-	5,  // 25: lore.SelectedLorePieces.faction:type_name -> lore.LorePiece
-	5,  // 26: lore.SelectedLorePieces.setting:type_name -> lore.LorePiece
-	5,  // 27: lore.SelectedLorePieces.event:type_name -> lore.LorePiece
-	5,  // 28: lore.SelectedLorePieces.relic:type_name -> lore.LorePiece
-	19, // 29: lore.FullStory.pieces:type_name -> lore.SelectedLorePieces
-	33, // 30: lore.FullStory.quest:type_name -> lore.FullStory.QuestEntry
-	19, // 31: lore.FullStoryRequest.pieces:type_name -> lore.SelectedLorePieces
-	20, // 32: lore.FullStoryResponse.story:type_name -> lore.FullStory
-	25, // 33: lore.RerankSearchRequest.worlds:type_name -> lore.WorldResult
-	25, // 34: lore.RerankSearchResponse.reranked_worlds:type_name -> lore.WorldResult
-	0,  // 35: lore.LoreService.GenerateCharacters:input_type -> lore.CharactersRequest
-	1,  // 36: lore.LoreService.GenerateFactions:input_type -> lore.FactionsRequest
-	2,  // 37: lore.LoreService.GenerateSettings:input_type -> lore.SettingsRequest
-	3,  // 38: lore.LoreService.GenerateEvents:input_type -> lore.EventsRequest
-	4,  // 39: lore.LoreService.GenerateRelics:input_type -> lore.RelicsRequest
-	17, // 40: lore.LoreService.GenerateAll:input_type -> lore.AllRequest
-	21, // 41: lore.LoreService.GenerateFullStory:input_type -> lore.FullStoryRequest
-	23, // 42: lore.LoreService.GenerateEmbedding:input_type -> lore.EmbeddingRequest
-	26, // 43: lore.LoreService.RerankResults:input_type -> lore.RerankSearchRequest
-	28, // 44: lore.LoreService.UploadImageToR2:input_type -> lore.UploadImageRequest
-	30, // 45: lore.LoreService.GenerateWorldImage:input_type -> lore.GenerateWorldImageRequest
-	12, // 46: lore.LoreService.GenerateCharacters:output_type -> lore.CharactersStreamResponse
-	13, // 47: lore.LoreService.GenerateFactions:output_type -> lore.FactionsStreamResponse
-	14, // 48: lore.LoreService.GenerateSettings:output_type -> lore.SettingsStreamResponse
-	15, // 49: lore.LoreService.GenerateEvents:output_type -> lore.EventsStreamResponse
-	16, // 50: lore.LoreService.GenerateRelics:output_type -> lore.RelicsStreamResponse
-	18, // 51: lore.LoreService.GenerateAll:output_type -> lore.AllResponse
-	22, // 52: lore.LoreService.GenerateFullStory:output_type -> lore.FullStoryResponse
-	24, // 53: lore.LoreService.GenerateEmbedding:output_type -> lore.EmbeddingResponse
-	27, // 54: lore.LoreService.RerankResults:output_type -> lore.RerankSearchResponse
-	29, // 55: lore.LoreService.UploadImageToR2:output_type -> lore.UploadImageResponse
-	31, // 56: lore.LoreService.GenerateWorldImage:output_type -> lore.GenerateWorldImageResponse
-	46, // [46:57] is the sub-list for method output_type
-	35, // [35:46] is the sub-list for method input_type
-	35, // [35:35] is the sub-list for extension type_name
-	35, // [35:35] is the sub-list for extension extendee
-	0,  // [0:35] is the sub-list for field type_name
+	11, // 24: lore.AllStreamResponse.progress:type_name -> lore.GenerationProgress
+	5,  // 25: lore.AllStreamResponse.piece:type_name -> lore.LorePiece
+	18, // 26: lore.AllStreamResponse.final:type_name -> lore.AllResponse
+	5,  // 27: lore.SelectedLorePieces.character:type_name -> lore.LorePiece
+	5,  // 28: lore.SelectedLorePieces.faction:type_name -> lore.LorePiece
+	5,  // 29: lore.SelectedLorePieces.setting:type_name -> lore.LorePiece
+	5,  // 30: lore.SelectedLorePieces.event:type_name -> lore.LorePiece
+	5,  // 31: lore.SelectedLorePieces.relic:type_name -> lore.LorePiece
+	20, // 32: lore.FullStory.pieces:type_name -> lore.SelectedLorePieces
+	41, // 33: lore.FullStory.quest:type_name -> lore.FullStory.QuestEntry
+	20, // 34: lore.FullStoryRequest.pieces:type_name -> lore.SelectedLorePieces
+	21, // 35: lore.FullStoryResponse.story:type_name -> lore.FullStory
+	26, // 36: lore.RerankSearchRequest.worlds:type_name -> lore.WorldResult
+	26, // 37: lore.RerankSearchResponse.reranked_worlds:type_name -> lore.WorldResult
+	42, // 38: lore.UploadImageResponse.variant_urls:type_name -> lore.UploadImageResponse.VariantUrlsEntry
+	32, // 39: lore.UploadImageChunk.metadata:type_name -> lore.UploadImageMetadata
+	29, // 40: lore.UploadImagesBatchRequest.images:type_name -> lore.UploadImageRequest
+	43, // 41: lore.UploadImageResult.variant_urls:type_name -> lore.UploadImageResult.VariantUrlsEntry
+	34, // 42: lore.UploadImagesBatchResponse.results:type_name -> lore.UploadImageResult
+	44, // 43: lore.WorldImageJob.variant_urls:type_name -> lore.WorldImageJob.VariantUrlsEntry
+	0,  // 44: lore.LoreService.GenerateCharacters:input_type -> lore.CharactersRequest
+	1,  // 45: lore.LoreService.GenerateFactions:input_type -> lore.FactionsRequest
+	2,  // 46: lore.LoreService.GenerateSettings:input_type -> lore.SettingsRequest
+	3,  // 47: lore.LoreService.GenerateEvents:input_type -> lore.EventsRequest
+	4,  // 48: lore.LoreService.GenerateRelics:input_type -> lore.RelicsRequest
+	17, // 49: lore.LoreService.GenerateAll:input_type -> lore.AllRequest
+	17, // 50: lore.LoreService.GenerateAllStream:input_type -> lore.AllRequest
+	22, // 51: lore.LoreService.GenerateFullStory:input_type -> lore.FullStoryRequest
+	24, // 52: lore.LoreService.GenerateEmbedding:input_type -> lore.EmbeddingRequest
+	27, // 53: lore.LoreService.RerankResults:input_type -> lore.RerankSearchRequest
+	29, // 54: lore.LoreService.UploadImageToR2:input_type -> lore.UploadImageRequest
+	33, // 55: lore.LoreService.UploadImagesBatch:input_type -> lore.UploadImagesBatchRequest
+	31, // 56: lore.LoreService.UploadImage:input_type -> lore.UploadImageChunk
+	36, // 57: lore.LoreService.GenerateWorldImage:input_type -> lore.GenerateWorldImageRequest
+	36, // 58: lore.LoreService.EnqueueWorldImage:input_type -> lore.GenerateWorldImageRequest
+	38, // 59: lore.LoreService.GetWorldImageJob:input_type -> lore.WorldImageJobRequest
+	12, // 60: lore.LoreService.GenerateCharacters:output_type -> lore.CharactersStreamResponse
+	13, // 61: lore.LoreService.GenerateFactions:output_type -> lore.FactionsStreamResponse
+	14, // 62: lore.LoreService.GenerateSettings:output_type -> lore.SettingsStreamResponse
+	15, // 63: lore.LoreService.GenerateEvents:output_type -> lore.EventsStreamResponse
+	16, // 64: lore.LoreService.GenerateRelics:output_type -> lore.RelicsStreamResponse
+	18, // 65: lore.LoreService.GenerateAll:output_type -> lore.AllResponse
+	19, // 66: lore.LoreService.GenerateAllStream:output_type -> lore.AllStreamResponse
+	23, // 67: lore.LoreService.GenerateFullStory:output_type -> lore.FullStoryResponse
+	25, // 68: lore.LoreService.GenerateEmbedding:output_type -> lore.EmbeddingResponse
+	28, // 69: lore.LoreService.RerankResults:output_type -> lore.RerankSearchResponse
+	30, // 70: lore.LoreService.UploadImageToR2:output_type -> lore.UploadImageResponse
+	35, // 71: lore.LoreService.UploadImagesBatch:output_type -> lore.UploadImagesBatchResponse
+	30, // 72: lore.LoreService.UploadImage:output_type -> lore.UploadImageResponse
+	37, // 73: lore.LoreService.GenerateWorldImage:output_type -> lore.GenerateWorldImageResponse
+	39, // 74: lore.LoreService.EnqueueWorldImage:output_type -> lore.WorldImageJob
+	39, // 75: lore.LoreService.GetWorldImageJob:output_type -> lore.WorldImageJob
+	60, // [60:76] is the sub-list for method output_type
+	44, // [44:60] is the sub-list for method input_type
+	44, // [44:44] is the sub-list for extension type_name
+	44, // [44:44] is the sub-list for extension extendee
+	0,  // [0:44] is the sub-list for field type_name
 }
 
 func init() { file_lore_proto_init() }
@@ -2217,13 +2860,22 @@ func file_lore_proto_init() {
 		(*RelicsStreamResponse_Progress)(nil),
 		(*RelicsStreamResponse_Final)(nil),
 	}
+	file_lore_proto_msgTypes[19].OneofWrappers = []any{
+		(*AllStreamResponse_Progress)(nil),
+		(*AllStreamResponse_Piece)(nil),
+		(*AllStreamResponse_Final)(nil),
+	}
+	file_lore_proto_msgTypes[31].OneofWrappers = []any{
+		(*UploadImageChunk_Metadata)(nil),
+		(*UploadImageChunk_Data)(nil),
+	}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_lore_proto_rawDesc), len(file_lore_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   34,
+			NumMessages:   45,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
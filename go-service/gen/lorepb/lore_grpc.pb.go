@@ -1,7 +1,7 @@
 // Code generated by protoc-gen-go-grpc. DO NOT EDIT.
 // versions:
 // - protoc-gen-go-grpc v1.5.1
-// - protoc             v3.12.4
+// - protoc             v3.21.12
 // source: lore.proto
 
 package lorepb
@@ -25,11 +25,16 @@ const (
 	LoreService_GenerateEvents_FullMethodName     = "/lore.LoreService/GenerateEvents"
 	LoreService_GenerateRelics_FullMethodName     = "/lore.LoreService/GenerateRelics"
 	LoreService_GenerateAll_FullMethodName        = "/lore.LoreService/GenerateAll"
+	LoreService_GenerateAllStream_FullMethodName  = "/lore.LoreService/GenerateAllStream"
 	LoreService_GenerateFullStory_FullMethodName  = "/lore.LoreService/GenerateFullStory"
 	LoreService_GenerateEmbedding_FullMethodName  = "/lore.LoreService/GenerateEmbedding"
 	LoreService_RerankResults_FullMethodName      = "/lore.LoreService/RerankResults"
 	LoreService_UploadImageToR2_FullMethodName    = "/lore.LoreService/UploadImageToR2"
+	LoreService_UploadImagesBatch_FullMethodName  = "/lore.LoreService/UploadImagesBatch"
+	LoreService_UploadImage_FullMethodName        = "/lore.LoreService/UploadImage"
 	LoreService_GenerateWorldImage_FullMethodName = "/lore.LoreService/GenerateWorldImage"
+	LoreService_EnqueueWorldImage_FullMethodName  = "/lore.LoreService/EnqueueWorldImage"
+	LoreService_GetWorldImageJob_FullMethodName   = "/lore.LoreService/GetWorldImageJob"
 )
 
 // LoreServiceClient is the client API for LoreService service.
@@ -42,11 +47,16 @@ type LoreServiceClient interface {
 	GenerateEvents(ctx context.Context, in *EventsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[EventsStreamResponse], error)
 	GenerateRelics(ctx context.Context, in *RelicsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[RelicsStreamResponse], error)
 	GenerateAll(ctx context.Context, in *AllRequest, opts ...grpc.CallOption) (*AllResponse, error)
+	GenerateAllStream(ctx context.Context, in *AllRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[AllStreamResponse], error)
 	GenerateFullStory(ctx context.Context, in *FullStoryRequest, opts ...grpc.CallOption) (*FullStoryResponse, error)
 	GenerateEmbedding(ctx context.Context, in *EmbeddingRequest, opts ...grpc.CallOption) (*EmbeddingResponse, error)
 	RerankResults(ctx context.Context, in *RerankSearchRequest, opts ...grpc.CallOption) (*RerankSearchResponse, error)
 	UploadImageToR2(ctx context.Context, in *UploadImageRequest, opts ...grpc.CallOption) (*UploadImageResponse, error)
+	UploadImagesBatch(ctx context.Context, in *UploadImagesBatchRequest, opts ...grpc.CallOption) (*UploadImagesBatchResponse, error)
+	UploadImage(ctx context.Context, opts ...grpc.CallOption) (grpc.ClientStreamingClient[UploadImageChunk, UploadImageResponse], error)
 	GenerateWorldImage(ctx context.Context, in *GenerateWorldImageRequest, opts ...grpc.CallOption) (*GenerateWorldImageResponse, error)
+	EnqueueWorldImage(ctx context.Context, in *GenerateWorldImageRequest, opts ...grpc.CallOption) (*WorldImageJob, error)
+	GetWorldImageJob(ctx context.Context, in *WorldImageJobRequest, opts ...grpc.CallOption) (*WorldImageJob, error)
 }
 
 type loreServiceClient struct {
@@ -162,6 +172,25 @@ func (c *loreServiceClient) GenerateAll(ctx context.Context, in *AllRequest, opt
 	return out, nil
 }
 
+func (c *loreServiceClient) GenerateAllStream(ctx context.Context, in *AllRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[AllStreamResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &LoreService_ServiceDesc.Streams[5], LoreService_GenerateAllStream_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[AllRequest, AllStreamResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type LoreService_GenerateAllStreamClient = grpc.ServerStreamingClient[AllStreamResponse]
+
 func (c *loreServiceClient) GenerateFullStory(ctx context.Context, in *FullStoryRequest, opts ...grpc.CallOption) (*FullStoryResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(FullStoryResponse)
@@ -202,6 +231,29 @@ func (c *loreServiceClient) UploadImageToR2(ctx context.Context, in *UploadImage
 	return out, nil
 }
 
+func (c *loreServiceClient) UploadImagesBatch(ctx context.Context, in *UploadImagesBatchRequest, opts ...grpc.CallOption) (*UploadImagesBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(UploadImagesBatchResponse)
+	err := c.cc.Invoke(ctx, LoreService_UploadImagesBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *loreServiceClient) UploadImage(ctx context.Context, opts ...grpc.CallOption) (grpc.ClientStreamingClient[UploadImageChunk, UploadImageResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &LoreService_ServiceDesc.Streams[6], LoreService_UploadImage_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[UploadImageChunk, UploadImageResponse]{ClientStream: stream}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type LoreService_UploadImageClient = grpc.ClientStreamingClient[UploadImageChunk, UploadImageResponse]
+
 func (c *loreServiceClient) GenerateWorldImage(ctx context.Context, in *GenerateWorldImageRequest, opts ...grpc.CallOption) (*GenerateWorldImageResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(GenerateWorldImageResponse)
@@ -212,6 +264,26 @@ func (c *loreServiceClient) GenerateWorldImage(ctx context.Context, in *Generate
 	return out, nil
 }
 
+func (c *loreServiceClient) EnqueueWorldImage(ctx context.Context, in *GenerateWorldImageRequest, opts ...grpc.CallOption) (*WorldImageJob, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(WorldImageJob)
+	err := c.cc.Invoke(ctx, LoreService_EnqueueWorldImage_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *loreServiceClient) GetWorldImageJob(ctx context.Context, in *WorldImageJobRequest, opts ...grpc.CallOption) (*WorldImageJob, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(WorldImageJob)
+	err := c.cc.Invoke(ctx, LoreService_GetWorldImageJob_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // LoreServiceServer is the server API for LoreService service.
 // All implementations must embed UnimplementedLoreServiceServer
 // for forward compatibility.
@@ -222,11 +294,16 @@ type LoreServiceServer interface {
 	GenerateEvents(*EventsRequest, grpc.ServerStreamingServer[EventsStreamResponse]) error
 	GenerateRelics(*RelicsRequest, grpc.ServerStreamingServer[RelicsStreamResponse]) error
 	GenerateAll(context.Context, *AllRequest) (*AllResponse, error)
+	GenerateAllStream(*AllRequest, grpc.ServerStreamingServer[AllStreamResponse]) error
 	GenerateFullStory(context.Context, *FullStoryRequest) (*FullStoryResponse, error)
 	GenerateEmbedding(context.Context, *EmbeddingRequest) (*EmbeddingResponse, error)
 	RerankResults(context.Context, *RerankSearchRequest) (*RerankSearchResponse, error)
 	UploadImageToR2(context.Context, *UploadImageRequest) (*UploadImageResponse, error)
+	UploadImagesBatch(context.Context, *UploadImagesBatchRequest) (*UploadImagesBatchResponse, error)
+	UploadImage(grpc.ClientStreamingServer[UploadImageChunk, UploadImageResponse]) error
 	GenerateWorldImage(context.Context, *GenerateWorldImageRequest) (*GenerateWorldImageResponse, error)
+	EnqueueWorldImage(context.Context, *GenerateWorldImageRequest) (*WorldImageJob, error)
+	GetWorldImageJob(context.Context, *WorldImageJobRequest) (*WorldImageJob, error)
 	mustEmbedUnimplementedLoreServiceServer()
 }
 
@@ -255,6 +332,9 @@ func (UnimplementedLoreServiceServer) GenerateRelics(*RelicsRequest, grpc.Server
 func (UnimplementedLoreServiceServer) GenerateAll(context.Context, *AllRequest) (*AllResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GenerateAll not implemented")
 }
+func (UnimplementedLoreServiceServer) GenerateAllStream(*AllRequest, grpc.ServerStreamingServer[AllStreamResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method GenerateAllStream not implemented")
+}
 func (UnimplementedLoreServiceServer) GenerateFullStory(context.Context, *FullStoryRequest) (*FullStoryResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GenerateFullStory not implemented")
 }
@@ -267,9 +347,21 @@ func (UnimplementedLoreServiceServer) RerankResults(context.Context, *RerankSear
 func (UnimplementedLoreServiceServer) UploadImageToR2(context.Context, *UploadImageRequest) (*UploadImageResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method UploadImageToR2 not implemented")
 }
+func (UnimplementedLoreServiceServer) UploadImagesBatch(context.Context, *UploadImagesBatchRequest) (*UploadImagesBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method UploadImagesBatch not implemented")
+}
+func (UnimplementedLoreServiceServer) UploadImage(grpc.ClientStreamingServer[UploadImageChunk, UploadImageResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method UploadImage not implemented")
+}
 func (UnimplementedLoreServiceServer) GenerateWorldImage(context.Context, *GenerateWorldImageRequest) (*GenerateWorldImageResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GenerateWorldImage not implemented")
 }
+func (UnimplementedLoreServiceServer) EnqueueWorldImage(context.Context, *GenerateWorldImageRequest) (*WorldImageJob, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method EnqueueWorldImage not implemented")
+}
+func (UnimplementedLoreServiceServer) GetWorldImageJob(context.Context, *WorldImageJobRequest) (*WorldImageJob, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetWorldImageJob not implemented")
+}
 func (UnimplementedLoreServiceServer) mustEmbedUnimplementedLoreServiceServer() {}
 func (UnimplementedLoreServiceServer) testEmbeddedByValue()                     {}
 
@@ -364,6 +456,17 @@ func _LoreService_GenerateAll_Handler(srv interface{}, ctx context.Context, dec
 	return interceptor(ctx, in, info, handler)
 }
 
+func _LoreService_GenerateAllStream_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(AllRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(LoreServiceServer).GenerateAllStream(m, &grpc.GenericServerStream[AllRequest, AllStreamResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type LoreService_GenerateAllStreamServer = grpc.ServerStreamingServer[AllStreamResponse]
+
 func _LoreService_GenerateFullStory_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(FullStoryRequest)
 	if err := dec(in); err != nil {
@@ -436,6 +539,31 @@ func _LoreService_UploadImageToR2_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _LoreService_UploadImagesBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(UploadImagesBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(LoreServiceServer).UploadImagesBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: LoreService_UploadImagesBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(LoreServiceServer).UploadImagesBatch(ctx, req.(*UploadImagesBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _LoreService_UploadImage_Handler(srv interface{}, stream grpc.ServerStream) error {
+	return srv.(LoreServiceServer).UploadImage(&grpc.GenericServerStream[UploadImageChunk, UploadImageResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type LoreService_UploadImageServer = grpc.ClientStreamingServer[UploadImageChunk, UploadImageResponse]
+
 func _LoreService_GenerateWorldImage_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(GenerateWorldImageRequest)
 	if err := dec(in); err != nil {
@@ -454,6 +582,42 @@ func _LoreService_GenerateWorldImage_Handler(srv interface{}, ctx context.Contex
 	return interceptor(ctx, in, info, handler)
 }
 
+func _LoreService_EnqueueWorldImage_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GenerateWorldImageRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(LoreServiceServer).EnqueueWorldImage(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: LoreService_EnqueueWorldImage_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(LoreServiceServer).EnqueueWorldImage(ctx, req.(*GenerateWorldImageRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _LoreService_GetWorldImageJob_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(WorldImageJobRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(LoreServiceServer).GetWorldImageJob(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: LoreService_GetWorldImageJob_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(LoreServiceServer).GetWorldImageJob(ctx, req.(*WorldImageJobRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // LoreService_ServiceDesc is the grpc.ServiceDesc for LoreService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -481,10 +645,22 @@ var LoreService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "UploadImageToR2",
 			Handler:    _LoreService_UploadImageToR2_Handler,
 		},
+		{
+			MethodName: "UploadImagesBatch",
+			Handler:    _LoreService_UploadImagesBatch_Handler,
+		},
 		{
 			MethodName: "GenerateWorldImage",
 			Handler:    _LoreService_GenerateWorldImage_Handler,
 		},
+		{
+			MethodName: "EnqueueWorldImage",
+			Handler:    _LoreService_EnqueueWorldImage_Handler,
+		},
+		{
+			MethodName: "GetWorldImageJob",
+			Handler:    _LoreService_GetWorldImageJob_Handler,
+		},
 	},
 	Streams: []grpc.StreamDesc{
 		{
@@ -512,6 +688,16 @@ var LoreService_ServiceDesc = grpc.ServiceDesc{
 			Handler:       _LoreService_GenerateRelics_Handler,
 			ServerStreams: true,
 		},
+		{
+			StreamName:    "GenerateAllStream",
+			Handler:       _LoreService_GenerateAllStream_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "UploadImage",
+			Handler:       _LoreService_UploadImage_Handler,
+			ClientStreams: true,
+		},
 	},
 	Metadata: "lore.proto",
 }
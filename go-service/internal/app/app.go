@@ -7,6 +7,7 @@ import (
 	"log"
 	"net/http"
 	"os"
+	"strconv"
 	"time"
 
 	"github.com/mdombrov-33/loresmith/go-service/gen/lorepb"
@@ -14,6 +15,7 @@ import (
 	"github.com/mdombrov-33/loresmith/go-service/internal/jobs"
 	"github.com/mdombrov-33/loresmith/go-service/internal/middleware"
 	"github.com/mdombrov-33/loresmith/go-service/internal/store"
+	"github.com/mdombrov-33/loresmith/go-service/internal/utils"
 	"github.com/mdombrov-33/loresmith/go-service/migrations"
 	"github.com/redis/go-redis/v9"
 	"google.golang.org/grpc"
@@ -61,8 +63,15 @@ func NewApplication() (*Application, error) {
 		grpcPort = "50051"
 	}
 
-	conn, err := grpc.NewClient(
+	//* One connection per Python server worker so RPCs spread across them
+	grpcPoolSize, err := strconv.Atoi(os.Getenv("GRPC_CONN_POOL_SIZE"))
+	if err != nil || grpcPoolSize < 1 {
+		grpcPoolSize = 1
+	}
+
+	conn, err := utils.NewGRPCConnPool(
 		fmt.Sprintf("%s:%s", grpcHost, grpcPort),
+		grpcPoolSize,
 		grpc.WithTransportCredentials(insecure.NewCredentials()),
 		grpc.WithDefaultCallOptions(
 			grpc.MaxCallRecvMsgSize(maxMsgSize),
@@ -11,8 +11,12 @@ import (
 	"github.com/mdombrov-33/loresmith/go-service/gen/lorepb"
 	"github.com/mdombrov-33/loresmith/go-service/internal/store"
 	"github.com/mdombrov-33/loresmith/go-service/internal/utils"
+	"google.golang.org/grpc/metadata"
 )
 
+// worldImagePollInterval is how often a queued world image job is checked.
+const worldImagePollInterval = 2 * time.Second
+
 // * GRPCExecutor executes jobs by calling Python gRPC service
 type GRPCExecutor struct {
 	loreClient    lorepb.LoreServiceClient
@@ -105,7 +109,7 @@ func (e *GRPCExecutor) generateCharacters(ctx context.Context, job *Job) (interf
 	})
 
 	//* Call streaming gRPC method
-	stream, err := e.loreClient.GenerateCharacters(ctx, &lorepb.CharactersRequest{
+	stream, err := e.loreClient.GenerateCharacters(e.withUserID(ctx, job), &lorepb.CharactersRequest{
 		Theme: theme,
 		Count: count,
 	})
@@ -657,42 +661,29 @@ func (e *GRPCExecutor) generateWorldImage(ctx context.Context, job *Job) (interf
 		}
 	}
 
-	//* Call Python service to generate world image
+	//* Queue the image on the Python image worker, which uploads it to R2 for this world
 	grpcCtx, grpcCancel := utils.NewGRPCContext(utils.OpGenerateWorldImage)
 	defer grpcCancel()
 
-	grpcResp, err := e.loreClient.GenerateWorldImage(grpcCtx, &lorepb.GenerateWorldImageRequest{
+	queued, err := e.loreClient.EnqueueWorldImage(e.withUserID(grpcCtx, job), &lorepb.GenerateWorldImageRequest{
 		WorldTitle:         worldTitle,
 		FullStory:          fullStory.Content,
 		Theme:              world.Theme,
 		SettingDescription: settingDescription,
 		UseReplicate:       false, //* Default to Automatic1111
+		WorldId:            int64(worldID),
 	})
 	if err != nil {
-		return nil, fmt.Errorf("failed to generate world image: %w", err)
+		return nil, fmt.Errorf("failed to queue world image: %w", err)
 	}
 
-	if grpcResp.ImageBase64 == "" {
-		return nil, fmt.Errorf("no image returned from Python service")
+	worldImage, err := e.waitForWorldImage(grpcCtx, queued.JobId)
+	if err != nil {
+		return nil, err
 	}
 
-	e.store.Update(ctx, job.ID, JobUpdate{
-		Progress: intPtr(70),
-		Message:  "Uploading world image to R2...",
-	})
-
-	//* Upload image to R2
-	uploadCtx, uploadCancel := utils.NewGRPCContext(utils.OpUploadImage)
-	defer uploadCancel()
-
-	uploadResp, err := e.loreClient.UploadImageToR2(uploadCtx, &lorepb.UploadImageRequest{
-		ImageBase64: grpcResp.ImageBase64,
-		WorldId:     int64(worldID),
-		CharacterId: "world",       //* Use "world" as identifier for world images
-		ImageType:   "world_scene", //* Different type from character portraits
-	})
-	if err != nil {
-		return nil, fmt.Errorf("failed to upload world image: %w", err)
+	if worldImage.ImageUrl == "" {
+		return nil, fmt.Errorf("no image URL returned from Python service")
 	}
 
 	e.store.Update(ctx, job.ID, JobUpdate{
@@ -701,7 +692,7 @@ func (e *GRPCExecutor) generateWorldImage(ctx context.Context, job *Job) (interf
 	})
 
 	//* Update world with image URL
-	if err := e.worldStore.UpdateWorldImage(worldID, uploadResp.ImageUrl); err != nil {
+	if err := e.worldStore.UpdateWorldImage(worldID, worldImage.ImageUrl); err != nil {
 		return nil, fmt.Errorf("failed to update world image: %w", err)
 	}
 
@@ -712,12 +703,40 @@ func (e *GRPCExecutor) generateWorldImage(ctx context.Context, job *Job) (interf
 
 	result := map[string]interface{}{
 		"world_id":  worldID,
-		"image_url": uploadResp.ImageUrl,
+		"image_url": worldImage.ImageUrl,
 	}
 
 	return result, nil
 }
 
+// waitForWorldImage polls a queued world image job until the worker finishes
+// it. Each poll is a short RPC, so no connection is held open for the whole
+// generation.
+func (e *GRPCExecutor) waitForWorldImage(ctx context.Context, jobID string) (*lorepb.WorldImageJob, error) {
+	ticker := time.NewTicker(worldImagePollInterval)
+	defer ticker.Stop()
+
+	for {
+		select {
+		case <-ctx.Done():
+			return nil, fmt.Errorf("world image job %s did not finish: %w", jobID, ctx.Err())
+		case <-ticker.C:
+		}
+
+		worldImage, err := e.loreClient.GetWorldImageJob(ctx, &lorepb.WorldImageJobRequest{JobId: jobID})
+		if err != nil {
+			return nil, fmt.Errorf("failed to get world image job: %w", err)
+		}
+
+		switch worldImage.Status {
+		case "completed":
+			return worldImage, nil
+		case "failed":
+			return nil, fmt.Errorf("failed to generate world image: %s", worldImage.Error)
+		}
+	}
+}
+
 // * Helper functions to extract payload values
 func (e *GRPCExecutor) getStringPayload(job *Job, key string, defaultValue string) string {
 	if val, ok := job.Payload[key].(string); ok {
@@ -726,6 +745,15 @@ func (e *GRPCExecutor) getStringPayload(job *Job, key string, defaultValue strin
 	return defaultValue
 }
 
+// withUserID tags an outgoing gRPC call with the job's user, which the Python
+// service uses to schedule image generation fairly across users.
+func (e *GRPCExecutor) withUserID(ctx context.Context, job *Job) context.Context {
+	if userID := e.getIntPayload(job, "user_id", 0); userID != 0 {
+		return metadata.AppendToOutgoingContext(ctx, "x-user-id", strconv.Itoa(userID))
+	}
+	return ctx
+}
+
 func (e *GRPCExecutor) getIntPayload(job *Job, key string, defaultValue int) int {
 	if val, ok := job.Payload[key].(float64); ok {
 		return int(val)
@@ -1,12 +1,18 @@
 package store
 
 import (
+	"bytes"
 	"context"
+	"encoding/base64"
 	"fmt"
 
 	"github.com/redis/go-redis/v9"
 )
 
+// pngSignature prefixes portraits stored as raw PNG bytes by the Python worker.
+// Values without it are legacy base64 strings and are returned unchanged.
+var pngSignature = []byte("\x89PNG\r\n\x1a\n")
+
 type PortraitStore struct {
 	redis *redis.Client
 }
@@ -15,14 +21,18 @@ func NewPortraitStore(redis *redis.Client) *PortraitStore {
 	return &PortraitStore{redis: redis}
 }
 
+// GetPortrait returns the portrait for uuid as a base64 string, or "" if it is not ready yet.
 func (s *PortraitStore) GetPortrait(ctx context.Context, uuid string) (string, error) {
 	key := fmt.Sprintf("portrait:%s", uuid)
-	val, err := s.redis.Get(ctx, key).Result()
+	val, err := s.redis.Get(ctx, key).Bytes()
 	if err == redis.Nil {
 		return "", nil
 	}
 	if err != nil {
 		return "", fmt.Errorf("failed to get portrait from Redis: %w", err)
 	}
-	return val, nil
+	if bytes.HasPrefix(val, pngSignature) {
+		return base64.StdEncoding.EncodeToString(val), nil
+	}
+	return string(val), nil
 }
@@ -0,0 +1,61 @@
+package utils
+
+import (
+	"context"
+	"sync/atomic"
+
+	"google.golang.org/grpc"
+)
+
+// GRPCConnPool spreads RPCs round-robin over several client connections.
+//
+// A single grpc.ClientConn multiplexes every RPC over one HTTP/2 connection,
+// so when the Python service runs several server processes behind one port
+// (SO_REUSEPORT balances connections, not RPCs) all traffic would land on
+// one of them. It implements grpc.ClientConnInterface, so generated clients
+// accept it in place of a *grpc.ClientConn.
+type GRPCConnPool struct {
+	conns []*grpc.ClientConn
+	next  atomic.Uint64
+}
+
+// NewGRPCConnPool opens size connections to target (at least one).
+func NewGRPCConnPool(target string, size int, opts ...grpc.DialOption) (*GRPCConnPool, error) {
+	if size < 1 {
+		size = 1
+	}
+
+	pool := &GRPCConnPool{}
+	for range size {
+		conn, err := grpc.NewClient(target, opts...)
+		if err != nil {
+			pool.Close()
+			return nil, err
+		}
+		pool.conns = append(pool.conns, conn)
+	}
+	return pool, nil
+}
+
+func (p *GRPCConnPool) pick() *grpc.ClientConn {
+	return p.conns[(p.next.Add(1)-1)%uint64(len(p.conns))]
+}
+
+func (p *GRPCConnPool) Invoke(ctx context.Context, method string, args any, reply any, opts ...grpc.CallOption) error {
+	return p.pick().Invoke(ctx, method, args, reply, opts...)
+}
+
+func (p *GRPCConnPool) NewStream(ctx context.Context, desc *grpc.StreamDesc, method string, opts ...grpc.CallOption) (grpc.ClientStream, error) {
+	return p.pick().NewStream(ctx, desc, method, opts...)
+}
+
+// Close closes every connection in the pool.
+func (p *GRPCConnPool) Close() error {
+	var firstErr error
+	for _, conn := range p.conns {
+		if err := conn.Close(); err != nil && firstErr == nil {
+			firstErr = err
+		}
+	}
+	return firstErr
+}
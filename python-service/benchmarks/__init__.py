@@ -0,0 +1,7 @@
+import argparse
+
+
+def make_parser(doc: str | None) -> argparse.ArgumentParser:
+    """Argument parser described by the summary line of a benchmark's docstring."""
+    summary = (doc or "").strip().partition("\n")[0]
+    return argparse.ArgumentParser(description=summary or None)
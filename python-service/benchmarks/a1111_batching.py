@@ -0,0 +1,139 @@
+"""
+Benchmark batched vs one-call-per-portrait Automatic1111 generation.
+
+Starts a local HTTP stub of /sdapi/v1/txt2img whose latency is a fixed
+per-call overhead plus a per-image cost, then pushes the same portrait jobs
+through PortraitBatcher with batching off (batch size 1) and on.
+
+Usage (from python-service/):
+    python -m benchmarks.a1111_batching --jobs 12 --batch-size 4
+"""
+
+import argparse
+import asyncio
+import base64
+import logging
+import time
+import uuid as uuid_lib
+
+from aiohttp import web
+
+from benchmarks import make_parser
+from config.settings import get_settings
+from services.http_session import close_http_session
+from services.image_gen.portraits.batcher import PortraitBatcher
+from services.image_gen.scheduler import create_image_scheduler
+from services.image_gen.portraits.generator import generate_character_images_batch
+from utils.logger import logger
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+THEMES = ["steampunk", "cyberpunk", "norse"]
+
+
+def make_stub_app(per_call_seconds: float, per_image_seconds: float) -> web.Application:
+    """txt2img stub: latency = per-call overhead + per-image cost."""
+    calls = {"count": 0}
+
+    async def txt2img(request: web.Request) -> web.Response:
+        payload = await request.json()
+        if payload.get("script_name"):
+            image_count = len(payload["script_args"][-1].splitlines())
+        else:
+            image_count = payload.get("batch_size", 1)
+
+        calls["count"] += 1
+        await asyncio.sleep(per_call_seconds + per_image_seconds * image_count)
+
+        image = base64.b64encode(PNG_BYTES).decode("utf-8")
+        # Real batches get a grid image first
+        images = [image] * (image_count + 1 if image_count > 1 else 1)
+        return web.json_response({"images": images})
+
+    app = web.Application()
+    app["calls"] = calls
+    app.router.add_post("/sdapi/v1/txt2img", txt2img)
+    return app
+
+
+def make_jobs(count: int) -> list[dict]:
+    return [
+        {
+            "uuid": str(uuid_lib.uuid4()),
+            "name": f"Character {i}",
+            "appearance": f"A tall figure with scar number {i}",
+            "theme": THEMES[i % len(THEMES)],
+            "traits": ["brave"],
+            "skills": ["swordsmanship"],
+        }
+        for i in range(count)
+    ]
+
+
+async def run_scenario(
+    jobs: list[dict], batch_size: int, window_seconds: float, concurrency: int
+) -> float:
+    batcher = PortraitBatcher(
+        generate_character_images_batch,
+        scheduler=create_image_scheduler(concurrency),
+        window_seconds=window_seconds,
+        max_size=batch_size,
+    )
+    start = time.perf_counter()
+    results = await asyncio.gather(*(batcher.submit(job["theme"], job) for job in jobs))
+    elapsed = time.perf_counter() - start
+    assert all(result["image_portrait_bytes"] == PNG_BYTES for result in results)
+    return elapsed
+
+
+async def main_async(args: argparse.Namespace):
+    app = make_stub_app(args.per_call, args.per_image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+
+    settings = get_settings()
+    settings.ENABLE_IMAGE_GENERATION = True
+    settings.IMAGE_PROVIDER = "local"
+    settings.AUTOMATIC1111_URL = f"http://127.0.0.1:{args.port}"
+
+    jobs = make_jobs(args.jobs)
+    try:
+        print(
+            f"{args.jobs} jobs, {len(THEMES)} themes, stub: {args.per_call}s/call + "
+            f"{args.per_image}s/image, concurrency {args.concurrency}"
+        )
+        for batch_size in (1, args.batch_size):
+            app["calls"]["count"] = 0
+            elapsed = await run_scenario(
+                jobs, batch_size, args.window_ms / 1000, args.concurrency
+            )
+            print(
+                f"batch size {batch_size}: {elapsed:.2f}s, "
+                f"{app['calls']['count']} txt2img calls, "
+                f"{len(jobs) / elapsed * 60:.0f} portraits/min"
+            )
+    finally:
+        await close_http_session()
+        await runner.cleanup()
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--jobs", type=int, default=12)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--window-ms", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--per-call", type=float, default=0.5, help="Seconds per call")
+    parser.add_argument(
+        "--per-image", type=float, default=0.2, help="Seconds per image"
+    )
+    parser.add_argument("--port", type=int, default=7861)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
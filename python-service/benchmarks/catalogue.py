@@ -0,0 +1,120 @@
+"""
+Benchmark the indexed flaw and trait catalogue against plain scans.
+
+Times each lookup in generate/chains/character/catalogue.py against the
+linear scan of FLAW_TEMPLATES / PersonalityTrait it replaced. Correctness is
+covered by tests/test_catalogue.py.
+
+Usage (from python-service/):
+    python -m benchmarks.catalogue --iterations 20000
+"""
+
+import logging
+import time
+
+from benchmarks import make_parser
+from generate.chains.character import catalogue
+from generate.chains.character.flaw_templates import FLAW_TEMPLATES
+from generate.chains.character.traits import (
+    PersonalityTrait,
+    are_traits_compatible,
+    get_trait_list_for_prompt,
+)
+
+
+def scan_flaw_by_id(flaw_id: str):
+    for flaw in FLAW_TEMPLATES:
+        if flaw["id"] == flaw_id:
+            return flaw
+    return None
+
+
+def scan_flaws_by_category(category: str):
+    return [f for f in FLAW_TEMPLATES if f["category"] == category]
+
+
+def scan_trait_names() -> list[str]:
+    return [trait.value for trait in PersonalityTrait]
+
+
+def scan_valid_selection(selection: list[PersonalityTrait]) -> bool:
+    if len(selection) != 3:
+        return False
+    for i in range(len(selection)):
+        for j in range(i + 1, len(selection)):
+            if not are_traits_compatible(selection[i], selection[j]):
+                return False
+    return True
+
+
+def timed(label: str, call, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    per_call = (time.perf_counter() - start) / iterations * 1e6
+    print(f"  {label:<52} {per_call:8.2f} us")
+    return per_call
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    logging.getLogger("loresmith").setLevel(logging.ERROR)
+
+    # The lookups one character makes: a flaw for each of 10 options plus
+    # the pick and a fallback, trait name checks and a selection check
+    flaw_ids = catalogue.FLAW_IDS[-10:]
+    sample = [PersonalityTrait.BRAVE, PersonalityTrait.LOYAL, PersonalityTrait.STOIC]
+
+    def scan_lookups():
+        for flaw_id in flaw_ids + flaw_ids[:2]:
+            scan_flaw_by_id(flaw_id)
+        names = scan_trait_names()
+        all(trait.value in names for trait in sample)
+        scan_valid_selection(sample)
+        get_trait_list_for_prompt()
+
+    def indexed_lookups():
+        for flaw_id in flaw_ids + flaw_ids[:2]:
+            catalogue.get_flaw_by_id(flaw_id)
+        all(trait.value in catalogue.TRAIT_NAMES for trait in sample)
+        catalogue.validate_trait_selection(sample)
+        catalogue.TRAIT_PROMPT
+
+    print(f"{args.iterations} iterations")
+    for name, scan, indexed in (
+        (
+            "get_flaw_by_id (last ID)",
+            lambda: scan_flaw_by_id(flaw_ids[-1]),
+            lambda: catalogue.get_flaw_by_id(flaw_ids[-1]),
+        ),
+        (
+            "get_flaws_by_category",
+            lambda: scan_flaws_by_category("trauma"),
+            lambda: catalogue.get_flaws_by_category("trauma"),
+        ),
+        (
+            "trait name membership",
+            lambda: "Team-Player" in scan_trait_names(),
+            lambda: "Team-Player" in catalogue.TRAIT_NAMES,
+        ),
+        (
+            "validate_trait_selection",
+            lambda: scan_valid_selection(sample),
+            lambda: catalogue.validate_trait_selection(sample),
+        ),
+        (
+            "trait prompt",
+            get_trait_list_for_prompt,
+            lambda: catalogue.TRAIT_PROMPT,
+        ),
+        ("all lookups for one character", scan_lookups, indexed_lookups),
+    ):
+        before = timed(f"{name}, scan", scan, args.iterations)
+        after = timed(f"{name}, catalogue", indexed, args.iterations)
+        print(f"  {'':<52} {before / after:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
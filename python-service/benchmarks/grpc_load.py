@@ -0,0 +1,208 @@
+"""
+Load test the gRPC server with mixed RerankResults/GenerateEmbedding traffic.
+
+Starts the server through lore_servicer.serve_workers (1 or more processes on
+one port) with stub models: embeddings are deterministic hash-seeded vectors
+and query preprocessing is a no-op, so only the server's own CPU work is
+measured (spaCy tokenization and BM25 fusion, Dartboard, protobuf
+conversion). Clients spread over several connections, since SO_REUSEPORT
+balances connections, not RPCs. Reports throughput, per-method latency, the
+RPCs each worker served (scraped from its metrics exporter) and how long a
+graceful shutdown took.
+
+Usage (from python-service/):
+    python -m benchmarks.grpc_load --workers 4 --clients 32 --duration 20
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import random
+import re
+import statistics
+import time
+import urllib.request
+
+import numpy as np
+
+from benchmarks import make_parser
+
+DIMENSIONS = 768
+
+WORDS = (
+    "ancient empire storm kingdom dragon forge river shadow city desert "
+    "machine ruin oracle frost rebellion merchant guild airship temple plague "
+    "crown exile harbor wasteland archive beacon pact tide citadel orchard"
+).split()
+
+
+def fake_embedding(text: str) -> list[float]:
+    """Deterministic unit vector seeded by the text."""
+    seed = int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest()[:4], "big")
+    vector = np.random.default_rng(seed).standard_normal(DIMENSIONS)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def stub_worker(worker_index: int):
+    """Server worker with the model calls replaced by stubs."""
+    logging.getLogger("loresmith").setLevel(logging.WARNING)
+    import lore_servicer
+
+    async def embed(text: str) -> list[float]:
+        return fake_embedding(text)
+
+    async def preprocess(query: str) -> str:
+        return query
+
+    lore_servicer.generate_search_embedding = embed
+    lore_servicer.generate_content_embedding = embed
+    lore_servicer.preprocess_search_query = preprocess
+    lore_servicer.run_server_worker(worker_index)
+
+
+def rerank_request(rng: random.Random, world_count: int):
+    import lore_pb2  # type: ignore
+
+    query = " ".join(rng.choices(WORDS, k=4))
+    worlds = [
+        lore_pb2.WorldResult(
+            title=f"World {i}",
+            theme="fantasy",
+            full_story=" ".join(rng.choices(WORDS, k=150)),
+            relevance=rng.random(),
+            embedding=fake_embedding(f"world-{i}-{rng.random()}"),
+        )
+        for i in range(world_count)
+    ]
+    return lore_pb2.RerankSearchRequest(
+        query=query, worlds=worlds, query_embedding=fake_embedding(query)
+    )
+
+
+async def run_load(args: argparse.Namespace) -> dict[str, list[float]]:
+    import grpc  # type: ignore
+    import lore_pb2  # type: ignore
+    import lore_pb2_grpc  # type: ignore
+
+    channels = [
+        # A local subchannel pool gives every channel its own TCP connection
+        grpc.aio.insecure_channel(
+            f"localhost:{args.port}", options=[("grpc.use_local_subchannel_pool", 1)]
+        )
+        for _ in range(args.connections)
+    ]
+    for channel in channels:
+        await asyncio.wait_for(channel.channel_ready(), timeout=120)
+    stubs = [lore_pb2_grpc.LoreServiceStub(channel) for channel in channels]
+
+    rng = random.Random(42)
+    requests = [rerank_request(rng, args.worlds) for _ in range(16)]
+    latencies: dict[str, list[float]] = {"RerankResults": [], "GenerateEmbedding": []}
+    errors = 0
+    deadline = time.perf_counter() + args.duration
+
+    async def client(index: int):
+        nonlocal errors
+        stub = stubs[index % len(stubs)]
+        client_rng = random.Random(index)
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                if client_rng.random() < args.rerank_ratio:
+                    method = "RerankResults"
+                    await stub.RerankResults(client_rng.choice(requests))
+                else:
+                    method = "GenerateEmbedding"
+                    text = " ".join(client_rng.choices(WORDS, k=6))
+                    await stub.GenerateEmbedding(lore_pb2.EmbeddingRequest(text=text))
+            except grpc.aio.AioRpcError:
+                errors += 1
+                continue
+            latencies[method].append(time.perf_counter() - start)
+
+    await asyncio.gather(*(client(i) for i in range(args.clients)))
+    for channel in channels:
+        await channel.close()
+
+    if errors:
+        print(f"  {errors} RPCs failed")
+    return latencies
+
+
+def scrape_worker_requests(metrics_port: int) -> float:
+    """Total RPCs a worker has served, from its Prometheus exporter."""
+    with urllib.request.urlopen(f"http://localhost:{metrics_port}/metrics") as response:
+        text = response.read().decode("utf-8")
+    return sum(
+        float(value)
+        for value in re.findall(
+            r"^loresmith_grpc_requests_total\{.*\} (\S+)$", text, re.M
+        )
+    )
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    return sorted(values)[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--rerank-ratio", type=float, default=0.5)
+    parser.add_argument("--worlds", type=int, default=20)
+    parser.add_argument("--port", type=int, default=50151)
+    parser.add_argument("--metrics-port", type=int, default=9400)
+    args = parser.parse_args()
+
+    # Read by the server processes when they load their settings
+    os.environ.update(
+        GRPC_PORT=str(args.port),
+        GRPC_SERVER_WORKERS=str(args.workers),
+        GRPC_METRICS_PORT=str(args.metrics_port),
+        LANGFUSE_ENABLED="false",
+    )
+    logging.getLogger("loresmith").setLevel(logging.WARNING)
+
+    import lore_servicer
+
+    supervisor = multiprocessing.get_context("spawn").Process(
+        target=lore_servicer.serve_workers, args=(args.workers, stub_worker)
+    )
+    supervisor.start()
+    try:
+        latencies = asyncio.run(run_load(args))
+        served = [
+            scrape_worker_requests(args.metrics_port + index)
+            for index in range(args.workers)
+        ]
+    finally:
+        start = time.perf_counter()
+        supervisor.terminate()
+        supervisor.join()
+        shutdown = time.perf_counter() - start
+
+    total = sum(len(values) for values in latencies.values())
+    print(
+        f"{args.workers} workers on {os.cpu_count()} CPUs, {args.clients} clients "
+        f"over {args.connections} connections, {args.rerank_ratio:.0%} rerank "
+        f"({args.worlds} worlds): {total / args.duration:.1f} RPC/s"
+    )
+    for method, values in latencies.items():
+        if values:
+            print(
+                f"  {method:<18} {len(values):>6} calls  "
+                f"p50 {statistics.median(values) * 1000:7.1f} ms  "
+                f"p99 {percentile(values, 0.99) * 1000:7.1f} ms"
+            )
+    print(f"  RPCs per worker: {', '.join(f'{count:.0f}' for count in served)}")
+    print(f"  graceful shutdown took {shutdown:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
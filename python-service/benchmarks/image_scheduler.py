@@ -0,0 +1,135 @@
+"""
+Benchmark image job scheduling against a stub GPU backend.
+
+One heavy user queues a burst of portraits, a few light users each queue a
+couple of portraits shortly after, and world scenes arrive in between. The
+stub backend's latency scales with resolution and steps, so degraded jobs
+finish faster. Compares a plain FIFO semaphore with ImageJobScheduler
+(fairness only, then with 'reduce' and 'skip' degrade modes) and reports
+latency per kind of job.
+
+Usage (from python-service/):
+    python -m benchmarks.image_scheduler --heavy-jobs 24 --light-users 3
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from contextlib import asynccontextmanager
+
+from benchmarks import make_parser
+from exceptions.image_generation import ImageJobRejectedError
+from services.image_gen.scheduler import (
+    ImageJobScheduler,
+    ImagePriority,
+    degrade_dimensions,
+)
+
+# (width, height, steps) per priority class at full quality
+FULL_QUALITY = {
+    ImagePriority.PORTRAIT: (1024, 1024, 20),
+    ImagePriority.WORLD_SCENE: (1024, 768, 20),
+}
+
+
+async def stub_gpu(priority: ImagePriority, degraded: bool, seconds_per_image: float):
+    """Simulated diffusion run: cost scales with pixels x steps."""
+    width, height, steps = FULL_QUALITY[priority]
+    if degraded:
+        width, height, steps = degrade_dimensions(width, height, steps)
+    await asyncio.sleep(seconds_per_image * (width * height / 1024**2) * (steps / 20))
+
+
+class FifoSemaphore:
+    """Previous behaviour: one semaphore, first come first served, no degrading."""
+
+    def __init__(self, slots: int):
+        self._semaphore = asyncio.Semaphore(slots)
+
+    @asynccontextmanager
+    async def slot(self, priority: ImagePriority, user_id: str = ""):
+        async with self._semaphore:
+            yield False
+
+
+async def run_scenario(scheduler, args: argparse.Namespace) -> dict[str, list]:
+    latencies: dict[str, list] = {"heavy": [], "light": [], "world": [], "shed": []}
+
+    async def job(kind: str, priority: ImagePriority, user_id: str, delay: float):
+        await asyncio.sleep(delay)
+        start = time.perf_counter()
+        try:
+            async with scheduler.slot(priority, user_id) as degraded:
+                await stub_gpu(priority, degraded, args.seconds_per_image)
+        except ImageJobRejectedError:
+            latencies["shed"].append(kind)
+            return
+        latencies[kind].append(time.perf_counter() - start)
+
+    jobs = [
+        job("heavy", ImagePriority.PORTRAIT, "heavy", 0) for _ in range(args.heavy_jobs)
+    ]
+    for user in range(args.light_users):
+        jobs += [
+            job("light", ImagePriority.PORTRAIT, f"light-{user}", 0.1)
+            for _ in range(args.light_jobs)
+        ]
+    jobs += [
+        job("world", ImagePriority.WORLD_SCENE, f"light-{i}", 0.05 * i)
+        for i in range(args.world_scenes)
+    ]
+    await asyncio.gather(*jobs)
+    return latencies
+
+
+def summarize(values: list[float]) -> str:
+    if not values:
+        return "-"
+    return f"p50 {statistics.median(values):5.2f}s  max {max(values):5.2f}s"
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--heavy-jobs", type=int, default=24)
+    parser.add_argument("--light-users", type=int, default=3)
+    parser.add_argument("--light-jobs", type=int, default=2)
+    parser.add_argument("--world-scenes", type=int, default=2)
+    parser.add_argument("--slots", type=int, default=2)
+    parser.add_argument("--seconds-per-image", type=float, default=0.2)
+    parser.add_argument("--degrade-backlog", type=int, default=12)
+    args = parser.parse_args()
+
+    logging.getLogger("loresmith").setLevel(logging.ERROR)
+    depth_limits = {ImagePriority.PORTRAIT: 64, ImagePriority.WORLD_SCENE: 8}
+
+    scenarios = {
+        "fifo semaphore": lambda: FifoSemaphore(args.slots),
+        "scheduler": lambda: ImageJobScheduler(
+            args.slots, depth_limits, args.degrade_backlog, degrade_mode="off"
+        ),
+        "scheduler+reduce": lambda: ImageJobScheduler(
+            args.slots, depth_limits, args.degrade_backlog, degrade_mode="reduce"
+        ),
+        "scheduler+skip": lambda: ImageJobScheduler(
+            args.slots, depth_limits, args.degrade_backlog, degrade_mode="skip"
+        ),
+    }
+
+    print(
+        f"{args.heavy_jobs} portraits from one user, {args.light_users}x"
+        f"{args.light_jobs} from light users, {args.world_scenes} world scenes, "
+        f"{args.slots} GPU slots, {args.seconds_per_image}s per full image"
+    )
+    for label, make_scheduler in scenarios.items():
+        start = time.perf_counter()
+        latencies = asyncio.run(run_scenario(make_scheduler(), args))
+        elapsed = time.perf_counter() - start
+        print(f"{label} ({elapsed:.1f}s total, {len(latencies['shed'])} shed)")
+        for kind in ("light", "heavy", "world"):
+            print(f"  {kind:<6} {summarize(latencies[kind])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark image variant encoding: encode time vs bytes saved over PNG.
+
+Encodes a portrait-sized image (a real PNG via --image, or a synthetic one)
+into each format and thumbnail size, then encodes a world's worth of images
+on the event loop vs through the transcode process pool and reports the
+longest event loop stall.
+
+Usage (from python-service/):
+    python -m benchmarks.image_variants --image portrait.png --formats webp,avif
+"""
+
+import asyncio
+import io
+import time
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from benchmarks import make_parser
+from benchmarks.r2_uploads import measure_loop_stall
+
+
+def synthetic_image(width: int, height: int) -> bytes:
+    """Smooth gradients, shapes and grain, closer to a render than pure noise."""
+    image = Image.radial_gradient("L").resize((width, height))
+    image = Image.merge(
+        "RGB",
+        (
+            image,
+            Image.linear_gradient("L").resize((width, height)),
+            Image.effect_mandelbrot((width, height), (-2, -1.2, 1, 1.2), 60),
+        ),
+    )
+    draw = ImageDraw.Draw(image)
+    for i in range(1, 12):
+        r = i * min(width, height) // 26
+        box = (width // 3 - r, height // 2 - r, width // 3 + r, height // 2 + r)
+        draw.ellipse(box, outline=(40 * i % 255, 90, 200 - 10 * i), width=6)
+    noise = Image.effect_noise((width, height), 24).convert("RGB")
+    image = Image.blend(image.filter(ImageFilter.GaussianBlur(2)), noise, 0.08)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def report_variants(image_data: bytes, formats: tuple[str, ...], sizes, qualities):
+    from services.image_gen.transcoding import encode_variants
+
+    print(f"original PNG: {len(image_data) / 1024:.0f} KB")
+    for fmt in formats:
+        for size_set in ((), sizes):
+            start = time.perf_counter()
+            variants = encode_variants(image_data, (fmt,), size_set, qualities)
+            elapsed = time.perf_counter() - start
+            if size_set:
+                variants = variants[1:]
+                label = f"{fmt} + thumbnails {','.join(map(str, sizes))}"
+            else:
+                label = fmt
+            total = sum(len(variant.data) for variant in variants)
+            print(
+                f"  {label:<28} {elapsed * 1000:>6.0f} ms  "
+                f"{total / 1024:>6.0f} KB  "
+                f"({100 * (1 - total / len(image_data)):.0f}% smaller than PNG)"
+            )
+
+
+async def encode_many(images: list[bytes], pooled: bool) -> tuple[float, float]:
+    from services.image_gen.transcoding import (
+        encode_variants,
+        parse_thumbnail_sizes,
+        parse_variant_formats,
+        settings,
+        transcode_image,
+    )
+
+    stop = asyncio.Event()
+    stall_task = asyncio.create_task(measure_loop_stall(stop))
+    await asyncio.sleep(0.02)
+
+    start = time.perf_counter()
+    if pooled:
+        await asyncio.gather(*(transcode_image(image) for image in images))
+    else:
+        # Encoding directly in the coroutine blocks the event loop
+        for image in images:
+            encode_variants(
+                image,
+                parse_variant_formats(settings.IMAGE_VARIANT_FORMATS),
+                parse_thumbnail_sizes(settings.IMAGE_THUMBNAIL_SIZES),
+                {
+                    "webp": settings.IMAGE_WEBP_QUALITY,
+                    "avif": settings.IMAGE_AVIF_QUALITY,
+                },
+            )
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    return elapsed, await stall_task
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--image", help="PNG to encode (default: synthetic)")
+    parser.add_argument("--formats", default="webp,avif")
+    parser.add_argument("--images", type=int, default=8)
+    args = parser.parse_args()
+
+    from services.image_gen.transcoding import (
+        close_transcode_executor,
+        get_transcode_executor,
+        parse_thumbnail_sizes,
+        parse_variant_formats,
+        settings,
+    )
+
+    if args.image:
+        with open(args.image, "rb") as f:
+            image_data = f.read()
+    else:
+        image_data = synthetic_image(1024, 1024)
+
+    formats = parse_variant_formats(args.formats)
+    sizes = parse_thumbnail_sizes(settings.IMAGE_THUMBNAIL_SIZES)
+    qualities = {
+        "webp": settings.IMAGE_WEBP_QUALITY,
+        "avif": settings.IMAGE_AVIF_QUALITY,
+    }
+    report_variants(image_data, formats, sizes, qualities)
+
+    # Start the pool up front so spawn time isn't counted
+    for future in [get_transcode_executor().submit(int) for _ in range(8)]:
+        future.result()
+
+    images = [image_data] * args.images
+    print(
+        f"{args.images} images, formats={settings.IMAGE_VARIANT_FORMATS}, "
+        f"thumbnails={settings.IMAGE_THUMBNAIL_SIZES}, "
+        f"{settings.IMAGE_TRANSCODE_WORKERS} encoder processes"
+    )
+    for label, pooled in (("on event loop", False), ("process pool", True)):
+        elapsed, stall = asyncio.run(encode_many(images, pooled))
+        print(
+            f"  {label:<14} {elapsed:.2f}s total, worst loop stall {stall * 1000:.0f} ms"
+        )
+
+    close_transcode_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark the keyword matching used to build portrait prompts.
+
+Times gender, skill visual and appearance feature extraction with the
+precompiled word-boundary regexes against the previous plain substring scans.
+tests/test_keyword_matching.py covers what they match.
+
+Usage (from python-service/):
+    python -m benchmarks.keyword_matching --iterations 20000
+"""
+
+import logging
+import time
+
+from benchmarks import make_parser
+from generate.chains.character.appearance_tracker import _FEATURE_MATCHER
+from services.image_gen.portraits.prompt_builder import (
+    _GENDER_MATCHER,
+    _SKILL_VISUAL_MATCHER,
+    get_skill_visuals,
+)
+from utils.keyword_matcher import KeywordMatcher
+
+SAMPLE_APPEARANCE = (
+    "A weathered woman in her late 30s with a scarred jaw and close-cropped "
+    "hair. She wears brass goggles pushed up on her forehead, a patched "
+    "leather jacket over a grease-stained shirt, and a tool belt heavy with "
+    "wrenches. A faded tattoo of a gear winds around her left forearm, and her "
+    "mechanical arm hisses softly whenever she flexes its fingers."
+)
+
+
+def substring_labels(matcher: KeywordMatcher, text: str) -> list[str]:
+    """Previous behaviour: plain substring scans over the same keywords."""
+    text = text.lower()
+    return [
+        label
+        for label, keywords in matcher.groups.items()
+        if any(keyword.strip("*") in text for keyword in keywords)
+    ]
+
+
+def substring_skill_visuals(skills: list[str]) -> list[str]:
+    visuals = []
+    for skill in skills[:3]:
+        labels = substring_labels(_SKILL_VISUAL_MATCHER, skill)
+        if labels:
+            visuals.append(labels[0])
+    return visuals
+
+
+def timeit(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    logging.getLogger("loresmith").setLevel(logging.ERROR)
+
+    skills = ["Blacksmithing", "Survival", "Persuasion"]
+    cases = {
+        "skill visuals (3 skills)": (
+            lambda: substring_skill_visuals(skills),
+            lambda: get_skill_visuals(skills),
+        ),
+        "gender": (
+            lambda: substring_labels(_GENDER_MATCHER, SAMPLE_APPEARANCE),
+            lambda: _GENDER_MATCHER.find(SAMPLE_APPEARANCE),
+        ),
+        "appearance features": (
+            lambda: substring_labels(_FEATURE_MATCHER, SAMPLE_APPEARANCE),
+            lambda: _FEATURE_MATCHER.labels(SAMPLE_APPEARANCE),
+        ),
+    }
+    print(f"per call, {args.iterations} iterations:")
+    for label, (old, new) in cases.items():
+        old_us = timeit(old, args.iterations)
+        new_us = timeit(new, args.iterations)
+        print(f"  {label:<26} substring {old_us:6.1f} us  regex {new_us:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Compare local trait/flaw selection with the LLM steps it replaces.
+
+For each fixture character (theme, name, appearance, backstory), picks traits
+and a flaw with CHARACTER_SELECTION_MODE=keywords and =embeddings, checks
+every trait pick passes validate_trait_selection (exits non-zero otherwise),
+and reports per-mode latency. When the fixtures carry reference picks it
+also reports agreement with them: mean share of the 3 traits in common,
+exact trait set matches and same flaw ID.
+
+The fixtures (benchmarks/fixtures/local_selection.json) are 20 characters,
+4 per theme, kept apart from the trait prompt's worked examples that the
+keyword cues were tuned on. Agreement is only meaningful on reference picks
+from a real provider: record them into the file with --llm --save, and
+commit the result. Without picks only latency and validity are reported.
+
+Usage (from python-service/):
+    python -m benchmarks.local_selection
+    AI_PROVIDER=openrouter python -m benchmarks.local_selection --llm \
+        --save benchmarks/fixtures/local_selection.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+from benchmarks import make_parser
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "local_selection.json")
+
+MODES = ("keywords", "embeddings")
+
+
+async def record_llm_picks(fixtures: list[dict]) -> list[float]:
+    """Fill in each fixture's traits and flaw with the LLM; returns latencies."""
+    from generate.chains.character.character import (
+        _select_flaw_with_llm,
+        _select_traits_with_llm,
+    )
+
+    with open("generate/prompts/shared/theme_references.txt", "r") as f:
+        theme_references = f.read()
+
+    latencies = []
+    for fixture in fixtures:
+        start = time.perf_counter()
+        try:
+            traits = await _select_traits_with_llm(
+                fixture["theme"],
+                theme_references,
+                fixture["name"],
+                fixture["appearance"],
+                fixture["backstory"],
+            )
+            fixture["traits"] = [trait.value for trait in traits]
+        except ValueError as e:
+            print(f"  {fixture['name']}: LLM traits invalid ({e})")
+            fixture.pop("traits", None)
+        fixture["flaw"] = await _select_flaw_with_llm(
+            fixture["theme"],
+            theme_references,
+            fixture["name"],
+            ", ".join(fixture.get("traits", [])),
+            fixture["backstory"],
+            fixture["flaw_ids"],
+        )
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run_mode(mode: str, fixtures: list[dict]) -> dict:
+    from generate.chains.character import local_selection
+    from generate.chains.character.catalogue import validate_trait_selection
+
+    local_selection.settings.CHARACTER_SELECTION_MODE = mode
+    latencies: list[float] = []
+    overlaps: list[float] = []
+    trait_matches: list[bool] = []
+    flaw_matches: list[bool] = []
+    invalid = 0
+
+    for fixture in fixtures:
+        start = time.perf_counter()
+        traits = await local_selection.select_traits_locally(
+            fixture["theme"], fixture["appearance"], fixture["backstory"]
+        )
+        flaw = await local_selection.select_flaw_locally(
+            fixture["flaw_ids"],
+            fixture["appearance"],
+            fixture["backstory"],
+            ", ".join(trait.value for trait in traits),
+        )
+        latencies.append(time.perf_counter() - start)
+
+        if not validate_trait_selection(traits):
+            invalid += 1
+            print(f"  INVALID {mode} traits for {fixture['name']}: {traits}")
+        if "traits" in fixture:
+            shared = {trait.value for trait in traits} & set(fixture["traits"])
+            overlaps.append(len(shared) / 3)
+            trait_matches.append(len(shared) == 3)
+        if "flaw" in fixture:
+            flaw_matches.append(flaw == fixture["flaw"])
+
+    return {
+        "latencies": latencies,
+        "overlaps": overlaps,
+        "trait_matches": trait_matches,
+        "flaw_matches": flaw_matches,
+        "invalid": invalid,
+    }
+
+
+def rate(values: list) -> str:
+    return f"{statistics.mean(values) * 100:5.0f}%" if values else "    -"
+
+
+async def run(args: argparse.Namespace) -> int:
+    from generate.chains.character.flaw_templates import FLAW_TEMPLATES
+
+    with open(args.fixtures) as f:
+        fixtures = json.load(f)
+
+    flaw_ids = [flaw["id"] for flaw in FLAW_TEMPLATES]
+    for index, fixture in enumerate(fixtures):
+        fixture.setdefault("flaw_ids", random.Random(index).sample(flaw_ids, 10))
+
+    print(f"{len(fixtures)} fixture characters from {args.fixtures}")
+    if args.llm:
+        llm_latencies = await record_llm_picks(fixtures)
+        print(
+            f"  LLM traits + flaw: mean {statistics.mean(llm_latencies) * 1000:.0f} ms "
+            f"per character ({os.environ.get('AI_PROVIDER', 'configured provider')})"
+        )
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump(fixtures, f, indent=2)
+            print(f"  Saved fixtures with LLM picks to {args.save}")
+    elif not any("traits" in fixture for fixture in fixtures):
+        print("  No reference picks: record them with --llm --save")
+
+    print(
+        f"  {'mode':<11} {'mean ms':>8} {'max ms':>9} {'trait overlap':>14} "
+        f"{'exact traits':>13} {'same flaw':>10}"
+    )
+    invalid = 0
+    for mode in MODES:
+        result = await run_mode(mode, fixtures)
+        invalid += result["invalid"]
+        print(
+            f"  {mode:<11} {statistics.mean(result['latencies']) * 1000:8.2f} "
+            f"{max(result['latencies']) * 1000:9.2f} {rate(result['overlaps']):>14} "
+            f"{rate(result['trait_matches']):>13} {rate(result['flaw_matches']):>10}"
+        )
+    return 1 if invalid else 0
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument(
+        "--fixtures", default=FIXTURES, help="JSON list of fixture characters"
+    )
+    parser.add_argument(
+        "--llm", action="store_true", help="Make the reference picks with the LLM"
+    )
+    parser.add_argument("--save", help="With --llm, write the fixtures here")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LANGFUSE_ENABLED", "false")
+    logging.getLogger("loresmith").setLevel(logging.ERROR)
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measure the character name prompt with whole name lists vs sampled names.
+
+For every theme, formats the name prompt with the whole first/last name
+lists and with NAME_POOL_SAMPLE_SIZE random names of each kind, and reports
+prompt tokens and the reduction. Tokens are counted with tiktoken when its
+encoding is available, otherwise estimated at 4 characters per token. Then
+times loading the names from disk (as every call used to) against the
+in-memory pools.
+
+Usage (from python-service/):
+    python -m benchmarks.name_pools --sample-sizes 20 40 80
+"""
+
+import logging
+import os
+import statistics
+import time
+
+from benchmarks import make_parser
+
+
+def token_counter():
+    """(count function, description) for prompt tokens."""
+    try:
+        import tiktoken  # type: ignore
+
+        encoding = tiktoken.get_encoding("o200k_base")
+        return (lambda text: len(encoding.encode(text))), "tiktoken o200k_base"
+    except Exception:
+        return (lambda text: round(len(text) / 4)), "estimated, 4 chars/token"
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--sample-sizes", type=int, nargs="+", default=[20, 40, 80])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("LANGFUSE_ENABLED", "false")
+    logging.getLogger("loresmith").setLevel(logging.ERROR)
+
+    from langchain_core.prompts import PromptTemplate
+
+    from generate.chains.character import name_loader
+    from generate.chains.character.character import blacklist_str
+
+    with open("generate/prompts/shared/theme_references.txt", "r") as f:
+        theme_references = f.read()
+    with open("generate/prompts/character/character_name.txt", "r") as f:
+        name_prompt = PromptTemplate.from_template(f.read())
+
+    count_tokens, counting = token_counter()
+
+    def prompt_tokens(theme: str, sample_size: int) -> int:
+        name_loader.settings.NAME_POOL_SAMPLE_SIZE = sample_size
+        names = name_loader.load_names_for_theme(theme) or {}
+        return count_tokens(
+            name_prompt.format(
+                theme=theme,
+                theme_references=theme_references,
+                first_names=names.get("first_names", ""),
+                last_names=names.get("last_names", ""),
+                blacklist=blacklist_str,
+            )
+        )
+
+    themes = [theme for theme in name_loader.THEME_NAMES_MAPPING if theme != "norse"]
+    print(f"Name prompt tokens ({counting})")
+    print(
+        f"  {'theme':<18} {'all names':>10}"
+        + "".join(f" {f'{size} each':>16}" for size in args.sample_sizes)
+    )
+    reductions: dict[int, list[float]] = {size: [] for size in args.sample_sizes}
+    for theme in themes:
+        full = prompt_tokens(theme, 0)
+        row = f"  {theme:<18} {full:>10}"
+        for size in args.sample_sizes:
+            sampled = prompt_tokens(theme, size)
+            reductions[size].append(1 - sampled / full)
+            row += f" {sampled:>7} ({(1 - sampled / full) * 100:4.0f}%)"
+        print(row)
+    print(
+        f"  {'mean reduction':<29}"
+        + "".join(
+            f" {statistics.mean(reductions[size]) * 100:15.0f}%"
+            for size in args.sample_sizes
+        )
+    )
+
+    print(f"Loading names, {args.iterations} iterations")
+    for label, sample_size, clear_cache in (
+        ("from disk (uncached)", 0, True),
+        ("whole lists, cached", 0, False),
+        (f"{args.sample_sizes[0]} sampled, cached", args.sample_sizes[0], False),
+    ):
+        name_loader.settings.NAME_POOL_SAMPLE_SIZE = sample_size
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            if clear_cache:
+                name_loader._name_pool.cache_clear()
+                name_loader._formatted_name_pool.cache_clear()
+            name_loader.load_names_for_theme("fantasy")
+        per_call = (time.perf_counter() - start) / args.iterations * 1e6
+        print(f"  {label:<28} {per_call:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Benchmark every generation and search RPC offline, with the fake AI provider.
+
+Runs an in-process gRPC server with AI_PROVIDER=fake (deterministic outputs,
+simulated LLM latency and token counts from the FAKE_LLM_* settings) and
+drives each scenario through a real channel: the Generate* streams,
+GenerateAll (unary and streamed), GenerateFullStory, GenerateEmbedding (search query and content)
+and RerankResults at several result set sizes. Reports throughput, p50/p99
+latency, errors and peak RSS per scenario, so regressions in orchestration
+overhead show up without a model.
+
+Usage (from python-service/):
+    python -m benchmarks.offline_rpcs --requests 20 --concurrency 4 --llm-latency-ms 20
+    python -m benchmarks.offline_rpcs --only RerankResults
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import resource
+import statistics
+import time
+
+from benchmarks import make_parser
+from benchmarks.grpc_load import WORDS, percentile
+
+THEME = "fantasy"
+
+
+def lore_piece(kind: str, index: int = 0):
+    import lore_pb2  # type: ignore
+
+    return lore_pb2.LorePiece(
+        name=f"Benchmark {kind} {index}",
+        description=" ".join(random.Random(index).choices(WORDS, k=60)),
+        details={"summary": "A benchmark fixture."},
+        type=kind,
+    )
+
+
+def scenarios(args: argparse.Namespace) -> dict:
+    """Scenario name -> (async function(stub, index), calls the LLM)."""
+    import lore_pb2  # type: ignore
+
+    from services.fake_llm import get_fake_embedding_model
+
+    embedder = get_fake_embedding_model()
+
+    async def stream(call, request):
+        async for _ in call(request):
+            pass
+
+    def rerank(world_count: int):
+        rng = random.Random(world_count)
+        worlds = [
+            lore_pb2.WorldResult(
+                title=f"World {i}",
+                theme=THEME,
+                full_story=" ".join(rng.choices(WORDS, k=150)),
+                relevance=rng.random(),
+                embedding=embedder.embed_query(f"world {i}"),
+            )
+            for i in range(world_count)
+        ]
+        request = lore_pb2.RerankSearchRequest(
+            query="ancient dragon empire",
+            worlds=worlds,
+            query_embedding=embedder.embed_query("ancient dragon empire"),
+        )
+        return lambda stub, _: stub.RerankResults(request)
+
+    count = args.count
+    setting = lore_piece("setting")
+    event = lore_piece("event")
+    pieces = lore_pb2.SelectedLorePieces(
+        character=lore_piece("character"),
+        faction=lore_piece("faction"),
+        setting=setting,
+        event=event,
+        relic=lore_piece("relic"),
+    )
+    long_text = " ".join(random.Random(1).choices(WORDS, k=300))
+
+    return {
+        "GenerateCharacters": lambda stub, _: stream(
+            stub.GenerateCharacters,
+            lore_pb2.CharactersRequest(theme=THEME, count=count),
+        ),
+        "GenerateFactions": lambda stub, _: stream(
+            stub.GenerateFactions, lore_pb2.FactionsRequest(theme=THEME, count=count)
+        ),
+        "GenerateSettings": lambda stub, _: stream(
+            stub.GenerateSettings, lore_pb2.SettingsRequest(theme=THEME, count=count)
+        ),
+        "GenerateEvents": lambda stub, _: stream(
+            stub.GenerateEvents,
+            lore_pb2.EventsRequest(theme=THEME, count=count, selected_setting=setting),
+        ),
+        "GenerateRelics": lambda stub, _: stream(
+            stub.GenerateRelics,
+            lore_pb2.RelicsRequest(
+                theme=THEME,
+                count=count,
+                selected_setting=setting,
+                selected_event=event,
+            ),
+        ),
+        "GenerateAll": lambda stub, _: stub.GenerateAll(
+            lore_pb2.AllRequest(theme=THEME, count=count)
+        ),
+        "GenerateAllStream": lambda stub, _: stream(
+            stub.GenerateAllStream, lore_pb2.AllRequest(theme=THEME, count=count)
+        ),
+        "GenerateFullStory": lambda stub, _: stub.GenerateFullStory(
+            lore_pb2.FullStoryRequest(pieces=pieces, theme=THEME)
+        ),
+        "GenerateEmbedding (query)": lambda stub, index: stub.GenerateEmbedding(
+            lore_pb2.EmbeddingRequest(text=f"ruined {WORDS[index % len(WORDS)]} city")
+        ),
+        "GenerateEmbedding (content)": lambda stub, _: stub.GenerateEmbedding(
+            lore_pb2.EmbeddingRequest(text=long_text)
+        ),
+        **{
+            f"RerankResults ({size} worlds)": rerank(size) for size in args.rerank_sizes
+        },
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS of this process (server and client) so far."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run_scenario(stub, call, args: argparse.Namespace) -> dict:
+    import grpc  # type: ignore
+
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(index: int):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call(stub, index)
+            except grpc.aio.AioRpcError:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    return {
+        "elapsed": time.perf_counter() - start,
+        "latencies": latencies,
+        "errors": errors,
+    }
+
+
+async def run(args: argparse.Namespace):
+    import grpc  # type: ignore
+    import lore_pb2_grpc  # type: ignore
+
+    from lore_servicer import LoreServicer
+    from search.rerank_executor import close_rerank_executor, warm_up_rerank_executor
+    from services.grpc_metrics import RpcMetricsInterceptor
+
+    server = grpc.aio.server(interceptors=[RpcMetricsInterceptor()])
+    lore_pb2_grpc.add_LoreServiceServicer_to_server(LoreServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    await warm_up_rerank_executor()
+
+    print(
+        f"{args.requests} requests per scenario, {args.concurrency} at once, "
+        f"count={args.count}, fake LLM {args.llm_latency_ms} ms + "
+        f"{args.ms_per_token} ms/token"
+    )
+    print(
+        f"  {'scenario':<30} {'req/s':>7} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'errors':>6} {'peak RSS':>9}"
+    )
+    async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+        stub = lore_pb2_grpc.LoreServiceStub(channel)
+        for name, call in scenarios(args).items():
+            if args.only and not name.startswith(args.only):
+                continue
+            result = await run_scenario(stub, call, args)
+            latencies = result["latencies"] or [0.0]
+            print(
+                f"  {name:<30} {len(result['latencies']) / result['elapsed']:7.1f} "
+                f"{statistics.median(latencies) * 1000:8.1f} "
+                f"{percentile(latencies, 0.99) * 1000:8.1f} "
+                f"{result['errors']:6d} {peak_rss_mb():7.0f}MB"
+            )
+
+    await server.stop(None)
+    close_rerank_executor()
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--count", type=int, default=3, help="Variants per Generate*")
+    parser.add_argument("--llm-latency-ms", type=int, default=0)
+    parser.add_argument("--ms-per-token", type=float, default=0.0)
+    parser.add_argument("--rerank-sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--only", help="Run scenarios starting with this name")
+    args = parser.parse_args()
+
+    # Read when the service modules load their settings
+    os.environ.update(
+        AI_PROVIDER="fake",
+        FAKE_LLM_LATENCY_MS=str(args.llm_latency_ms),
+        FAKE_LLM_MS_PER_TOKEN=str(args.ms_per_token),
+        ENABLE_IMAGE_GENERATION="false",  # No portrait jobs to publish
+        LANGFUSE_ENABLED="false",
+    )
+    logging.getLogger("loresmith").setLevel(logging.ERROR)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark R2 uploads: blocking put_object on the event loop vs the upload pool.
+
+Uploads one world's worth of images (portraits plus a large scene that goes
+through multipart) to an in-process S3 stand-in (moto) and reports total
+time, the longest event loop stall seen while uploading, and the
+loresmith_r2_upload_duration_seconds histogram.
+
+Usage (from python-service/):
+    python -m benchmarks.r2_uploads --portraits 8 --scene-mb 12
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+import boto3
+from moto import mock_aws
+
+from benchmarks import make_parser
+
+BUCKET = "loresmith-benchmark"
+
+
+async def measure_loop_stall(stop: asyncio.Event) -> float:
+    """Longest gap between ticks of a 10ms timer while uploads run."""
+    worst = 0.0
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(0.01)
+        worst = max(worst, time.perf_counter() - before - 0.01)
+    return worst
+
+
+async def run(images: list[tuple[str, bytes]], blocking: bool) -> tuple[float, float]:
+    from services.object_storage import s3_client, upload_object
+
+    async def upload_blocking(key: str, data: bytes):
+        # Previous behaviour: async function calling boto3 directly
+        s3_client.put_object(Bucket=BUCKET, Key=key, Body=data, ContentType="image/png")
+
+    stop = asyncio.Event()
+    stall_task = asyncio.create_task(measure_loop_stall(stop))
+    await asyncio.sleep(0.02)
+
+    start = time.perf_counter()
+    if blocking:
+        for key, data in images:
+            await upload_blocking(key, data)
+    else:
+        await asyncio.gather(
+            *(
+                upload_object(
+                    BUCKET,
+                    key,
+                    data,
+                    image_type=(
+                        "world_scene" if key.startswith("worlds/") else "portrait"
+                    ),
+                )
+                for key, data in images
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    return elapsed, await stall_task
+
+
+def print_histogram():
+    from services.object_storage import r2_upload_duration_histogram
+
+    for metric in r2_upload_duration_histogram.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_bucket"):
+                labels = sample.labels
+                print(
+                    f"  {labels['image_type']:<10} le={labels['le']:<6} {sample.value:.0f}"
+                )
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--portraits", type=int, default=8)
+    parser.add_argument("--portrait-kb", type=int, default=1500)
+    parser.add_argument("--scene-mb", type=int, default=12)
+    args = parser.parse_args()
+
+    # R2 client is created at import time from these settings
+    os.environ.update(
+        AWS_ACCESS_KEY_ID="benchmark",
+        AWS_SECRET_ACCESS_KEY="benchmark",
+        AWS_ENDPOINT_URL="https://s3.amazonaws.com",
+    )
+    logging.getLogger("loresmith").setLevel(logging.WARNING)
+
+    with mock_aws():
+        from services.object_storage import s3_client
+
+        assert s3_client is not None
+        # moto buckets are visible from every region, and us-east-1 needs no
+        # LocationConstraint (R2's "auto" isn't a valid AWS one)
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+
+        images = [
+            (f"portraits/{i}.png", os.urandom(args.portrait_kb * 1024))
+            for i in range(args.portraits)
+        ]
+        images.append(("worlds/scene.png", os.urandom(args.scene_mb * 1024 * 1024)))
+
+        print(
+            f"{args.portraits} portraits x {args.portrait_kb} KB + "
+            f"{args.scene_mb} MB scene (multipart)"
+        )
+        for label, blocking in (("blocking put_object", True), ("upload pool", False)):
+            elapsed, stall = asyncio.run(run(images, blocking))
+            print(
+                f"{label}: {elapsed:.2f}s total, worst loop stall {stall * 1000:.0f} ms"
+            )
+
+        print("loresmith_r2_upload_duration_seconds (upload pool):")
+        print_histogram()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark portrait storage in Redis: legacy vs pooled async client.
+
+Legacy: a new synchronous client per call, base64 strings, one GET per portrait.
+Current: the shared async client, raw image bytes, pipelined batch get/set.
+
+Runs against fakeredis, so the numbers cover client overhead, encoding and
+payload size but not real network round trips (which pipelining saves on top).
+
+Usage (from python-service/):
+    python -m benchmarks.redis_portraits --portraits 8 --rounds 50
+"""
+
+import asyncio
+import base64
+import logging
+import os
+import time
+import uuid as uuid_lib
+from typing import cast
+
+import fakeredis
+
+import services.redis as redis_service
+from benchmarks import make_parser
+from services.image_gen.portraits.operations import get_portraits, store_portraits
+from utils.logger import logger
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def make_portraits(count: int, size_bytes: int) -> dict[str, bytes]:
+    """Random PNG-like payloads keyed by character UUID."""
+    return {
+        str(uuid_lib.uuid4()): PNG_SIGNATURE + os.urandom(size_bytes)
+        for _ in range(count)
+    }
+
+
+def run_legacy(
+    server: fakeredis.FakeServer, portraits: dict[str, bytes], rounds: int
+) -> float:
+    """Old path: new client per call, base64 encode/decode, sequential GETs."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for uuid, image_data in portraits.items():
+            client = fakeredis.FakeRedis(server=server)
+            client.setex(
+                f"portrait:{uuid}", 3600, base64.b64encode(image_data).decode("utf-8")
+            )
+        for uuid in portraits:
+            client = fakeredis.FakeRedis(server=server)
+            data = cast(bytes | None, client.get(f"portrait:{uuid}"))
+            assert data is not None
+            base64.b64decode(data)
+    return time.perf_counter() - start
+
+
+async def run_pooled(portraits: dict[str, bytes], rounds: int) -> float:
+    """New path: shared async client, raw bytes, pipelined batch set/get."""
+    uuids = list(portraits)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await store_portraits(portraits)
+        results = await get_portraits(uuids)
+        assert all(results.values())
+    return time.perf_counter() - start
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--portraits", type=int, default=8, help="Portraits per batch")
+    parser.add_argument("--size-kb", type=int, default=1500, help="Portrait size in KB")
+    parser.add_argument("--rounds", type=int, default=50, help="Store+get rounds")
+    args = parser.parse_args()
+
+    # Per-call store logs would dominate the timings
+    logger.setLevel(logging.WARNING)
+
+    portraits = make_portraits(args.portraits, args.size_kb * 1024)
+    server = fakeredis.FakeServer()
+
+    legacy_seconds = run_legacy(server, portraits, args.rounds)
+    legacy_values = cast(
+        list[bytes],
+        fakeredis.FakeRedis(server=server).mget(
+            [f"portrait:{uuid}" for uuid in portraits]
+        ),
+    )
+    legacy_bytes = sum(len(value) for value in legacy_values)
+
+    server = fakeredis.FakeServer()
+    redis_service._redis_client = fakeredis.FakeAsyncRedis(server=server)
+    pooled_seconds = asyncio.run(run_pooled(portraits, args.rounds))
+    pooled_bytes = sum(len(image_data) for image_data in portraits.values())
+
+    ops = args.portraits * args.rounds
+    print(f"{args.portraits} portraits x {args.size_kb} KB, {args.rounds} rounds")
+    print(
+        f"legacy (client per call, base64): {legacy_seconds:.3f}s "
+        f"({legacy_seconds / ops * 1000:.2f} ms/portrait), "
+        f"{legacy_bytes / 1024 / 1024:.1f} MB stored"
+    )
+    print(
+        f"pooled (shared async, raw bytes, pipelined): {pooled_seconds:.3f}s "
+        f"({pooled_seconds / ops * 1000:.2f} ms/portrait), "
+        f"{pooled_bytes / 1024 / 1024:.1f} MB stored"
+    )
+    print(f"speedup: {legacy_seconds / pooled_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
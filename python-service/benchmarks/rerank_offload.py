@@ -0,0 +1,141 @@
+"""
+Benchmark search reranking inline on the event loop vs in the rerank pool.
+
+Fires concurrent rerank requests (fusion + Dartboard over synthetic worlds
+with random embeddings) while a 10ms ticker stands in for other streams on
+the same event loop, and reports request latency, how late the ticker ran
+(p99 and worst), and how many requests fell back to fused-only or vector
+order under the latency budget.
+
+Usage (from python-service/):
+    python -m benchmarks.rerank_offload --requests 40 --concurrency 8 --worlds 60
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+
+import numpy as np
+
+from benchmarks import make_parser
+from benchmarks.grpc_load import WORDS
+
+
+def synthetic_worlds(rng: random.Random, count: int, dimensions: int) -> list[dict]:
+    np_rng = np.random.default_rng(rng.randrange(2**32))
+    worlds = []
+    for i in range(count):
+        embedding = np_rng.standard_normal(dimensions)
+        worlds.append(
+            {
+                "title": f"World {i}",
+                "theme": "fantasy",
+                "full_story": " ".join(rng.choices(WORDS, k=300)),
+                "relevance": rng.random(),
+                "embedding": (embedding / np.linalg.norm(embedding)).tolist(),
+            }
+        )
+    return worlds
+
+
+async def ticker(stop: asyncio.Event, lags: list[float]):
+    """Stand-in for a generation stream: wants to run every 10ms."""
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(max(time.perf_counter() - before - 0.01, 0))
+
+
+async def run(args: argparse.Namespace, mode: str) -> dict:
+    from search import rerank_executor
+    from search.rerank_executor import (
+        close_rerank_executor,
+        rerank_requests_counter,
+        rerank_worlds,
+        settings,
+        warm_up_rerank_executor,
+    )
+
+    settings.RERANK_EXECUTOR = mode
+    rerank_executor._executor = None
+    await warm_up_rerank_executor()
+
+    rng = random.Random(7)
+    requests = [
+        (" ".join(rng.choices(WORDS, k=4)), synthetic_worlds(rng, args.worlds, 768))
+        for _ in range(4)
+    ]
+    query_embedding = np.random.default_rng(1).standard_normal(768)
+    query_embedding = (query_embedding / np.linalg.norm(query_embedding)).tolist()
+
+    def outcomes() -> dict[str, float]:
+        return {
+            outcome: rerank_requests_counter.labels(outcome=outcome)._value.get()
+            for outcome in ("full", "fused_only", "vector_only", "shed")
+        }
+
+    before = outcomes()
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(stop, lags))
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def request(index: int):
+        query, worlds = requests[index % len(requests)]
+        async with semaphore:
+            start = time.perf_counter()
+            await rerank_worlds(query, worlds, query_embedding)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker_task
+    close_rerank_executor()
+
+    after = outcomes()
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "lags": lags,
+        "outcomes": {
+            k: int(after[k] - before[k]) for k in after if after[k] > before[k]
+        },
+    }
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--worlds", type=int, default=60)
+    parser.add_argument("--budget-ms", type=int, default=1500)
+    args = parser.parse_args()
+
+    logging.getLogger("loresmith").setLevel(logging.ERROR)
+    from search.rerank_executor import settings
+
+    settings.RERANK_BUDGET_MS = args.budget_ms
+    print(
+        f"{args.requests} reranks of {args.worlds} worlds, {args.concurrency} at once, "
+        f"{settings.RERANK_WORKERS} pool workers, {args.budget_ms} ms budget"
+    )
+    for mode in ("inline", "thread", "process"):
+        result = asyncio.run(run(args, mode))
+        lags = sorted(result["lags"])
+        p99_lag = lags[int(len(lags) * 0.99)] if lags else 0
+        print(
+            f"  {mode:<8} {result['elapsed']:5.2f}s total  "
+            f"latency p50 {statistics.median(result['latencies']) * 1000:6.0f} ms  "
+            f"loop lag p99 {p99_lag * 1000:5.0f} ms, worst {max(lags, default=0) * 1000:5.0f} ms  "
+            f"{result['outcomes']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
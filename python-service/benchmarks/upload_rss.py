@@ -0,0 +1,166 @@
+"""
+Peak server memory for concurrent image uploads: unary base64 vs streaming.
+
+Starts the gRPC server in a subprocess against an in-process S3 stand-in
+(moto, spilling objects to disk), sends N concurrent uploads with either
+UploadImageToR2 (whole image as base64 in one message) or UploadImage
+(raw bytes in 64 KiB chunks), and reports the server's peak RSS growth
+(VmHWM) over its idle baseline.
+
+Usage (from python-service/):
+    python -m benchmarks.upload_rss --uploads 8 --image-mb 12
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import subprocess
+import sys
+
+import grpc
+
+import lore_pb2
+import lore_pb2_grpc
+from benchmarks import make_parser
+
+CHUNK_SIZE = 64 * 1024
+BUCKETS = ("loresmith-portraits", "loresmith-world-images")
+
+
+def read_peak_rss_mb(pid: int) -> float:
+    """Peak resident set size (VmHWM) of a process in MB."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("VmHWM not available")
+
+
+def reset_peak_rss(pid: int):
+    """Reset VmHWM to the current RSS (Linux: write 5 to clear_refs)."""
+    with open(f"/proc/{pid}/clear_refs", "w") as f:
+        f.write("5")
+
+
+async def serve(port: int):
+    """Run the LoreServicer on `port` against moto (subprocess entry point)."""
+    from moto import mock_aws
+
+    with mock_aws():
+        import boto3
+
+        from lore_servicer import LoreServicer
+
+        s3 = boto3.client("s3", region_name="us-east-1")
+        for bucket in BUCKETS:
+            s3.create_bucket(Bucket=bucket)
+
+        max_msg_size = 64 * 1024 * 1024
+        server = grpc.aio.server(
+            options=[("grpc.max_receive_message_length", max_msg_size)]
+        )
+        lore_pb2_grpc.add_LoreServiceServicer_to_server(LoreServicer(), server)
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        await server.start()
+        print("ready", flush=True)
+        await server.wait_for_termination()
+
+
+async def upload_unary(stub, image: bytes, index: int):
+    response = await stub.UploadImageToR2(
+        lore_pb2.UploadImageRequest(
+            image_base64=base64.b64encode(image).decode("utf-8"),
+            world_id=1,
+            character_id=str(index),
+            image_type="portrait",
+        )
+    )
+    assert response.image_url
+
+
+async def upload_stream(stub, image: bytes, index: int):
+    async def chunks():
+        yield lore_pb2.UploadImageChunk(
+            metadata=lore_pb2.UploadImageMetadata(
+                world_id=1, character_id=str(index), image_type="portrait"
+            )
+        )
+        view = memoryview(image)
+        for offset in range(0, len(image), CHUNK_SIZE):
+            yield lore_pb2.UploadImageChunk(
+                data=bytes(view[offset : offset + CHUNK_SIZE])
+            )
+
+    response = await stub.UploadImage(chunks())
+    assert response.image_url
+
+
+async def run_client(port: int, mode: str, uploads: int, image: bytes):
+    max_msg_size = 64 * 1024 * 1024
+    async with grpc.aio.insecure_channel(
+        f"127.0.0.1:{port}",
+        options=[("grpc.max_send_message_length", max_msg_size)],
+    ) as channel:
+        stub = lore_pb2_grpc.LoreServiceStub(channel)
+        upload = upload_unary if mode == "unary" else upload_stream
+        await asyncio.gather(*(upload(stub, image, i) for i in range(uploads)))
+
+
+def measure(mode: str, args: argparse.Namespace) -> float:
+    env = dict(
+        os.environ,
+        AWS_ACCESS_KEY_ID="benchmark",
+        AWS_SECRET_ACCESS_KEY="benchmark",
+        AWS_ENDPOINT_URL="https://s3.amazonaws.com",
+        R2_PORTRAITS_BUCKET_NAME=BUCKETS[0],
+        R2_WORLD_IMAGES_BUCKET_NAME=BUCKETS[1],
+        MOTO_S3_DEFAULT_KEY_BUFFER_SIZE="1",  # Keep stored objects out of RSS
+        LANGFUSE_ENABLED="false",
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.upload_rss", "--serve", str(args.port)],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        assert server.stdout is not None
+        for line in server.stdout:
+            if line.strip() == "ready":
+                break
+
+        image = os.urandom(args.image_mb * 1024 * 1024)
+        # Warm up code paths once, then measure from the idle baseline
+        asyncio.run(run_client(args.port, mode, 1, image))
+        reset_peak_rss(server.pid)
+        baseline = read_peak_rss_mb(server.pid)
+
+        asyncio.run(run_client(args.port, mode, args.uploads, image))
+        return read_peak_rss_mb(server.pid) - baseline
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--uploads", type=int, default=8)
+    parser.add_argument("--image-mb", type=int, default=12)
+    parser.add_argument("--port", type=int, default=50071)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(serve(args.serve))
+        return
+
+    print(f"{args.uploads} concurrent uploads x {args.image_mb} MB")
+    for mode in ("unary", "stream"):
+        growth = measure(mode, args)
+        print(f"{mode:>6}: server peak RSS +{growth:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
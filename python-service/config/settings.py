@@ -11,7 +11,7 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    AI_PROVIDER: str = "local"  # Options: 'local', 'openrouter'
+    AI_PROVIDER: str = "local"  # Options: 'local', 'openrouter', 'fake' (offline)
     OPENROUTER_API_KEY: str = ""
     OPENROUTER_MODEL: str = "gpt-5"
     OPENROUTER_EMBEDDING_MODEL: str = "text-embedding-3-small"
@@ -20,11 +20,73 @@ class Settings(BaseSettings):
     LOCAL_EMBEDDING_MODEL: str = "nomic-embed-text"
     OLLAMA_URL: str = "http://host.docker.internal:11434"
 
+    # LLM Model Tiers: each chain step declares a tier ('short': names and picks,
+    # 'structured': JSON fields, 'long': prose); unset = the provider's main model
+    OPENROUTER_MODEL_SHORT: str = ""
+    OPENROUTER_MODEL_STRUCTURED: str = ""
+    OPENROUTER_MODEL_LONG: str = ""
+    LOCAL_MODEL_SHORT: str = ""
+    LOCAL_MODEL_STRUCTURED: str = ""
+    LOCAL_MODEL_LONG: str = ""
+    LLM_TIER_FALLBACK: bool = True  # Retry a failed step on the next tier's model
+
+    # Fake AI Provider Settings (AI_PROVIDER=fake, deterministic offline outputs)
+    FAKE_LLM_LATENCY_MS: int = 0  # Simulated time per call
+    FAKE_LLM_MS_PER_TOKEN: float = 0.0  # Plus this per completion token
+    FAKE_LLM_COMPLETION_TOKENS: int = 0  # Per call (0 = half of max_tokens)
+    FAKE_EMBEDDING_DIMENSIONS: int = 768
+
+    # GenerateAll: lore pieces generated at once across calls (per server worker)
+    LORE_PIPELINE_CONCURRENCY: int = 8
+
+    # Lore Pool: pre-generated characters, factions and settings per theme,
+    # kept in Redis and refilled while the worker is idle
+    LORE_POOL_ENABLED: bool = False
+    LORE_POOL_TARGET: int = 6  # Pieces kept per kind and theme
+    LORE_POOL_THEMES: str = ""  # Comma-separated themes to stock ('' = all)
+    LORE_POOL_REFILL_INTERVAL_SECONDS: float = 5  # Idle check when nothing to do
+    LORE_POOL_MAX_AGE_SECONDS: int = 86400  # Older pieces are discarded
+
+    # Full story generation: 'chained' (story, quest title, quest description as
+    # 3 calls), 'combined' (story + quest in one structured call), or 'ab'
+    # (random split between the two, compare via loresmith_full_story_* metrics)
+    FULL_STORY_MODE: str = "chained"
+    FULL_STORY_AB_COMBINED_RATIO: float = 0.5
+
+    # Character traits and flaw: 'llm' (one LLM call each), or picked locally
+    # from the appearance and backstory by 'keywords' or 'embeddings'
+    CHARACTER_SELECTION_MODE: str = "llm"
+
+    # Character name prompt: random first/last names per prompt (0 = whole lists),
+    # skipping name parts recently generated for the theme
+    NAME_POOL_SAMPLE_SIZE: int = 0
+    NAME_POOL_RECENT_EXCLUSION: int = 50
+
     LANGFUSE_PUBLIC_KEY: str = ""
     LANGFUSE_SECRET_KEY: str = ""
     LANGFUSE_HOST: str = "https://cloud.langfuse.com"
     LANGFUSE_ENABLED: bool = True
 
+    # gRPC Server Settings
+    GRPC_PORT: int = 50051
+    GRPC_SERVER_WORKERS: int = 1  # Server processes sharing the port (SO_REUSEPORT)
+    GRPC_SHUTDOWN_GRACE_SECONDS: int = 30  # In-flight RPCs get this long on SIGTERM
+    GRPC_METRICS_PORT: int = 0  # Worker N exports on this port + N (0 = disabled)
+    GRPC_WORKER_RESTART_BACKOFF_SECONDS: float = 1  # Doubles per fast failure
+    GRPC_WORKER_MIN_UPTIME_SECONDS: float = 60  # Exits sooner are fast failures
+    GRPC_WORKER_MAX_FAST_FAILURES: int = 5  # In a row, then the server exits (1)
+
+    # Event Loop Instrumentation (per server worker, 0 = disabled)
+    LOOP_LAG_INTERVAL_SECONDS: float = 0.25  # Lag sampling period
+    SLOW_CALLBACK_THRESHOLD_MS: int = 500  # Log the loop's stack when blocked this long
+    RPC_PHASE_METRICS: bool = True  # Per-RPC queue/LLM/on-loop/CPU time histograms
+
+    # Search Rerank Settings (fusion + Dartboard run off the event loop)
+    RERANK_EXECUTOR: str = "process"  # Options: 'process', 'thread', 'inline'
+    RERANK_WORKERS: int = 2  # Pool size per server worker (spaCy loaded in each)
+    RERANK_MAX_PENDING: int = 16  # Pool jobs queued or running before shedding
+    RERANK_BUDGET_MS: int = 1500  # Then return fused-only (or vector order) results
+
     # Image Generation Settings
     ENABLE_IMAGE_GENERATION: bool = True
     IMAGE_PROVIDER: str = "local"  # Options: 'replicate', 'local'
@@ -33,6 +95,41 @@ class Settings(BaseSettings):
         "http://host.docker.internal:7860"  # For local Automatic1111 WebUI
     )
 
+    # Image Backend HTTP Settings (shared by all image providers)
+    IMAGE_HTTP_TIMEOUT_SECONDS: int = 180  # Default total timeout per request
+    IMAGE_HTTP_CONNECT_TIMEOUT_SECONDS: int = 10
+    IMAGE_HTTP_MAX_CONNECTIONS: int = 100
+    IMAGE_HTTP_MAX_CONNECTIONS_PER_HOST: int = 8
+    IMAGE_HTTP_RETRIES: int = 2  # Retries of failed requests (see http_request)
+
+    # Image Job Scheduling (priority classes, per-user fairness, load shedding)
+    IMAGE_BACKEND_CONCURRENCY: int = 2  # Backend calls at once in the API process
+    IMAGE_QUEUE_MAX_DEPTH_PORTRAIT: int = 64  # Waiting jobs before rejecting more
+    IMAGE_QUEUE_MAX_DEPTH_WORLD_SCENE: int = 8
+    IMAGE_DEGRADE_MODE: str = "reduce"  # Options: 'off', 'reduce', 'skip'
+    IMAGE_DEGRADE_BACKLOG: int = 12  # Backlog (jobs) at which degrade mode starts
+    IMAGE_DEGRADED_STEPS: int = 12  # Max sampling steps while degraded
+    IMAGE_DEGRADED_SCALE: float = 0.75  # Resolution multiplier while degraded
+
+    # Portrait Worker Settings
+    PORTRAIT_WORKER_PREFETCH: int = 4  # Unacked jobs the broker hands the worker
+    PORTRAIT_WORKER_CONCURRENCY: int = 2  # Jobs generated at once (backend capacity)
+    PORTRAIT_WORKER_METRICS_PORT: int = 0  # Prometheus exporter port (0 = disabled)
+    PORTRAIT_BATCH_MAX_SIZE: int = 4  # Jobs per Automatic1111 call (1 = no batching)
+    PORTRAIT_BATCH_WINDOW_MS: int = 200  # How long the first job waits for others
+    PORTRAIT_JOB_MAX_ATTEMPTS: int = 5  # Then the job goes to the dead-letter queue
+    PORTRAIT_JOB_RETRY_BASE_DELAY_SECONDS: int = 5  # Doubled after every attempt
+    PORTRAIT_JOB_RETRY_MAX_DELAY_SECONDS: int = 300
+
+    # Portrait Reuse Cache: serve a cached portrait with the same prompt signature
+    # (gender, theme, key appearance features, skill visuals) instead of generating
+    PORTRAIT_REUSE_POLICY: str = "never"  # Options: 'never', 'queue_depth', 'always'
+    PORTRAIT_REUSE_QUEUE_DEPTH: int = 20  # 'queue_depth': reuse above this backlog
+    PORTRAIT_REUSE_MAX_PER_SIGNATURE: int = 4  # Distinct portraits kept per signature
+    PORTRAIT_REUSE_TTL_SECONDS: int = 86400
+    PORTRAIT_REUSE_PHASH_ENABLED: bool = True  # Skip caching near-duplicate images
+    PORTRAIT_REUSE_PHASH_MAX_DISTANCE: int = 6  # Max differing bits of 64 to count
+
     # R2 Storage Settings (S3-compatible)
     AWS_ACCESS_KEY_ID: str = ""
     AWS_SECRET_ACCESS_KEY: str = ""
@@ -41,6 +138,17 @@ class Settings(BaseSettings):
     R2_PORTRAITS_PUBLIC_URL: str = ""
     R2_WORLD_IMAGES_BUCKET_NAME: str = ""
     R2_WORLD_IMAGES_PUBLIC_URL: str = ""
+    R2_UPLOAD_CONCURRENCY: int = 8  # Uploads running at once (thread pool size)
+    R2_MULTIPART_THRESHOLD_MB: int = 8  # Larger objects use multipart upload
+    R2_MULTIPART_CHUNK_SIZE_MB: int = 8  # R2 needs parts of at least 5 MB
+    R2_MULTIPART_CONCURRENCY: int = 4  # Parts uploaded in parallel per object
+
+    # Image Variant Settings (encoded next to the original PNG on upload)
+    IMAGE_VARIANT_FORMATS: str = "webp"  # Comma-separated: 'webp', 'avif' ('' = off)
+    IMAGE_THUMBNAIL_SIZES: str = "256,512"  # Longest edge in px, first format
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_AVIF_QUALITY: int = 60
+    IMAGE_TRANSCODE_WORKERS: int = 2  # Encoder processes
 
 
 @lru_cache()
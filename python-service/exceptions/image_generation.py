@@ -0,0 +1,32 @@
+from exceptions.base import LoreSmithException
+
+
+class ImageGenerationError(LoreSmithException):
+    """Base class for all image generation errors."""
+
+    pass
+
+
+class TransientImageGenerationError(ImageGenerationError):
+    """Image backend unreachable, timed out, rate limited or returned 5xx. Worth retrying."""
+
+    pass
+
+
+class PermanentImageGenerationError(ImageGenerationError):
+    """Invalid job, rejected prompt or misconfigured provider. Retrying will not help."""
+
+    pass
+
+
+class ImageJobRejectedError(TransientImageGenerationError):
+    """Image job queue is full or the job was shed under load. Retry later."""
+
+    pass
+
+
+def classify_http_status(status: int, message: str) -> ImageGenerationError:
+    """Map an image backend HTTP error status to a transient or permanent error."""
+    if status in (408, 429) or status >= 500:
+        return TransientImageGenerationError(message)
+    return PermanentImageGenerationError(message)
@@ -9,6 +9,25 @@ from collections import deque
 from typing import Set
 import random
 
+from utils.keyword_matcher import KeywordMatcher
+
+# Common appearance features to track, with the word forms that count as them
+_FEATURE_MATCHER = KeywordMatcher({
+    "goggles": ["goggles"], "monocle": ["monocle"], "top hat": ["top hat"],
+    "cane": ["cane"], "scar": ["scar", "scarred"], "tattoo": ["tattoo*"],
+    "piercing": ["piercing", "pierced"], "implant": ["implant*"],
+    "leather jacket": ["leather jacket"], "brass buttons": ["brass buttons"],
+    "tool belt": ["tool belt"], "flight jacket": ["flight jacket"],
+    "trench coat": ["trench coat"], "hood": ["hood*"],
+    "cybernetic eye": ["cybernetic eye"], "facial implant": ["facial implant*"],
+    "neon tattoo": ["neon tattoo*"], "gas mask": ["gas mask"],
+    "respirator": ["respirator"], "visor": ["visor"],
+    "mechanical arm": ["mechanical arm"], "prosthetic": ["prosthetic"],
+    "braid": ["braid*"], "mohawk": ["mohawk"], "bald": ["bald*"],
+    "dreadlocks": ["dreadlocks"], "beard": ["beard*"],
+    "mustache": ["mustache*"], "clean-shaven": ["clean-shaven"],
+})
+
 
 class AppearanceTracker:
     """Tracks recently used appearance features to ensure variety."""
@@ -40,27 +59,7 @@ class AppearanceTracker:
 
         Looks for common feature keywords in the appearance description.
         """
-        appearance_lower = appearance_text.lower()
-
-        # Common appearance features to track
-        feature_keywords = [
-            "goggles", "monocle", "top hat", "cane",
-            "scar", "tattoo", "piercing", "implant",
-            "leather jacket", "brass buttons", "tool belt",
-            "flight jacket", "trench coat", "hood",
-            "cybernetic eye", "facial implant", "neon tattoo",
-            "gas mask", "respirator", "visor",
-            "mechanical arm", "prosthetic",
-            "braid", "mohawk", "bald", "dreadlocks",
-            "beard", "mustache", "clean-shaven",
-        ]
-
-        found_features = []
-        for keyword in feature_keywords:
-            if keyword in appearance_lower:
-                found_features.append(keyword)
-
-        return found_features
+        return _FEATURE_MATCHER.labels(appearance_text)
 
 
 # Global singleton instance
@@ -73,6 +72,11 @@ def add_generated_features(appearance_text: str):
     _tracker.add_features(features)
 
 
+def extract_appearance_features(appearance_text: str) -> list[str]:
+    """Extract key appearance features from text without tracking them."""
+    return _tracker.extract_features_from_text(appearance_text)
+
+
 def get_excluded_features(limit: int = 15) -> list[str]:
     """Get recently used features to exclude from generation."""
     return _tracker.get_excluded_features(limit)
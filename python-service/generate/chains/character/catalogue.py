@@ -0,0 +1,84 @@
+"""
+Indexed, read-only views of the flaw templates and personality traits.
+
+flaw_templates.py and traits.py define the catalogue and its rules; this
+module builds the lookups once at import so character generation doesn't
+rescan them on every call:
+
+- flaws by ID and by category
+- the set of trait names, for validating LLM output
+- a compatibility bitmatrix (bit j of row i is set when traits i and j don't
+  oppose each other), so validating a selection is three bit tests
+- the trait list prompt text
+
+Look flaws and traits up through this module; tests/test_catalogue.py checks
+it exhaustively against plain scans of the catalogue.
+"""
+
+import random
+from types import MappingProxyType
+
+from . import traits
+from .flaw_templates import FLAW_TEMPLATES, FlawTemplate
+from .traits import PersonalityTrait, get_trait_list_for_prompt
+
+FLAW_IDS: tuple[str, ...] = tuple(flaw["id"] for flaw in FLAW_TEMPLATES)
+
+# First template wins on a duplicate ID, as with a scan
+FLAWS_BY_ID: MappingProxyType[str, FlawTemplate] = MappingProxyType(
+    {flaw["id"]: flaw for flaw in reversed(FLAW_TEMPLATES)}
+)
+
+FLAWS_BY_CATEGORY: MappingProxyType[str, tuple[FlawTemplate, ...]] = MappingProxyType(
+    {
+        category: tuple(f for f in FLAW_TEMPLATES if f["category"] == category)
+        for category in dict.fromkeys(f["category"] for f in FLAW_TEMPLATES)
+    }
+)
+
+TRAIT_NAMES: frozenset[str] = frozenset(trait.value for trait in PersonalityTrait)
+
+TRAIT_PROMPT: str = get_trait_list_for_prompt()
+
+_TRAIT_INDEX = {trait: index for index, trait in enumerate(PersonalityTrait)}
+
+_COMPATIBLE: tuple[int, ...] = tuple(
+    sum(
+        1 << j
+        for j, other in enumerate(PersonalityTrait)
+        if traits.are_traits_compatible(trait, other)
+    )
+    for trait in PersonalityTrait
+)
+
+
+def get_flaw_by_id(flaw_id: str) -> FlawTemplate | None:
+    """Get a specific flaw template by ID."""
+    return FLAWS_BY_ID.get(flaw_id)
+
+
+def get_flaws_by_category(category: str) -> list[FlawTemplate]:
+    """Get all flaws in a specific category."""
+    return list(FLAWS_BY_CATEGORY.get(category, ()))
+
+
+def get_random_flaw_ids(count: int = 10) -> list[str]:
+    """Get random flaw IDs for prompt variety."""
+    return random.sample(FLAW_IDS, min(count, len(FLAW_IDS)))
+
+
+def are_traits_compatible(trait1: PersonalityTrait, trait2: PersonalityTrait) -> bool:
+    """Check if two traits are compatible (not opposing)."""
+    return bool(_COMPATIBLE[_TRAIT_INDEX[trait1]] >> _TRAIT_INDEX[trait2] & 1)
+
+
+def validate_trait_selection(selection: list[PersonalityTrait]) -> bool:
+    """
+    Validate that a selection of 3 traits is compatible.
+    Returns True if all traits are compatible with each other.
+    """
+    if len(selection) != 3:
+        return False
+
+    a, b, c = (_TRAIT_INDEX[trait] for trait in selection)
+    return bool(_COMPATIBLE[a] >> b & _COMPATIBLE[a] >> c & _COMPATIBLE[b] >> c & 1)
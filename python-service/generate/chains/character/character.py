@@ -7,6 +7,7 @@ from langchain_core.output_parsers import StrOutputParser
 
 from langfuse import observe
 
+from config.settings import get_settings
 from utils.blacklist import BLACKLIST
 from utils.logger import logger
 from .appearance_tracker import (
@@ -14,32 +15,34 @@ from .appearance_tracker import (
     get_excluded_features,
     add_generated_features,
 )
-from .name_loader import load_names_for_theme
+from .local_selection import select_flaw_locally, select_traits_locally
+from .name_loader import add_used_name, load_names_for_theme
 from generate.models.lore_piece import LorePiece
-from .flaw_templates import (
-    FlawTemplate,
+from .flaw_templates import FlawTemplate
+from .catalogue import (
+    TRAIT_NAMES,
+    TRAIT_PROMPT,
     get_flaw_by_id,
     get_random_flaw_ids,
+    validate_trait_selection,
 )
 from services.llm_client import (
     get_llm,
+    llm_step,
     increment_success_counter,
     increment_failure_counter,
 )
 from exceptions.generation import CharacterGenerationError
 from utils.format_text import clean_ai_text
-from .traits import (
-    PersonalityTrait,
-    get_trait_list_for_prompt,
-    get_all_trait_names,
-    validate_trait_selection,
-)
+from .traits import PersonalityTrait
 from generate.models.structured_llm_output.character_schema import (
     CharacterTraits,
     CharacterSkills,
     CharacterStats,
 )
 
+settings = get_settings()
+
 blacklist_str = ", ".join(BLACKLIST["words"] + BLACKLIST["full_names"])
 
 
@@ -72,7 +75,7 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
             name_prompt_text = f.read()
 
         name_prompt = PromptTemplate.from_template(name_prompt_text)
-        name_llm = get_llm(max_tokens=50)
+        name_llm = get_llm(max_tokens=50, tier="short")
         name_chain = name_prompt | name_llm | StrOutputParser()
         name_raw = await name_chain.ainvoke(
             {
@@ -81,9 +84,11 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
                 "first_names": first_names,
                 "last_names": last_names,
                 "blacklist": blacklist_str,
-            }
+            },
+            config=llm_step("character", "name"),
         )
         name = clean_ai_text(name_raw)
+        add_used_name(theme, name)
         logger.info(f"Generated character name: {name}")
 
         current_step += 1
@@ -104,7 +109,7 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
         )
 
         appearance_prompt = PromptTemplate.from_template(appearance_prompt_text)
-        appearance_llm = get_llm(max_tokens=250)
+        appearance_llm = get_llm(max_tokens=250, tier="long")
         appearance_chain = appearance_prompt | appearance_llm | StrOutputParser()
         appearance_raw = await appearance_chain.ainvoke(
             {
@@ -115,7 +120,8 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
                 "build": constraints["build"],
                 "distinctive_feature": constraints["distinctive_feature"],
                 "excluded_features": excluded_features_str,
-            }
+            },
+            config=llm_step("character", "appearance"),
         )
         appearance = clean_ai_text(appearance_raw)
         logger.info(
@@ -134,7 +140,7 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
             backstory_prompt_text = f.read()
 
         backstory_prompt = PromptTemplate.from_template(backstory_prompt_text)
-        backstory_llm = get_llm(max_tokens=200)
+        backstory_llm = get_llm(max_tokens=200, tier="long")
         backstory_chain = backstory_prompt | backstory_llm | StrOutputParser()
         backstory_raw = await backstory_chain.ainvoke(
             {
@@ -142,7 +148,8 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
                 "theme_references": theme_references,
                 "name": name,
                 "appearance": appearance,
-            }
+            },
+            config=llm_step("character", "backstory"),
         )
         backstory = clean_ai_text(backstory_raw)
         logger.info(f"Generated backstory for {name}")
@@ -152,50 +159,15 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
             await progress_callback(current_step, total_steps, "Generated backstories...")
 
         # Generate Personality Traits
-        with open("generate/prompts/character/character_traits.txt", "r") as f:
-            traits_prompt_text = f.read()
-
-        traits_prompt = PromptTemplate.from_template(traits_prompt_text)
-        traits_llm = get_llm(max_tokens=50).with_structured_output(CharacterTraits)
-        traits_chain = traits_prompt | traits_llm
-
-        # Get the formatted trait list for the prompt
-        trait_list = get_trait_list_for_prompt()
-
         try:
-            traits_result = cast(
-                CharacterTraits,
-                await traits_chain.ainvoke(
-                    {
-                        "theme": theme,
-                        "theme_references": theme_references,
-                        "name": name,
-                        "appearance": appearance,
-                        "backstory": backstory,
-                        "trait_list": trait_list,
-                    }
-                ),
-            )
-            # LLM returns validated list of trait names directly
-            trait_names = traits_result.traits
-
-            # Convert to PersonalityTrait enums
-            personality_traits = []
-            all_valid_traits = get_all_trait_names()
-
-            for trait_name in trait_names:
-                if trait_name in all_valid_traits:
-                    personality_traits.append(PersonalityTrait(trait_name))
-                else:
-                    logger.warning(
-                        f"Invalid trait '{trait_name}' from LLM, will use fallback"
-                    )
-
-            # Validate we have exactly 3 compatible traits
-            if len(personality_traits) != 3 or not validate_trait_selection(
-                personality_traits
-            ):
-                raise ValueError(f"Invalid trait selection: {trait_names}")
+            if settings.CHARACTER_SELECTION_MODE == "llm":
+                personality_traits = await _select_traits_with_llm(
+                    theme, theme_references, name, appearance, backstory
+                )
+            else:
+                personality_traits = await select_traits_locally(
+                    theme, appearance, backstory
+                )
 
             logger.info(
                 f"Generated traits for {name}: {[t.value for t in personality_traits]}"
@@ -254,7 +226,7 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
             skills_prompt_text = f.read()
 
         skills_prompt = PromptTemplate.from_template(skills_prompt_text)
-        skills_llm = get_llm(max_tokens=70).with_structured_output(CharacterSkills)
+        skills_llm = get_llm(max_tokens=70, tier="short").with_structured_output(CharacterSkills)
         skills_chain = skills_prompt | skills_llm
 
         try:
@@ -267,7 +239,8 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
                         "name": name,
                         "personality": ", ".join(traits_list),
                         "appearance": appearance,
-                    }
+                    },
+                    config=llm_step("character", "skills"),
                 ),
             )
             # LLM returns validated list of skills directly
@@ -288,35 +261,22 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
         if progress_callback:
             await progress_callback(current_step, total_steps, "Generated skills...")
 
-        # Generate Flaw
-        with open("generate/prompts/character/character_flaw.txt", "r") as f:
-            flaw_prompt_text = f.read()
-
-        # Get 10 random flaw template IDs and format them for the prompt
+        # Generate Flaw from 10 random flaw templates
         flaw_ids = get_random_flaw_ids(10)
-        flaw_options_list = []
-        for flaw_id in flaw_ids:
-            template = get_flaw_by_id(flaw_id)
-            if template:
-                flaw_options_list.append(
-                    f"{template['id']}: {template['name']} - {template['description']}"
-                )
-        flaw_options = "\n".join(flaw_options_list)
 
-        flaw_prompt = PromptTemplate.from_template(flaw_prompt_text)
-        flaw_llm = get_llm(max_tokens=30)
-        flaw_chain = flaw_prompt | flaw_llm | StrOutputParser()
-        flaw_raw = await flaw_chain.ainvoke(
-            {
-                "theme": theme,
-                "theme_references": theme_references,
-                "name": name,
-                "personality": ", ".join(traits_list),
-                "description": backstory,
-                "flaw_options": flaw_options,
-            }
-        )
-        flaw_id_raw = clean_ai_text(flaw_raw)
+        if settings.CHARACTER_SELECTION_MODE == "llm":
+            flaw_id_raw = await _select_flaw_with_llm(
+                theme,
+                theme_references,
+                name,
+                ", ".join(traits_list),
+                backstory,
+                flaw_ids,
+            )
+        else:
+            flaw_id_raw = await select_flaw_locally(
+                flaw_ids, appearance, backstory, ", ".join(traits_list)
+            )
 
         flaw_template = get_flaw_by_id(flaw_id_raw)
 
@@ -358,7 +318,7 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
             stats_prompt_text = f.read()
 
         stats_prompt = PromptTemplate.from_template(stats_prompt_text)
-        stats_llm = get_llm(max_tokens=70).with_structured_output(CharacterStats)
+        stats_llm = get_llm(max_tokens=70, tier="short").with_structured_output(CharacterStats)
         stats_chain = stats_prompt | stats_llm
 
         try:
@@ -373,7 +333,8 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
                         "appearance": appearance,
                         "description": backstory,
                         "skills": json.dumps(skills_array),
-                    }
+                    },
+                    config=llm_step("character", "stats"),
                 ),
             )
             # LLM returns validated stats directly
@@ -443,3 +404,85 @@ async def generate_character(theme: str = "post-apocalyptic", progress_callback=
         details=details,
         type="character",
     )
+
+
+async def _select_traits_with_llm(
+    theme: str, theme_references: str, name: str, appearance: str, backstory: str
+) -> list[PersonalityTrait]:
+    """Ask the LLM for 3 traits; raises ValueError unless they are valid and compatible."""
+    with open("generate/prompts/character/character_traits.txt", "r") as f:
+        traits_prompt_text = f.read()
+
+    traits_prompt = PromptTemplate.from_template(traits_prompt_text)
+    traits_llm = get_llm(max_tokens=50, tier="short").with_structured_output(CharacterTraits)
+    traits_chain = traits_prompt | traits_llm
+
+    traits_result = cast(
+        CharacterTraits,
+        await traits_chain.ainvoke(
+            {
+                "theme": theme,
+                "theme_references": theme_references,
+                "name": name,
+                "appearance": appearance,
+                "backstory": backstory,
+                "trait_list": TRAIT_PROMPT,
+            },
+            config=llm_step("character", "traits"),
+        ),
+    )
+    # LLM returns validated list of trait names directly
+    trait_names = traits_result.traits
+
+    # Convert to PersonalityTrait enums
+    personality_traits = []
+    for trait_name in trait_names:
+        if trait_name in TRAIT_NAMES:
+            personality_traits.append(PersonalityTrait(trait_name))
+        else:
+            logger.warning(f"Invalid trait '{trait_name}' from LLM, will use fallback")
+
+    # Validate we have exactly 3 compatible traits
+    if len(personality_traits) != 3 or not validate_trait_selection(personality_traits):
+        raise ValueError(f"Invalid trait selection: {trait_names}")
+
+    return personality_traits
+
+
+async def _select_flaw_with_llm(
+    theme: str,
+    theme_references: str,
+    name: str,
+    personality: str,
+    backstory: str,
+    flaw_ids: list[str],
+) -> str:
+    """Ask the LLM to pick one of the flaw templates; returns the ID it answered."""
+    with open("generate/prompts/character/character_flaw.txt", "r") as f:
+        flaw_prompt_text = f.read()
+
+    # Format the flaw template IDs for the prompt
+    flaw_options_list = []
+    for flaw_id in flaw_ids:
+        template = get_flaw_by_id(flaw_id)
+        if template:
+            flaw_options_list.append(
+                f"{template['id']}: {template['name']} - {template['description']}"
+            )
+    flaw_options = "\n".join(flaw_options_list)
+
+    flaw_prompt = PromptTemplate.from_template(flaw_prompt_text)
+    flaw_llm = get_llm(max_tokens=30, tier="short")
+    flaw_chain = flaw_prompt | flaw_llm | StrOutputParser()
+    flaw_raw = await flaw_chain.ainvoke(
+        {
+            "theme": theme,
+            "theme_references": theme_references,
+            "name": name,
+            "personality": personality,
+            "description": backstory,
+            "flaw_options": flaw_options,
+        },
+        config=llm_step("character", "flaw"),
+    )
+    return clean_ai_text(flaw_raw)
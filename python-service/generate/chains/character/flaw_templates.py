@@ -488,26 +488,6 @@ FLAW_TEMPLATES: list[FlawTemplate] = [
 ]
 
 
-def get_flaw_by_id(flaw_id: str) -> FlawTemplate | None:
-    """Get a specific flaw template by ID."""
-    for flaw in FLAW_TEMPLATES:
-        if flaw["id"] == flaw_id:
-            return flaw
-    return None
-
-
-def get_flaws_by_category(category: str) -> list[FlawTemplate]:
-    """Get all flaws in a specific category."""
-    return [f for f in FLAW_TEMPLATES if f["category"] == category]
-
-
-def get_random_flaw_ids(count: int = 10) -> list[str]:
-    """Get random flaw IDs for prompt variety."""
-    import random
-
-    return [f["id"] for f in random.sample(FLAW_TEMPLATES, min(count, len(FLAW_TEMPLATES)))]
-
-
 def format_flaw_for_storage(template: FlawTemplate) -> str:
     """
     Format flaw template for database storage.
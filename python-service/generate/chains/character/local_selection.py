@@ -0,0 +1,284 @@
+"""
+Pick a character's personality traits and flaw without an LLM call.
+
+Used by generate_character when CHARACTER_SELECTION_MODE is 'keywords' or
+'embeddings' instead of 'llm'. Each trait and flaw template is scored against
+the generated appearance and backstory:
+
+- keywords: words of its name and description found in the text (stems
+  match any ending; name words count triple, hand-picked trait cues double),
+  plus a bonus for the traits the trait prompt favours for the theme
+- embeddings: cosine similarity between the text and the candidate's
+  description, with the embedding model of the AI provider
+
+Traits are then taken best first, one per category, skipping any that
+contradict those already picked, so the result always passes
+validate_trait_selection. Ties are broken by a hash of the text, so the
+same character always gets the same picks.
+"""
+
+import hashlib
+import math
+import re
+from typing import Iterable
+
+from config.settings import get_settings
+from services.embedding_client import get_embedding_model
+from utils.keyword_matcher import KeywordMatcher
+from utils.logger import logger
+from .catalogue import are_traits_compatible, get_flaw_by_id
+from .flaw_templates import FLAW_TEMPLATES, FlawTemplate
+from .traits import TRAIT_CATEGORIES, TRAIT_METADATA, PersonalityTrait
+
+settings = get_settings()
+
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or "
+    "that the their them they this to was when who with without other others "
+    "people someone something".split()
+)
+_STEM_LENGTH = 5
+_NAME_WEIGHT = 3
+
+# From the theme guidance in the trait prompt
+_THEME_TRAITS = {
+    "post-apocalyptic": {"Cautious", "Ruthless", "Paranoid", "Adaptable", "Pragmatic"},
+    "fantasy": {"Honorable", "Brave", "Curious", "Loyal", "Fearless"},
+    "cyberpunk": {"Cynical", "Analytical", "Rebellious", "Pragmatic"},
+    "norse-mythology": {"Fearless", "Honorable", "Competitive", "Brave", "Loyal"},
+    "steampunk": {"Creative", "Curious", "Ambitious", "Methodical"},
+}
+_THEME_BONUS = 1.0
+
+# Words that suggest a trait but rarely appear in its description
+_TRAIT_CUES = {
+    "Melancholic": ["lost", "grief", "griev*", "mourn*", "sorrow*", "tired", "haunt*"],
+    "Optimistic": ["hope*", "dream*", "smile*", "believ*", "bright"],
+    "Stoic": ["endur*", "silent", "unflinch*", "weather*", "scarred"],
+    "Passionate": ["fierce*", "devot*", "burn*", "cause"],
+    "Cynical": ["corrupt*", "corporat*", "distrust*", "lies", "bitter*"],
+    "Empathetic": ["listen*", "feel*", "comfort*"],
+    "Volatile": ["temper", "rage", "outburst*", "unpredict*"],
+    "Serene": ["calm*", "peace*", "meditat*", "quiet"],
+    "Charismatic": ["charm*", "crowd*", "inspir*", "orator"],
+    "Intimidating": ["tower*", "menac*", "scowl*", "threat*", "huge"],
+    "Shy": ["quiet", "withdrawn", "avoid*", "stammer*"],
+    "Diplomatic": ["negotiat*", "envoy", "mediat*", "treaty"],
+    "Abrasive": ["rude", "blunt", "insult*", "harsh"],
+    "Loyal": ["squad", "sworn", "oath", "comrade*", "protect*", "family", "friend*"],
+    "Manipulative": ["scheme*", "con", "deceiv*", "pull* strings"],
+    "Honest": ["truth*", "confess*", "sincere"],
+    "Reckless": ["gamble*", "daredevil", "dare*", "wild"],
+    "Cautious": ["survivor", "careful*", "wary", "veteran", "watch*"],
+    "Methodical": ["research*", "notes", "precise*", "ledger*", "plan*"],
+    "Spontaneous": ["whim", "drift*", "wander*"],
+    "Stubborn": ["refus*", "despite", "never gives up", "won't", "abandon"],
+    "Adaptable": ["scaveng*", "salvag*", "improvis*", "makeshift"],
+    "Disciplined": ["train*", "regiment*", "soldier*", "drill*", "military"],
+    "Impulsive": ["rash*", "hasty", "sudden*"],
+    "Analytical": [
+        "scien*",
+        "research*",
+        "code",
+        "hacker",
+        "data",
+        "logic*",
+        "engineer*",
+    ],
+    "Intuitive": ["instinct*", "vision*", "omen*", "sense*"],
+    "Creative": ["invent*", "tinker*", "artist*", "craft*", "build*"],
+    "Pragmatic": ["practical", "surviv*", "trade*", "barter*"],
+    "Curious": ["explor*", "search*", "mystery", "mysteries", "study", "studies"],
+    "Paranoid": ["trusts no one", "betray*", "suspic*", "conspir*"],
+    "Perceptive": ["sharp eye*", "keen", "observ*", "notic*"],
+    "Oblivious": ["naive*", "dreamy", "absent*"],
+    "Honorable": ["knight", "code", "oath", "honor*", "crest", "order"],
+    "Ruthless": ["kill*", "merciless", "brutal*", "mercenar*", "warlord"],
+    "Compassionate": ["heal*", "cure", "save", "care*", "plague", "medic*", "doctor"],
+    "Selfish": ["hoard*", "alone", "self*"],
+    "Just": ["law*", "justice", "judge*", "fair*"],
+    "Vengeful": ["reveng*", "vengeance", "murder*", "avenge*", "hunt*"],
+    "Merciful": ["spare*", "forgiv*", "redemption"],
+    "Cruel": ["tortur*", "sadist*", "enslav*"],
+    "Ambitious": ["power", "throne", "rise", "rule*", "empire"],
+    "Content": ["simple", "farm*", "home"],
+    "Greedy": ["hoard*", "gold", "treasure", "wealth*", "loot*", "profit*", "coin*"],
+    "Humble": ["modest*", "servant", "peasant*", "humble"],
+    "Competitive": ["champion*", "rival*", "contest*", "arena"],
+    "Cooperative": ["crew", "team*", "together"],
+    "Brave": ["warrior", "battle*", "fought", "defeat*", "sword*", "armor*"],
+    "Cowardly": ["fled", "flee*", "hide*", "hid"],
+    "Fearless": ["dragon*", "giant*", "berserk*"],
+    "Anxious": ["worr*", "nervous*", "jumpy", "fear*"],
+    "Authoritative": ["captain", "commander", "leader", "chief*", "lord"],
+    "Follower": ["apprentice", "acolyte", "recruit*"],
+    "Rebellious": ["rebel*", "fights the system", "resist*", "outlaw*", "corporat*"],
+    "Obedient": ["orders", "serve*", "duty"],
+    "Independent": ["loner", "alone", "solitary", "nomad*", "wanderer"],
+    "Team-Player": ["squad", "crew", "party", "guild"],
+}
+_CUE_WEIGHT = 2
+
+_TRAIT_CATEGORY = {
+    trait: category for category, traits in TRAIT_CATEGORIES.items() for trait in traits
+}
+
+
+def _keywords(text: str) -> set[str]:
+    """Content words of `text`; longer words become stems ("caref*")."""
+    keywords = set()
+    for word in re.findall(r"[a-z]+", text.lower().replace("_", " ")):
+        if len(word) < 3 or word in _STOP_WORDS:
+            continue
+        if len(word) > _STEM_LENGTH:
+            word = word[:_STEM_LENGTH] + "*"
+        keywords.add(word)
+    return keywords
+
+
+def _weighted_keywords(
+    name: str, *texts: str, cues: Iterable[str] = ()
+) -> dict[str, int]:
+    weights = {keyword: 1 for keyword in _keywords(" ".join(texts))}
+    weights.update({keyword: _CUE_WEIGHT for keyword in cues})
+    weights.update({keyword: _NAME_WEIGHT for keyword in _keywords(name)})
+    return weights
+
+
+def _trait_document(trait: PersonalityTrait) -> str:
+    return f"{trait.value}: {TRAIT_METADATA[trait]['description']}"
+
+
+def _flaw_document(flaw: FlawTemplate) -> str:
+    return f"{flaw['name']}: {flaw['description']}"
+
+
+_TRAIT_KEYWORDS = {
+    trait.value: _weighted_keywords(
+        trait.value,
+        TRAIT_METADATA[trait]["description"],
+        cues=_TRAIT_CUES[trait.value],
+    )
+    for trait in PersonalityTrait
+}
+_FLAW_KEYWORDS = {
+    flaw["id"]: _weighted_keywords(flaw["name"], flaw["description"], flaw["trigger"])
+    for flaw in FLAW_TEMPLATES
+}
+_TRAIT_MATCHER = KeywordMatcher(_TRAIT_KEYWORDS)
+_FLAW_MATCHER = KeywordMatcher(_FLAW_KEYWORDS)
+
+# Embeddings of trait and flaw descriptions, computed on first use
+_document_embeddings: dict[str, list[float]] = {}
+
+
+def _tie_breaker(text: str, label: str) -> int:
+    """Stable value that varies with the text, to order equal scores."""
+    digest = hashlib.sha1(f"{label}\n{text}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
+def _keyword_scores(
+    matcher: KeywordMatcher, weights: dict[str, dict[str, int]], text: str
+) -> dict[str, float]:
+    return {
+        label: float(sum(weights[label][keyword] for keyword in keywords))
+        for label, keywords in matcher.find(text).items()
+    }
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+async def _embedding_scores(text: str, documents: dict[str, str]) -> dict[str, float]:
+    model = get_embedding_model()
+    missing = [doc for doc in documents.values() if doc not in _document_embeddings]
+    if missing:
+        for doc, embedding in zip(missing, await model.aembed_documents(missing)):
+            _document_embeddings[doc] = embedding
+
+    query = await model.aembed_query(text)
+    return {
+        label: _cosine(query, _document_embeddings[doc])
+        for label, doc in documents.items()
+    }
+
+
+async def _scores(
+    text: str,
+    documents: dict[str, str],
+    matcher: KeywordMatcher,
+    weights: dict[str, dict[str, int]],
+) -> dict[str, float]:
+    if settings.CHARACTER_SELECTION_MODE == "embeddings":
+        try:
+            return await _embedding_scores(text, documents)
+        except Exception as e:
+            logger.warning(f"Embedding selection failed, using keywords: {e}")
+    return _keyword_scores(matcher, weights, text)
+
+
+async def select_traits_locally(
+    theme: str, appearance: str, backstory: str
+) -> list[PersonalityTrait]:
+    """Three compatible traits from different categories that best fit the text."""
+    text = f"{appearance}\n{backstory}"
+    scores = await _scores(
+        text,
+        {trait.value: _trait_document(trait) for trait in PersonalityTrait},
+        _TRAIT_MATCHER,
+        _TRAIT_KEYWORDS,
+    )
+    if settings.CHARACTER_SELECTION_MODE == "keywords":
+        for trait_name in _THEME_TRAITS.get(theme.lower(), ()):
+            scores[trait_name] = scores.get(trait_name, 0.0) + _THEME_BONUS
+
+    ranked = sorted(
+        PersonalityTrait,
+        key=lambda trait: (
+            scores.get(trait.value, 0.0),
+            _tie_breaker(text, trait.value),
+        ),
+        reverse=True,
+    )
+
+    chosen: list[PersonalityTrait] = []
+    for one_per_category in (True, False):
+        for trait in ranked:
+            if len(chosen) == 3:
+                break
+            if trait in chosen or not all(
+                are_traits_compatible(trait, other) for other in chosen
+            ):
+                continue
+            if one_per_category and any(
+                _TRAIT_CATEGORY[trait] == _TRAIT_CATEGORY[other] for other in chosen
+            ):
+                continue
+            chosen.append(trait)
+
+    return chosen
+
+
+async def select_flaw_locally(
+    flaw_ids: list[str], appearance: str, backstory: str, personality: str
+) -> str:
+    """The ID of the flaw template among `flaw_ids` that best fits the text."""
+    text = f"{appearance}\n{backstory}\n{personality}"
+    candidates = [flaw for flaw in map(get_flaw_by_id, flaw_ids) if flaw]
+    scores = await _scores(
+        text,
+        {flaw["id"]: _flaw_document(flaw) for flaw in candidates},
+        _FLAW_MATCHER,
+        _FLAW_KEYWORDS,
+    )
+    return max(
+        flaw_ids,
+        key=lambda flaw_id: (
+            scores.get(flaw_id, 0.0),
+            _tie_breaker(text, flaw_id),
+        ),
+    )
@@ -1,7 +1,14 @@
+import random
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+
+from config.settings import get_settings
 from utils.logger import logger
 
+settings = get_settings()
+
 NAMES_DIR = Path("generate/chains/character/data/names")
 
 THEME_NAMES_MAPPING = {
@@ -26,19 +33,15 @@ THEME_NAMES_MAPPING = {
         "last": "norse_last_names.txt",
     },
 }
+THEME_NAMES_MAPPING["norse-mythology"] = THEME_NAMES_MAPPING["norse"]
 
+# Names recently used per theme, kept out of sampled name lists
+_recent_names: dict[str, deque[str]] = {}
 
-def load_names_for_theme(theme: str) -> Optional[dict[str, str]]:
-    """
-    Load first and last names for a given theme.
-
-    Args:
-        theme: The theme (e.g., 'cyberpunk', 'steampunk', 'post-apocalyptic')
 
-    Returns:
-        Dictionary with 'first_names' and 'last_names' keys containing formatted strings,
-        or None if theme not found.
-    """
+@lru_cache(maxsize=None)
+def _name_pool(theme: str) -> Optional[tuple[tuple[str, ...], tuple[str, ...]]]:
+    """First and last names of a theme, read from disk once."""
     files = THEME_NAMES_MAPPING.get(theme)
     if not files:
         return None
@@ -54,13 +57,72 @@ def load_names_for_theme(theme: str) -> Optional[dict[str, str]]:
             last_names = f.read().strip().split("\n")
 
         # Filter out empty strings
-        first_names = [name.strip() for name in first_names if name.strip()]
-        last_names = [name.strip() for name in last_names if name.strip()]
-
-        return {
-            "first_names": ", ".join(first_names),
-            "last_names": ", ".join(last_names),
-        }
+        return (
+            tuple(name.strip() for name in first_names if name.strip()),
+            tuple(name.strip() for name in last_names if name.strip()),
+        )
     except FileNotFoundError as e:
         logger.error(f"Error loading names for theme '{theme}': {e}")
         return None
+
+
+@lru_cache(maxsize=None)
+def _formatted_name_pool(theme: str) -> Optional[dict[str, str]]:
+    pool = _name_pool(theme)
+    if pool is None:
+        return None
+
+    first_names, last_names = pool
+    return {
+        "first_names": ", ".join(first_names),
+        "last_names": ", ".join(last_names),
+    }
+
+
+def _sample(names: tuple[str, ...], count: int, recent: set[str]) -> list[str]:
+    """`count` random names, avoiding recent ones while enough others remain."""
+    fresh = [name for name in names if name not in recent]
+    candidates = fresh if len(fresh) >= count else names
+    return random.sample(candidates, min(count, len(candidates)))
+
+
+def load_names_for_theme(theme: str) -> Optional[dict[str, str]]:
+    """
+    Load first and last names for a given theme.
+
+    With NAME_POOL_SAMPLE_SIZE set, returns that many random names of each
+    kind (skipping names recently used for the theme) instead of the whole
+    lists, to keep the name prompt short.
+
+    Args:
+        theme: The theme (e.g., 'cyberpunk', 'steampunk', 'post-apocalyptic')
+
+    Returns:
+        Dictionary with 'first_names' and 'last_names' keys containing formatted strings,
+        or None if theme not found.
+    """
+    if settings.NAME_POOL_SAMPLE_SIZE <= 0:
+        return _formatted_name_pool(theme)
+
+    pool = _name_pool(theme)
+    if pool is None:
+        return None
+
+    first_names, last_names = pool
+    recent = set(_recent_names.get(theme, ()))
+    return {
+        "first_names": ", ".join(
+            _sample(first_names, settings.NAME_POOL_SAMPLE_SIZE, recent)
+        ),
+        "last_names": ", ".join(
+            _sample(last_names, settings.NAME_POOL_SAMPLE_SIZE, recent)
+        ),
+    }
+
+
+def add_used_name(theme: str, name: str):
+    """Remember the parts of a generated name, to leave them out of samples."""
+    recent = _recent_names.setdefault(
+        theme, deque(maxlen=settings.NAME_POOL_RECENT_EXCLUSION)
+    )
+    recent.extend(part.strip(",.") for part in name.split() if part.strip(",."))
@@ -423,6 +423,83 @@ OPPOSING_TRAITS = [
 ]
 
 
+# Traits grouped by category, in prompt order
+TRAIT_CATEGORIES = {
+    "EMOTIONAL": [
+        PersonalityTrait.MELANCHOLIC,
+        PersonalityTrait.OPTIMISTIC,
+        PersonalityTrait.STOIC,
+        PersonalityTrait.PASSIONATE,
+        PersonalityTrait.CYNICAL,
+        PersonalityTrait.EMPATHETIC,
+        PersonalityTrait.VOLATILE,
+        PersonalityTrait.SERENE,
+    ],
+    "SOCIAL": [
+        PersonalityTrait.CHARISMATIC,
+        PersonalityTrait.INTIMIDATING,
+        PersonalityTrait.SHY,
+        PersonalityTrait.DIPLOMATIC,
+        PersonalityTrait.ABRASIVE,
+        PersonalityTrait.LOYAL,
+        PersonalityTrait.MANIPULATIVE,
+        PersonalityTrait.HONEST,
+    ],
+    "BEHAVIORAL": [
+        PersonalityTrait.RECKLESS,
+        PersonalityTrait.CAUTIOUS,
+        PersonalityTrait.METHODICAL,
+        PersonalityTrait.SPONTANEOUS,
+        PersonalityTrait.STUBBORN,
+        PersonalityTrait.ADAPTABLE,
+        PersonalityTrait.DISCIPLINED,
+        PersonalityTrait.IMPULSIVE,
+    ],
+    "COGNITIVE": [
+        PersonalityTrait.ANALYTICAL,
+        PersonalityTrait.INTUITIVE,
+        PersonalityTrait.CREATIVE,
+        PersonalityTrait.PRAGMATIC,
+        PersonalityTrait.CURIOUS,
+        PersonalityTrait.PARANOID,
+        PersonalityTrait.PERCEPTIVE,
+        PersonalityTrait.OBLIVIOUS,
+    ],
+    "MORAL": [
+        PersonalityTrait.HONORABLE,
+        PersonalityTrait.RUTHLESS,
+        PersonalityTrait.COMPASSIONATE,
+        PersonalityTrait.SELFISH,
+        PersonalityTrait.JUST,
+        PersonalityTrait.VENGEFUL,
+        PersonalityTrait.MERCIFUL,
+        PersonalityTrait.CRUEL,
+    ],
+    "AMBITION": [
+        PersonalityTrait.AMBITIOUS,
+        PersonalityTrait.CONTENT,
+        PersonalityTrait.GREEDY,
+        PersonalityTrait.HUMBLE,
+        PersonalityTrait.COMPETITIVE,
+        PersonalityTrait.COOPERATIVE,
+    ],
+    "COURAGE": [
+        PersonalityTrait.BRAVE,
+        PersonalityTrait.COWARDLY,
+        PersonalityTrait.FEARLESS,
+        PersonalityTrait.ANXIOUS,
+    ],
+    "LEADERSHIP": [
+        PersonalityTrait.AUTHORITATIVE,
+        PersonalityTrait.FOLLOWER,
+        PersonalityTrait.REBELLIOUS,
+        PersonalityTrait.OBEDIENT,
+        PersonalityTrait.INDEPENDENT,
+        PersonalityTrait.TEAM_PLAYER,
+    ],
+}
+
+
 def are_traits_compatible(trait1: PersonalityTrait, trait2: PersonalityTrait) -> bool:
     """Check if two traits are compatible (not opposing)."""
     return (trait1, trait2) not in OPPOSING_TRAITS and (
@@ -431,23 +508,6 @@ def are_traits_compatible(trait1: PersonalityTrait, trait2: PersonalityTrait) ->
     ) not in OPPOSING_TRAITS
 
 
-def validate_trait_selection(traits: list[PersonalityTrait]) -> bool:
-    """
-    Validate that a selection of 3 traits is compatible.
-    Returns True if all traits are compatible with each other.
-    """
-    if len(traits) != 3:
-        return False
-
-    # Check all pairs for opposition
-    for i in range(len(traits)):
-        for j in range(i + 1, len(traits)):
-            if not are_traits_compatible(traits[i], traits[j]):
-                return False
-
-    return True
-
-
 def get_trait_list_for_prompt() -> str:
     """
     Generate a formatted string of all traits for use in LLM prompts.
@@ -456,90 +516,10 @@ def get_trait_list_for_prompt() -> str:
     trait_lines = []
 
     # Group traits by category for better organization
-    categories = {
-        "EMOTIONAL": [
-            PersonalityTrait.MELANCHOLIC,
-            PersonalityTrait.OPTIMISTIC,
-            PersonalityTrait.STOIC,
-            PersonalityTrait.PASSIONATE,
-            PersonalityTrait.CYNICAL,
-            PersonalityTrait.EMPATHETIC,
-            PersonalityTrait.VOLATILE,
-            PersonalityTrait.SERENE,
-        ],
-        "SOCIAL": [
-            PersonalityTrait.CHARISMATIC,
-            PersonalityTrait.INTIMIDATING,
-            PersonalityTrait.SHY,
-            PersonalityTrait.DIPLOMATIC,
-            PersonalityTrait.ABRASIVE,
-            PersonalityTrait.LOYAL,
-            PersonalityTrait.MANIPULATIVE,
-            PersonalityTrait.HONEST,
-        ],
-        "BEHAVIORAL": [
-            PersonalityTrait.RECKLESS,
-            PersonalityTrait.CAUTIOUS,
-            PersonalityTrait.METHODICAL,
-            PersonalityTrait.SPONTANEOUS,
-            PersonalityTrait.STUBBORN,
-            PersonalityTrait.ADAPTABLE,
-            PersonalityTrait.DISCIPLINED,
-            PersonalityTrait.IMPULSIVE,
-        ],
-        "COGNITIVE": [
-            PersonalityTrait.ANALYTICAL,
-            PersonalityTrait.INTUITIVE,
-            PersonalityTrait.CREATIVE,
-            PersonalityTrait.PRAGMATIC,
-            PersonalityTrait.CURIOUS,
-            PersonalityTrait.PARANOID,
-            PersonalityTrait.PERCEPTIVE,
-            PersonalityTrait.OBLIVIOUS,
-        ],
-        "MORAL": [
-            PersonalityTrait.HONORABLE,
-            PersonalityTrait.RUTHLESS,
-            PersonalityTrait.COMPASSIONATE,
-            PersonalityTrait.SELFISH,
-            PersonalityTrait.JUST,
-            PersonalityTrait.VENGEFUL,
-            PersonalityTrait.MERCIFUL,
-            PersonalityTrait.CRUEL,
-        ],
-        "AMBITION": [
-            PersonalityTrait.AMBITIOUS,
-            PersonalityTrait.CONTENT,
-            PersonalityTrait.GREEDY,
-            PersonalityTrait.HUMBLE,
-            PersonalityTrait.COMPETITIVE,
-            PersonalityTrait.COOPERATIVE,
-        ],
-        "COURAGE": [
-            PersonalityTrait.BRAVE,
-            PersonalityTrait.COWARDLY,
-            PersonalityTrait.FEARLESS,
-            PersonalityTrait.ANXIOUS,
-        ],
-        "LEADERSHIP": [
-            PersonalityTrait.AUTHORITATIVE,
-            PersonalityTrait.FOLLOWER,
-            PersonalityTrait.REBELLIOUS,
-            PersonalityTrait.OBEDIENT,
-            PersonalityTrait.INDEPENDENT,
-            PersonalityTrait.TEAM_PLAYER,
-        ],
-    }
-
-    for category, traits in categories.items():
+    for category, traits in TRAIT_CATEGORIES.items():
         trait_lines.append(f"\n{category} TRAITS:")
         for trait in traits:
             metadata = TRAIT_METADATA[trait]
             trait_lines.append(f"  - {trait.value}: {metadata['description']}")
 
     return "\n".join(trait_lines)
-
-
-def get_all_trait_names() -> list[str]:
-    """Get a simple list of all trait names (for LLM output parsing)."""
-    return [trait.value for trait in PersonalityTrait]
@@ -12,6 +12,7 @@ from generate.models.structured_llm_output.event_schema import (
 )
 from services.llm_client import (
     get_llm,
+    llm_step,
     increment_success_counter,
     increment_failure_counter,
 )
@@ -51,14 +52,15 @@ async def generate_event(
             name_prompt_text = f.read()
 
         name_prompt = PromptTemplate.from_template(name_prompt_text)
-        name_llm = get_llm(max_tokens=50)
+        name_llm = get_llm(max_tokens=50, tier="short")
         name_chain = name_prompt | name_llm | StrOutputParser()
         name_raw = await name_chain.ainvoke(
             {
                 "theme": theme,
                 "theme_references": theme_references,
                 "blacklist": blacklist_str,
-            }
+            },
+            config=llm_step("event", "name"),
         )
         name = clean_ai_text(name_raw)
         logger.info(f"Generated event name: {name}")
@@ -72,7 +74,7 @@ async def generate_event(
             description_prompt_text = f.read()
 
         description_prompt = PromptTemplate.from_template(description_prompt_text)
-        description_llm = get_llm(max_tokens=200).with_structured_output(EventDescription)
+        description_llm = get_llm(max_tokens=200, tier="structured").with_structured_output(EventDescription)
         description_chain = description_prompt | description_llm
         description_result = cast(
             EventDescription,
@@ -82,7 +84,8 @@ async def generate_event(
                     "theme_references": theme_references,
                     "name": name,
                     "setting_context": setting_context,
-                }
+                },
+                config=llm_step("event", "description"),
             )
         )
         description = description_result.description
@@ -97,7 +100,7 @@ async def generate_event(
             impact_prompt_text = f.read()
 
         impact_prompt = PromptTemplate.from_template(impact_prompt_text)
-        impact_llm = get_llm(max_tokens=150).with_structured_output(EventImpact)
+        impact_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(EventImpact)
         impact_chain = impact_prompt | impact_llm
         impact_result = cast(
             EventImpact,
@@ -107,7 +110,8 @@ async def generate_event(
                     "theme_references": theme_references,
                     "name": name,
                     "description": description,
-                }
+                },
+                config=llm_step("event", "impact"),
             )
         )
         impact = impact_result.impact
@@ -13,6 +13,7 @@ from generate.models.structured_llm_output.faction_schema import (
 )
 from services.llm_client import (
     get_llm,
+    llm_step,
     increment_success_counter,
     increment_failure_counter,
 )
@@ -48,14 +49,15 @@ async def generate_faction(theme: str = "post-apocalyptic", progress_callback=No
             name_prompt_text = f.read()
 
         name_prompt = PromptTemplate.from_template(name_prompt_text)
-        name_llm = get_llm(max_tokens=50)
+        name_llm = get_llm(max_tokens=50, tier="short")
         name_chain = name_prompt | name_llm | StrOutputParser()
         name_raw = await name_chain.ainvoke(
             {
                 "theme": theme,
                 "theme_references": theme_references,
                 "blacklist": blacklist_str,
-            }
+            },
+            config=llm_step("faction", "name"),
         )
         name = clean_ai_text(name_raw)
         logger.info(f"Generated faction name: {name}")
@@ -69,12 +71,13 @@ async def generate_faction(theme: str = "post-apocalyptic", progress_callback=No
             ideology_prompt_text = f.read()
 
         ideology_prompt = PromptTemplate.from_template(ideology_prompt_text)
-        ideology_llm = get_llm(max_tokens=100).with_structured_output(FactionIdeology)
+        ideology_llm = get_llm(max_tokens=100, tier="structured").with_structured_output(FactionIdeology)
         ideology_chain = ideology_prompt | ideology_llm
         ideology_result = cast(
             FactionIdeology,
             await ideology_chain.ainvoke(
-                {"theme": theme, "theme_references": theme_references, "name": name}
+                {"theme": theme, "theme_references": theme_references, "name": name},
+                config=llm_step("faction", "ideology"),
             ),
         )
         ideology = ideology_result.ideology
@@ -89,7 +92,7 @@ async def generate_faction(theme: str = "post-apocalyptic", progress_callback=No
             appearance_prompt_text = f.read()
 
         appearance_prompt = PromptTemplate.from_template(appearance_prompt_text)
-        appearance_llm = get_llm(max_tokens=150).with_structured_output(
+        appearance_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(
             FactionAppearance
         )
         appearance_chain = appearance_prompt | appearance_llm
@@ -101,7 +104,8 @@ async def generate_faction(theme: str = "post-apocalyptic", progress_callback=No
                     "theme_references": theme_references,
                     "name": name,
                     "ideology": ideology,
-                }
+                },
+                config=llm_step("faction", "appearance"),
             ),
         )
         appearance = appearance_result.appearance
@@ -116,7 +120,7 @@ async def generate_faction(theme: str = "post-apocalyptic", progress_callback=No
             summary_prompt_text = f.read()
 
         summary_prompt = PromptTemplate.from_template(summary_prompt_text)
-        summary_llm = get_llm(max_tokens=200).with_structured_output(FactionSummary)
+        summary_llm = get_llm(max_tokens=200, tier="structured").with_structured_output(FactionSummary)
         summary_chain = summary_prompt | summary_llm
         summary_result = cast(
             FactionSummary,
@@ -127,7 +131,8 @@ async def generate_faction(theme: str = "post-apocalyptic", progress_callback=No
                     "name": name,
                     "ideology": ideology,
                     "appearance": appearance,
-                }
+                },
+                config=llm_step("faction", "summary"),
             ),
         )
         summary = summary_result.summary
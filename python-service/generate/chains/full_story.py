@@ -1,13 +1,23 @@
+import random
+import time
+from typing import Any, cast
+
+from langchain_core.callbacks import get_usage_metadata_callback
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from langfuse import observe
 
+from prometheus_client import Counter, Histogram
+
+from config.settings import get_settings
 from constants.themes import Theme
 from generate.models.full_story import FullStory
 from generate.models.selected_lore_pieces import SelectedLorePieces
+from generate.models.structured_llm_output.full_story_schema import FullStoryOutput
 from services.llm_client import (
     get_llm,
+    llm_step,
     increment_success_counter,
     increment_failure_counter,
 )
@@ -15,6 +25,167 @@ from utils.format_text import clean_ai_text, format_details
 from utils.logger import logger
 from exceptions.generation import FullStoryGenerationError
 
+settings = get_settings()
+
+# Prometheus metrics for comparing full story modes (A/B)
+full_story_duration_histogram = Histogram(
+    "loresmith_full_story_duration_seconds",
+    "End-to-end full story generation latency per mode",
+    ["mode"],
+    buckets=(1, 2.5, 5, 10, 15, 20, 30, 45, 60, 90, 120),
+)
+
+full_story_tokens_counter = Counter(
+    "loresmith_full_story_tokens_total",
+    "Tokens spent on full story generation per mode",
+    ["mode", "token_type"],
+)
+
+full_story_fallback_counter = Counter(
+    "loresmith_full_story_fallback_total",
+    "Combined full story generations that fell back to the chained mode",
+)
+
+
+def _select_mode() -> str:
+    """Pick the generation mode for this request based on FULL_STORY_MODE."""
+    mode = settings.FULL_STORY_MODE.lower()
+    if mode == "ab":
+        if random.random() < settings.FULL_STORY_AB_COMBINED_RATIO:
+            return "combined"
+        return "chained"
+    if mode not in ("combined", "chained"):
+        logger.warning(f"Unknown FULL_STORY_MODE '{mode}', using 'chained'")
+        return "chained"
+    return mode
+
+
+def _build_story_inputs(
+    selected_pieces: SelectedLorePieces, theme: Theme, theme_references: str
+) -> dict[str, Any]:
+    """Build prompt variables shared by the combined and chained story prompts."""
+    character = selected_pieces.character
+    faction = selected_pieces.faction
+    setting = selected_pieces.setting
+    event = selected_pieces.event
+    relic = selected_pieces.relic
+
+    return {
+        "theme": theme,
+        "theme_references": theme_references,
+        "character_name": character.name if character else "N/A",
+        "character_description": character.description if character else "N/A",
+        "character_details": format_details(character.details) if character else "N/A",
+        "faction_name": faction.name if faction else "N/A",
+        "faction_description": faction.description if faction else "N/A",
+        "faction_details": format_details(faction.details) if faction else "N/A",
+        "setting_name": setting.name if setting else "N/A",
+        "setting_description": setting.description if setting else "N/A",
+        "setting_details": format_details(setting.details) if setting else "N/A",
+        "event_name": event.name if event else "N/A",
+        "event_description": event.description if event else "N/A",
+        "event_details": format_details(event.details) if event else "N/A",
+        "relic_name": relic.name if relic else "N/A",
+        "relic_description": relic.description if relic else "N/A",
+        "relic_details": format_details(relic.details) if relic else "N/A",
+    }
+
+
+async def _generate_combined(story_inputs: dict[str, Any]) -> tuple[str, str, str]:
+    """
+    Generate story content, quest title and quest description in one structured call.
+
+    Raises if the structured output can't be parsed or is incomplete.
+    """
+    with open("generate/prompts/full_story/full_story_with_quest.txt", "r") as f:
+        prompt_text = f.read()
+
+    prompt = PromptTemplate.from_template(prompt_text)
+    llm = get_llm(max_tokens=700, tier="long").with_structured_output(FullStoryOutput)
+    chain = prompt | llm
+
+    result = cast(
+        FullStoryOutput,
+        await chain.ainvoke(story_inputs, config=llm_step("full_story", "combined")),
+    )
+    if result is None:
+        raise ValueError("Structured full story output could not be parsed")
+
+    content = clean_ai_text(result.content)
+    quest_title = clean_ai_text(result.quest_title).strip("\"'")
+    quest_description = clean_ai_text(result.quest_description)
+
+    if not content or not quest_title or not quest_description:
+        raise ValueError("Structured full story output is missing fields")
+
+    logger.info(f"Generated full story with quest in one call: {quest_title}")
+    return content, quest_title, quest_description
+
+
+async def _generate_chained(story_inputs: dict[str, Any]) -> tuple[str, str, str]:
+    """Generate story content, then quest title, then quest description (3 calls)."""
+    theme = story_inputs["theme"]
+    theme_references = story_inputs["theme_references"]
+
+    # Generate Full Story
+    with open("generate/prompts/full_story/full_story.txt", "r") as f:
+        full_story_prompt_text = f.read()
+
+    full_story_prompt = PromptTemplate.from_template(full_story_prompt_text)
+    full_story_llm = get_llm(max_tokens=500, tier="long")
+    full_story_chain = full_story_prompt | full_story_llm | StrOutputParser()
+
+    full_story_raw = await full_story_chain.ainvoke(
+        story_inputs, config=llm_step("full_story", "story")
+    )
+    full_story_content = clean_ai_text(full_story_raw)
+    logger.info("Generated full story content")
+
+    # Generate Quest Title
+    with open("generate/prompts/full_story/quest_title.txt", "r") as f:
+        quest_title_prompt_text = f.read()
+
+    quest_title_prompt = PromptTemplate.from_template(quest_title_prompt_text)
+    quest_title_llm = get_llm(max_tokens=50, tier="short")
+    quest_title_chain = quest_title_prompt | quest_title_llm | StrOutputParser()
+
+    quest_title_raw = await quest_title_chain.ainvoke(
+        {
+            "theme": theme,
+            "theme_references": theme_references,
+            "story_content": full_story_content,
+        },
+        config=llm_step("full_story", "quest_title"),
+    )
+    quest_title = clean_ai_text(quest_title_raw)
+    logger.info(f"Generated quest title: {quest_title}")
+
+    # Generate Quest Description
+    with open("generate/prompts/full_story/quest_description.txt", "r") as f:
+        quest_description_prompt_text = f.read()
+
+    quest_description_prompt = PromptTemplate.from_template(
+        quest_description_prompt_text
+    )
+    quest_description_llm = get_llm(max_tokens=150, tier="long")
+    quest_description_chain = (
+        quest_description_prompt | quest_description_llm | StrOutputParser()
+    )
+
+    quest_description_raw = await quest_description_chain.ainvoke(
+        {
+            "theme": theme,
+            "theme_references": theme_references,
+            "story_content": full_story_content,
+            "quest_title": quest_title,
+        },
+        config=llm_step("full_story", "quest_description"),
+    )
+    quest_description = clean_ai_text(quest_description_raw)
+    logger.info("Generated quest description")
+
+    return full_story_content, quest_title, quest_description
+
 
 @observe()
 async def generate_full_story(
@@ -23,6 +194,11 @@ async def generate_full_story(
     """
     Generate a full story based on the selected lore pieces and theme.
 
+    In 'combined' mode the story and quest come from one structured call, falling
+    back to the 'chained' 3-step generation if the structured output fails to parse.
+    Latency and tokens are recorded under the selected mode, fallback included,
+    so the A/B comparison charges combined for its failures.
+
     Parameters:
     - selected_pieces: SelectedLorePieces containing the selected lore pieces (character, faction, setting, event, relic).
     - theme: The theme for the story generation.
@@ -30,101 +206,48 @@ async def generate_full_story(
     Returns:
     A FullStory containing the generated story, selected pieces, quest title, and quest description.
     """
+    mode = _select_mode()
+    start_time = time.perf_counter()
+
     try:
         # Load shared theme references
         with open("generate/prompts/shared/theme_references.txt", "r") as f:
             theme_references = f.read()
 
-        character = selected_pieces.character
-        faction = selected_pieces.faction
-        setting = selected_pieces.setting
-        event = selected_pieces.event
-        relic = selected_pieces.relic
-
-        # Generate Full Story
-        with open("generate/prompts/full_story/full_story.txt", "r") as f:
-            full_story_prompt_text = f.read()
-
-        full_story_prompt = PromptTemplate.from_template(full_story_prompt_text)
-        full_story_llm = get_llm(max_tokens=500)
-        full_story_chain = full_story_prompt | full_story_llm | StrOutputParser()
-
-        full_story_raw = await full_story_chain.ainvoke(
-            {
-                "theme": theme,
-                "theme_references": theme_references,
-                "character_name": character.name if character else "N/A",
-                "character_description": character.description if character else "N/A",
-                "character_details": format_details(character.details)
-                if character
-                else "N/A",
-                "faction_name": faction.name if faction else "N/A",
-                "faction_description": faction.description if faction else "N/A",
-                "faction_details": format_details(faction.details)
-                if faction
-                else "N/A",
-                "setting_name": setting.name if setting else "N/A",
-                "setting_description": setting.description if setting else "N/A",
-                "setting_details": format_details(setting.details)
-                if setting
-                else "N/A",
-                "event_name": event.name if event else "N/A",
-                "event_description": event.description if event else "N/A",
-                "event_details": format_details(event.details) if event else "N/A",
-                "relic_name": relic.name if relic else "N/A",
-                "relic_description": relic.description if relic else "N/A",
-                "relic_details": format_details(relic.details) if relic else "N/A",
-            }
-        )
-        full_story_content = clean_ai_text(full_story_raw)
-        logger.info("Generated full story content")
-
-        # Generate Quest Title
-        with open("generate/prompts/full_story/quest_title.txt", "r") as f:
-            quest_title_prompt_text = f.read()
-
-        quest_title_prompt = PromptTemplate.from_template(quest_title_prompt_text)
-        quest_title_llm = get_llm(max_tokens=50)
-        quest_title_chain = quest_title_prompt | quest_title_llm | StrOutputParser()
-
-        quest_title_raw = await quest_title_chain.ainvoke(
-            {
-                "theme": theme,
-                "theme_references": theme_references,
-                "story_content": full_story_content,
-            }
-        )
-        quest_title = clean_ai_text(quest_title_raw)
-        logger.info(f"Generated quest title: {quest_title}")
+        story_inputs = _build_story_inputs(selected_pieces, theme, theme_references)
 
-        # Generate Quest Description
-        with open("generate/prompts/full_story/quest_description.txt", "r") as f:
-            quest_description_prompt_text = f.read()
+        with get_usage_metadata_callback() as usage_callback:
+            generated = None
+            if mode == "combined":
+                try:
+                    generated = await _generate_combined(story_inputs)
+                except Exception as e:
+                    full_story_fallback_counter.inc()
+                    logger.warning(
+                        f"Combined full story generation failed: {e}. Falling back to chained mode."
+                    )
 
-        quest_description_prompt = PromptTemplate.from_template(
-            quest_description_prompt_text
-        )
-        quest_description_llm = get_llm(max_tokens=150)
-        quest_description_chain = (
-            quest_description_prompt | quest_description_llm | StrOutputParser()
-        )
+            if generated is None:
+                generated = await _generate_chained(story_inputs)
+
+        content, quest_title, quest_description = generated
 
-        quest_description_raw = await quest_description_chain.ainvoke(
-            {
-                "theme": theme,
-                "theme_references": theme_references,
-                "story_content": full_story_content,
-                "quest_title": quest_title,
-            }
+        full_story_duration_histogram.labels(mode=mode).observe(
+            time.perf_counter() - start_time
         )
-        quest_description = clean_ai_text(quest_description_raw)
-        logger.info("Generated quest description")
+        for usage in usage_callback.usage_metadata.values():
+            full_story_tokens_counter.labels(mode=mode, token_type="input").inc(
+                usage.get("input_tokens", 0)
+            )
+            full_story_tokens_counter.labels(mode=mode, token_type="output").inc(
+                usage.get("output_tokens", 0)
+            )
 
         increment_success_counter()
-        logger.info("Successfully generated full story with quest")
+        logger.info(f"Successfully generated full story with quest (mode: {mode})")
 
         return FullStory(
-            content=full_story_content,
+            content=content,
             theme=theme,
             pieces=selected_pieces,
             quest={"title": quest_title, "description": quest_description},
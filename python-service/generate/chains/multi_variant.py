@@ -1,4 +1,5 @@
 import asyncio
+import uuid as uuid_lib
 
 from generate.models.lore_piece import LorePiece
 from constants.themes import Theme
@@ -7,9 +8,16 @@ from generate.chains.faction import generate_faction
 from generate.chains.setting import generate_setting
 from generate.chains.event import generate_event
 from generate.chains.relic import generate_relic
-from services.image_gen.portraits.operations import publish_portrait_job
+from generate.lore_pool import take_from_pool
+from services.image_gen.portraits.operations import (
+    build_portrait_job,
+    publish_portrait_jobs,
+)
+from config.settings import get_settings
 from utils.logger import logger
 
+settings = get_settings()
+
 
 async def generate_multiple_generic(
     prefix: str,
@@ -21,8 +29,11 @@ async def generate_multiple_generic(
     """
     Generic helper to generate multiple lore pieces.
 
+    Pieces in stock in the lore pool are served first; only the rest are
+    generated (and report progress).
+
     Args:
-        prefix: Unused (kept for API compatibility).
+        prefix: Lore kind ("characters", "factions", ...), the lore pool to use.
         generate_func: Async function to generate a single lore piece.
         count: Number of lore pieces to generate.
         theme: Theme for generation.
@@ -31,6 +42,9 @@ async def generate_multiple_generic(
     Returns:
         List of LorePiece instances.
     """
+    pooled = await take_from_pool(prefix, theme, count)
+    count -= len(pooled)
+
     # Track completed steps across all parallel generations
     completed_steps = {"count": 0}
     # We'll calculate total_steps dynamically based on first callback
@@ -56,42 +70,59 @@ async def generate_multiple_generic(
         generate_func(theme, progress_callback=item_progress_callback)
         for _ in range(count)
     ))
-    return items
+    return pooled + list(items)
+
+
+async def publish_character_portraits(
+    characters: list[LorePiece], theme: Theme, user_id: str = ""
+):
+    """Queue portrait generation for the characters (failures are logged)."""
+    if not settings.ENABLE_IMAGE_GENERATION:
+        return
+
+    # Publish portrait jobs to RabbitMQ in a single batch. The user is the
+    # fairness key for image scheduling; without one, fall back to this request
+    owner = user_id or f"request:{uuid_lib.uuid4()}"
+    portrait_jobs = []
+    for character in characters:
+        uuid = character.details.get("uuid")
+        appearance = character.details.get("appearance")
+
+        if uuid and appearance:
+            portrait_jobs.append(
+                build_portrait_job(
+                    uuid=uuid,
+                    name=character.name,
+                    appearance=appearance,
+                    theme=theme,
+                    traits=character.details.get("traits", []),
+                    skills=character.details.get("skills", []),
+                    user_id=owner,
+                )
+            )
+        else:
+            logger.warning(
+                f"Missing UUID or appearance for {character.name}, skipping portrait job"
+            )
+
+    try:
+        await publish_portrait_jobs(portrait_jobs)
+    except Exception as e:
+        logger.error(f"Failed to publish portrait jobs: {e}")
 
 
 async def generate_multiple_characters(
-    count: int = 3, theme: Theme = Theme.post_apocalyptic, progress_callback=None
+    count: int = 3,
+    theme: Theme = Theme.post_apocalyptic,
+    progress_callback=None,
+    user_id: str = "",
 ) -> list[LorePiece]:
     # Generate characters
     characters = await generate_multiple_generic(
         "characters", generate_character, count, theme, progress_callback
     )
 
-    # Publish portrait jobs to RabbitMQ
-    for character in characters:
-        try:
-            uuid = character.details.get("uuid")
-            name = character.name
-            appearance = character.details.get("appearance")
-            traits = character.details.get("traits", [])
-            skills = character.details.get("skills", [])
-
-            if uuid and appearance:
-                publish_portrait_job(
-                    uuid=uuid,
-                    name=name,
-                    appearance=appearance,
-                    theme=theme,
-                    traits=traits,
-                    skills=skills,
-                )
-                logger.info(f"Published portrait job for {name}")
-            else:
-                logger.warning(
-                    f"Missing UUID or appearance for {name}, skipping portrait job"
-                )
-        except Exception as e:
-            logger.error(f"Failed to publish portrait job for {character.name}: {e}")
+    await publish_character_portraits(characters, theme, user_id)
 
     return characters
 
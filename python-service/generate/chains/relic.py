@@ -12,6 +12,7 @@ from generate.models.structured_llm_output.relic_schema import (
 )
 from services.llm_client import (
     get_llm,
+    llm_step,
     increment_success_counter,
     increment_failure_counter,
 )
@@ -59,14 +60,15 @@ async def generate_relic(
             name_prompt_text = f.read()
 
         name_prompt = PromptTemplate.from_template(name_prompt_text)
-        name_llm = get_llm(max_tokens=50)
+        name_llm = get_llm(max_tokens=50, tier="short")
         name_chain = name_prompt | name_llm | StrOutputParser()
         name_raw = await name_chain.ainvoke(
             {
                 "theme": theme,
                 "theme_references": theme_references,
                 "blacklist": blacklist_str,
-            }
+            },
+            config=llm_step("relic", "name"),
         )
         name = clean_ai_text(name_raw)
         logger.info(f"Generated relic name: {name}")
@@ -80,7 +82,7 @@ async def generate_relic(
             description_prompt_text = f.read()
 
         description_prompt = PromptTemplate.from_template(description_prompt_text)
-        description_llm = get_llm(max_tokens=150).with_structured_output(RelicDescription)
+        description_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(RelicDescription)
         description_chain = description_prompt | description_llm
         description_result = cast(
             RelicDescription,
@@ -90,7 +92,8 @@ async def generate_relic(
                     "theme_references": theme_references,
                     "name": name,
                     "lore_context": lore_context,
-                }
+                },
+                config=llm_step("relic", "description"),
             )
         )
         description = description_result.description
@@ -105,7 +108,7 @@ async def generate_relic(
             history_prompt_text = f.read()
 
         history_prompt = PromptTemplate.from_template(history_prompt_text)
-        history_llm = get_llm(max_tokens=150).with_structured_output(RelicHistory)
+        history_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(RelicHistory)
         history_chain = history_prompt | history_llm
         history_result = cast(
             RelicHistory,
@@ -115,7 +118,8 @@ async def generate_relic(
                     "theme_references": theme_references,
                     "name": name,
                     "description": description,
-                }
+                },
+                config=llm_step("relic", "history"),
             )
         )
         history = history_result.history
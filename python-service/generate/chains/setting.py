@@ -15,6 +15,7 @@ from generate.models.structured_llm_output.setting_schema import (
 )
 from services.llm_client import (
     get_llm,
+    llm_step,
     increment_success_counter,
     increment_failure_counter,
 )
@@ -50,10 +51,11 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
             name_prompt_text = f.read()
 
         name_prompt = PromptTemplate.from_template(name_prompt_text)
-        name_llm = get_llm(max_tokens=50)
+        name_llm = get_llm(max_tokens=50, tier="short")
         name_chain = name_prompt | name_llm | StrOutputParser()
         name_raw = await name_chain.ainvoke(
-            {"theme": theme, "theme_references": theme_references, "blacklist": blacklist_str}
+            {"theme": theme, "theme_references": theme_references, "blacklist": blacklist_str},
+            config=llm_step("setting", "name"),
         )
         name = clean_ai_text(name_raw)
         logger.info(f"Generated setting name: {name}")
@@ -67,11 +69,14 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
             landscape_prompt_text = f.read()
 
         landscape_prompt = PromptTemplate.from_template(landscape_prompt_text)
-        landscape_llm = get_llm(max_tokens=150).with_structured_output(SettingLandscape)
+        landscape_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(SettingLandscape)
         landscape_chain = landscape_prompt | landscape_llm
         landscape_result = cast(
             SettingLandscape,
-            await landscape_chain.ainvoke({"theme": theme, "theme_references": theme_references, "name": name})
+            await landscape_chain.ainvoke(
+                {"theme": theme, "theme_references": theme_references, "name": name},
+                config=llm_step("setting", "landscape"),
+            )
         )
         landscape = landscape_result.landscape
         logger.info(f"Generated landscape for {name}")
@@ -85,7 +90,7 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
             culture_prompt_text = f.read()
 
         culture_prompt = PromptTemplate.from_template(culture_prompt_text)
-        culture_llm = get_llm(max_tokens=150).with_structured_output(SettingCulture)
+        culture_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(SettingCulture)
         culture_chain = culture_prompt | culture_llm
         culture_result = cast(
             SettingCulture,
@@ -95,7 +100,8 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
                     "theme_references": theme_references,
                     "name": name,
                     "landscape": landscape,
-                }
+                },
+                config=llm_step("setting", "culture"),
             )
         )
         culture = culture_result.culture
@@ -110,7 +116,7 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
             history_prompt_text = f.read()
 
         history_prompt = PromptTemplate.from_template(history_prompt_text)
-        history_llm = get_llm(max_tokens=150).with_structured_output(SettingHistory)
+        history_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(SettingHistory)
         history_chain = history_prompt | history_llm
         history_result = cast(
             SettingHistory,
@@ -121,7 +127,8 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
                     "name": name,
                     "landscape": landscape,
                     "culture": culture,
-                }
+                },
+                config=llm_step("setting", "history"),
             )
         )
         history = history_result.history
@@ -136,7 +143,7 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
             economy_prompt_text = f.read()
 
         economy_prompt = PromptTemplate.from_template(economy_prompt_text)
-        economy_llm = get_llm(max_tokens=150).with_structured_output(SettingEconomy)
+        economy_llm = get_llm(max_tokens=150, tier="structured").with_structured_output(SettingEconomy)
         economy_chain = economy_prompt | economy_llm
         economy_result = cast(
             SettingEconomy,
@@ -148,7 +155,8 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
                     "landscape": landscape,
                     "culture": culture,
                     "history": history,
-                }
+                },
+                config=llm_step("setting", "economy"),
             )
         )
         economy = economy_result.economy
@@ -163,7 +171,7 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
             summary_prompt_text = f.read()
 
         summary_prompt = PromptTemplate.from_template(summary_prompt_text)
-        summary_llm = get_llm(max_tokens=200).with_structured_output(SettingSummary)
+        summary_llm = get_llm(max_tokens=200, tier="structured").with_structured_output(SettingSummary)
         summary_chain = summary_prompt | summary_llm
         summary_result = cast(
             SettingSummary,
@@ -176,7 +184,8 @@ async def generate_setting(theme: str = "post-apocalyptic", progress_callback=No
                     "culture": culture,
                     "history": history,
                     "economy": economy,
-                }
+                },
+                config=llm_step("setting", "summary"),
             )
         )
         summary = summary_result.summary
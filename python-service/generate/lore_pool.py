@@ -0,0 +1,207 @@
+"""
+Pool of pre-generated lore pieces, served instantly by the Generate* RPCs.
+
+Characters, factions and settings don't depend on anything the user picked,
+so they can be generated ahead of time. Each (kind, theme) has a Redis list
+of pieces; Generate* takes from it first and only generates the shortfall
+live. A background task on each server worker tops the lists up to
+LORE_POOL_TARGET while the worker is idle, one piece at a time at the lowest
+priority of the GenerateAll concurrency slots. Events and relics depend on
+the selected setting (and event), so they are always generated live.
+"""
+
+import asyncio
+import json
+import time
+
+from prometheus_client import Counter, Gauge
+
+from config.settings import get_settings
+from constants.themes import Theme
+from generate.chains.character.character import generate_character
+from generate.chains.faction import generate_faction
+from generate.chains.setting import generate_setting
+from generate.models.lore_piece import LorePiece
+from services.grpc_metrics import rpcs_in_flight
+from services.redis import get_redis_client
+from utils.logger import logger
+
+settings = get_settings()
+
+POOL_KEY_PREFIX = "lore_pool:"
+
+POOLED_KINDS = {
+    "characters": generate_character,
+    "factions": generate_faction,
+    "settings": generate_setting,
+}
+
+# RPCs that generate lore with the LLM; refills wait while any of them runs
+GENERATION_RPCS = frozenset(
+    {
+        "GenerateCharacters",
+        "GenerateFactions",
+        "GenerateSettings",
+        "GenerateEvents",
+        "GenerateRelics",
+        "GenerateAll",
+        "GenerateAllStream",
+        "GenerateFullStory",
+    }
+)
+
+# Prometheus metrics for the lore pool
+lore_pool_depth_gauge = Gauge(
+    "loresmith_lore_pool_depth",
+    "Pre-generated lore pieces in stock",
+    ["kind", "theme"],
+)
+
+lore_pool_oldest_age_gauge = Gauge(
+    "loresmith_lore_pool_oldest_age_seconds",
+    "Age of the oldest pre-generated piece in stock",
+    ["kind", "theme"],
+)
+
+lore_pool_pieces_counter = Counter(
+    "loresmith_lore_pool_pieces_total",
+    "Lore pieces served by Generate*, from the pool or generated live",
+    ["kind", "source"],  # source: pool, live
+)
+
+lore_pool_refills_counter = Counter(
+    "loresmith_lore_pool_refills_total",
+    "Pieces generated for the pool",
+    ["kind", "status"],  # status: success, failure
+)
+
+
+def _pool_key(kind: str, theme: str) -> str:
+    return f"{POOL_KEY_PREFIX}{kind}:{theme}"
+
+
+def _theme_value(theme: Theme | str) -> str:
+    return theme.value if isinstance(theme, Theme) else str(theme)
+
+
+async def take_from_pool(kind: str, theme: Theme | str, count: int) -> list[LorePiece]:
+    """
+    Take up to `count` pieces from stock (oldest first), dropping any older
+    than LORE_POOL_MAX_AGE_SECONDS. Returns [] when the pool is off, empty or
+    unreachable; callers generate whatever is missing live.
+    """
+    if not settings.LORE_POOL_ENABLED or kind not in POOLED_KINDS or count <= 0:
+        return []
+
+    theme = _theme_value(theme)
+    pieces: list[LorePiece] = []
+    try:
+        client = get_redis_client()
+        expired_before = time.time() - settings.LORE_POOL_MAX_AGE_SECONDS
+        while len(pieces) < count:
+            entries = await client.lpop(  # type: ignore[misc]
+                _pool_key(kind, theme), count - len(pieces)
+            )
+            if not entries:
+                break
+            for entry in entries:
+                stocked = json.loads(entry)
+                if stocked["created_at"] >= expired_before:
+                    pieces.append(LorePiece.model_validate(stocked["piece"]))
+    except Exception as e:
+        logger.error(f"Failed to take {kind} from lore pool: {e}")
+
+    lore_pool_pieces_counter.labels(kind=kind, source="pool").inc(len(pieces))
+    lore_pool_pieces_counter.labels(kind=kind, source="live").inc(count - len(pieces))
+    return pieces
+
+
+async def add_to_pool(kind: str, theme: Theme | str, piece: LorePiece):
+    """Stock a piece, keeping at most LORE_POOL_TARGET per kind and theme."""
+    key = _pool_key(kind, _theme_value(theme))
+    entry = json.dumps({"created_at": time.time(), "piece": piece.model_dump()})
+    client = get_redis_client()
+    async with client.pipeline(transaction=False) as pipe:
+        pipe.rpush(key, entry)
+        # Several server workers refill the same lists: drop the oldest extras
+        pipe.ltrim(key, -settings.LORE_POOL_TARGET, -1)
+        await pipe.execute()
+
+
+async def _pool_stock(kind: str, theme: str) -> int:
+    """Current depth of a pool list; also refreshes its depth and age gauges."""
+    client = get_redis_client()
+    key = _pool_key(kind, theme)
+    async with client.pipeline(transaction=False) as pipe:
+        pipe.llen(key)
+        pipe.lindex(key, 0)
+        depth, oldest = await pipe.execute()
+
+    lore_pool_depth_gauge.labels(kind=kind, theme=theme).set(depth)
+    age = time.time() - json.loads(oldest)["created_at"] if oldest else 0
+    lore_pool_oldest_age_gauge.labels(kind=kind, theme=theme).set(age)
+    return depth
+
+
+def _pool_themes() -> list[str]:
+    """Themes to stock: those in LORE_POOL_THEMES (unknown ones are skipped)."""
+    if not settings.LORE_POOL_THEMES:
+        return [theme.value for theme in Theme]
+    configured = {theme.strip() for theme in settings.LORE_POOL_THEMES.split(",")}
+    return [theme.value for theme in Theme if theme.value in configured]
+
+
+async def _refill_once(slots) -> bool:
+    """
+    Generate one piece for the emptiest pool list. Returns False when every
+    list is at LORE_POOL_TARGET (or the worker is busy with generation RPCs).
+    """
+    if rpcs_in_flight(GENERATION_RPCS) > 0:
+        return False
+
+    stock = {
+        (kind, theme): await _pool_stock(kind, theme)
+        for kind in POOLED_KINDS
+        for theme in _pool_themes()
+    }
+    if not stock:
+        return False
+    (kind, theme), depth = min(stock.items(), key=lambda item: item[1])
+    if depth >= settings.LORE_POOL_TARGET:
+        return False
+
+    try:
+        async with slots.slot(priority=slots.LOWEST):
+            piece = await POOLED_KINDS[kind](Theme(theme))
+        await add_to_pool(kind, theme, piece)
+        lore_pool_refills_counter.labels(kind=kind, status="success").inc()
+        logger.info(f"Lore pool: stocked a {kind[:-1]} for {theme} ({depth + 1})")
+    except Exception as e:
+        lore_pool_refills_counter.labels(kind=kind, status="failure").inc()
+        logger.error(f"Lore pool refill of {kind} for {theme} failed: {e}")
+        return False
+    return True
+
+
+async def replenish_lore_pool(slots):
+    """
+    Keep the pool stocked until cancelled: generate pieces back to back while
+    any list is short and the worker is idle, otherwise check again every
+    LORE_POOL_REFILL_INTERVAL_SECONDS.
+    """
+    themes = _pool_themes()
+    logger.info(
+        f"Lore pool: keeping {settings.LORE_POOL_TARGET} of each "
+        f"{', '.join(POOLED_KINDS)} for {', '.join(themes) or 'no themes'}"
+    )
+    for theme in settings.LORE_POOL_THEMES.split(","):
+        if theme.strip() and theme.strip() not in themes:
+            logger.warning(f"Lore pool: ignoring unknown theme '{theme.strip()}'")
+    while True:
+        try:
+            refilled = await _refill_once(slots)
+        except Exception as e:
+            logger.error(f"Lore pool check failed: {e}")
+            refilled = False
+        if not refilled:
+            await asyncio.sleep(settings.LORE_POOL_REFILL_INTERVAL_SECONDS)
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class FullStoryOutput(BaseModel):
+    """Full story with its main quest in a single structured output"""
+
+    content: str = Field(
+        description="The story opening (2 paragraphs, 150-200 words, plain text)"
+    )
+    quest_title: str = Field(
+        description="Compelling title for the main quest (3-8 words, no quotes)"
+    )
+    quest_description: str = Field(
+        description="Actionable description of the main quest tied to the story's conflict (1-2 sentences)"
+    )
@@ -1,39 +1,152 @@
 import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from utils.logger import logger
+from config.settings import get_settings
 from generate.models.generated_lore_bundle import GeneratedLoreBundle
-from generate.chains.multi_variant import (
-    generate_multiple_characters,
-    generate_multiple_factions,
-    generate_multiple_settings,
-    generate_multiple_events,
-    generate_multiple_relics,
-)
+from generate.models.lore_piece import LorePiece
+from generate.chains.character.character import generate_character
+from generate.chains.faction import generate_faction
+from generate.chains.setting import generate_setting
+from generate.chains.event import generate_event
+from generate.chains.relic import generate_relic
+from generate.chains.multi_variant import publish_character_portraits
+from generate.lore_pool import POOLED_KINDS, take_from_pool
 from constants.themes import Theme
 from exceptions.generation import LoreVariantsGenerationError
 
+settings = get_settings()
+
+LORE_KINDS = ("characters", "factions", "settings", "events", "relics")
+
+# Lower runs first: relics wait on events, which wait on settings, so the
+# setting -> event -> relic chain (the critical path) gets free slots first
+_PRIORITY = {"relics": 0, "events": 1, "settings": 2, "characters": 3, "factions": 3}
+
+
+class _PrioritySlots:
+    """Concurrency limit that hands freed slots to the lowest priority first."""
+
+    LOWEST = 99  # Background work (lore pool refills) waits behind any RPC
+
+    def __init__(self, limit: int):
+        self._free = limit
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+
+    @asynccontextmanager
+    async def slot(self, priority: int):
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int):
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Handed a slot just as we were cancelled: pass it on
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+
+# Shared by all GenerateAll calls on this server worker
+generation_slots = _PrioritySlots(settings.LORE_PIPELINE_CONCURRENCY)
+
+
+async def stream_lore_variants(
+    count: int = 3, theme: Theme = Theme.post_apocalyptic, user_id: str = ""
+) -> AsyncIterator[tuple[str, int, LorePiece]]:
+    """
+    Generate `count` of each lore type, yielding (kind, index, piece) as each
+    piece is done.
+
+    Characters, factions and settings start at once; event i starts as soon
+    as setting i is done, and relic i as soon as event i is. Pieces are
+    generated at most LORE_PIPELINE_CONCURRENCY at a time across all calls;
+    pieces in stock in the lore pool are used as they are. Returns once the
+    characters' portrait jobs are published too.
+    Raises the first piece's error, cancelling the rest.
+    """
+    done: asyncio.Queue[tuple[str, int, LorePiece] | Exception] = asyncio.Queue()
+    pooled = {kind: await take_from_pool(kind, theme, count) for kind in POOLED_KINDS}
+
+    async def generate(kind: str, index: int, generate_func, **kwargs) -> LorePiece:
+        if index < len(pooled.get(kind, [])):
+            piece = pooled[kind][index]
+        else:
+            async with generation_slots.slot(_PRIORITY[kind]):
+                piece = await generate_func(theme, **kwargs)
+        done.put_nowait((kind, index, piece))
+        return piece
+
+    async def setting_chain(index: int):
+        setting = await generate("settings", index, generate_setting)
+        event = await generate("events", index, generate_event, setting=setting)
+        await generate("relics", index, generate_relic, setting=setting, event=event)
+
+    async def characters():
+        pieces = await asyncio.gather(
+            *(generate("characters", i, generate_character) for i in range(count))
+        )
+        await publish_character_portraits(list(pieces), theme, user_id)
+
+    async def factions():
+        await asyncio.gather(
+            *(generate("factions", i, generate_faction) for i in range(count))
+        )
+
+    async def report_errors(job):
+        try:
+            await job
+        except Exception as e:
+            done.put_nowait(e)
+
+    # Setting chains first, so they queue ahead of the other pieces
+    jobs = [setting_chain(i) for i in range(count)] + [characters(), factions()]
+    tasks = [asyncio.create_task(report_errors(job)) for job in jobs]
+    try:
+        for _ in range(count * len(LORE_KINDS)):
+            result = await done.get()
+            if isinstance(result, Exception):
+                raise result
+            yield result
+        # All pieces are out, but publishing the portrait jobs may still run
+        await asyncio.gather(*tasks)
+    finally:
+        # Only reached with unfinished tasks on an error or an abandoned stream
+        for task in tasks:
+            task.cancel()
+
 
 async def generate_lore_variants(
-    count: int = 3, theme: Theme = Theme.post_apocalyptic
+    count: int = 3, theme: Theme = Theme.post_apocalyptic, user_id: str = ""
 ) -> GeneratedLoreBundle:
     try:
-        character_task = generate_multiple_characters(count, theme)
-        faction_task = generate_multiple_factions(count, theme)
-        setting_task = generate_multiple_settings(count, theme)
-        event_task = generate_multiple_events(count, theme)
-        relic_task = generate_multiple_relics(count, theme)
-
-        characters, factions, settings, events, relics = await asyncio.gather(
-            character_task, faction_task, setting_task, event_task, relic_task
-        )
+        pieces: dict[str, list] = {kind: [None] * count for kind in LORE_KINDS}
+        async for kind, index, piece in stream_lore_variants(count, theme, user_id):
+            pieces[kind][index] = piece
 
-        return GeneratedLoreBundle(
-            characters=characters,
-            factions=factions,
-            settings=settings,
-            events=events,
-            relics=relics,
-        )
+        return GeneratedLoreBundle(**pieces)
 
     except Exception as e:
         logger.error(f"Error generating lore variants: {e}", exc_info=True)
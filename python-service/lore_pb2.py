@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nlore.proto\x12\x04lore\"1\n\x11\x43haractersRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"/\n\x0f\x46\x61\x63tionsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"/\n\x0fSettingsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"X\n\rEventsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12)\n\x10selected_setting\x18\x03 \x01(\x0b\x32\x0f.lore.LorePiece\"\x81\x01\n\rRelicsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12)\n\x10selected_setting\x18\x03 \x01(\x0b\x32\x0f.lore.LorePiece\x12\'\n\x0eselected_event\x18\x04 \x01(\x0b\x32\x0f.lore.LorePiece\"\x9b\x01\n\tLorePiece\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12-\n\x07\x64\x65tails\x18\x03 \x03(\x0b\x32\x1c.lore.LorePiece.DetailsEntry\x12\x0c\n\x04type\x18\x04 \x01(\t\x1a.\n\x0c\x44\x65tailsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"9\n\x12\x43haractersResponse\x12#\n\ncharacters\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"5\n\x10\x46\x61\x63tionsResponse\x12!\n\x08\x66\x61\x63tions\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"5\n\x10SettingsResponse\x12!\n\x08settings\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"1\n\x0e\x45ventsResponse\x12\x1f\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"1\n\x0eRelicsResponse\x12\x1f\n\x06relics\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"7\n\x12GenerationProgress\x12\x10\n\x08progress\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x7f\n\x18\x43haractersStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12)\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x18.lore.CharactersResponseH\x00\x42\n\n\x08response\"{\n\x16\x46\x61\x63tionsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12\'\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x16.lore.FactionsResponseH\x00\x42\n\n\x08response\"{\n\x16SettingsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12\'\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x16.lore.SettingsResponseH\x00\x42\n\n\x08response\"w\n\x14\x45ventsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12%\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x14.lore.EventsResponseH\x00\x42\n\n\x08response\"w\n\x14RelicsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12%\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x14.lore.RelicsResponseH\x00\x42\n\n\x08response\"*\n\nAllRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xba\x01\n\x0b\x41llResponse\x12#\n\ncharacters\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\x12!\n\x08\x66\x61\x63tions\x18\x02 \x03(\x0b\x32\x0f.lore.LorePiece\x12!\n\x08settings\x18\x03 \x03(\x0b\x32\x0f.lore.LorePiece\x12\x1f\n\x06\x65vents\x18\x04 \x03(\x0b\x32\x0f.lore.LorePiece\x12\x1f\n\x06relics\x18\x05 \x03(\x0b\x32\x0f.lore.LorePiece\"\xbc\x01\n\x12SelectedLorePieces\x12\"\n\tcharacter\x18\x01 \x01(\x0b\x32\x0f.lore.LorePiece\x12 \n\x07\x66\x61\x63tion\x18\x02 \x01(\x0b\x32\x0f.lore.LorePiece\x12 \n\x07setting\x18\x03 \x01(\x0b\x32\x0f.lore.LorePiece\x12\x1e\n\x05\x65vent\x18\x04 \x01(\x0b\x32\x0f.lore.LorePiece\x12\x1e\n\x05relic\x18\x05 \x01(\x0b\x32\x0f.lore.LorePiece\"\xae\x01\n\tFullStory\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\r\n\x05theme\x18\x02 \x01(\t\x12(\n\x06pieces\x18\x03 \x01(\x0b\x32\x18.lore.SelectedLorePieces\x12)\n\x05quest\x18\x04 \x03(\x0b\x32\x1a.lore.FullStory.QuestEntry\x1a,\n\nQuestEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"K\n\x10\x46ullStoryRequest\x12(\n\x06pieces\x18\x01 \x01(\x0b\x32\x18.lore.SelectedLorePieces\x12\r\n\x05theme\x18\x02 \x01(\t\"3\n\x11\x46ullStoryResponse\x12\x1e\n\x05story\x18\x01 \x01(\x0b\x32\x0f.lore.FullStory\" \n\x10\x45mbeddingRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\"&\n\x11\x45mbeddingResponse\x12\x11\n\tembedding\x18\x01 \x03(\x02\"e\n\x0bWorldResult\x12\r\n\x05title\x18\x01 \x01(\t\x12\r\n\x05theme\x18\x02 \x01(\t\x12\x12\n\nfull_story\x18\x03 \x01(\t\x12\x11\n\trelevance\x18\x04 \x01(\x02\x12\x11\n\tembedding\x18\x05 \x03(\x02\"`\n\x13RerankSearchRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12!\n\x06worlds\x18\x02 \x03(\x0b\x32\x11.lore.WorldResult\x12\x17\n\x0fquery_embedding\x18\x03 \x03(\x02\"B\n\x14RerankSearchResponse\x12*\n\x0freranked_worlds\x18\x01 \x03(\x0b\x32\x11.lore.WorldResult\"f\n\x12UploadImageRequest\x12\x14\n\x0cimage_base64\x18\x01 \x01(\t\x12\x10\n\x08world_id\x18\x02 \x01(\x03\x12\x14\n\x0c\x63haracter_id\x18\x03 \x01(\t\x12\x12\n\nimage_type\x18\x04 \x01(\t\"(\n\x13UploadImageResponse\x12\x11\n\timage_url\x18\x01 \x01(\t\"\x87\x01\n\x19GenerateWorldImageRequest\x12\x13\n\x0bworld_title\x18\x01 \x01(\t\x12\x12\n\nfull_story\x18\x02 \x01(\t\x12\r\n\x05theme\x18\x03 \x01(\t\x12\x1b\n\x13setting_description\x18\x04 \x01(\t\x12\x15\n\ruse_replicate\x18\x05 \x01(\x08\"2\n\x1aGenerateWorldImageResponse\x12\x14\n\x0cimage_base64\x18\x01 \x01(\t2\xa7\x06\n\x0bLoreService\x12O\n\x12GenerateCharacters\x12\x17.lore.CharactersRequest\x1a\x1e.lore.CharactersStreamResponse0\x01\x12I\n\x10GenerateFactions\x12\x15.lore.FactionsRequest\x1a\x1c.lore.FactionsStreamResponse0\x01\x12I\n\x10GenerateSettings\x12\x15.lore.SettingsRequest\x1a\x1c.lore.SettingsStreamResponse0\x01\x12\x43\n\x0eGenerateEvents\x12\x13.lore.EventsRequest\x1a\x1a.lore.EventsStreamResponse0\x01\x12\x43\n\x0eGenerateRelics\x12\x13.lore.RelicsRequest\x1a\x1a.lore.RelicsStreamResponse0\x01\x12\x32\n\x0bGenerateAll\x12\x10.lore.AllRequest\x1a\x11.lore.AllResponse\x12\x44\n\x11GenerateFullStory\x12\x16.lore.FullStoryRequest\x1a\x17.lore.FullStoryResponse\x12\x44\n\x11GenerateEmbedding\x12\x16.lore.EmbeddingRequest\x1a\x17.lore.EmbeddingResponse\x12\x46\n\rRerankResults\x12\x19.lore.RerankSearchRequest\x1a\x1a.lore.RerankSearchResponse\x12\x46\n\x0fUploadImageToR2\x12\x18.lore.UploadImageRequest\x1a\x19.lore.UploadImageResponse\x12W\n\x12GenerateWorldImage\x12\x1f.lore.GenerateWorldImageRequest\x1a .lore.GenerateWorldImageResponseB\x0cZ\ngen/lorepbb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nlore.proto\x12\x04lore\"1\n\x11\x43haractersRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"/\n\x0f\x46\x61\x63tionsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"/\n\x0fSettingsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"X\n\rEventsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12)\n\x10selected_setting\x18\x03 \x01(\x0b\x32\x0f.lore.LorePiece\"\x81\x01\n\rRelicsRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12)\n\x10selected_setting\x18\x03 \x01(\x0b\x32\x0f.lore.LorePiece\x12\'\n\x0eselected_event\x18\x04 \x01(\x0b\x32\x0f.lore.LorePiece\"\x9b\x01\n\tLorePiece\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12-\n\x07\x64\x65tails\x18\x03 \x03(\x0b\x32\x1c.lore.LorePiece.DetailsEntry\x12\x0c\n\x04type\x18\x04 \x01(\t\x1a.\n\x0c\x44\x65tailsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"9\n\x12\x43haractersResponse\x12#\n\ncharacters\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"5\n\x10\x46\x61\x63tionsResponse\x12!\n\x08\x66\x61\x63tions\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"5\n\x10SettingsResponse\x12!\n\x08settings\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"1\n\x0e\x45ventsResponse\x12\x1f\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"1\n\x0eRelicsResponse\x12\x1f\n\x06relics\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\"7\n\x12GenerationProgress\x12\x10\n\x08progress\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x7f\n\x18\x43haractersStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12)\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x18.lore.CharactersResponseH\x00\x42\n\n\x08response\"{\n\x16\x46\x61\x63tionsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12\'\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x16.lore.FactionsResponseH\x00\x42\n\n\x08response\"{\n\x16SettingsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12\'\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x16.lore.SettingsResponseH\x00\x42\n\n\x08response\"w\n\x14\x45ventsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12%\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x14.lore.EventsResponseH\x00\x42\n\n\x08response\"w\n\x14RelicsStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12%\n\x05\x66inal\x18\x02 \x01(\x0b\x32\x14.lore.RelicsResponseH\x00\x42\n\n\x08response\"*\n\nAllRequest\x12\r\n\x05theme\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xba\x01\n\x0b\x41llResponse\x12#\n\ncharacters\x18\x01 \x03(\x0b\x32\x0f.lore.LorePiece\x12!\n\x08\x66\x61\x63tions\x18\x02 \x03(\x0b\x32\x0f.lore.LorePiece\x12!\n\x08settings\x18\x03 \x03(\x0b\x32\x0f.lore.LorePiece\x12\x1f\n\x06\x65vents\x18\x04 \x03(\x0b\x32\x0f.lore.LorePiece\x12\x1f\n\x06relics\x18\x05 \x03(\x0b\x32\x0f.lore.LorePiece\"\xa8\x01\n\x11\x41llStreamResponse\x12,\n\x08progress\x18\x01 \x01(\x0b\x32\x18.lore.GenerationProgressH\x00\x12 \n\x05piece\x18\x02 \x01(\x0b\x32\x0f.lore.LorePieceH\x00\x12\"\n\x05\x66inal\x18\x03 \x01(\x0b\x32\x11.lore.AllResponseH\x00\x12\x13\n\x0bpiece_index\x18\x04 \x01(\x05\x42\n\n\x08response\"\xbc\x01\n\x12SelectedLorePieces\x12\"\n\tcharacter\x18\x01 \x01(\x0b\x32\x0f.lore.LorePiece\x12 \n\x07\x66\x61\x63tion\x18\x02 \x01(\x0b\x32\x0f.lore.LorePiece\x12 \n\x07setting\x18\x03 \x01(\x0b\x32\x0f.lore.LorePiece\x12\x1e\n\x05\x65vent\x18\x04 \x01(\x0b\x32\x0f.lore.LorePiece\x12\x1e\n\x05relic\x18\x05 \x01(\x0b\x32\x0f.lore.LorePiece\"\xae\x01\n\tFullStory\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\r\n\x05theme\x18\x02 \x01(\t\x12(\n\x06pieces\x18\x03 \x01(\x0b\x32\x18.lore.SelectedLorePieces\x12)\n\x05quest\x18\x04 \x03(\x0b\x32\x1a.lore.FullStory.QuestEntry\x1a,\n\nQuestEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"K\n\x10\x46ullStoryRequest\x12(\n\x06pieces\x18\x01 \x01(\x0b\x32\x18.lore.SelectedLorePieces\x12\r\n\x05theme\x18\x02 \x01(\t\"3\n\x11\x46ullStoryResponse\x12\x1e\n\x05story\x18\x01 \x01(\x0b\x32\x0f.lore.FullStory\" \n\x10\x45mbeddingRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\"&\n\x11\x45mbeddingResponse\x12\x11\n\tembedding\x18\x01 \x03(\x02\"e\n\x0bWorldResult\x12\r\n\x05title\x18\x01 \x01(\t\x12\r\n\x05theme\x18\x02 \x01(\t\x12\x12\n\nfull_story\x18\x03 \x01(\t\x12\x11\n\trelevance\x18\x04 \x01(\x02\x12\x11\n\tembedding\x18\x05 \x03(\x02\"`\n\x13RerankSearchRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12!\n\x06worlds\x18\x02 \x03(\x0b\x32\x11.lore.WorldResult\x12\x17\n\x0fquery_embedding\x18\x03 \x03(\x02\"B\n\x14RerankSearchResponse\x12*\n\x0freranked_worlds\x18\x01 \x03(\x0b\x32\x11.lore.WorldResult\"f\n\x12UploadImageRequest\x12\x14\n\x0cimage_base64\x18\x01 \x01(\t\x12\x10\n\x08world_id\x18\x02 \x01(\x03\x12\x14\n\x0c\x63haracter_id\x18\x03 \x01(\t\x12\x12\n\nimage_type\x18\x04 \x01(\t\"\x9e\x01\n\x13UploadImageResponse\x12\x11\n\timage_url\x18\x01 \x01(\t\x12@\n\x0cvariant_urls\x18\x02 \x03(\x0b\x32*.lore.UploadImageResponse.VariantUrlsEntry\x1a\x32\n\x10VariantUrlsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\\\n\x10UploadImageChunk\x12-\n\x08metadata\x18\x01 \x01(\x0b\x32\x19.lore.UploadImageMetadataH\x00\x12\x0e\n\x04\x64\x61ta\x18\x02 \x01(\x0cH\x00\x42\t\n\x07payload\"Q\n\x13UploadImageMetadata\x12\x10\n\x08world_id\x18\x01 \x01(\x03\x12\x14\n\x0c\x63haracter_id\x18\x02 \x01(\t\x12\x12\n\nimage_type\x18\x03 \x01(\t\"D\n\x18UploadImagesBatchRequest\x12(\n\x06images\x18\x01 \x03(\x0b\x32\x18.lore.UploadImageRequest\"\xd3\x01\n\x11UploadImageResult\x12\x14\n\x0c\x63haracter_id\x18\x01 \x01(\t\x12\x12\n\nimage_type\x18\x02 \x01(\t\x12\x11\n\timage_url\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12>\n\x0cvariant_urls\x18\x05 \x03(\x0b\x32(.lore.UploadImageResult.VariantUrlsEntry\x1a\x32\n\x10VariantUrlsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"E\n\x19UploadImagesBatchResponse\x12(\n\x07results\x18\x01 \x03(\x0b\x32\x17.lore.UploadImageResult\"\x99\x01\n\x19GenerateWorldImageRequest\x12\x13\n\x0bworld_title\x18\x01 \x01(\t\x12\x12\n\nfull_story\x18\x02 \x01(\t\x12\r\n\x05theme\x18\x03 \x01(\t\x12\x1b\n\x13setting_description\x18\x04 \x01(\t\x12\x15\n\ruse_replicate\x18\x05 \x01(\x08\x12\x10\n\x08world_id\x18\x06 \x01(\x03\"2\n\x1aGenerateWorldImageResponse\x12\x14\n\x0cimage_base64\x18\x01 \x01(\t\"&\n\x14WorldImageJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\xd5\x01\n\rWorldImageJob\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x12\n\nimage_data\x18\x03 \x01(\x0c\x12\x11\n\timage_url\x18\x04 \x01(\t\x12:\n\x0cvariant_urls\x18\x05 \x03(\x0b\x32$.lore.WorldImageJob.VariantUrlsEntry\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x1a\x32\n\x10VariantUrlsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\x93\t\n\x0bLoreService\x12O\n\x12GenerateCharacters\x12\x17.lore.CharactersRequest\x1a\x1e.lore.CharactersStreamResponse0\x01\x12I\n\x10GenerateFactions\x12\x15.lore.FactionsRequest\x1a\x1c.lore.FactionsStreamResponse0\x01\x12I\n\x10GenerateSettings\x12\x15.lore.SettingsRequest\x1a\x1c.lore.SettingsStreamResponse0\x01\x12\x43\n\x0eGenerateEvents\x12\x13.lore.EventsRequest\x1a\x1a.lore.EventsStreamResponse0\x01\x12\x43\n\x0eGenerateRelics\x12\x13.lore.RelicsRequest\x1a\x1a.lore.RelicsStreamResponse0\x01\x12\x32\n\x0bGenerateAll\x12\x10.lore.AllRequest\x1a\x11.lore.AllResponse\x12@\n\x11GenerateAllStream\x12\x10.lore.AllRequest\x1a\x17.lore.AllStreamResponse0\x01\x12\x44\n\x11GenerateFullStory\x12\x16.lore.FullStoryRequest\x1a\x17.lore.FullStoryResponse\x12\x44\n\x11GenerateEmbedding\x12\x16.lore.EmbeddingRequest\x1a\x17.lore.EmbeddingResponse\x12\x46\n\rRerankResults\x12\x19.lore.RerankSearchRequest\x1a\x1a.lore.RerankSearchResponse\x12\x46\n\x0fUploadImageToR2\x12\x18.lore.UploadImageRequest\x1a\x19.lore.UploadImageResponse\x12T\n\x11UploadImagesBatch\x12\x1e.lore.UploadImagesBatchRequest\x1a\x1f.lore.UploadImagesBatchResponse\x12\x42\n\x0bUploadImage\x12\x16.lore.UploadImageChunk\x1a\x19.lore.UploadImageResponse(\x01\x12W\n\x12GenerateWorldImage\x12\x1f.lore.GenerateWorldImageRequest\x1a .lore.GenerateWorldImageResponse\x12I\n\x11\x45nqueueWorldImage\x12\x1f.lore.GenerateWorldImageRequest\x1a\x13.lore.WorldImageJob\x12\x43\n\x10GetWorldImageJob\x12\x1a.lore.WorldImageJobRequest\x1a\x13.lore.WorldImageJobB\x0cZ\ngen/lorepbb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -36,6 +36,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_LOREPIECE_DETAILSENTRY']._serialized_options = b'8\001'
   _globals['_FULLSTORY_QUESTENTRY']._loaded_options = None
   _globals['_FULLSTORY_QUESTENTRY']._serialized_options = b'8\001'
+  _globals['_UPLOADIMAGERESPONSE_VARIANTURLSENTRY']._loaded_options = None
+  _globals['_UPLOADIMAGERESPONSE_VARIANTURLSENTRY']._serialized_options = b'8\001'
+  _globals['_UPLOADIMAGERESULT_VARIANTURLSENTRY']._loaded_options = None
+  _globals['_UPLOADIMAGERESULT_VARIANTURLSENTRY']._serialized_options = b'8\001'
+  _globals['_WORLDIMAGEJOB_VARIANTURLSENTRY']._loaded_options = None
+  _globals['_WORLDIMAGEJOB_VARIANTURLSENTRY']._serialized_options = b'8\001'
   _globals['_CHARACTERSREQUEST']._serialized_start=20
   _globals['_CHARACTERSREQUEST']._serialized_end=69
   _globals['_FACTIONSREQUEST']._serialized_start=71
@@ -76,34 +82,56 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_ALLREQUEST']._serialized_end=1540
   _globals['_ALLRESPONSE']._serialized_start=1543
   _globals['_ALLRESPONSE']._serialized_end=1729
-  _globals['_SELECTEDLOREPIECES']._serialized_start=1732
-  _globals['_SELECTEDLOREPIECES']._serialized_end=1920
-  _globals['_FULLSTORY']._serialized_start=1923
-  _globals['_FULLSTORY']._serialized_end=2097
-  _globals['_FULLSTORY_QUESTENTRY']._serialized_start=2053
-  _globals['_FULLSTORY_QUESTENTRY']._serialized_end=2097
-  _globals['_FULLSTORYREQUEST']._serialized_start=2099
-  _globals['_FULLSTORYREQUEST']._serialized_end=2174
-  _globals['_FULLSTORYRESPONSE']._serialized_start=2176
-  _globals['_FULLSTORYRESPONSE']._serialized_end=2227
-  _globals['_EMBEDDINGREQUEST']._serialized_start=2229
-  _globals['_EMBEDDINGREQUEST']._serialized_end=2261
-  _globals['_EMBEDDINGRESPONSE']._serialized_start=2263
-  _globals['_EMBEDDINGRESPONSE']._serialized_end=2301
-  _globals['_WORLDRESULT']._serialized_start=2303
-  _globals['_WORLDRESULT']._serialized_end=2404
-  _globals['_RERANKSEARCHREQUEST']._serialized_start=2406
-  _globals['_RERANKSEARCHREQUEST']._serialized_end=2502
-  _globals['_RERANKSEARCHRESPONSE']._serialized_start=2504
-  _globals['_RERANKSEARCHRESPONSE']._serialized_end=2570
-  _globals['_UPLOADIMAGEREQUEST']._serialized_start=2572
-  _globals['_UPLOADIMAGEREQUEST']._serialized_end=2674
-  _globals['_UPLOADIMAGERESPONSE']._serialized_start=2676
-  _globals['_UPLOADIMAGERESPONSE']._serialized_end=2716
-  _globals['_GENERATEWORLDIMAGEREQUEST']._serialized_start=2719
-  _globals['_GENERATEWORLDIMAGEREQUEST']._serialized_end=2854
-  _globals['_GENERATEWORLDIMAGERESPONSE']._serialized_start=2856
-  _globals['_GENERATEWORLDIMAGERESPONSE']._serialized_end=2906
-  _globals['_LORESERVICE']._serialized_start=2909
-  _globals['_LORESERVICE']._serialized_end=3716
+  _globals['_ALLSTREAMRESPONSE']._serialized_start=1732
+  _globals['_ALLSTREAMRESPONSE']._serialized_end=1900
+  _globals['_SELECTEDLOREPIECES']._serialized_start=1903
+  _globals['_SELECTEDLOREPIECES']._serialized_end=2091
+  _globals['_FULLSTORY']._serialized_start=2094
+  _globals['_FULLSTORY']._serialized_end=2268
+  _globals['_FULLSTORY_QUESTENTRY']._serialized_start=2224
+  _globals['_FULLSTORY_QUESTENTRY']._serialized_end=2268
+  _globals['_FULLSTORYREQUEST']._serialized_start=2270
+  _globals['_FULLSTORYREQUEST']._serialized_end=2345
+  _globals['_FULLSTORYRESPONSE']._serialized_start=2347
+  _globals['_FULLSTORYRESPONSE']._serialized_end=2398
+  _globals['_EMBEDDINGREQUEST']._serialized_start=2400
+  _globals['_EMBEDDINGREQUEST']._serialized_end=2432
+  _globals['_EMBEDDINGRESPONSE']._serialized_start=2434
+  _globals['_EMBEDDINGRESPONSE']._serialized_end=2472
+  _globals['_WORLDRESULT']._serialized_start=2474
+  _globals['_WORLDRESULT']._serialized_end=2575
+  _globals['_RERANKSEARCHREQUEST']._serialized_start=2577
+  _globals['_RERANKSEARCHREQUEST']._serialized_end=2673
+  _globals['_RERANKSEARCHRESPONSE']._serialized_start=2675
+  _globals['_RERANKSEARCHRESPONSE']._serialized_end=2741
+  _globals['_UPLOADIMAGEREQUEST']._serialized_start=2743
+  _globals['_UPLOADIMAGEREQUEST']._serialized_end=2845
+  _globals['_UPLOADIMAGERESPONSE']._serialized_start=2848
+  _globals['_UPLOADIMAGERESPONSE']._serialized_end=3006
+  _globals['_UPLOADIMAGERESPONSE_VARIANTURLSENTRY']._serialized_start=2956
+  _globals['_UPLOADIMAGERESPONSE_VARIANTURLSENTRY']._serialized_end=3006
+  _globals['_UPLOADIMAGECHUNK']._serialized_start=3008
+  _globals['_UPLOADIMAGECHUNK']._serialized_end=3100
+  _globals['_UPLOADIMAGEMETADATA']._serialized_start=3102
+  _globals['_UPLOADIMAGEMETADATA']._serialized_end=3183
+  _globals['_UPLOADIMAGESBATCHREQUEST']._serialized_start=3185
+  _globals['_UPLOADIMAGESBATCHREQUEST']._serialized_end=3253
+  _globals['_UPLOADIMAGERESULT']._serialized_start=3256
+  _globals['_UPLOADIMAGERESULT']._serialized_end=3467
+  _globals['_UPLOADIMAGERESULT_VARIANTURLSENTRY']._serialized_start=2956
+  _globals['_UPLOADIMAGERESULT_VARIANTURLSENTRY']._serialized_end=3006
+  _globals['_UPLOADIMAGESBATCHRESPONSE']._serialized_start=3469
+  _globals['_UPLOADIMAGESBATCHRESPONSE']._serialized_end=3538
+  _globals['_GENERATEWORLDIMAGEREQUEST']._serialized_start=3541
+  _globals['_GENERATEWORLDIMAGEREQUEST']._serialized_end=3694
+  _globals['_GENERATEWORLDIMAGERESPONSE']._serialized_start=3696
+  _globals['_GENERATEWORLDIMAGERESPONSE']._serialized_end=3746
+  _globals['_WORLDIMAGEJOBREQUEST']._serialized_start=3748
+  _globals['_WORLDIMAGEJOBREQUEST']._serialized_end=3786
+  _globals['_WORLDIMAGEJOB']._serialized_start=3789
+  _globals['_WORLDIMAGEJOB']._serialized_end=4002
+  _globals['_WORLDIMAGEJOB_VARIANTURLSENTRY']._serialized_start=2956
+  _globals['_WORLDIMAGEJOB_VARIANTURLSENTRY']._serialized_end=3006
+  _globals['_LORESERVICE']._serialized_start=4005
+  _globals['_LORESERVICE']._serialized_end=5176
 # @@protoc_insertion_point(module_scope)
@@ -171,6 +171,18 @@ class AllResponse(_message.Message):
     relics: _containers.RepeatedCompositeFieldContainer[LorePiece]
     def __init__(self, characters: _Optional[_Iterable[_Union[LorePiece, _Mapping]]] = ..., factions: _Optional[_Iterable[_Union[LorePiece, _Mapping]]] = ..., settings: _Optional[_Iterable[_Union[LorePiece, _Mapping]]] = ..., events: _Optional[_Iterable[_Union[LorePiece, _Mapping]]] = ..., relics: _Optional[_Iterable[_Union[LorePiece, _Mapping]]] = ...) -> None: ...
 
+class AllStreamResponse(_message.Message):
+    __slots__ = ("progress", "piece", "final", "piece_index")
+    PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    PIECE_FIELD_NUMBER: _ClassVar[int]
+    FINAL_FIELD_NUMBER: _ClassVar[int]
+    PIECE_INDEX_FIELD_NUMBER: _ClassVar[int]
+    progress: GenerationProgress
+    piece: LorePiece
+    final: AllResponse
+    piece_index: int
+    def __init__(self, progress: _Optional[_Union[GenerationProgress, _Mapping]] = ..., piece: _Optional[_Union[LorePiece, _Mapping]] = ..., final: _Optional[_Union[AllResponse, _Mapping]] = ..., piece_index: _Optional[int] = ...) -> None: ...
+
 class SelectedLorePieces(_message.Message):
     __slots__ = ("character", "faction", "setting", "event", "relic")
     CHARACTER_FIELD_NUMBER: _ClassVar[int]
@@ -273,27 +285,118 @@ class UploadImageRequest(_message.Message):
     def __init__(self, image_base64: _Optional[str] = ..., world_id: _Optional[int] = ..., character_id: _Optional[str] = ..., image_type: _Optional[str] = ...) -> None: ...
 
 class UploadImageResponse(_message.Message):
-    __slots__ = ("image_url",)
+    __slots__ = ("image_url", "variant_urls")
+    class VariantUrlsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
     IMAGE_URL_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_URLS_FIELD_NUMBER: _ClassVar[int]
     image_url: str
-    def __init__(self, image_url: _Optional[str] = ...) -> None: ...
+    variant_urls: _containers.ScalarMap[str, str]
+    def __init__(self, image_url: _Optional[str] = ..., variant_urls: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class UploadImageChunk(_message.Message):
+    __slots__ = ("metadata", "data")
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    metadata: UploadImageMetadata
+    data: bytes
+    def __init__(self, metadata: _Optional[_Union[UploadImageMetadata, _Mapping]] = ..., data: _Optional[bytes] = ...) -> None: ...
+
+class UploadImageMetadata(_message.Message):
+    __slots__ = ("world_id", "character_id", "image_type")
+    WORLD_ID_FIELD_NUMBER: _ClassVar[int]
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    world_id: int
+    character_id: str
+    image_type: str
+    def __init__(self, world_id: _Optional[int] = ..., character_id: _Optional[str] = ..., image_type: _Optional[str] = ...) -> None: ...
+
+class UploadImagesBatchRequest(_message.Message):
+    __slots__ = ("images",)
+    IMAGES_FIELD_NUMBER: _ClassVar[int]
+    images: _containers.RepeatedCompositeFieldContainer[UploadImageRequest]
+    def __init__(self, images: _Optional[_Iterable[_Union[UploadImageRequest, _Mapping]]] = ...) -> None: ...
+
+class UploadImageResult(_message.Message):
+    __slots__ = ("character_id", "image_type", "image_url", "error", "variant_urls")
+    class VariantUrlsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    CHARACTER_ID_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_URL_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_URLS_FIELD_NUMBER: _ClassVar[int]
+    character_id: str
+    image_type: str
+    image_url: str
+    error: str
+    variant_urls: _containers.ScalarMap[str, str]
+    def __init__(self, character_id: _Optional[str] = ..., image_type: _Optional[str] = ..., image_url: _Optional[str] = ..., error: _Optional[str] = ..., variant_urls: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class UploadImagesBatchResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[UploadImageResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[UploadImageResult, _Mapping]]] = ...) -> None: ...
 
 class GenerateWorldImageRequest(_message.Message):
-    __slots__ = ("world_title", "full_story", "theme", "setting_description", "use_replicate")
+    __slots__ = ("world_title", "full_story", "theme", "setting_description", "use_replicate", "world_id")
     WORLD_TITLE_FIELD_NUMBER: _ClassVar[int]
     FULL_STORY_FIELD_NUMBER: _ClassVar[int]
     THEME_FIELD_NUMBER: _ClassVar[int]
     SETTING_DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
     USE_REPLICATE_FIELD_NUMBER: _ClassVar[int]
+    WORLD_ID_FIELD_NUMBER: _ClassVar[int]
     world_title: str
     full_story: str
     theme: str
     setting_description: str
     use_replicate: bool
-    def __init__(self, world_title: _Optional[str] = ..., full_story: _Optional[str] = ..., theme: _Optional[str] = ..., setting_description: _Optional[str] = ..., use_replicate: bool = ...) -> None: ...
+    world_id: int
+    def __init__(self, world_title: _Optional[str] = ..., full_story: _Optional[str] = ..., theme: _Optional[str] = ..., setting_description: _Optional[str] = ..., use_replicate: bool = ..., world_id: _Optional[int] = ...) -> None: ...
 
 class GenerateWorldImageResponse(_message.Message):
     __slots__ = ("image_base64",)
     IMAGE_BASE64_FIELD_NUMBER: _ClassVar[int]
     image_base64: str
     def __init__(self, image_base64: _Optional[str] = ...) -> None: ...
+
+class WorldImageJobRequest(_message.Message):
+    __slots__ = ("job_id",)
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    def __init__(self, job_id: _Optional[str] = ...) -> None: ...
+
+class WorldImageJob(_message.Message):
+    __slots__ = ("job_id", "status", "image_data", "image_url", "variant_urls", "error")
+    class VariantUrlsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_DATA_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_URL_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_URLS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    status: str
+    image_data: bytes
+    image_url: str
+    variant_urls: _containers.ScalarMap[str, str]
+    error: str
+    def __init__(self, job_id: _Optional[str] = ..., status: _Optional[str] = ..., image_data: _Optional[bytes] = ..., image_url: _Optional[str] = ..., variant_urls: _Optional[_Mapping[str, str]] = ..., error: _Optional[str] = ...) -> None: ...
@@ -64,6 +64,11 @@ class LoreServiceStub(object):
                 request_serializer=lore__pb2.AllRequest.SerializeToString,
                 response_deserializer=lore__pb2.AllResponse.FromString,
                 _registered_method=True)
+        self.GenerateAllStream = channel.unary_stream(
+                '/lore.LoreService/GenerateAllStream',
+                request_serializer=lore__pb2.AllRequest.SerializeToString,
+                response_deserializer=lore__pb2.AllStreamResponse.FromString,
+                _registered_method=True)
         self.GenerateFullStory = channel.unary_unary(
                 '/lore.LoreService/GenerateFullStory',
                 request_serializer=lore__pb2.FullStoryRequest.SerializeToString,
@@ -84,11 +89,31 @@ class LoreServiceStub(object):
                 request_serializer=lore__pb2.UploadImageRequest.SerializeToString,
                 response_deserializer=lore__pb2.UploadImageResponse.FromString,
                 _registered_method=True)
+        self.UploadImagesBatch = channel.unary_unary(
+                '/lore.LoreService/UploadImagesBatch',
+                request_serializer=lore__pb2.UploadImagesBatchRequest.SerializeToString,
+                response_deserializer=lore__pb2.UploadImagesBatchResponse.FromString,
+                _registered_method=True)
+        self.UploadImage = channel.stream_unary(
+                '/lore.LoreService/UploadImage',
+                request_serializer=lore__pb2.UploadImageChunk.SerializeToString,
+                response_deserializer=lore__pb2.UploadImageResponse.FromString,
+                _registered_method=True)
         self.GenerateWorldImage = channel.unary_unary(
                 '/lore.LoreService/GenerateWorldImage',
                 request_serializer=lore__pb2.GenerateWorldImageRequest.SerializeToString,
                 response_deserializer=lore__pb2.GenerateWorldImageResponse.FromString,
                 _registered_method=True)
+        self.EnqueueWorldImage = channel.unary_unary(
+                '/lore.LoreService/EnqueueWorldImage',
+                request_serializer=lore__pb2.GenerateWorldImageRequest.SerializeToString,
+                response_deserializer=lore__pb2.WorldImageJob.FromString,
+                _registered_method=True)
+        self.GetWorldImageJob = channel.unary_unary(
+                '/lore.LoreService/GetWorldImageJob',
+                request_serializer=lore__pb2.WorldImageJobRequest.SerializeToString,
+                response_deserializer=lore__pb2.WorldImageJob.FromString,
+                _registered_method=True)
 
 
 class LoreServiceServicer(object):
@@ -130,6 +155,12 @@ class LoreServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GenerateAllStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GenerateFullStory(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -154,12 +185,36 @@ class LoreServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UploadImagesBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UploadImage(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GenerateWorldImage(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def EnqueueWorldImage(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetWorldImageJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_LoreServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -193,6 +248,11 @@ def add_LoreServiceServicer_to_server(servicer, server):
                     request_deserializer=lore__pb2.AllRequest.FromString,
                     response_serializer=lore__pb2.AllResponse.SerializeToString,
             ),
+            'GenerateAllStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.GenerateAllStream,
+                    request_deserializer=lore__pb2.AllRequest.FromString,
+                    response_serializer=lore__pb2.AllStreamResponse.SerializeToString,
+            ),
             'GenerateFullStory': grpc.unary_unary_rpc_method_handler(
                     servicer.GenerateFullStory,
                     request_deserializer=lore__pb2.FullStoryRequest.FromString,
@@ -213,11 +273,31 @@ def add_LoreServiceServicer_to_server(servicer, server):
                     request_deserializer=lore__pb2.UploadImageRequest.FromString,
                     response_serializer=lore__pb2.UploadImageResponse.SerializeToString,
             ),
+            'UploadImagesBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.UploadImagesBatch,
+                    request_deserializer=lore__pb2.UploadImagesBatchRequest.FromString,
+                    response_serializer=lore__pb2.UploadImagesBatchResponse.SerializeToString,
+            ),
+            'UploadImage': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadImage,
+                    request_deserializer=lore__pb2.UploadImageChunk.FromString,
+                    response_serializer=lore__pb2.UploadImageResponse.SerializeToString,
+            ),
             'GenerateWorldImage': grpc.unary_unary_rpc_method_handler(
                     servicer.GenerateWorldImage,
                     request_deserializer=lore__pb2.GenerateWorldImageRequest.FromString,
                     response_serializer=lore__pb2.GenerateWorldImageResponse.SerializeToString,
             ),
+            'EnqueueWorldImage': grpc.unary_unary_rpc_method_handler(
+                    servicer.EnqueueWorldImage,
+                    request_deserializer=lore__pb2.GenerateWorldImageRequest.FromString,
+                    response_serializer=lore__pb2.WorldImageJob.SerializeToString,
+            ),
+            'GetWorldImageJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetWorldImageJob,
+                    request_deserializer=lore__pb2.WorldImageJobRequest.FromString,
+                    response_serializer=lore__pb2.WorldImageJob.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'lore.LoreService', rpc_method_handlers)
@@ -391,6 +471,33 @@ class LoreService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GenerateAllStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/lore.LoreService/GenerateAllStream',
+            lore__pb2.AllRequest.SerializeToString,
+            lore__pb2.AllStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GenerateFullStory(request,
             target,
@@ -499,6 +606,60 @@ class LoreService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def UploadImagesBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/lore.LoreService/UploadImagesBatch',
+            lore__pb2.UploadImagesBatchRequest.SerializeToString,
+            lore__pb2.UploadImagesBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UploadImage(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/lore.LoreService/UploadImage',
+            lore__pb2.UploadImageChunk.SerializeToString,
+            lore__pb2.UploadImageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GenerateWorldImage(request,
             target,
@@ -525,3 +686,57 @@ class LoreService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def EnqueueWorldImage(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/lore.LoreService/EnqueueWorldImage',
+            lore__pb2.GenerateWorldImageRequest.SerializeToString,
+            lore__pb2.WorldImageJob.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetWorldImageJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/lore.LoreService/GetWorldImageJob',
+            lore__pb2.WorldImageJobRequest.SerializeToString,
+            lore__pb2.WorldImageJob.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -2,8 +2,15 @@ import grpc  # type: ignore
 import asyncio
 import base64
 import json
+import multiprocessing
+from multiprocessing.process import BaseProcess
+import signal
+import sys
+import time
+import uuid
 import lore_pb2  # type: ignore
 import lore_pb2_grpc  # type: ignore
+from prometheus_client import start_http_server
 from generate.chains.multi_variant import (
     generate_multiple_characters,
     generate_multiple_factions,
@@ -11,7 +18,13 @@ from generate.chains.multi_variant import (
     generate_multiple_events,
     generate_multiple_relics,
 )
-from generate.orchestrators.orchestrator_lore_variants import generate_lore_variants
+from generate.orchestrators.orchestrator_lore_variants import (
+    LORE_KINDS,
+    generate_lore_variants,
+    generation_slots,
+    stream_lore_variants,
+)
+from generate.lore_pool import replenish_lore_pool
 from generate.orchestrators.orchestrator_full_story import (
     generate_full_story_orchestrator,
 )
@@ -19,14 +32,41 @@ from generate.models.selected_lore_pieces import SelectedLorePieces
 from generate.models.lore_piece import LorePiece
 from constants.themes import Theme
 from utils.logger import logger
-from search.reranker import rerank_with_fusion_dartboard
+from config.settings import get_settings
+from search.rerank_executor import (
+    rerank_worlds,
+    warm_up_rerank_executor,
+    close_rerank_executor,
+)
 from search.query_preprocessor import preprocess_search_query
 from services.embedding_client import (
     generate_search_embedding,
     generate_content_embedding,
 )
-from services.image_gen.portraits.processor import upload_image_to_r2
+from services.image_gen.portraits.processor import (
+    upload_image_with_variants_to_r2,
+    upload_image_stream_to_r2,
+)
+from services.image_gen.transcoding import close_transcode_executor
+from services.rabbitmq import close_publisher
+from services.http_session import close_http_session
+from services.redis import close_redis_client
 from services.image_gen.worlds.generator import generate_world_image
+from services.image_gen.worlds.operations import (
+    JOB_QUEUED,
+    build_world_image_job,
+    enqueue_world_image_job,
+    get_world_image_job,
+)
+from exceptions.image_generation import ImageJobRejectedError
+from services.grpc_metrics import (
+    BlockingCallDetector,
+    RpcMetricsInterceptor,
+    record_worker_info,
+    sample_event_loop_lag,
+)
+
+settings = get_settings()
 
 
 class LoreServicer(lore_pb2_grpc.LoreServiceServicer):
@@ -76,7 +116,8 @@ class LoreServicer(lore_pb2_grpc.LoreServiceServicer):
                     result = await generate_multiple_characters(
                         request.count,
                         request.theme,
-                        progress_callback=progress_callback
+                        progress_callback=progress_callback,
+                        user_id=request_user_id(context),
                     )
                     return result
                 finally:
@@ -405,9 +446,11 @@ class LoreServicer(lore_pb2_grpc.LoreServiceServicer):
             context.set_details(f"Relic generation failed: {str(e)}")
 
     async def GenerateAll(self, request, context):
-        """Generate all lore types in parallel."""
+        """Generate all lore types, pipelining setting -> event -> relic."""
         try:
-            bundle = await generate_lore_variants(request.count, request.theme)
+            bundle = await generate_lore_variants(
+                request.count, request.theme, user_id=request_user_id(context)
+            )
             return lore_pb2.AllResponse(  # type: ignore
                 characters=[
                     convert_to_grpc_lore_piece(char) for char in bundle.characters
@@ -427,6 +470,44 @@ class LoreServicer(lore_pb2_grpc.LoreServiceServicer):
             context.set_details(f"Full lore generation failed: {str(e)}")
             return lore_pb2.AllResponse()  # type: ignore
 
+    async def GenerateAllStream(self, request, context):
+        """Generate all lore types, streaming each piece as soon as it's done."""
+        try:
+            yield lore_pb2.AllStreamResponse(  # type: ignore
+                progress=lore_pb2.GenerationProgress(
+                    progress=5, message="Generating lore..."
+                )
+            )
+
+            total = max(request.count * len(LORE_KINDS), 1)
+            pieces: dict[str, list] = {
+                kind: [None] * request.count for kind in LORE_KINDS
+            }
+            completed = 0
+            async for kind, index, piece in stream_lore_variants(
+                request.count, request.theme, user_id=request_user_id(context)
+            ):
+                grpc_piece = convert_to_grpc_lore_piece(piece)
+                pieces[kind][index] = grpc_piece
+                completed += 1
+                yield lore_pb2.AllStreamResponse(  # type: ignore
+                    piece=grpc_piece, piece_index=index
+                )
+                yield lore_pb2.AllStreamResponse(  # type: ignore
+                    progress=lore_pb2.GenerationProgress(
+                        progress=5 + int(completed / total * 90),
+                        message=f"Generated {completed}/{total} lore pieces...",
+                    )
+                )
+
+            yield lore_pb2.AllStreamResponse(  # type: ignore
+                final=lore_pb2.AllResponse(**pieces)  # type: ignore
+            )
+        except Exception as e:
+            logger.error(f"Full lore generation failed: {str(e)}", exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Full lore generation failed: {str(e)}")
+
     async def GenerateFullStory(self, request, context):
         """Generate complete story from selected lore pieces."""
         try:
@@ -528,7 +609,7 @@ class LoreServicer(lore_pb2_grpc.LoreServiceServicer):
                 f"Worlds with embeddings: {sum(1 for w in worlds if w['embedding'])}/{len(worlds)}"
             )
 
-            reranked_worlds = rerank_with_fusion_dartboard(
+            reranked_worlds = await rerank_worlds(
                 request.query, worlds, query_embedding=list(request.query_embedding)
             )
 
@@ -552,46 +633,151 @@ class LoreServicer(lore_pb2_grpc.LoreServiceServicer):
             return lore_pb2.RerankSearchResponse()
 
     # * Image Upload Methods
+    async def _upload_image(self, request) -> tuple[str, dict[str, str]]:
+        """
+        Validate an UploadImageRequest, decode it and upload it to R2 along
+        with its WebP/AVIF and thumbnail variants.
+
+        Returns:
+            The original's URL and a {variant name: URL} map
+
+        Raises:
+            ValueError: If the request is invalid
+        """
+        if not request.image_base64:
+            raise ValueError("image_base64 cannot be empty")
+
+        if not request.world_id:
+            raise ValueError("world_id cannot be empty")
+
+        if not request.character_id:
+            raise ValueError("character_id cannot be empty")
+
+        # Decode base64 to bytes
+        try:
+            image_data = base64.b64decode(request.image_base64)
+        except Exception as e:
+            logger.error(f"Failed to decode base64: {e}")
+            raise ValueError(f"Invalid base64 data: {e}")
+
+        # Upload to R2
+        image_url, variant_urls = await upload_image_with_variants_to_r2(
+            image_data=image_data,
+            world_id=request.world_id,
+            character_id=request.character_id,
+            image_type=request.image_type or "portrait",
+        )
+
+        logger.info(f"Successfully uploaded image to R2: {image_url}")
+        return image_url, variant_urls
+
     async def UploadImageToR2(self, request, context):
         """Upload base64 image to R2 with real world_id after world creation."""
         try:
-            if not request.image_base64:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("image_base64 cannot be empty")
-                return lore_pb2.UploadImageResponse()
+            image_url, variant_urls = await self._upload_image(request)
+            return lore_pb2.UploadImageResponse(
+                image_url=image_url, variant_urls=variant_urls
+            )
 
-            if not request.world_id:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("world_id cannot be empty")
-                return lore_pb2.UploadImageResponse()
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return lore_pb2.UploadImageResponse()
 
-            if not request.character_id:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("character_id cannot be empty")
-                return lore_pb2.UploadImageResponse()
+        except Exception as e:
+            logger.error(f"Image upload to R2 failed: {str(e)}", exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Image upload failed: {str(e)}")
+            return lore_pb2.UploadImageResponse()
+
+    async def UploadImagesBatch(self, request, context):
+        """
+        Upload a world's images (portraits and scene) to R2 in parallel.
 
-            # Decode base64 to bytes
+        Each image succeeds or fails on its own; failures are reported in the
+        matching result's `error` field instead of failing the whole batch.
+        """
+
+        async def upload_one(image_request) -> lore_pb2.UploadImageResult:
+            result = lore_pb2.UploadImageResult(
+                character_id=image_request.character_id,
+                image_type=image_request.image_type or "portrait",
+            )
             try:
-                image_data = base64.b64decode(request.image_base64)
+                image_url, variant_urls = await self._upload_image(image_request)
+                result.image_url = image_url
+                result.variant_urls.update(variant_urls)
             except Exception as e:
-                logger.error(f"Failed to decode base64: {e}")
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details(f"Invalid base64 data: {e}")
-                return lore_pb2.UploadImageResponse()
+                logger.error(
+                    f"Image upload to R2 failed for {image_request.character_id}: {e}"
+                )
+                result.error = str(e)
+            return result
 
-            # Upload to R2
-            image_url = await upload_image_to_r2(
-                image_data=image_data,
-                world_id=request.world_id,
-                character_id=request.character_id,
-                image_type=request.image_type or "portrait",
+        results = await asyncio.gather(
+            *(upload_one(image_request) for image_request in request.images)
+        )
+
+        failed = sum(1 for result in results if result.error)
+        logger.info(
+            f"Uploaded {len(results) - failed}/{len(results)} images to R2 in batch"
+        )
+        return lore_pb2.UploadImagesBatchResponse(results=results)
+
+    async def UploadImage(self, request_iterator, context):
+        """
+        Client-streaming upload of raw image bytes to R2.
+
+        The first message carries the metadata, the following ones raw byte
+        chunks which are piped straight into a multipart upload, so neither the
+        whole image nor a base64 copy of it is ever held in memory.
+        Variants are not generated here, as that would need the whole image;
+        use UploadImageToR2 for images that should get them.
+        """
+        try:
+            first = await anext(aiter(request_iterator), None)
+            if first is None or first.WhichOneof("payload") != "metadata":
+                raise ValueError("first message must carry upload metadata")
+
+            metadata = first.metadata
+            if not metadata.world_id:
+                raise ValueError("world_id cannot be empty")
+
+            if not metadata.character_id:
+                raise ValueError("character_id cannot be empty")
+
+            received = 0
+
+            async def image_chunks():
+                nonlocal received
+                async for message in request_iterator:
+                    if message.WhichOneof("payload") != "data":
+                        raise ValueError("only data chunks may follow the metadata")
+                    received += len(message.data)
+                    yield message.data
+
+                if not received:
+                    raise ValueError("image data cannot be empty")
+
+            image_url = await upload_image_stream_to_r2(
+                image_chunks(),
+                world_id=metadata.world_id,
+                character_id=metadata.character_id,
+                image_type=metadata.image_type or "portrait",
             )
 
-            logger.info(f"Successfully uploaded image to R2: {image_url}")
+            logger.info(f"Successfully streamed image to R2: {image_url}")
             return lore_pb2.UploadImageResponse(image_url=image_url)
 
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return lore_pb2.UploadImageResponse()
+
         except Exception as e:
-            logger.error(f"Image upload to R2 failed: {str(e)}", exc_info=True)
+            logger.error(
+                f"Streaming image upload to R2 failed: {str(e)}", exc_info=True
+            )
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Image upload failed: {str(e)}")
             return lore_pb2.UploadImageResponse()
@@ -620,22 +806,95 @@ class LoreServicer(lore_pb2_grpc.LoreServiceServicer):
                 theme=request.theme or "fantasy",
                 setting_description=getattr(request, "setting_description", ""),
                 use_replicate=use_replicate,
+                user_id=request_user_id(context),
             )
 
             logger.info(f"World image generated for '{request.world_title}'")
             return lore_pb2.GenerateWorldImageResponse(image_base64=image_base64)
 
+        except ImageJobRejectedError as e:
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(f"World image generation is overloaded: {str(e)}")
+            return lore_pb2.GenerateWorldImageResponse()
+
         except Exception as e:
             logger.error(f"World image generation failed: {str(e)}", exc_info=True)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"World image generation failed: {str(e)}")
             return lore_pb2.GenerateWorldImageResponse()
 
+    async def EnqueueWorldImage(self, request, context):
+        """
+        Queue a world image for the image worker and return its job ID.
+
+        Returns immediately instead of holding the RPC open for the whole
+        generation; poll GetWorldImageJob (or the world_image_job:{job_id}
+        Redis hash) for the result. With a world_id the image is uploaded to
+        R2 and the job carries its URL, otherwise the raw image bytes.
+        """
+        try:
+            if not request.world_title or not request.full_story:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("world_title and full_story are required")
+                return lore_pb2.WorldImageJob()
+
+            job = build_world_image_job(
+                job_id=str(uuid.uuid4()),
+                world_title=request.world_title,
+                full_story=request.full_story,
+                theme=request.theme or "fantasy",
+                setting_description=request.setting_description,
+                use_replicate=request.use_replicate,
+                world_id=request.world_id,
+                user_id=request_user_id(context),
+            )
+            await enqueue_world_image_job(job)
+
+            return lore_pb2.WorldImageJob(job_id=job["job_id"], status=JOB_QUEUED)
+
+        except Exception as e:
+            logger.error(f"Failed to enqueue world image: {str(e)}", exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to enqueue world image: {str(e)}")
+            return lore_pb2.WorldImageJob()
+
+    async def GetWorldImageJob(self, request, context):
+        """Get the status, and once completed the result, of a world image job."""
+        try:
+            job = await get_world_image_job(request.job_id)
+            if job is None:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Unknown or expired job {request.job_id}")
+                return lore_pb2.WorldImageJob()
+
+            return lore_pb2.WorldImageJob(
+                job_id=request.job_id,
+                status=job["status"],
+                image_data=job["image"] or b"",
+                image_url=job["image_url"],
+                variant_urls=job["variant_urls"],
+                error=job["error"],
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to get world image job: {str(e)}", exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to get world image job: {str(e)}")
+            return lore_pb2.WorldImageJob()
+
     # * Adventure Methods
     # TODO: Add adventure session management methods
 
 
 # * Helper Functions
+def request_user_id(context) -> str:
+    """User ID the Go service sent in the x-user-id metadata ("" if absent)."""
+    for key, value in context.invocation_metadata() or ():
+        if key == "x-user-id":
+            return value
+    return ""
+
+
 def convert_lore_piece(grpc_piece):
     """Convert gRPC LorePiece to Python model."""
     # Deserialize JSON strings back to their original types (arrays, objects)
@@ -698,18 +957,31 @@ def convert_selected_lore_pieces_to_grpc(selected_pieces):
 
 
 # * Server Startup
-async def serve():
-    # Increase max message size to 20MB to handle base64-encoded images
+async def serve(worker_index: int = 0):
+    """Run one gRPC server until SIGINT/SIGTERM, then drain in-flight RPCs."""
+    if settings.GRPC_METRICS_PORT:
+        start_http_server(settings.GRPC_METRICS_PORT + worker_index)
+    record_worker_info(worker_index)
+
+    # Increase max message size to 20MB to handle base64-encoded images in the
+    # unary upload RPCs (UploadImage streams small chunks instead)
     max_msg_size = 20 * 1024 * 1024  # 20MB
     server = grpc.aio.server(
+        interceptors=[RpcMetricsInterceptor(settings.RPC_PHASE_METRICS)],
         options=[
             ("grpc.max_send_message_length", max_msg_size),
             ("grpc.max_receive_message_length", max_msg_size),
-        ]
+            # Several worker processes bind the same port, the kernel spreads
+            # incoming connections across them
+            ("grpc.so_reuseport", 1 if settings.GRPC_SERVER_WORKERS > 1 else 0),
+        ],
     )
     lore_pb2_grpc.add_LoreServiceServicer_to_server(LoreServicer(), server)
-    server.add_insecure_port("0.0.0.0:50051")
-    logger.info("gRPC server running on port 50051 (max message size: 20MB)")
+    server.add_insecure_port(f"0.0.0.0:{settings.GRPC_PORT}")
+    logger.info(
+        f"gRPC server worker {worker_index} running on port {settings.GRPC_PORT} "
+        "(max message size: 20MB)"
+    )
 
     # * Preload Ollama models to avoid cold start delays
     try:
@@ -726,9 +998,149 @@ async def serve():
     except Exception as e:
         logger.warning(f"Failed to preload LLM model: {e}")
 
+    try:
+        await warm_up_rerank_executor()
+    except Exception as e:
+        logger.warning(f"Failed to start rerank pool: {e}")
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
     await server.start()
-    await server.wait_for_termination()
+    pool_task = None
+    if settings.LORE_POOL_ENABLED:
+        pool_task = asyncio.create_task(replenish_lore_pool(generation_slots))
+    lag_task = None
+    if settings.LOOP_LAG_INTERVAL_SECONDS > 0:
+        lag_task = asyncio.create_task(
+            sample_event_loop_lag(settings.LOOP_LAG_INTERVAL_SECONDS)
+        )
+    blocking_detector = None
+    if settings.SLOW_CALLBACK_THRESHOLD_MS > 0:
+        blocking_detector = BlockingCallDetector(
+            settings.SLOW_CALLBACK_THRESHOLD_MS / 1000
+        )
+        blocking_detector.start()
+    try:
+        await stop_event.wait()
+        logger.info(
+            f"gRPC server worker {worker_index} shutting down, draining in-flight "
+            f"RPCs (up to {settings.GRPC_SHUTDOWN_GRACE_SECONDS}s)..."
+        )
+        await server.stop(settings.GRPC_SHUTDOWN_GRACE_SECONDS)
+    finally:
+        if pool_task:
+            pool_task.cancel()
+        if lag_task:
+            lag_task.cancel()
+        if blocking_detector:
+            blocking_detector.stop()
+        await close_publisher()
+        await close_http_session()
+        close_transcode_executor()
+        close_rerank_executor()
+        await close_redis_client()
+
+
+def run_server_worker(worker_index: int):
+    """Entry point of a server worker process."""
+    asyncio.run(serve(worker_index))
+
+
+def serve_workers(worker_count: int, target=run_server_worker) -> int:
+    """
+    Run `worker_count` server processes on the same port and keep them up.
+
+    Each worker is a separate process (spawned, gRPC doesn't survive fork)
+    with its own event loop, so CPU-bound work in one RPC only stalls the
+    RPCs on that worker. Workers that die are restarted after a backoff that
+    doubles with each exit within GRPC_WORKER_MIN_UPTIME_SECONDS of starting;
+    after GRPC_WORKER_MAX_FAST_FAILURES of those in a row all workers are
+    stopped and 1 is returned, so the supervisor sees the crash.
+    SIGINT/SIGTERM are passed on to the workers, which drain their in-flight
+    RPCs before exiting; any still running after the grace period are killed.
+    """
+    context = multiprocessing.get_context("spawn")
+    workers: dict[int, BaseProcess] = {}
+    started: dict[int, float] = {}
+    fast_failures: dict[int, int] = {}
+    restart_at: dict[int, float] = {}
+    stopping = False
+    exit_code = 0
+
+    def start_worker(index: int):
+        process = context.Process(
+            target=target, args=(index,), name=f"grpc-worker-{index}"
+        )
+        process.start()
+        workers[index] = process
+        started[index] = time.monotonic()
+        logger.info(f"Started gRPC server worker {index} (pid {process.pid})")
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process in workers.values():
+            if process.is_alive():
+                process.terminate()
+
+    def schedule_restart(index: int, exitcode: int | None):
+        nonlocal exit_code
+        now = time.monotonic()
+        if now - started[index] < settings.GRPC_WORKER_MIN_UPTIME_SECONDS:
+            fast_failures[index] = fast_failures.get(index, 0) + 1
+        else:
+            fast_failures[index] = 0
+
+        if fast_failures[index] >= settings.GRPC_WORKER_MAX_FAST_FAILURES:
+            logger.error(
+                f"gRPC server worker {index} exited with code {exitcode} "
+                f"{fast_failures[index]} times in a row shortly after starting, "
+                "shutting down"
+            )
+            exit_code = 1
+            stop(None, None)
+            return
+
+        delay = settings.GRPC_WORKER_RESTART_BACKOFF_SECONDS * 2 ** fast_failures[index]
+        restart_at[index] = now + delay
+        logger.warning(
+            f"gRPC server worker {index} exited with code {exitcode}, "
+            f"restarting in {delay:.1f}s"
+        )
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for index in range(worker_count):
+        start_worker(index)
+
+    while not stopping:
+        time.sleep(1)
+        for index, process in list(workers.items()):
+            if stopping or process.is_alive():
+                continue
+            if index not in restart_at:
+                schedule_restart(index, process.exitcode)
+            elif time.monotonic() >= restart_at[index]:
+                del restart_at[index]
+                start_worker(index)
+
+    deadline = time.monotonic() + settings.GRPC_SHUTDOWN_GRACE_SECONDS + 5
+    for index, process in workers.items():
+        process.join(max(deadline - time.monotonic(), 0))
+        if process.is_alive():
+            logger.warning(f"gRPC server worker {index} didn't stop in time, killing")
+            process.kill()
+            process.join()
+
+    return exit_code
 
 
 if __name__ == "__main__":
-    asyncio.run(serve())
+    if settings.GRPC_SERVER_WORKERS > 1:
+        sys.exit(serve_workers(settings.GRPC_SERVER_WORKERS))
+    else:
+        asyncio.run(serve())
@@ -9,7 +9,7 @@ We use Query Rewriting technique to transform user queries into more effective s
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
 
-from services.llm_client import get_llm
+from services.llm_client import get_llm, llm_step
 from utils.logger import logger
 
 
@@ -18,7 +18,7 @@ class QueryPreprocessor:
 
     def __init__(self, llm: BaseChatModel | None = None):
         """Initialize with optional LLM instance."""
-        self.llm = llm or get_llm(max_tokens=200, temperature=0.3)
+        self.llm = llm or get_llm(max_tokens=200, temperature=0.3, tier="structured")
 
     async def preprocess_query(self, query: str) -> str:
         """
@@ -71,7 +71,9 @@ class QueryPreprocessor:
         """)
 
         chain = prompt | self.llm
-        response = await chain.ainvoke({"query": query})
+        response = await chain.ainvoke(
+            {"query": query}, config=llm_step("search", "query_preprocess")
+        )
 
         # Handle different response content types
         content = response.content
@@ -0,0 +1,235 @@
+"""
+Run search reranking off the event loop, within a latency budget.
+
+Fusion (spaCy tokenization + BM25) and Dartboard are CPU-bound; run inline
+they freeze every other RPC on the server. Here they run in a pool, one
+stage at a time, so a request that runs out of budget after fusion can still
+return fused results instead of waiting for Dartboard.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from config.settings import get_settings
+from search.fusion_retriever import fuse_search_results
+from search.reranker import dartboard_rerank, rerank_with_fusion_dartboard
+from utils.logger import logger
+
+settings = get_settings()
+
+RERANK_EXECUTORS = ("process", "thread", "inline")
+
+# Prometheus metrics for reranking
+rerank_requests_counter = Counter(
+    "loresmith_rerank_requests_total",
+    "Rerank requests by how far they got",
+    ["outcome"],  # full, fused_only, vector_only, shed, error
+)
+
+rerank_duration_histogram = Histogram(
+    "loresmith_rerank_duration_seconds",
+    "Time spent in each rerank stage, including waiting for the pool",
+    ["stage"],  # fusion, dartboard, total
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+rerank_pending_gauge = Gauge(
+    "loresmith_rerank_pending",
+    "Rerank jobs queued or running in the pool",
+)
+
+
+def _load_models():
+    """Pool process initializer: load the spaCy model before the first job."""
+    import search.tokenizer  # noqa: F401
+
+
+# Global pool (created lazily). Spawned rather than forked so workers don't
+# inherit the gRPC server's threads.
+_executor: Executor | None = None
+_pending = 0
+
+
+def get_rerank_executor() -> Executor:
+    global _executor
+
+    if _executor is None:
+        if settings.RERANK_EXECUTOR == "thread":
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.RERANK_WORKERS, thread_name_prefix="rerank"
+            )
+        else:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.RERANK_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_models,
+            )
+
+    return _executor
+
+
+async def warm_up_rerank_executor():
+    """Start the pool processes now so the first search doesn't wait for them."""
+    if settings.RERANK_EXECUTOR not in RERANK_EXECUTORS:
+        logger.warning(
+            f"Unknown RERANK_EXECUTOR '{settings.RERANK_EXECUTOR}', "
+            "reranking will run inline"
+        )
+    if settings.RERANK_EXECUTOR not in ("process", "thread"):
+        return
+
+    loop = asyncio.get_running_loop()
+    executor = get_rerank_executor()
+    await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, time.sleep, 0.1)
+            for _ in range(settings.RERANK_WORKERS)
+        )
+    )
+
+
+def close_rerank_executor():
+    """Shut down the rerank pool (call on shutdown)."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+
+
+def _drop_broken_executor(executor: Executor):
+    """Forget a pool whose worker died, so the next request starts a new one."""
+    global _executor
+
+    if _executor is executor:
+        _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit(executor: Executor, fn, *args) -> asyncio.Future:
+    """Submit to the pool, counting the job as pending until it really ends."""
+    global _pending
+
+    loop = asyncio.get_running_loop()
+
+    def done(_: Future):
+        global _pending
+        _pending -= 1
+        rerank_pending_gauge.set(_pending)
+
+    future = executor.submit(fn, *args)
+    _pending += 1
+    rerank_pending_gauge.set(_pending)
+
+    def on_done(f: Future):
+        try:
+            loop.call_soon_threadsafe(done, f)
+        except RuntimeError:
+            pass  # Loop already closed on shutdown
+
+    future.add_done_callback(on_done)
+    # Cancelling the wrapper (on timeout) drops the job if it hasn't started
+    return asyncio.wrap_future(future)
+
+
+def _vector_order(worlds: list[dict]) -> list[dict]:
+    return sorted(worlds, key=lambda world: world["relevance"], reverse=True)
+
+
+async def rerank_worlds(
+    query: str, worlds: list[dict], query_embedding: list | None = None
+) -> list[dict]:
+    """
+    Fusion + Dartboard rerank of vector search results, off the event loop.
+
+    Gives up on the remaining stages once RERANK_BUDGET_MS is spent: returns
+    fused results if Dartboard isn't done, or the vector search order if
+    fusion isn't. With RERANK_MAX_PENDING jobs already in the pool the
+    request is shed straight to vector order instead of queueing. If the
+    rerank fails, vector order too; a pool broken by a dead worker is
+    replaced for the next request.
+    """
+    start_time = time.perf_counter()
+
+    if settings.RERANK_EXECUTOR not in ("process", "thread"):
+        reranked = rerank_with_fusion_dartboard(
+            query, worlds, query_embedding=query_embedding
+        )
+        rerank_requests_counter.labels(outcome="full").inc()
+        rerank_duration_histogram.labels(stage="total").observe(
+            time.perf_counter() - start_time
+        )
+        return reranked
+
+    if _pending >= settings.RERANK_MAX_PENDING:
+        logger.warning(f"Rerank pool busy ({_pending} jobs), using vector order")
+        rerank_requests_counter.labels(outcome="shed").inc()
+        return _vector_order(worlds)
+
+    budget = settings.RERANK_BUDGET_MS / 1000
+    executor = get_rerank_executor()
+    outcome = "full"
+    try:
+        # Copies, so a thread still fusing after the budget can't touch the
+        # worlds we fall back to
+        fused = await asyncio.wait_for(
+            _submit(
+                executor, fuse_search_results, [dict(world) for world in worlds], query
+            ),
+            timeout=budget,
+        )
+        fusion_time = time.perf_counter() - start_time
+        rerank_duration_histogram.labels(stage="fusion").observe(fusion_time)
+
+        if _pending >= settings.RERANK_MAX_PENDING:
+            outcome = "fused_only"
+            return fused
+
+        try:
+            reranked = await asyncio.wait_for(
+                _submit(
+                    executor, dartboard_rerank, query, fused, 1.0, 1.0, query_embedding
+                ),
+                timeout=max(budget - fusion_time, 0),
+            )
+            rerank_duration_histogram.labels(stage="dartboard").observe(
+                time.perf_counter() - start_time - fusion_time
+            )
+            return reranked
+        except asyncio.TimeoutError:
+            outcome = "fused_only"
+            logger.warning(f"Dartboard over the {budget}s budget, using fused results")
+            return fused
+
+    except asyncio.TimeoutError:
+        outcome = "vector_only"
+        logger.warning(f"Fusion over the {budget}s budget, using vector order")
+        return _vector_order(worlds)
+
+    except BrokenExecutor as e:
+        # A worker died (OOM, segfault): the pool refuses all further jobs
+        outcome = "error"
+        logger.error(f"Rerank pool broken ({e}), starting a new one")
+        _drop_broken_executor(executor)
+        return _vector_order(worlds)
+
+    except Exception as e:
+        outcome = "error"
+        logger.error(f"Rerank failed, using vector order: {e}", exc_info=True)
+        return _vector_order(worlds)
+
+    finally:
+        rerank_requests_counter.labels(outcome=outcome).inc()
+        rerank_duration_histogram.labels(stage="total").observe(
+            time.perf_counter() - start_time
+        )
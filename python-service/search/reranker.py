@@ -137,7 +137,24 @@ def rerank_with_fusion_dartboard(
     from search.fusion_retriever import fuse_search_results
 
     fused_worlds = fuse_search_results(worlds, query, alpha)
+    return dartboard_rerank(
+        query, fused_worlds, diversity_weight, relevance_weight, query_embedding
+    )
+
+
+def dartboard_rerank(
+    query: str,
+    fused_worlds: list[dict],
+    diversity_weight: float = 1.0,
+    relevance_weight: float = 1.0,
+    query_embedding: list | None = None,
+) -> list[dict]:
+    """
+    Dartboard step of rerank_with_fusion_dartboard, on already fused worlds.
 
+    Returns the fused worlds unchanged if embeddings are missing or Dartboard
+    fails.
+    """
     has_query_embedding = query_embedding is not None
     worlds_with_embeddings = sum(
         1 for w in fused_worlds if "embedding" in w and w["embedding"]
@@ -10,8 +10,10 @@ nlp: Language | None = None
 
 try:
     nlp = spacy.load("en_core_web_sm")
-except ImportError:
-    logger.warning("spaCy not installed, falling back to basic tokenization")
+except (ImportError, OSError):
+    logger.warning(
+        "spaCy or its en_core_web_sm model not installed, falling back to basic tokenization"
+    )
     nlp = None
 
 
@@ -3,6 +3,7 @@ from langchain_openai import OpenAIEmbeddings
 from pydantic import SecretStr
 
 from config.settings import get_settings
+from services.fake_llm import get_fake_embedding_model
 from search.query_preprocessor import preprocess_search_query
 from utils.logger import logger
 
@@ -18,11 +19,15 @@ def get_embedding_model():
     Model is initialized once on first call and reused for all subsequent calls.
     - local: Uses Ollama with configurable embedding model (default: nomic-embed-text, 768 dims, free)
     - openrouter: Uses OpenAI embeddings via OpenRouter (default: text-embedding-3-small, 1536 dims, paid)
+    - fake: Deterministic text-seeded vectors (FAKE_EMBEDDING_DIMENSIONS dims, offline)
     """
     global _embedding_model
 
     if _embedding_model is None:
-        if settings.AI_PROVIDER == "local":
+        if settings.AI_PROVIDER == "fake":
+            logger.info("Initializing fake embeddings (deterministic, offline)")
+            _embedding_model = get_fake_embedding_model()
+        elif settings.AI_PROVIDER == "local":
             logger.info(
                 f"Initializing Ollama embeddings with {settings.LOCAL_EMBEDDING_MODEL} at {settings.OLLAMA_URL}"
             )
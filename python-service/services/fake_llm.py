@@ -0,0 +1,146 @@
+"""
+Deterministic stand-ins for the LLM and embedding model (AI_PROVIDER=fake).
+
+Outputs are seeded by the prompt, so the same prompt always gets the same
+answer, and structured output is always valid for the requested schema. Used
+to run and benchmark the service offline: latency and completion length are
+simulated from the FAKE_LLM_* settings, and usage metadata is reported so
+token metrics work as with a real model.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+import typing
+from typing import Any
+
+from annotated_types import Ge, Le, MaxLen, MinLen
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import BaseModel
+
+from config.settings import get_settings
+
+settings = get_settings()
+
+FAKE_MODEL_NAME = "fake"
+
+_WORDS = (
+    "ash ember hollow crown river iron vale storm shard oath ruin lantern "
+    "salt thorn beacon drift harbor ward relic frost signal veil cinder "
+    "market guild tower wild old bright broken silent distant northern "
+    "the of and a with under beyond across their its"
+).split()
+
+
+def _rng(text: str) -> random.Random:
+    return random.Random(hashlib.sha1(text.encode("utf-8")).digest())
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(max(count, 1)))
+
+
+def _constraints(field) -> dict[str, int]:
+    """ge/le/min_length/max_length set on a pydantic field."""
+    found = {}
+    for constraint in field.metadata:
+        for kind, attribute in (
+            (Ge, "ge"),
+            (Le, "le"),
+            (MinLen, "min_length"),
+            (MaxLen, "max_length"),
+        ):
+            if isinstance(constraint, kind):
+                found[attribute] = getattr(constraint, attribute)
+    return found
+
+
+def _fake_structured(schema: type[BaseModel], rng: random.Random, tokens: int):
+    """A JSON object valid for `schema`, text fields sharing `tokens` words."""
+    text_fields = [
+        name for name, field in schema.model_fields.items() if field.annotation is str
+    ]
+    words_per_field = tokens // max(len(text_fields), 1)
+
+    values: dict[str, Any] = {}
+    for name, field in schema.model_fields.items():
+        bounds = _constraints(field)
+        if field.annotation is str:
+            values[name] = _words(rng, words_per_field).capitalize() + "."
+        elif field.annotation is int:
+            values[name] = rng.randint(bounds.get("ge", 0), bounds.get("le", 100))
+        elif field.annotation is float:
+            values[name] = rng.uniform(bounds.get("ge", 0), bounds.get("le", 1))
+        elif field.annotation is bool:
+            values[name] = rng.random() < 0.5
+        elif typing.get_origin(field.annotation) is list:
+            count = bounds.get("min_length", bounds.get("max_length", 3))
+            values[name] = [_words(rng, 2).title() for _ in range(count)]
+        else:
+            raise TypeError(f"Fake LLM can't fill field {name}: {field.annotation}")
+    return values
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model returning deterministic text or schema-valid JSON."""
+
+    max_tokens: int = 500
+    structured_schema: type[BaseModel] | None = None
+
+    @property
+    def _llm_type(self) -> str:
+        return FAKE_MODEL_NAME
+
+    def _get_ls_params(self, stop=None, **kwargs: Any):
+        params = super()._get_ls_params(stop=stop, **kwargs)
+        params["ls_model_name"] = FAKE_MODEL_NAME
+        return params
+
+    def with_structured_output(self, schema, **kwargs: Any):  # type: ignore[override]
+        model = self.model_copy(update={"structured_schema": schema})
+        return model | PydanticOutputParser(pydantic_object=schema)
+
+    def _respond(self, messages: list[BaseMessage]) -> tuple[ChatResult, float]:
+        prompt = "\n".join(str(message.content) for message in messages)
+        tokens = settings.FAKE_LLM_COMPLETION_TOKENS or max(self.max_tokens // 2, 1)
+        tokens = min(tokens, self.max_tokens)
+        rng = _rng(prompt)
+
+        if self.structured_schema is not None:
+            content = json.dumps(_fake_structured(self.structured_schema, rng, tokens))
+        else:
+            content = _words(rng, tokens).capitalize()
+
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": len(prompt.split()),
+                "output_tokens": tokens,
+                "total_tokens": len(prompt.split()) + tokens,
+            },
+        )
+        latency = (
+            settings.FAKE_LLM_LATENCY_MS + settings.FAKE_LLM_MS_PER_TOKEN * tokens
+        ) / 1000
+        return ChatResult(generations=[ChatGeneration(message=message)]), latency
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        result, latency = self._respond(messages)
+        time.sleep(latency)
+        return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        result, latency = self._respond(messages)
+        await asyncio.sleep(latency)
+        return result
+
+
+def get_fake_embedding_model() -> DeterministicFakeEmbedding:
+    """Embeddings seeded by the text, FAKE_EMBEDDING_DIMENSIONS long."""
+    return DeterministicFakeEmbedding(size=settings.FAKE_EMBEDDING_DIMENSIONS)
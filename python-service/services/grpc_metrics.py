@@ -0,0 +1,324 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Collection
+from contextvars import ContextVar
+
+import grpc  # type: ignore
+from prometheus_client import Counter, Gauge, Histogram
+
+from utils.logger import logger
+
+# Prometheus metrics for the gRPC server. Each server worker process exports
+# its own (on GRPC_METRICS_PORT + worker index), so they are per worker.
+grpc_requests_counter = Counter(
+    "loresmith_grpc_requests_total",
+    "RPCs handled by this server worker",
+    ["method", "code"],
+)
+
+grpc_requests_in_flight_gauge = Gauge(
+    "loresmith_grpc_requests_in_flight",
+    "RPCs currently being handled by this server worker",
+    ["method"],
+)
+
+grpc_worker_info_gauge = Gauge(
+    "loresmith_grpc_worker_info",
+    "Index and PID of this gRPC server worker process",
+    ["worker", "pid"],
+)
+
+event_loop_lag_histogram = Histogram(
+    "loresmith_event_loop_lag_seconds",
+    "How late a periodic timer fired on this worker's event loop",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+event_loop_blocked_counter = Counter(
+    "loresmith_event_loop_blocked_total",
+    "Times this worker's event loop was blocked past the slow callback threshold",
+)
+
+_RPC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+grpc_request_duration_histogram = Histogram(
+    "loresmith_grpc_request_duration_seconds",
+    "Wall time of RPCs handled by this server worker",
+    ["method"],
+    buckets=_RPC_BUCKETS,
+)
+
+grpc_request_phase_histogram = Histogram(
+    "loresmith_grpc_request_phase_seconds",
+    "Per-RPC time by phase: queue (before the handler ran), llm (LLM calls, "
+    "summed), loop (handler holding the event loop) and cpu (CPU time of that)",
+    ["method", "phase"],
+    buckets=_RPC_BUCKETS,
+)
+
+# Phase timings of the RPC being handled, shared with the tasks it spawns
+_rpc_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "rpc_timings", default=None
+)
+
+# RPCs being handled on this worker, by method (the gauge can't be read back)
+_in_flight: dict[str, int] = {}
+
+# (handler attribute, handler factory, streams responses)
+_RPC_KINDS = (
+    ("unary_unary", grpc.unary_unary_rpc_method_handler, False),
+    ("stream_unary", grpc.stream_unary_rpc_method_handler, False),
+    ("unary_stream", grpc.unary_stream_rpc_method_handler, True),
+    ("stream_stream", grpc.stream_stream_rpc_method_handler, True),
+)
+
+
+def record_worker_info(worker_index: int):
+    grpc_worker_info_gauge.labels(worker=str(worker_index), pid=str(os.getpid())).set(1)
+
+
+async def sample_event_loop_lag(interval: float = 0.25):
+    """
+    Record event loop lag until cancelled.
+
+    Sleeps for `interval` and records how much later than that it woke up;
+    anything blocking the loop (CPU-bound work in a handler) shows up as lag.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        event_loop_lag_histogram.observe(max(loop.time() - start - interval, 0))
+
+
+def add_rpc_time(phase: str, seconds: float):
+    """Add time to a phase of the RPC being handled (no-op outside an RPC)."""
+    timings = _rpc_timings.get()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+def rpcs_in_flight(methods: Collection[str] | None = None) -> int:
+    """RPCs this worker is handling, only counting `methods` if given."""
+    return sum(
+        count
+        for method, count in _in_flight.items()
+        if methods is None or method in methods
+    )
+
+
+class BlockingCallDetector:
+    """
+    Log the event loop thread's stack whenever the loop is blocked too long.
+
+    asyncio's own slow callback warning needs debug mode (too slow to leave
+    on) and only names the callback once it has finished. Here a heartbeat
+    task refreshes a timestamp and a watchdog thread checks it: when the loop
+    has missed its heartbeat by `threshold` seconds, the watchdog logs the
+    loop thread's current stack, i.e. the blocking call itself. Logs once
+    per stall.
+    """
+
+    def __init__(self, threshold: float):
+        self._threshold = threshold
+        self._interval = threshold / 4
+        self._heartbeat = time.monotonic()
+        self._stopped = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        """Start watching the running event loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._beat())
+        threading.Thread(target=self._watch, name="loop-watchdog", daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _beat(self):
+        while True:
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self._interval)
+
+    def _watch(self):
+        reported = False
+        while not self._stopped.wait(self._interval):
+            blocked = time.monotonic() - self._heartbeat - self._interval
+            if blocked < self._threshold:
+                reported = False
+                continue
+            if reported:
+                continue
+
+            reported = True
+            event_loop_blocked_counter.inc()
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            stack = "".join(traceback.format_stack(frame)) if frame else "unavailable"
+            logger.warning(
+                f"Event loop blocked for {blocked * 1000:.0f}ms, "
+                f"loop thread stack:\n{stack}"
+            )
+
+
+class _TimedSteps:
+    """
+    Await a coroutine, adding the time each of its steps holds the event loop
+    (wall and CPU) to `timings`. Tasks it spawns aren't included.
+    """
+
+    __slots__ = ("_awaitable", "_timings")
+
+    def __init__(self, awaitable, timings: dict[str, float]):
+        self._awaitable = awaitable
+        self._timings = timings
+
+    def __await__(self):
+        steps = self._awaitable.__await__()
+        timings = self._timings
+        value, error = None, None
+        while True:
+            wall, cpu = time.perf_counter(), time.thread_time()
+            try:
+                if error is None:
+                    future = steps.send(value)
+                else:
+                    future = steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                timings["loop"] += time.perf_counter() - wall
+                timings["cpu"] += time.thread_time() - cpu
+
+            try:
+                value, error = (yield future), None
+            except GeneratorExit:
+                steps.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
+
+class _RpcTracker:
+    """
+    Bookkeeping for one RPC: in-flight gauge, duration and (when enabled)
+    phase timings, then count by status code.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        context: grpc.aio.ServicerContext,
+        accepted: float,
+        phase_timing: bool,
+    ):
+        self._method = method
+        self._context = context
+        self._start = time.perf_counter()
+        self._timings: dict[str, float] | None = None
+        if phase_timing:
+            self._timings = {
+                "queue": self._start - accepted,
+                "llm": 0.0,
+                "loop": 0.0,
+                "cpu": 0.0,
+            }
+            _rpc_timings.set(self._timings)
+        grpc_requests_in_flight_gauge.labels(method=method).inc()
+        _in_flight[method] = _in_flight.get(method, 0) + 1
+
+    def step(self, awaitable):
+        """Wrap a handler awaitable so its time on the event loop is counted."""
+        if self._timings is None:
+            return awaitable
+        return _TimedSteps(awaitable, self._timings)
+
+    def finish(self, error: BaseException | None):
+        if error is None or isinstance(error, grpc.aio.AbortError):
+            code = self._context.code() or grpc.StatusCode.OK
+        elif isinstance(error, Exception):
+            code = grpc.StatusCode.UNKNOWN
+        else:
+            code = grpc.StatusCode.CANCELLED
+
+        grpc_requests_in_flight_gauge.labels(method=self._method).dec()
+        _in_flight[self._method] -= 1
+        grpc_requests_counter.labels(method=self._method, code=code.name).inc()
+        grpc_request_duration_histogram.labels(method=self._method).observe(
+            time.perf_counter() - self._start
+        )
+        for phase, seconds in (self._timings or {}).items():
+            grpc_request_phase_histogram.labels(
+                method=self._method, phase=phase
+            ).observe(seconds)
+
+
+def _track(method: str, behavior, streaming: bool, accepted: float, phase_timing: bool):
+    if streaming:
+
+        async def track_stream(request, context):
+            tracker = _RpcTracker(method, context, accepted, phase_timing)
+            error = None
+            try:
+                responses = behavior(request, context)
+                while True:
+                    try:
+                        response = await tracker.step(responses.__anext__())
+                    except StopAsyncIteration:
+                        break
+                    yield response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                tracker.finish(error)
+
+        return track_stream
+
+    async def track_unary(request, context):
+        tracker = _RpcTracker(method, context, accepted, phase_timing)
+        error = None
+        try:
+            return await tracker.step(behavior(request, context))
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            tracker.finish(error)
+
+    return track_unary
+
+
+class RpcMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Count and time RPCs per method and status code, and track the ones in
+    flight. With `phase_timing`, also split each RPC's time into phases
+    (see loresmith_grpc_request_phase_seconds).
+    """
+
+    def __init__(self, phase_timing: bool = True):
+        self._phase_timing = phase_timing
+
+    async def intercept_service(self, continuation, handler_call_details):
+        accepted = time.perf_counter()
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        for kind, handler_factory, streaming in _RPC_KINDS:
+            behavior = getattr(handler, kind)
+            if behavior:
+                return handler_factory(
+                    _track(method, behavior, streaming, accepted, self._phase_timing),
+                    request_deserializer=handler.request_deserializer,
+                    response_serializer=handler.response_serializer,
+                )
+        return handler
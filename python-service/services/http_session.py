@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiohttp
+
+from config.settings import get_settings
+from utils.logger import logger
+
+settings = get_settings()
+
+# A dropped connection or a gateway error can come after the backend has done
+# the work, so only idempotent requests are retried on those. Other requests
+# (e.g. a txt2img POST) are only retried when the connection couldn't be
+# opened, i.e. the request never left.
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRYABLE_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ServerDisconnectedError)
+RETRYABLE_STATUSES = {502, 503, 504}
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Global session instance (created lazily, bound to the running event loop)
+_session: aiohttp.ClientSession | None = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=settings.IMAGE_HTTP_MAX_CONNECTIONS,
+        limit_per_host=settings.IMAGE_HTTP_MAX_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=settings.IMAGE_HTTP_TIMEOUT_SECONDS,
+        sock_connect=settings.IMAGE_HTTP_CONNECT_TIMEOUT_SECONDS,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session used for all image backends.
+
+    One session per process keeps connections to Automatic1111, Replicate and
+    image CDNs alive between requests (with cached DNS and per-host connection
+    limits) instead of paying a new TCP/TLS handshake per image. Every request
+    gets the IMAGE_HTTP_* timeouts unless it passes its own.
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        _session = _create_session()
+
+    return _session
+
+
+@asynccontextmanager
+async def http_request(
+    method: str, url: str, **kwargs
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """
+    Send a request on the shared session, retrying up to IMAGE_HTTP_RETRIES
+    times with backoff: idempotent requests on connection failures and
+    502/503/504 responses, others only when the connection couldn't be opened.
+
+    Usage:
+        async with http_request("GET", url) as response:
+            data = await response.read()
+    """
+    idempotent = method.upper() in IDEMPOTENT_METHODS
+    retryable_errors = RETRYABLE_ERRORS if idempotent else aiohttp.ClientConnectorError
+    retryable_statuses = RETRYABLE_STATUSES if idempotent else set()
+
+    attempts = settings.IMAGE_HTTP_RETRIES + 1
+    for attempt in range(1, attempts + 1):
+        try:
+            response = await get_http_session().request(method, url, **kwargs)
+        except retryable_errors as e:
+            if attempt == attempts:
+                raise
+            logger.warning(
+                f"{method} {url} failed ({e}), retrying ({attempt}/{attempts - 1})"
+            )
+        else:
+            if response.status not in retryable_statuses or attempt == attempts:
+                break
+            response.release()
+            logger.warning(
+                f"{method} {url} returned HTTP {response.status}, "
+                f"retrying ({attempt}/{attempts - 1})"
+            )
+
+        await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+    try:
+        yield response
+    finally:
+        response.release()
+
+
+async def close_http_session():
+    """Close the shared session (call on shutdown)."""
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
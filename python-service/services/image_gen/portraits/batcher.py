@@ -0,0 +1,90 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from utils.logger import logger
+from services.image_gen.scheduler import ImageJobScheduler, ImagePriority
+
+PortraitResult = dict[str, bytes | None]
+GenerateBatch = Callable[
+    [list[dict], bool], Awaitable[list[PortraitResult | BaseException]]
+]
+
+
+class PortraitBatcher:
+    """
+    Groups portrait jobs that arrive close together into one backend call.
+
+    The first job for a key opens a window; jobs with the same key submitted
+    before it closes (or until `max_size` is reached) are generated together
+    and each caller gets back its own result. Each batch waits for a portrait
+    slot from `scheduler` (fair across users, bounded concurrency) and runs
+    degraded when the scheduler says so.
+    """
+
+    def __init__(
+        self,
+        generate_batch: GenerateBatch,
+        scheduler: ImageJobScheduler,
+        window_seconds: float,
+        max_size: int,
+    ):
+        self._generate_batch = generate_batch
+        self._scheduler = scheduler
+        self._window_seconds = window_seconds
+        self._max_size = max(max_size, 1)
+        self._pending: dict[str, list[tuple[dict, asyncio.Future]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._batches: set[asyncio.Task] = set()
+
+    async def submit(self, key: str, job: dict) -> PortraitResult:
+        """Queue a job for the next batch with this key and wait for its portrait."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((job, future))
+
+        if len(pending) >= self._max_size:
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self._window_seconds, self._flush, key
+            )
+
+        return await future
+
+    def _flush(self, key: str):
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(key, [])
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: list[tuple[dict, asyncio.Future]]):
+        jobs = [job for job, _ in batch]
+        try:
+            async with self._scheduler.slot(
+                ImagePriority.PORTRAIT, jobs[0].get("user_id", "")
+            ) as degraded:
+                results = await self._generate_batch(jobs, degraded)
+            if len(results) != len(jobs):
+                raise RuntimeError(
+                    f"Batch returned {len(results)} results for {len(jobs)} jobs"
+                )
+        except Exception as e:
+            results = [e for _ in jobs]
+
+        if len(batch) > 1:
+            logger.info(f"Generated portrait batch of {len(batch)}")
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,7 +1,14 @@
+import asyncio
+
 from utils.logger import logger
 from config.settings import get_settings
+from exceptions.image_generation import PermanentImageGenerationError
 from .prompt_builder import build_character_prompt
-from .providers import generate_via_replicate, generate_via_automatic1111
+from .providers import (
+    generate_via_replicate,
+    generate_via_automatic1111,
+    generate_batch_via_automatic1111,
+)
 
 settings = get_settings()
 
@@ -14,11 +21,12 @@ async def generate_character_images(
     character_id: str,
     traits: list[str] | None = None,
     skills: list[str] | None = None,
-) -> dict[str, str | None]:
+    degraded: bool = False,
+) -> dict[str, bytes | None]:
     """
-    Generate portrait image for a character and return as base64.
+    Generate portrait image for a character and return the raw image bytes.
 
-    Returns base64 instead of uploading straight to R2.
+    Returns bytes instead of uploading straight to R2.
     Go will upload to R2 AFTER world creation with real world_id.
 
     Args:
@@ -29,33 +37,113 @@ async def generate_character_images(
         character_id: Unique identifier for the character
         traits: List of personality traits
         skills: List of skill names for visual elements
+        degraded: Use fewer steps and a lower resolution (backlog is high)
 
     Returns:
-        Dict with image_portrait_base64 (or None if disabled/failed)
+        Dict with image_portrait_bytes (None if image generation is disabled)
+
+    Raises:
+        TransientImageGenerationError: Provider failed in a way worth retrying
+        PermanentImageGenerationError: Provider failed in a way retries won't fix
     """
     if not settings.ENABLE_IMAGE_GENERATION:
         logger.info("Image generation disabled, skipping")
-        return {"image_portrait_base64": None}
+        return {"image_portrait_bytes": None}
 
-    try:
-        logger.info(f"Generating images for {name} using {settings.IMAGE_PROVIDER}")
+    logger.info(f"Generating images for {name} using {settings.IMAGE_PROVIDER}")
 
-        # Build optimized prompt with skills for more distinctive portraits
-        prompt, negative_prompt = build_character_prompt(
-            name, appearance, theme, traits, skills
+    # Build optimized prompt with skills for more distinctive portraits
+    prompt, negative_prompt = build_character_prompt(
+        name, appearance, theme, traits, skills
+    )
+
+    if settings.IMAGE_PROVIDER == "replicate":
+        portrait = await generate_via_replicate(
+            prompt, negative_prompt, character_id, degraded=degraded
+        )
+    elif settings.IMAGE_PROVIDER == "local":
+        portrait = await generate_via_automatic1111(
+            prompt, negative_prompt, character_id, degraded=degraded
         )
+    else:
+        raise PermanentImageGenerationError(
+            f"Unknown image provider: {settings.IMAGE_PROVIDER}"
+        )
+
+    return {"image_portrait_bytes": portrait["image_portrait_bytes"]}
+
 
-        if settings.IMAGE_PROVIDER == "replicate":
-            return await generate_via_replicate(prompt, negative_prompt, character_id)
-        elif settings.IMAGE_PROVIDER == "local":
-            return await generate_via_automatic1111(
-                prompt, negative_prompt, character_id
+async def generate_character_images_batch(
+    jobs: list[dict],
+    degraded: bool = False,
+) -> list[dict[str, bytes | None] | BaseException]:
+    """
+    Generate portraits for several portrait jobs at once.
+
+    With the local provider all portraits come from a single Automatic1111 call;
+    other providers generate them concurrently.
+
+    Args:
+        jobs: Portrait job payloads (see build_portrait_job)
+        degraded: Use fewer steps and a lower resolution (backlog is high)
+
+    Returns:
+        Per job, in order: a dict with image_portrait_bytes, or the exception
+        that job failed with
+    """
+    if not settings.ENABLE_IMAGE_GENERATION:
+        logger.info("Image generation disabled, skipping")
+        return [{"image_portrait_bytes": None} for _ in jobs]
+
+    if settings.IMAGE_PROVIDER != "local" or len(jobs) == 1:
+        return await asyncio.gather(
+            *(_generate_job(job, degraded) for job in jobs),
+            return_exceptions=True,
+        )
+
+    logger.info(f"Generating {len(jobs)} portraits in one batch")
+
+    # Build optimized prompts with skills for more distinctive portraits; a
+    # malformed job only fails its own slot
+    prompts = {}
+    results: dict[int, dict[str, bytes | None] | BaseException] = {}
+    for index, job in enumerate(jobs):
+        try:
+            prompts[index] = build_character_prompt(
+                job["name"],
+                job["appearance"],
+                job["theme"],
+                job["traits"],
+                job.get("skills", []),
+            )
+        except Exception as e:
+            results[index] = e
+
+    if prompts:
+        try:
+            images = await generate_batch_via_automatic1111(
+                list(prompts.values()), degraded=degraded
             )
-        else:
-            logger.warning(f"Unknown image provider: {settings.IMAGE_PROVIDER}")
-            return {"image_portrait_base64": None}
-
-    except Exception as e:
-        logger.error(f"Failed to generate character images: {e}", exc_info=True)
-        # Don't fail character generation if images fail
-        return {"image_portrait_base64": None}
+            if len(images) != len(prompts):
+                raise RuntimeError(
+                    f"Got {len(images)} images for {len(prompts)} prompts"
+                )
+            for index, image in zip(prompts, images):
+                results[index] = {"image_portrait_bytes": image}
+        except Exception as e:
+            results.update(dict.fromkeys(prompts, e))
+
+    return [results[index] for index in range(len(jobs))]
+
+
+async def _generate_job(job: dict, degraded: bool) -> dict[str, bytes | None]:
+    return await generate_character_images(
+        name=job["name"],
+        appearance=job["appearance"],
+        theme=job["theme"],
+        world_id=0,
+        character_id=job["uuid"],
+        traits=job["traits"],
+        skills=job.get("skills", []),
+        degraded=degraded,
+    )
@@ -1,66 +1,120 @@
-import json
 from utils.logger import logger
 from services.redis import get_redis_client
-from services.rabbitmq import get_rabbitmq_connection
-import pika
+from services.rabbitmq import get_publisher
 
+PORTRAIT_QUEUE = "portrait_generation"
 
-def store_portrait(uuid: str, base64_data: str, ttl_seconds: int = 3600):
-    """Store portrait base64 in Redis with TTL."""
+# Payload keys a portrait job can't be generated without
+PORTRAIT_JOB_REQUIRED_KEYS = ("uuid", "name", "appearance", "theme", "traits")
+
+
+PORTRAIT_KEY_PREFIX = "portrait:"
+PORTRAIT_TTL_SECONDS = 3600
+
+
+def _portrait_key(uuid: str) -> str:
+    return f"{PORTRAIT_KEY_PREFIX}{uuid}"
+
+
+async def store_portrait(
+    uuid: str, image_data: bytes, ttl_seconds: int = PORTRAIT_TTL_SECONDS
+):
+    """Store raw portrait image bytes in Redis with TTL."""
     try:
         client = get_redis_client()
-        key = f"portrait:{uuid}"
-        client.setex(key, ttl_seconds, base64_data)
-        logger.info(f"Stored portrait {uuid} in Redis (TTL: {ttl_seconds}s)")
+        await client.setex(_portrait_key(uuid), ttl_seconds, image_data)
+        logger.info(
+            f"Stored portrait {uuid} in Redis ({len(image_data)} bytes, TTL: {ttl_seconds}s)"
+        )
     except Exception as e:
         logger.error(f"Failed to store portrait in Redis: {e}")
         raise
 
 
-def get_portrait(uuid: str) -> str | None:
-    """Retrieve portrait base64 from Redis."""
+async def store_portraits(
+    portraits: dict[str, bytes], ttl_seconds: int = PORTRAIT_TTL_SECONDS
+):
+    """Store several portraits (uuid -> raw image bytes) in one pipelined round trip."""
+    if not portraits:
+        return
+
     try:
         client = get_redis_client()
-        key = f"portrait:{uuid}"
-        data = client.get(key)
-        if data is None:
-            return None
-        if isinstance(data, bytes):
-            return data.decode('utf-8')
-        return str(data)
+        async with client.pipeline(transaction=False) as pipe:
+            for uuid, image_data in portraits.items():
+                pipe.setex(_portrait_key(uuid), ttl_seconds, image_data)
+            await pipe.execute()
+        logger.info(f"Stored {len(portraits)} portraits in Redis (TTL: {ttl_seconds}s)")
+    except Exception as e:
+        logger.error(f"Failed to store portraits in Redis: {e}")
+        raise
+
+
+async def get_portrait(uuid: str) -> bytes | None:
+    """Retrieve raw portrait image bytes from Redis."""
+    try:
+        client = get_redis_client()
+        return await client.get(_portrait_key(uuid))
     except Exception as e:
         logger.error(f"Failed to get portrait from Redis: {e}")
         return None
 
 
-def publish_portrait_job(uuid: str, name: str, appearance: str, theme: str, traits: list, skills: list):
-    """Publish a portrait generation job to RabbitMQ."""
+async def get_portraits(uuids: list[str]) -> dict[str, bytes | None]:
+    """
+    Retrieve several portraits in one pipelined round trip.
+
+    Returns a mapping of uuid -> raw image bytes (None for portraits that are
+    missing or not generated yet).
+    """
+    if not uuids:
+        return {}
+
     try:
-        connection = get_rabbitmq_connection()
-        channel = connection.channel()
-        channel.queue_declare(queue='portrait_generation', durable=True)
-
-        job_data = {
-            "uuid": uuid,
-            "name": name,
-            "appearance": appearance,
-            "theme": theme,
-            "traits": traits,
-            "skills": skills
-        }
-
-        channel.basic_publish(
-            exchange='',
-            routing_key='portrait_generation',
-            body=json.dumps(job_data),
-            properties=pika.BasicProperties(
-                delivery_mode=2,
-                content_type='application/json'
-            )
-        )
+        client = get_redis_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for uuid in uuids:
+                pipe.get(_portrait_key(uuid))
+            results = await pipe.execute()
+        return dict(zip(uuids, results))
+    except Exception as e:
+        logger.error(f"Failed to get portraits from Redis: {e}")
+        return {uuid: None for uuid in uuids}
 
-        logger.info(f"Published portrait job for {name} (UUID: {uuid})")
-        connection.close()
+
+def build_portrait_job(
+    uuid: str,
+    name: str,
+    appearance: str,
+    theme: str,
+    traits: list,
+    skills: list,
+    user_id: str = "",
+) -> dict:
+    """
+    Build the RabbitMQ payload for a portrait generation job.
+
+    `user_id` is the fairness key for image scheduling (see ImageJobScheduler).
+    """
+    return {
+        "uuid": uuid,
+        "name": name,
+        "appearance": appearance,
+        "theme": theme,
+        "traits": traits,
+        "skills": skills,
+        "user_id": user_id,
+    }
+
+
+async def publish_portrait_jobs(jobs: list[dict]):
+    """Publish a batch of portrait generation jobs to RabbitMQ (waits for broker confirms)."""
+    if not jobs:
+        return
+
+    try:
+        await get_publisher().publish_batch(PORTRAIT_QUEUE, jobs)
+        logger.info(f"Published {len(jobs)} portrait jobs")
     except Exception as e:
-        logger.error(f"Failed to publish portrait job: {e}", exc_info=True)
+        logger.error(f"Failed to publish portrait jobs: {e}", exc_info=True)
         raise
@@ -1,24 +1,15 @@
+import asyncio
 import base64
-import aiohttp
-import boto3
-from botocore.exceptions import ClientError
+from typing import AsyncIterator
 
 from utils.logger import logger
 from config.settings import get_settings
+from services.http_session import http_request
+from services.image_gen.transcoding import transcode_image
+from services.object_storage import upload_object, upload_stream
 
 settings = get_settings()
 
-# Initialize R2 client (S3-compatible)
-s3_client = None
-if settings.AWS_ACCESS_KEY_ID and settings.AWS_ENDPOINT_URL:
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=settings.AWS_ENDPOINT_URL,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name="auto",  # R2 uses 'auto' as region
-    )
-
 
 async def save_base64_image(
     base64_data: str, world_id: int, character_id: str, image_type: str
@@ -35,29 +26,18 @@ async def save_base64_image(
     Returns:
         R2 object key (path in bucket)
     """
-    if not s3_client:
-        raise Exception("R2 client not initialized. Check AWS credentials in .env")
-
     # Decode image
     image_data = base64.b64decode(base64_data)
 
     # Object key: portraits/{world_id}/{character_id}_portrait.png
     key = f"portraits/{world_id}/{character_id}_{image_type}.png"
 
-    try:
-        # Upload to R2
-        s3_client.put_object(
-            Bucket=settings.R2_PORTRAITS_BUCKET_NAME,
-            Key=key,
-            Body=image_data,
-            ContentType="image/png",
-        )
-        logger.info(f"Uploaded image to R2: {key}")
-        return key
-
-    except ClientError as e:
-        logger.error(f"Failed to upload to R2: {e}")
-        raise Exception(f"R2 upload failed: {e}")
+    # Upload to R2
+    await upload_object(
+        settings.R2_PORTRAITS_BUCKET_NAME, key, image_data, image_type=image_type
+    )
+    logger.info(f"Uploaded image to R2: {key}")
+    return key
 
 
 async def download_and_save_image(
@@ -75,34 +55,41 @@ async def download_and_save_image(
     Returns:
         R2 object key (path in bucket)
     """
-    if not s3_client:
-        raise Exception("R2 client not initialized. Check AWS credentials in .env")
-
     # Download image
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status != 200:
-                raise Exception(f"Failed to download image: HTTP {response.status}")
+    async with http_request("GET", url) as response:
+        if response.status != 200:
+            raise Exception(f"Failed to download image: HTTP {response.status}")
 
-            image_data = await response.read()
+        image_data = await response.read()
 
     # Object key: portraits/{world_id}/{character_id}_portrait.png
     key = f"portraits/{world_id}/{character_id}_{image_type}.png"
 
-    try:
-        # Upload to R2
-        s3_client.put_object(
-            Bucket=settings.R2_PORTRAITS_BUCKET_NAME,
-            Key=key,
-            Body=image_data,
-            ContentType="image/png",
+    # Upload to R2
+    await upload_object(
+        settings.R2_PORTRAITS_BUCKET_NAME, key, image_data, image_type=image_type
+    )
+    logger.info(f"Uploaded image to R2: {key}")
+    return key
+
+
+def _image_location(
+    world_id: int, character_id: str, image_type: str
+) -> tuple[str, str, str]:
+    """Select bucket, public URL and object key based on image type."""
+    if image_type == "world_scene":
+        return (
+            settings.R2_WORLD_IMAGES_BUCKET_NAME,
+            settings.R2_WORLD_IMAGES_PUBLIC_URL,
+            f"worlds/{world_id}/scene.png",
         )
-        logger.info(f"Uploaded image to R2: {key}")
-        return key
 
-    except ClientError as e:
-        logger.error(f"Failed to upload to R2: {e}")
-        raise Exception(f"R2 upload failed: {e}")
+    # Portrait or card images
+    return (
+        settings.R2_PORTRAITS_BUCKET_NAME,
+        settings.R2_PORTRAITS_PUBLIC_URL,
+        f"portraits/{world_id}/{character_id}_{image_type}.png",
+    )
 
 
 async def upload_image_to_r2(
@@ -122,36 +109,93 @@ async def upload_image_to_r2(
     Returns:
         Full R2 public URL
     """
-    if not s3_client:
-        raise Exception("R2 client not initialized. Check AWS credentials in .env")
+    bucket, public_url, key = _image_location(world_id, character_id, image_type)
 
-    # Select bucket and build key based on image type
-    if image_type == "world_scene":
-        bucket = settings.R2_WORLD_IMAGES_BUCKET_NAME
-        public_url = settings.R2_WORLD_IMAGES_PUBLIC_URL
-        key = f"worlds/{world_id}/scene.png"
-    else:
-        # Portrait or card images
-        bucket = settings.R2_PORTRAITS_BUCKET_NAME
-        public_url = settings.R2_PORTRAITS_PUBLIC_URL
-        key = f"portraits/{world_id}/{character_id}_{image_type}.png"
+    # Upload to R2
+    await upload_object(bucket, key, image_data, image_type=image_type)
+    logger.info(f"Uploaded {image_type} image to R2: {key}")
+
+    # Return full public URL
+    return f"{public_url}/{key}"
+
+
+async def upload_image_with_variants_to_r2(
+    image_data: bytes, world_id: int, character_id: str, image_type: str
+) -> tuple[str, dict[str, str]]:
+    """
+    Upload image bytes to R2 together with their WebP/AVIF and thumbnail
+    variants (IMAGE_VARIANT_FORMATS, IMAGE_THUMBNAIL_SIZES).
 
+    The original keeps its key; variants replace its extension, e.g.
+    portraits/1/abc_portrait.png -> portraits/1/abc_portrait.webp and
+    portraits/1/abc_portrait_256.webp. Encoding runs in a process pool while
+    the original uploads. Failed variants are logged and left out.
+
+    Returns:
+        Full R2 public URL of the original and a {variant name: URL} map
+    """
+    bucket, public_url, key = _image_location(world_id, character_id, image_type)
+    stem = key.rsplit(".", 1)[0]
+
+    transcode_task = asyncio.create_task(transcode_image(image_data))
     try:
-        # Upload to R2
-        s3_client.put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=image_data,
-            ContentType="image/png",
-        )
-        logger.info(f"Uploaded {image_type} image to R2: {key}")
+        await upload_object(bucket, key, image_data, image_type=image_type)
+    except Exception:
+        transcode_task.cancel()
+        raise
+    logger.info(f"Uploaded {image_type} image to R2: {key}")
+
+    try:
+        variants = await transcode_task
+    except Exception as e:
+        logger.warning(f"Failed to encode variants of {key}: {e}")
+        return f"{public_url}/{key}", {}
+
+    results = await asyncio.gather(
+        *(
+            upload_object(
+                bucket,
+                stem + variant.key_suffix,
+                variant.data,
+                content_type=variant.content_type,
+                image_type=image_type,
+            )
+            for variant in variants
+        ),
+        return_exceptions=True,
+    )
+
+    variant_urls = {}
+    for variant, result in zip(variants, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                f"Failed to upload {variant.name} variant of {key}: {result}"
+            )
+            continue
+        variant_urls[variant.name] = f"{public_url}/{stem}{variant.key_suffix}"
+    logger.info(f"Uploaded {len(variant_urls)} variants of {key} to R2")
+
+    return f"{public_url}/{key}", variant_urls
+
+
+async def upload_image_stream_to_r2(
+    chunks: AsyncIterator[bytes], world_id: int, character_id: str, image_type: str
+) -> str:
+    """
+    Upload an image to R2 from a stream of raw byte chunks.
+
+    Same destination as upload_image_to_r2, but the image is never held in
+    memory as a whole.
+
+    Returns:
+        Full R2 public URL
+    """
+    bucket, public_url, key = _image_location(world_id, character_id, image_type)
 
-        # Return full public URL
-        return f"{public_url}/{key}"
+    size = await upload_stream(bucket, key, chunks, image_type=image_type)
+    logger.info(f"Streamed {image_type} image to R2: {key} ({size} bytes)")
 
-    except ClientError as e:
-        logger.error(f"Failed to upload to R2: {e}")
-        raise Exception(f"R2 upload failed: {e}")
+    return f"{public_url}/{key}"
 
 
 def build_image_urls(world_id: int, character_id: str) -> dict[str, str | None]:
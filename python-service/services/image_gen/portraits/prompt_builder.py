@@ -1,20 +1,267 @@
 import random
 from utils.logger import logger
+from utils.keyword_matcher import KeywordMatcher
+
+# Keyword groups, matched on word boundaries ("man" doesn't match "woman"). A
+# trailing "*" also matches longer words ("heal*" -> "healing"), a leading one
+# compounds ("*sword" -> "longsword"); see utils.keyword_matcher.
+_GENDER_MATCHER = KeywordMatcher(
+    {
+        "male": ["man", "boy", "male", "he", "his", "himself"],
+        "female": ["woman", "girl", "female", "she", "her", "herself"],
+    }
+)
+
+# Skill keywords -> visual elements (weapons, clothing, tools). Order matters:
+# a skill gets the visual of the first group it matches.
+_SKILL_VISUAL_MATCHER = KeywordMatcher(
+    {
+        # Melee Combat - Blades
+        "sword sheathed at hip or back": [
+            "*sword*",
+            "blade*",
+            "fencing",
+            "duel*",
+            "katana",
+            "saber",
+            "rapier",
+        ],
+        # Melee Combat - Axes
+        "battle axe handle visible at belt": ["*axe", "hatchet", "cleaver", "chop*"],
+        # Melee Combat - Spears/Polearms
+        "spear or staff visible over shoulder": [
+            "spear*",
+            "lance*",
+            "pike*",
+            "polearm",
+            "halberd*",
+            "staff combat",
+        ],
+        # Melee Combat - Unarmed
+        "wrapped knuckles, combat wraps on hands": [
+            "brawl*",
+            "martial",
+            "fist*",
+            "hand-to-hand",
+            "boxing",
+            "wrestl*",
+            "monk",
+            "unarmed",
+        ],
+        # Ranged Combat - Bows
+        "quiver strap visible over shoulder, bow visible": [
+            "archer*",
+            "bow",
+            "arrow*",
+            "longbow",
+            "shortbow",
+            "crossbow",
+        ],
+        # Ranged Combat - Firearms
+        "holstered weapon at hip, ammunition belt": [
+            "gun*",
+            "rifle*",
+            "pistol*",
+            "firearm",
+            "*shoot*",
+            "marksman*",
+            "sniper",
+        ],
+        # Combat - Shields
+        "shield strapped to back or arm": ["shield*", "buckler", "defensive"],
+        # Combat - Dual Weapons
+        "twin weapons at hips": ["dual wield*", "two weapon*", "twin blade*"],
+        # Magic - Fire
+        "red and orange robes, flame motifs on clothing": [
+            "fire*",
+            "flame*",
+            "pyro*",
+            "inferno",
+            "burn*",
+        ],
+        # Magic - Ice/Frost
+        "blue and white robes, frost patterns on clothing": [
+            "ice",
+            "frost*",
+            "cryo*",
+            "frozen",
+            "cold",
+        ],
+        # Magic - Lightning/Storm
+        "purple and blue robes, lightning symbols": [
+            "lightning",
+            "thunder*",
+            "storm*",
+            "electro*",
+            "shock*",
+        ],
+        # Magic - Healing/Divine
+        "healing pouches on belt, herbs visible, white robes, medical bag, staff with healing symbols": [
+            "heal*",
+            "restor*",
+            "divine",
+            "holy",
+            "white magic",
+            "cleric",
+            "priest*",
+            "medicine",
+            "medic*",
+        ],
+        # Magic - Necromancy/Dark
+        "dark robes, skull motifs, shadow aesthetic": [
+            "necro*",
+            "death",
+            "dark*",
+            "shadow*",
+            "unholy",
+            "curse*",
+            "hex*",
+        ],
+        # Magic - Illusion/Mind
+        "mystical robes with hypnotic patterns": [
+            "illusion*",
+            "mind",
+            "enchant*",
+            "charm*",
+            "mesmer*",
+        ],
+        # Magic - Summoning
+        "robes with summoning runes, mystical talismans": [
+            "summon*",
+            "conjur*",
+            "binding",
+            "familiar*",
+        ],
+        # Magic - General
+        "mystical robes, arcane symbols on clothing, magical staff": [
+            "magic*",
+            "mage*",
+            "wizard*",
+            "sorc*",
+            "arcane",
+            "mystic*",
+            "spell*",
+            "cast*",
+        ],
+        # Alchemy/Potions
+        "alchemical vials on belt, mystical tools, ingredient pouches": [
+            "alche*",
+            "potion*",
+            "brew*",
+            "elixir*",
+            "transmut*",
+            "herbal*",
+        ],
+        # Crafting - Smithing
+        "leather apron, forge tools at belt, soot-stained work clothes": [
+            "blacksmith*",
+            "forg*",
+            "metal*",
+            "*smith*",
+            "weaponcraft*",
+        ],
+        # Crafting - Woodworking
+        "tool belt, woodworking tools, practical work clothes": [
+            "carpen*",
+            "wood*",
+            "lumber*",
+            "craft*",
+        ],
+        # Crafting - Leather
+        "leather working tools, material samples": ["leather*", "tann*", "hide*"],
+        # Crafting - Engineering
+        "tool belt, mechanical parts, goggles on forehead": [
+            "engineer*",
+            "mechanic*",
+            "tinker*",
+            "gadget*",
+            "inventor*",
+        ],
+        # Crafting - Cooking
+        "apron, cooking utensils at belt": ["cook*", "culinary", "chef", "baking"],
+        # Stealth - General
+        "dark hooded cloak, concealing garments, face wrap": [
+            "stealth*",
+            "sneak*",
+            "infiltrat*",
+            "shadow*",
+            "assassin*",
+            "ninja*",
+        ],
+        # Stealth - Thievery
+        "leather vest, lockpicks visible at belt, dark practical clothing": [
+            "thief",
+            "steal*",
+            "lockpick*",
+            "pickpocket*",
+            "burglar*",
+            "rogue*",
+        ],
+        # Stealth - Disguise
+        "nondescript practical clothing, hidden tools": [
+            "disguise*",
+            "decept*",
+            "spy*",
+            "espionage",
+        ],
+        # Survival - Hunting/Tracking
+        "practical survival gear, rugged outdoor attire, hunting knife visible": [
+            "hunt*",
+            "track*",
+            "trap*",
+            "ranger",
+            "scout*",
+            "wilderness",
+        ],
+        # Survival - Foraging
+        "collection pouches, worn practical gear, backpack straps visible": [
+            "forag*",
+            "scaveng*",
+            "salvag*",
+            "loot*",
+            "gather*",
+        ],
+        # Survival - Animal Handling
+        "leather gear, animal training tools, rugged outdoor clothing": [
+            "animal*",
+            "beast*",
+            "taming",
+            "falconry",
+            "riding",
+        ],
+        # Survival - Fishing
+        "fishing tools, net on belt, waterproof gear": ["fish*", "angling", "maritime"],
+        # Survival - General
+        "survival knife, rope coils, weatherproof clothing": [
+            "survival",
+            "bushcraft",
+            "outdoors",
+        ],
+        # No visual elements for pure social skills like persuasion, leadership, etc.
+    }
+)
+
+# Personality trait keywords -> portrait visual cues, first match wins
+_TRAIT_VISUAL_MATCHER = KeywordMatcher(
+    {
+        "confident bearing": ["brave*", "courageous"],
+        "thoughtful gaze": ["wise", "intelligent"],
+        "intense expression": ["aggressive", "fierce"],
+        "warm eyes": ["kind*", "compassionate"],
+        "shrewd look": ["cunning", "clever"],
+        "steady gaze": ["loyal*"],
+    }
+)
 
 
-def _extract_gender(appearance: str) -> str:
+def extract_gender(appearance: str) -> str:
     """
     Extract gender from appearance description.
     Returns 'male', 'female', or 'neutral' based on keywords.
     """
-    appearance_lower = appearance.lower()
-
-    # Check for explicit gender keywords
-    male_keywords = ["man", "boy", "male", " he ", " his ", "himself"]
-    female_keywords = ["woman", "girl", "female", " she ", " her ", "herself"]
-
-    male_count = sum(1 for keyword in male_keywords if keyword in appearance_lower)
-    female_count = sum(1 for keyword in female_keywords if keyword in appearance_lower)
+    found = _GENDER_MATCHER.find(appearance)
+    male_count = len(found.get("male", ()))
+    female_count = len(found.get("female", ()))
 
     if male_count > female_count:
         gender = "male"
@@ -29,6 +276,17 @@ def _extract_gender(appearance: str) -> str:
     return gender
 
 
+def get_skill_visuals(skills: list[str]) -> list[str]:
+    """Map the top 3 skills to visual elements (weapons, clothing, tools)."""
+    skill_visuals = []
+    for skill in skills[:3]:  # Use top 3 skills
+        visual = _SKILL_VISUAL_MATCHER.first(skill)
+        if visual:
+            skill_visuals.append(visual)
+
+    return skill_visuals
+
+
 def build_character_prompt(
     name: str,
     appearance: str,
@@ -51,7 +309,7 @@ def build_character_prompt(
     """
 
     # Extract gender from appearance
-    gender = _extract_gender(appearance)
+    gender = extract_gender(appearance)
 
     # Gender tags for character models (critical for correct gender generation)
     if gender == "male":
@@ -126,19 +384,9 @@ def build_character_prompt(
     if traits and len(traits) > 0:
         trait_visuals = []
         for trait in traits[:2]:  # Use top 2 traits
-            trait_lower = trait.lower()
-            if "brave" in trait_lower or "courageous" in trait_lower:
-                trait_visuals.append("confident bearing")
-            elif "wise" in trait_lower or "intelligent" in trait_lower:
-                trait_visuals.append("thoughtful gaze")
-            elif "aggressive" in trait_lower or "fierce" in trait_lower:
-                trait_visuals.append("intense expression")
-            elif "kind" in trait_lower or "compassionate" in trait_lower:
-                trait_visuals.append("warm eyes")
-            elif "cunning" in trait_lower or "clever" in trait_lower:
-                trait_visuals.append("shrewd look")
-            elif "loyal" in trait_lower:
-                trait_visuals.append("steady gaze")
+            visual = _TRAIT_VISUAL_MATCHER.first(trait)
+            if visual:
+                trait_visuals.append(visual)
 
         if trait_visuals:
             trait_details = ", " + ", ".join(trait_visuals)
@@ -146,281 +394,7 @@ def build_character_prompt(
     # Build skill-based visual elements with comprehensive keyword matching
     skill_details = ""
     if skills and len(skills) > 0:
-        skill_visuals = []
-        for skill in skills[:3]:  # Use top 3 skills
-            skill_lower = skill.lower()
-
-            # Melee Combat - Blades
-            if any(
-                word in skill_lower
-                for word in [
-                    "sword",
-                    "blade",
-                    "fencing",
-                    "duel",
-                    "katana",
-                    "saber",
-                    "rapier",
-                ]
-            ):
-                skill_visuals.append("sword sheathed at hip or back")
-            # Melee Combat - Axes
-            elif any(
-                word in skill_lower for word in ["axe", "hatchet", "cleaver", "chop"]
-            ):
-                skill_visuals.append("battle axe handle visible at belt")
-            # Melee Combat - Spears/Polearms
-            elif any(
-                word in skill_lower
-                for word in [
-                    "spear",
-                    "lance",
-                    "pike",
-                    "polearm",
-                    "halberd",
-                    "staff combat",
-                ]
-            ):
-                skill_visuals.append("spear or staff visible over shoulder")
-            # Melee Combat - Unarmed
-            elif any(
-                word in skill_lower
-                for word in [
-                    "brawl",
-                    "martial",
-                    "fist",
-                    "hand-to-hand",
-                    "boxing",
-                    "wrestling",
-                    "monk",
-                    "unarmed",
-                ]
-            ):
-                skill_visuals.append("wrapped knuckles, combat wraps on hands")
-            # Ranged Combat - Bows
-            elif any(
-                word in skill_lower
-                for word in ["archer", "bow", "arrow", "longbow", "crossbow"]
-            ):
-                skill_visuals.append("quiver strap visible over shoulder, bow visible")
-            # Ranged Combat - Firearms
-            elif any(
-                word in skill_lower
-                for word in [
-                    "gun",
-                    "rifle",
-                    "pistol",
-                    "firearm",
-                    "shoot",
-                    "marksman",
-                    "sniper",
-                ]
-            ):
-                skill_visuals.append("holstered weapon at hip, ammunition belt")
-            # Combat - Shields
-            elif any(
-                word in skill_lower for word in ["shield", "buckler", "defensive"]
-            ):
-                skill_visuals.append("shield strapped to back or arm")
-            # Combat - Dual Weapons
-            elif any(
-                word in skill_lower
-                for word in ["dual wield", "two weapon", "twin blade"]
-            ):
-                skill_visuals.append("twin weapons at hips")
-
-            # Magic - Fire
-            elif any(
-                word in skill_lower
-                for word in ["fire", "flame", "pyro", "inferno", "burn"]
-            ):
-                skill_visuals.append("red and orange robes, flame motifs on clothing")
-            # Magic - Ice/Frost
-            elif any(
-                word in skill_lower
-                for word in ["ice", "frost", "cryo", "frozen", "cold"]
-            ):
-                skill_visuals.append("blue and white robes, frost patterns on clothing")
-            # Magic - Lightning/Storm
-            elif any(
-                word in skill_lower
-                for word in ["lightning", "thunder", "storm", "electro", "shock"]
-            ):
-                skill_visuals.append("purple and blue robes, lightning symbols")
-            # Magic - Healing/Divine
-            elif any(
-                word in skill_lower
-                for word in [
-                    "heal",
-                    "restor",
-                    "divine",
-                    "holy",
-                    "white magic",
-                    "cleric",
-                    "priest",
-                    "medicine",
-                    "medic",
-                ]
-            ):
-                skill_visuals.append(
-                    "healing pouches on belt, herbs visible, white robes, medical bag, staff with healing symbols"
-                )
-            # Magic - Necromancy/Dark
-            elif any(
-                word in skill_lower
-                for word in [
-                    "necro",
-                    "death",
-                    "dark",
-                    "shadow",
-                    "unholy",
-                    "curse",
-                    "hex",
-                ]
-            ):
-                skill_visuals.append("dark robes, skull motifs, shadow aesthetic")
-            # Magic - Illusion/Mind
-            elif any(
-                word in skill_lower
-                for word in ["illusion", "mind", "enchant", "charm", "mesmer"]
-            ):
-                skill_visuals.append("mystical robes with hypnotic patterns")
-            # Magic - Summoning
-            elif any(
-                word in skill_lower
-                for word in ["summon", "conjur", "binding", "familiar"]
-            ):
-                skill_visuals.append("robes with summoning runes, mystical talismans")
-            # Magic - General
-            elif any(
-                word in skill_lower
-                for word in [
-                    "magic",
-                    "mage",
-                    "wizard",
-                    "sorc",
-                    "arcane",
-                    "mystic",
-                    "spell",
-                    "cast",
-                ]
-            ):
-                skill_visuals.append(
-                    "mystical robes, arcane symbols on clothing, magical staff"
-                )
-            # Alchemy/Potions
-            elif any(
-                word in skill_lower
-                for word in ["alche", "potion", "brew", "elixir", "transmut", "herbal"]
-            ):
-                skill_visuals.append(
-                    "alchemical vials on belt, mystical tools, ingredient pouches"
-                )
-
-            # Crafting - Smithing
-            elif any(
-                word in skill_lower
-                for word in ["blacksmith", "forg", "metal", "smith", "weaponcraft"]
-            ):
-                skill_visuals.append(
-                    "leather apron, forge tools at belt, soot-stained work clothes"
-                )
-            # Crafting - Woodworking
-            elif any(
-                word in skill_lower for word in ["carpen", "wood", "lumber", "craft"]
-            ):
-                skill_visuals.append(
-                    "tool belt, woodworking tools, practical work clothes"
-                )
-            # Crafting - Leather
-            elif any(word in skill_lower for word in ["leather", "tann", "hide"]):
-                skill_visuals.append("leather working tools, material samples")
-            # Crafting - Engineering
-            elif any(
-                word in skill_lower
-                for word in ["engineer", "mechanic", "tinker", "gadget", "inventor"]
-            ):
-                skill_visuals.append("tool belt, mechanical parts, goggles on forehead")
-            # Crafting - Cooking
-            elif any(
-                word in skill_lower for word in ["cook", "culinary", "chef", "baking"]
-            ):
-                skill_visuals.append("apron, cooking utensils at belt")
-
-            # Stealth - General
-            elif any(
-                word in skill_lower
-                for word in [
-                    "stealth",
-                    "sneak",
-                    "infiltrat",
-                    "shadow",
-                    "assassin",
-                    "ninja",
-                ]
-            ):
-                skill_visuals.append(
-                    "dark hooded cloak, concealing garments, face wrap"
-                )
-            # Stealth - Thievery
-            elif any(
-                word in skill_lower
-                for word in [
-                    "thief",
-                    "steal",
-                    "lockpick",
-                    "pickpocket",
-                    "burglar",
-                    "rogue",
-                ]
-            ):
-                skill_visuals.append(
-                    "leather vest, lockpicks visible at belt, dark practical clothing"
-                )
-            # Stealth - Disguise
-            elif any(
-                word in skill_lower
-                for word in ["disguise", "decept", "spy", "espionage"]
-            ):
-                skill_visuals.append("nondescript practical clothing, hidden tools")
-
-            # Survival - Hunting/Tracking
-            elif any(
-                word in skill_lower
-                for word in ["hunt", "track", "trap", "ranger", "scout", "wilderness"]
-            ):
-                skill_visuals.append(
-                    "practical survival gear, rugged outdoor attire, hunting knife visible"
-                )
-            # Survival - Foraging
-            elif any(
-                word in skill_lower
-                for word in ["forag", "scaveng", "salvag", "loot", "gather"]
-            ):
-                skill_visuals.append(
-                    "collection pouches, worn practical gear, backpack straps visible"
-                )
-            # Survival - Animal Handling
-            elif any(
-                word in skill_lower
-                for word in ["animal", "beast", "taming", "falconry", "riding"]
-            ):
-                skill_visuals.append(
-                    "leather gear, animal training tools, rugged outdoor clothing"
-                )
-            # Survival - Fishing
-            elif any(word in skill_lower for word in ["fish", "angling", "maritime"]):
-                skill_visuals.append("fishing tools, net on belt, waterproof gear")
-            # Survival - General
-            elif any(
-                word in skill_lower for word in ["survival", "bushcraft", "outdoors"]
-            ):
-                skill_visuals.append(
-                    "survival knife, rope coils, weatherproof clothing"
-                )
-
-            # No visual elements for pure social skills like persuasion, leadership, etc.
-
+        skill_visuals = get_skill_visuals(skills)
         if skill_visuals:
             skill_details = ", " + ", ".join(skill_visuals)
 
@@ -2,14 +2,24 @@ import os
 import asyncio
 import aiohttp
 import base64
+import shlex
 
 from utils.logger import logger
 from config.settings import get_settings
+from services.http_session import http_request
+from services.image_gen.scheduler import degrade_dimensions
+from exceptions.image_generation import (
+    ImageGenerationError,
+    PermanentImageGenerationError,
+    TransientImageGenerationError,
+    classify_http_status,
+)
 
 settings = get_settings()
 
 try:
     import replicate
+    from replicate.exceptions import ModelError, ReplicateError
 
     REPLICATE_AVAILABLE = True
 except ImportError:
@@ -20,34 +30,44 @@ async def generate_via_replicate(
     prompt: str,
     negative_prompt: str,
     character_id: str,
-) -> dict[str, str | None]:
+    degraded: bool = False,
+) -> dict[str, bytes]:
     """
-    Generate portrait image via Replicate and return as base64.
+    Generate portrait image via Replicate and return the raw image bytes.
 
-    Returns base64 instead of uploading to R2.
+    Returns bytes instead of uploading to R2. With `degraded`, fewer steps and a
+    lower resolution are used (see degrade_dimensions).
+
+    Raises:
+        TransientImageGenerationError: Replicate unreachable, rate limited or 5xx
+        PermanentImageGenerationError: Missing configuration or rejected prediction
     """
 
     if not REPLICATE_AVAILABLE:
-        logger.error("replicate package not installed. Run: pip install replicate")
-        return {"image_portrait_base64": None}
+        raise PermanentImageGenerationError(
+            "replicate package not installed. Run: pip install replicate"
+        )
 
     if not settings.REPLICATE_API_TOKEN:
-        logger.warning("REPLICATE_API_TOKEN not set, skipping image generation")
-        return {"image_portrait_base64": None}
+        raise PermanentImageGenerationError("REPLICATE_API_TOKEN not set")
 
     try:
         os.environ["REPLICATE_API_TOKEN"] = settings.REPLICATE_API_TOKEN
 
-        logger.info("Generating portrait image (1024x1024) via Replicate...")
+        width, height, steps = 1024, 1024, 40
+        if degraded:
+            width, height, steps = degrade_dimensions(width, height, steps)
+
+        logger.info(f"Generating portrait image ({width}x{height}) via Replicate...")
         portrait_output = await asyncio.to_thread(
             replicate.run,
             "stability-ai/sdxl:39ed52f2a78e934b3ba6e2a89f5b1c712de7dfea535525255b1aa35c5565e08b",  # change later
             input={
                 "prompt": prompt,
                 "negative_prompt": negative_prompt,
-                "width": 1024,
-                "height": 1024,
-                "num_inference_steps": 40,
+                "width": width,
+                "height": height,
+                "num_inference_steps": steps,
                 "guidance_scale": 7.5,
                 "scheduler": "DPMSolverMultistep",
                 "refine": "expert_ensemble_refiner",
@@ -70,79 +90,208 @@ async def generate_via_replicate(
 
         portrait_url = extract_url(portrait_output)
 
-        # Download image and convert to base64
-        async with aiohttp.ClientSession() as session:
-            async with session.get(portrait_url) as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to download image: HTTP {response.status}")
+        # Download image
+        async with http_request("GET", portrait_url) as response:
+            if response.status != 200:
+                raise classify_http_status(
+                    response.status, f"Failed to download image: HTTP {response.status}"
+                )
 
-                image_bytes = await response.read()
-                image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+            image_bytes = await response.read()
 
         logger.info("Successfully generated portrait via Replicate")
-        return {"image_portrait_base64": image_base64}
+        return {"image_portrait_bytes": image_bytes}
 
+    except ImageGenerationError:
+        raise
+    except ModelError as e:
+        raise PermanentImageGenerationError(f"Replicate prediction failed: {e}")
+    except ReplicateError as e:
+        raise classify_http_status(e.status or 500, f"Replicate API error: {e}")
     except Exception as e:
         logger.error(f"Replicate API error: {e}", exc_info=True)
-        return {"image_portrait_base64": None}
+        raise TransientImageGenerationError(f"Replicate API error: {e}")
 
 
-async def generate_via_automatic1111(
-    prompt: str,
-    negative_prompt: str,
-    character_id: str,
-) -> dict[str, str | None]:
+# Optimized settings for character portrait models
+AUTOMATIC1111_PORTRAIT_PARAMS = {
+    "width": 1024,
+    "height": 1024,
+    "steps": 20,
+    "cfg_scale": 7.0,
+    "sampler_name": "DPM++ 2M Karras",
+    "seed": -1,
+    "enable_hr": False,
+}
+
+AUTOMATIC1111_TIMEOUT_PER_IMAGE_SECONDS = 120  # 2 min
+
+
+def _automatic1111_portrait_params(degraded: bool) -> dict:
+    """Portrait txt2img params, reduced while the image backlog is degraded."""
+    if not degraded:
+        return AUTOMATIC1111_PORTRAIT_PARAMS
+
+    width, height, steps = degrade_dimensions(
+        AUTOMATIC1111_PORTRAIT_PARAMS["width"],
+        AUTOMATIC1111_PORTRAIT_PARAMS["height"],
+        AUTOMATIC1111_PORTRAIT_PARAMS["steps"],
+    )
+    return {
+        **AUTOMATIC1111_PORTRAIT_PARAMS,
+        "width": width,
+        "height": height,
+        "steps": steps,
+    }
+
+
+async def _automatic1111_txt2img(payload: dict, image_count: int) -> list[bytes]:
     """
-    Generate portrait image via Automatic1111 and return as base64.
+    Run one txt2img call and return `image_count` raw images in prompt order.
 
-    Returns base64 instead of uploading to R2.
+    Raises:
+        TransientImageGenerationError: Automatic1111 unreachable, timed out or 5xx
+        PermanentImageGenerationError: Missing configuration or rejected request
     """
     if not settings.AUTOMATIC1111_URL:
-        logger.error("AUTOMATIC1111_URL not set in settings")
-        return {"image_portrait_base64": None}
+        raise PermanentImageGenerationError("AUTOMATIC1111_URL not set in settings")
 
     try:
         api_url = settings.AUTOMATIC1111_URL.rstrip("/")
 
-        # Generate portrait image (1024x1024)
-        # Optimized settings for character portrait models
-        logger.info("Generating portrait image via Automatic1111 (1024x1024)...")
-        portrait_payload = {
-            "prompt": prompt,
-            "negative_prompt": negative_prompt,
-            "width": 1024,
-            "height": 1024,
-            "steps": 20,
-            "cfg_scale": 7.0,
-            "sampler_name": "DPM++ 2M Karras",
-            "seed": -1,
-            "enable_hr": False,
-        }
+        async with http_request(
+            "POST",
+            f"{api_url}/sdapi/v1/txt2img",
+            json=payload,
+            timeout=aiohttp.ClientTimeout(
+                total=AUTOMATIC1111_TIMEOUT_PER_IMAGE_SECONDS * image_count
+            ),
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise classify_http_status(
+                    response.status,
+                    f"Automatic1111 API error: {response.status} - {error_text}",
+                )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{api_url}/sdapi/v1/txt2img",
-                json=portrait_payload,
-                timeout=aiohttp.ClientTimeout(total=120),  # 2 min
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"Automatic1111 API error: {response.status} - {error_text}"
-                    )
+            result = await response.json()
 
-                result = await response.json()
-                portrait_base64 = result["images"][0]
+        images = result.get("images") or []
+        if len(images) < image_count:
+            raise TransientImageGenerationError(
+                f"Automatic1111 returned {len(images)} images, expected {image_count}"
+            )
 
-        logger.info("Successfully generated portrait locally")
-        return {"image_portrait_base64": portrait_base64}
+        # A grid image is prepended when more than one image is generated
+        # Automatic1111 only returns base64; decode once here
+        return [base64.b64decode(image) for image in images[-image_count:]]
 
+    except ImageGenerationError:
+        raise
     except aiohttp.ClientConnectorError:
-        logger.error(
+        raise TransientImageGenerationError(
             f"Could not connect to Automatic1111 at {settings.AUTOMATIC1111_URL}. "
             "Is it running with --api flag?"
         )
-        return {"image_portrait_base64": None}
     except Exception as e:
         logger.error(f"Local image generation error: {e}", exc_info=True)
-        return {"image_portrait_base64": None}
+        raise TransientImageGenerationError(f"Local image generation error: {e}")
+
+
+async def generate_via_automatic1111(
+    prompt: str,
+    negative_prompt: str,
+    character_id: str,
+    degraded: bool = False,
+) -> dict[str, bytes]:
+    """
+    Generate portrait image via Automatic1111 and return the raw image bytes.
+
+    Returns bytes instead of uploading to R2. With `degraded`, fewer steps and a
+    lower resolution are used (see degrade_dimensions).
+
+    Raises:
+        TransientImageGenerationError: Automatic1111 unreachable, timed out or 5xx
+        PermanentImageGenerationError: Missing configuration or rejected request
+    """
+    params = _automatic1111_portrait_params(degraded)
+    logger.info(
+        f"Generating portrait image via Automatic1111 "
+        f"({params['width']}x{params['height']})..."
+    )
+    portrait_payload = {
+        "prompt": prompt,
+        "negative_prompt": negative_prompt,
+        **params,
+    }
+
+    images = await _automatic1111_txt2img(portrait_payload, image_count=1)
+
+    logger.info("Successfully generated portrait locally")
+    return {"image_portrait_bytes": images[0]}
+
+
+def _prompt_file_line(prompt: str, negative_prompt: str) -> str:
+    """One line for the 'Prompts from file or textbox' script."""
+    return (
+        f"--prompt {shlex.quote(' '.join(prompt.split()))} "
+        f"--negative_prompt {shlex.quote(' '.join(negative_prompt.split()))}"
+    )
+
+
+async def generate_batch_via_automatic1111(
+    prompts: list[tuple[str, str]],
+    degraded: bool = False,
+) -> list[bytes]:
+    """
+    Generate several portraits via Automatic1111 in a single txt2img call.
+
+    Identical prompts are generated as one batch (`batch_size`). txt2img takes a
+    single prompt, so distinct prompts go through the built-in "Prompts from file
+    or textbox" script, which runs each line in the same request and saves the
+    per-call overhead.
+
+    Args:
+        prompts: (prompt, negative_prompt) per portrait
+        degraded: Use fewer steps and a lower resolution
+
+    Returns:
+        Raw image bytes per portrait, in the order of `prompts`
+    """
+    if len(prompts) == 1:
+        prompt, negative_prompt = prompts[0]
+        portrait = await generate_via_automatic1111(
+            prompt, negative_prompt, "", degraded=degraded
+        )
+        return [portrait["image_portrait_bytes"]]
+
+    logger.info(
+        f"Generating {len(prompts)} portrait images via Automatic1111 in one call..."
+    )
+    params = _automatic1111_portrait_params(degraded)
+
+    if len(set(prompts)) == 1:
+        prompt, negative_prompt = prompts[0]
+        batch_payload = {
+            "prompt": prompt,
+            "negative_prompt": negative_prompt,
+            **params,
+            "batch_size": len(prompts),
+        }
+    else:
+        batch_payload = {
+            **params,
+            "script_name": "prompts from file or textbox",
+            # checkbox_iterate, checkbox_iterate_batch, prompt_position, prompt_txt
+            "script_args": [
+                False,
+                False,
+                "start",
+                "\n".join(_prompt_file_line(p, n) for p, n in prompts),
+            ],
+        }
+
+    images = await _automatic1111_txt2img(batch_payload, image_count=len(prompts))
+
+    logger.info(f"Successfully generated {len(images)} portraits locally")
+    return images
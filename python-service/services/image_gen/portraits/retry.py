@@ -0,0 +1,115 @@
+"""
+Retry and dead-letter policy for portrait jobs.
+
+Failed jobs are republished to a per-delay retry queue whose messages expire
+after the backoff delay and are dead-lettered back onto the work queue. Jobs
+that fail permanently, or run out of attempts, go to the dead-letter queue.
+"""
+
+import json
+
+import aio_pika
+from aio_pika.abc import AbstractChannel
+
+from config.settings import get_settings
+from exceptions.image_generation import PermanentImageGenerationError
+
+settings = get_settings()
+
+ATTEMPT_HEADER = "x-attempt"
+
+
+def get_attempt(headers: dict | None) -> int:
+    """Attempt number of a delivered job (first delivery is attempt 1)."""
+    if not headers:
+        return 1
+    try:
+        return int(headers.get(ATTEMPT_HEADER, 1))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 1
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """Whether retrying the job can't help (bad payload, rejected request, config)."""
+    return isinstance(
+        error, (PermanentImageGenerationError, json.JSONDecodeError, KeyError)
+    )
+
+
+def retry_delay_seconds(attempt: int) -> int:
+    """Exponential backoff delay before retrying after the given failed attempt."""
+    delay = settings.PORTRAIT_JOB_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)
+    return min(delay, settings.PORTRAIT_JOB_RETRY_MAX_DELAY_SECONDS)
+
+
+def retry_queue_name(queue_name: str, delay_seconds: int) -> str:
+    return f"{queue_name}.retry.{delay_seconds}s"
+
+
+def dead_letter_queue_name(queue_name: str) -> str:
+    return f"{queue_name}.dead"
+
+
+async def declare_retry_topology(channel: AbstractChannel, queue_name: str):
+    """Declare the dead-letter queue and one delay queue per backoff step."""
+    await channel.declare_queue(dead_letter_queue_name(queue_name), durable=True)
+
+    delays = {
+        retry_delay_seconds(attempt)
+        for attempt in range(1, settings.PORTRAIT_JOB_MAX_ATTEMPTS)
+    }
+    for delay in sorted(delays):
+        await channel.declare_queue(
+            retry_queue_name(queue_name, delay),
+            durable=True,
+            arguments={
+                "x-message-ttl": delay * 1000,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": queue_name,
+            },
+        )
+
+
+async def publish_retry(
+    channel: AbstractChannel,
+    queue_name: str,
+    body: bytes,
+    attempt: int,
+    error: Exception,
+) -> int:
+    """Schedule the job for another attempt after a backoff delay. Returns the delay."""
+    delay = retry_delay_seconds(attempt)
+    await channel.default_exchange.publish(
+        aio_pika.Message(
+            body=body,
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            headers={ATTEMPT_HEADER: attempt + 1, "x-last-error": str(error)[:500]},
+        ),
+        routing_key=retry_queue_name(queue_name, delay),
+    )
+    return delay
+
+
+async def publish_dead_letter(
+    channel: AbstractChannel,
+    queue_name: str,
+    body: bytes,
+    attempt: int,
+    reason: str,
+    error: Exception,
+):
+    """Park the job in the dead-letter queue for inspection or manual replay."""
+    await channel.default_exchange.publish(
+        aio_pika.Message(
+            body=body,
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            headers={
+                ATTEMPT_HEADER: attempt,
+                "x-failure-reason": reason,
+                "x-last-error": str(error)[:500],
+            },
+        ),
+        routing_key=dead_letter_queue_name(queue_name),
+    )
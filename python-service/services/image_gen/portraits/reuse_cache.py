@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import io
+
+from PIL import Image
+from redis.exceptions import WatchError
+
+from utils.logger import logger
+from config.settings import get_settings
+from services.redis import get_redis_client
+from generate.chains.character.appearance_tracker import extract_appearance_features
+from .prompt_builder import extract_gender, get_skill_visuals
+
+settings = get_settings()
+
+REUSE_KEY_PREFIX = "portrait_reuse:"
+
+REUSE_POLICIES = ("never", "queue_depth", "always")
+
+
+def portrait_signature(appearance: str, theme: str, skills: list[str] | None) -> str:
+    """
+    Normalized signature of what a portrait prompt will look like.
+
+    Two characters with the same gender, theme, dominant appearance features
+    (goggles, scar, beard, ...) and skill visuals (sword at hip, mage robes,
+    ...) get the same signature, even though their prompts differ in wording
+    and random composition.
+    """
+    parts = [
+        extract_gender(appearance),
+        theme.lower(),
+        ",".join(sorted(extract_appearance_features(appearance))),
+        ",".join(sorted(set(get_skill_visuals(skills or [])))),
+    ]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def should_reuse(backlog: int) -> bool:
+    """Whether to serve a cached portrait given the current job backlog."""
+    policy = settings.PORTRAIT_REUSE_POLICY
+    if policy == "always":
+        return True
+    if policy == "queue_depth":
+        return backlog > settings.PORTRAIT_REUSE_QUEUE_DEPTH
+    return False
+
+
+def perceptual_hash(image_data: bytes) -> int:
+    """
+    64-bit difference hash (dHash) of an image.
+
+    Near-identical images (re-encodes, small detail changes) differ in only a
+    few bits, so the Hamming distance between hashes measures similarity.
+    """
+    with Image.open(io.BytesIO(image_data)) as image:
+        pixels = list(
+            image.convert("L").resize((9, 8), Image.Resampling.LANCZOS).getdata()
+        )
+
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            bits = (bits << 1) | (left > right)
+    return bits
+
+
+def _reuse_key(signature: str) -> str:
+    return f"{REUSE_KEY_PREFIX}{signature}"
+
+
+async def get_reusable_portrait(signature: str) -> bytes | None:
+    """Pick a random cached portrait for the signature, if there is one."""
+    try:
+        client = get_redis_client()
+        result = await client.hrandfield(_reuse_key(signature), 1, withvalues=True)
+        return result[1] if result else None
+    except Exception as e:
+        logger.error(f"Failed to read portrait reuse cache: {e}")
+        return None
+
+
+async def remember_portrait(signature: str, image_data: bytes):
+    """
+    Add a generated portrait to the reuse cache for its signature.
+
+    Keeps up to PORTRAIT_REUSE_MAX_PER_SIGNATURE portraits per signature so
+    reuse still varies. With PORTRAIT_REUSE_PHASH_ENABLED, entries are keyed
+    by perceptual hash and portraits within PORTRAIT_REUSE_PHASH_MAX_DISTANCE
+    bits of a cached one are skipped as duplicates. Best effort: errors are
+    logged, never raised.
+    """
+    try:
+        client = get_redis_client()
+        key = _reuse_key(signature)
+        async with client.pipeline(transaction=True) as pipe:
+            # Workers race to cache portraits for the same signature: the write
+            # only goes through if the hash is unchanged since it was checked
+            await pipe.watch(key)
+            fields = await pipe.hkeys(key)  # type: ignore[misc]
+            if len(fields) >= settings.PORTRAIT_REUSE_MAX_PER_SIGNATURE:
+                return
+
+            if settings.PORTRAIT_REUSE_PHASH_ENABLED:
+                image_hash = await asyncio.to_thread(perceptual_hash, image_data)
+                for cached_field in fields:
+                    distance = (image_hash ^ int(cached_field, 16)).bit_count()
+                    if distance <= settings.PORTRAIT_REUSE_PHASH_MAX_DISTANCE:
+                        logger.info(
+                            f"Portrait is a near-duplicate of a cached one "
+                            f"(distance {distance}), not caching"
+                        )
+                        return
+                field = f"{image_hash:016x}"
+            else:
+                field = hashlib.sha1(image_data).hexdigest()[:16]
+
+            pipe.multi()
+            pipe.hset(key, field, image_data)  # type: ignore[arg-type]
+            pipe.expire(key, settings.PORTRAIT_REUSE_TTL_SECONDS)
+            await pipe.execute()
+    except WatchError:
+        logger.info("Reuse cache changed while adding a portrait, not caching")
+    except Exception as e:
+        logger.error(f"Failed to add portrait to reuse cache: {e}")
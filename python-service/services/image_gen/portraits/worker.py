@@ -1,77 +1,488 @@
 import json
+import time
+import base64
+import signal
 import asyncio
+
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
 from utils.logger import logger
-from services.rabbitmq import get_rabbitmq_connection
-from .operations import store_portrait
-from .generator import generate_character_images
-
-
-def process_portrait_job(ch, method, properties, body):
-    """Process a single portrait generation job."""
-    try:
-        job_data = json.loads(body)
-        uuid = job_data["uuid"]
-        name = job_data["name"]
-        appearance = job_data["appearance"]
-        theme = job_data["theme"]
-        traits = job_data["traits"]
-        skills = job_data.get("skills", [])
-
-        logger.info(f"Processing portrait job for {name} (UUID: {uuid})")
-
-        async def generate():
-            return await generate_character_images(
-                name=name,
-                appearance=appearance,
-                theme=theme,
-                world_id=0,
-                character_id=uuid,
-                traits=traits,
-                skills=skills,
+from config.settings import get_settings
+from exceptions.image_generation import PermanentImageGenerationError
+from services.rabbitmq import connect_rabbitmq_robust
+from services.redis import close_redis_client
+from services.http_session import close_http_session
+from services.image_gen.scheduler import create_image_scheduler
+from services.image_gen.worlds.generator import generate_world_image
+from services.image_gen.worlds.operations import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    WORLD_IMAGE_QUEUE,
+    update_world_image_job,
+)
+from .processor import upload_image_with_variants_to_r2
+from .operations import PORTRAIT_JOB_REQUIRED_KEYS, PORTRAIT_QUEUE, store_portrait
+from .generator import generate_character_images_batch
+from .batcher import PortraitBatcher
+from .reuse_cache import (
+    REUSE_POLICIES,
+    get_reusable_portrait,
+    portrait_signature,
+    remember_portrait,
+    should_reuse,
+)
+from .retry import (
+    dead_letter_queue_name,
+    declare_retry_topology,
+    get_attempt,
+    is_permanent_failure,
+    publish_dead_letter,
+    publish_retry,
+)
+
+settings = get_settings()
+
+# Prometheus metrics for the portrait worker
+portrait_jobs_counter = Counter(
+    "loresmith_portrait_jobs_total",
+    "Portrait jobs handled by the worker",
+    ["status"],  # stored, reused, skipped, failed
+)
+
+portrait_reuse_lookups_counter = Counter(
+    "loresmith_portrait_reuse_lookups_total",
+    "Portrait reuse cache lookups made under the reuse policy",
+    ["result"],  # hit, miss
+)
+
+portrait_queue_depth_gauge = Gauge(
+    "loresmith_portrait_queue_depth",
+    "Portrait jobs waiting in the work queue",
+)
+
+portrait_job_retries_counter = Counter(
+    "loresmith_portrait_job_retries_total",
+    "Failed portrait jobs scheduled for another attempt",
+)
+
+portrait_jobs_dead_lettered_counter = Counter(
+    "loresmith_portrait_jobs_dead_lettered_total",
+    "Portrait jobs moved to the dead-letter queue",
+    ["reason"],  # permanent, exhausted
+)
+
+portrait_dead_letter_depth_gauge = Gauge(
+    "loresmith_portrait_dead_letter_queue_depth",
+    "Messages waiting in the portrait dead-letter queue",
+)
+
+portrait_job_duration_histogram = Histogram(
+    "loresmith_portrait_job_duration_seconds",
+    "Time from starting a portrait job to ack/nack",
+    buckets=(1, 2.5, 5, 10, 20, 30, 45, 60, 90, 120, 180),
+)
+
+portrait_jobs_in_flight_gauge = Gauge(
+    "loresmith_portrait_jobs_in_flight",
+    "Portrait jobs currently being generated",
+)
+
+world_image_jobs_counter = Counter(
+    "loresmith_world_image_jobs_total",
+    "World image jobs handled by the worker",
+    ["status"],  # completed, retried, failed
+)
+
+world_image_job_duration_histogram = Histogram(
+    "loresmith_world_image_job_duration_seconds",
+    "Time from starting a world image job to ack/nack",
+    buckets=(5, 10, 20, 30, 45, 60, 90, 120, 180, 300),
+)
+
+STATS_INTERVAL_SECONDS = 60
+QUEUE_DEPTH_INTERVAL_SECONDS = 5
+
+
+class PortraitWorker:
+    """
+    Asyncio RabbitMQ consumer for portrait generation jobs.
+
+    One event loop, AMQP connection, Redis pool and HTTP session live for the
+    whole process. The broker hands over up to `prefetch` unacked jobs; jobs
+    for the same theme arriving within `batch_window_seconds` are generated in
+    one backend call (up to `batch_max_size`), and an ImageJobScheduler runs at
+    most `concurrency` backend calls at once, round-robin across users and
+    degraded when the backlog (including the broker queue) grows too large.
+
+    Failed jobs are retried with exponential backoff via delay queues; jobs
+    that fail permanently or exhaust their attempts are dead-lettered, so a
+    poison message never spins on the work queue.
+
+    World image jobs (WORLD_IMAGE_QUEUE) are consumed by the same worker and
+    share its scheduler, so they queue behind portraits for the backend. Their
+    status and result are kept in Redis (see worlds.operations).
+
+    Unless PORTRAIT_REUSE_POLICY is 'never', generated portraits are added to
+    a reuse cache keyed by prompt signature, and when the policy allows it
+    (always, or while the backlog exceeds PORTRAIT_REUSE_QUEUE_DEPTH) a cached
+    portrait is served instead of queueing another diffusion run.
+    """
+
+    def __init__(
+        self,
+        prefetch: int,
+        concurrency: int,
+        batch_window_seconds: float = 0,
+        batch_max_size: int = 1,
+    ):
+        self._prefetch = max(prefetch, concurrency, batch_max_size)
+        self._concurrency = concurrency
+        self._batch_max_size = batch_max_size
+        self._scheduler = create_image_scheduler(concurrency)
+        self._batcher = PortraitBatcher(
+            generate_character_images_batch,
+            scheduler=self._scheduler,
+            window_seconds=batch_window_seconds,
+            max_size=batch_max_size,
+        )
+        self._in_flight: set[asyncio.Task] = set()
+        self._draining = False
+        self._completed = 0
+        self._queue_depth = 0
+        self._world_queue_depth = 0
+        self._publish_channel: AbstractChannel | None = None
+
+    async def process_portrait_job(self, message: AbstractIncomingMessage):
+        """Process a single portrait generation job and ack/nack it."""
+        self._in_flight.add(asyncio.current_task())  # type: ignore[arg-type]
+        try:
+            if self._draining:
+                # Delivered while shutting down, hand it back
+                await message.nack(requeue=True)
+                return
+            await self._handle(message)
+        finally:
+            self._in_flight.discard(asyncio.current_task())  # type: ignore[arg-type]
+
+    async def process_world_image_job(self, message: AbstractIncomingMessage):
+        """Process a single world image generation job and ack/nack it."""
+        self._in_flight.add(asyncio.current_task())  # type: ignore[arg-type]
+        try:
+            if self._draining:
+                await message.nack(requeue=True)
+                return
+            await self._handle_world_image(message)
+        finally:
+            self._in_flight.discard(asyncio.current_task())  # type: ignore[arg-type]
+
+    async def _handle(self, message: AbstractIncomingMessage):
+        start_time = time.perf_counter()
+        portrait_jobs_in_flight_gauge.inc()
+        try:
+            job_data = json.loads(message.body)
+            # Reject a malformed job here, before it can join (and fail) a batch
+            missing = [key for key in PORTRAIT_JOB_REQUIRED_KEYS if key not in job_data]
+            if missing:
+                raise PermanentImageGenerationError(
+                    f"Portrait job is missing {', '.join(missing)}"
+                )
+            uuid = job_data["uuid"]
+            name = job_data["name"]
+
+            logger.info(f"Processing portrait job for {name} (UUID: {uuid})")
+
+            signature = None
+            if settings.PORTRAIT_REUSE_POLICY != "never":
+                signature = portrait_signature(
+                    job_data["appearance"], job_data["theme"], job_data.get("skills")
+                )
+                if await self._reuse_portrait(uuid, signature):
+                    portrait_jobs_counter.labels(status="reused").inc()
+                    logger.info(f"✓ Reused cached portrait for {name}")
+                    await message.ack()
+                    self._completed += 1
+                    return
+
+            portrait_data = await self._batcher.submit(job_data["theme"], job_data)
+
+            image_data = portrait_data.get("image_portrait_bytes")
+            if image_data:
+                await store_portrait(uuid, image_data)
+                portrait_jobs_counter.labels(status="stored").inc()
+                logger.info(f"✓ Portrait for {name} stored in Redis")
+                if signature:
+                    await remember_portrait(signature, image_data)
+            else:
+                # Only happens when image generation is disabled
+                portrait_jobs_counter.labels(status="skipped").inc()
+                logger.info(f"Image generation disabled, skipped portrait for {name}")
+
+            await message.ack()
+            self._completed += 1
+
+        except Exception as e:
+            portrait_jobs_counter.labels(status="failed").inc()
+            outcome = await self._handle_failure(message, e, PORTRAIT_QUEUE)
+            if outcome == "retried":
+                portrait_job_retries_counter.inc()
+            elif outcome:
+                portrait_jobs_dead_lettered_counter.labels(reason=outcome).inc()
+
+        finally:
+            portrait_jobs_in_flight_gauge.dec()
+            portrait_job_duration_histogram.observe(time.perf_counter() - start_time)
+
+    async def _handle_world_image(self, message: AbstractIncomingMessage):
+        start_time = time.perf_counter()
+        job_id = None
+        try:
+            job_data = json.loads(message.body)
+            job_id = job_data["job_id"]
+
+            logger.info(
+                f"Processing world image job {job_id} for '{job_data['world_title']}'"
+            )
+            await update_world_image_job(job_id, status=JOB_RUNNING)
+
+            image_base64 = await generate_world_image(
+                world_title=job_data["world_title"],
+                full_story=job_data["full_story"],
+                theme=job_data["theme"] or "fantasy",
+                setting_description=job_data.get("setting_description", ""),
+                use_replicate=job_data.get("use_replicate", False),
+                user_id=job_data.get("user_id", ""),
+                scheduler=self._scheduler,
             )
+            image_data = base64.b64decode(image_base64)
+
+            if job_data.get("world_id"):
+                image_url, variant_urls = await upload_image_with_variants_to_r2(
+                    image_data, job_data["world_id"], "world", "world_scene"
+                )
+                await update_world_image_job(
+                    job_id,
+                    status=JOB_COMPLETED,
+                    image_url=image_url,
+                    variant_urls=json.dumps(variant_urls),
+                )
+            else:
+                await update_world_image_job(
+                    job_id, status=JOB_COMPLETED, image=image_data
+                )
+
+            world_image_jobs_counter.labels(status="completed").inc()
+            logger.info(f"✓ World image job {job_id} completed")
+            await message.ack()
+
+        except Exception as e:
+            outcome = await self._handle_failure(message, e, WORLD_IMAGE_QUEUE)
+            if job_id and outcome:
+                retried = outcome == "retried"
+                world_image_jobs_counter.labels(
+                    status="retried" if retried else "failed"
+                ).inc()
+                try:
+                    await update_world_image_job(
+                        job_id,
+                        status=JOB_QUEUED if retried else JOB_FAILED,
+                        error=str(e),
+                    )
+                except Exception:
+                    pass  # Already logged; the job state just lags behind
+
+        finally:
+            world_image_job_duration_histogram.observe(time.perf_counter() - start_time)
 
-        portrait_data = asyncio.run(generate())
+    async def _reuse_portrait(self, uuid: str, signature: str) -> bool:
+        """Store a cached portrait for the job if the reuse policy allows it."""
+        backlog = self._queue_depth + len(self._in_flight)
+        if not should_reuse(backlog):
+            return False
 
-        if (
-            portrait_data.get("image_portrait_base64")
-            and portrait_data["image_portrait_base64"] is not None
-        ):
-            store_portrait(uuid, portrait_data["image_portrait_base64"])
-            logger.info(f"✓ Portrait for {name} stored in Redis")
+        image_data = await get_reusable_portrait(signature)
+        portrait_reuse_lookups_counter.labels(
+            result="hit" if image_data else "miss"
+        ).inc()
+        if not image_data:
+            return False
+
+        await store_portrait(uuid, image_data)
+        return True
+
+    async def _handle_failure(
+        self, message: AbstractIncomingMessage, error: Exception, queue_name: str
+    ) -> str | None:
+        """
+        Retry the job with backoff or dead-letter it, then ack the original.
+
+        Returns "retried", the dead-letter reason ("permanent" or "exhausted"),
+        or None if the job couldn't be handed off and was requeued.
+        """
+        attempt = get_attempt(message.headers)
+        if is_permanent_failure(error):
+            reason = "permanent"
+        elif attempt >= settings.PORTRAIT_JOB_MAX_ATTEMPTS:
+            reason = "exhausted"
         else:
-            logger.warning(f"No portrait generated for {name}")
+            reason = None
 
-        ch.basic_ack(delivery_tag=method.delivery_tag)
+        try:
+            if self._publish_channel is None:
+                raise RuntimeError("Worker has no publish channel")
+            if reason:
+                await publish_dead_letter(
+                    self._publish_channel,
+                    queue_name,
+                    message.body,
+                    attempt,
+                    reason,
+                    error,
+                )
+                logger.error(
+                    f"Job from {queue_name} dead-lettered ({reason}, "
+                    f"attempt {attempt}): {error}",
+                    exc_info=error,
+                )
+            else:
+                delay = await publish_retry(
+                    self._publish_channel, queue_name, message.body, attempt, error
+                )
+                logger.warning(
+                    f"Job from {queue_name} failed (attempt {attempt}/"
+                    f"{settings.PORTRAIT_JOB_MAX_ATTEMPTS}), retrying in {delay}s: {error}"
+                )
+            await message.ack()
+            return reason or "retried"
 
-    except Exception as e:
-        logger.error(f"Error processing portrait job: {e}", exc_info=True)
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+        except Exception as e:
+            # Couldn't hand the job off (broker trouble), let RabbitMQ redeliver it
+            logger.error(f"Failed to reschedule job: {e}", exc_info=True)
+            await message.nack(requeue=True)
+            return None
 
+    async def _report_stats(self, channel: AbstractChannel):
+        """Periodically log throughput in portraits/minute and sample DLQ depth."""
+        while True:
+            completed_before = self._completed
+            await asyncio.sleep(STATS_INTERVAL_SECONDS)
+            per_minute = (
+                (self._completed - completed_before) * 60 / STATS_INTERVAL_SECONDS
+            )
+            logger.info(
+                f"Portrait throughput: {per_minute:.1f}/min "
+                f"(in flight: {len(self._in_flight)}, total: {self._completed})"
+            )
 
-def start_worker():
-    """Start the portrait generation worker."""
-    logger.info("Starting portrait generation worker...")
+            try:
+                dead_letter_queue = await channel.declare_queue(
+                    dead_letter_queue_name(PORTRAIT_QUEUE), passive=True
+                )
+                depth = dead_letter_queue.declaration_result.message_count or 0
+                portrait_dead_letter_depth_gauge.set(depth)
+            except Exception as e:
+                logger.warning(f"Failed to sample dead-letter queue depth: {e}")
 
-    connection = get_rabbitmq_connection()
-    channel = connection.channel()
+    async def _sample_queue_depth(self, channel: AbstractChannel):
+        """Keep the work queue depths fresh for the reuse and degrade policies."""
+        while True:
+            try:
+                queue = await channel.declare_queue(PORTRAIT_QUEUE, passive=True)
+                self._queue_depth = queue.declaration_result.message_count or 0
+                world_queue = await channel.declare_queue(
+                    WORLD_IMAGE_QUEUE, passive=True
+                )
+                self._world_queue_depth = (
+                    world_queue.declaration_result.message_count or 0
+                )
+                self._scheduler.external_backlog = (
+                    self._queue_depth + self._world_queue_depth
+                )
+                portrait_queue_depth_gauge.set(self._queue_depth)
+            except Exception as e:
+                logger.warning(f"Failed to sample portrait queue depth: {e}")
+            await asyncio.sleep(QUEUE_DEPTH_INTERVAL_SECONDS)
 
-    channel.queue_declare(queue="portrait_generation", durable=True)
-    channel.basic_qos(prefetch_count=1)
+    async def run(self, stop_event: asyncio.Event):
+        """Consume jobs until stop_event is set, then drain in-flight jobs."""
+        connection = await connect_rabbitmq_robust()
+        stats_task = None
+        depth_task = None
 
-    channel.basic_consume(
-        queue="portrait_generation", on_message_callback=process_portrait_job
+        try:
+            channel = await connection.channel()
+            await channel.set_qos(prefetch_count=self._prefetch)
+            queue = await channel.declare_queue(PORTRAIT_QUEUE, durable=True)
+            await declare_retry_topology(channel, PORTRAIT_QUEUE)
+            world_queue = await channel.declare_queue(WORLD_IMAGE_QUEUE, durable=True)
+            await declare_retry_topology(channel, WORLD_IMAGE_QUEUE)
+
+            # Retries/dead letters go through a confirm channel, so the original
+            # is only acked once the broker has taken the copy
+            self._publish_channel = await connection.channel(publisher_confirms=True)
+            stats_task = asyncio.create_task(self._report_stats(channel))
+            depth_task = asyncio.create_task(self._sample_queue_depth(channel))
+
+            consumer_tag = await queue.consume(self.process_portrait_job)
+            world_consumer_tag = await world_queue.consume(self.process_world_image_job)
+
+            logger.info(
+                f"✓ Worker ready (prefetch: {self._prefetch}, "
+                f"concurrency: {self._concurrency}, batch: {self._batch_max_size}). "
+                "Waiting for portrait and world image jobs..."
+            )
+
+            await stop_event.wait()
+
+            logger.info(f"Draining {len(self._in_flight)} in-flight image jobs...")
+            self._draining = True
+            await queue.cancel(consumer_tag)
+            await world_queue.cancel(world_consumer_tag)
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        finally:
+            if stats_task:
+                stats_task.cancel()
+            if depth_task:
+                depth_task.cancel()
+            await connection.close()
+            await close_http_session()
+            await close_redis_client()
+
+
+async def run_worker():
+    """Run the portrait worker until SIGINT/SIGTERM."""
+    if settings.PORTRAIT_WORKER_METRICS_PORT:
+        start_http_server(settings.PORTRAIT_WORKER_METRICS_PORT)
+
+    if settings.PORTRAIT_REUSE_POLICY not in REUSE_POLICIES:
+        logger.warning(
+            f"Unknown PORTRAIT_REUSE_POLICY '{settings.PORTRAIT_REUSE_POLICY}', "
+            "portraits will not be reused"
+        )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    worker = PortraitWorker(
+        prefetch=settings.PORTRAIT_WORKER_PREFETCH,
+        concurrency=settings.PORTRAIT_WORKER_CONCURRENCY,
+        batch_window_seconds=settings.PORTRAIT_BATCH_WINDOW_MS / 1000,
+        batch_max_size=settings.PORTRAIT_BATCH_MAX_SIZE,
     )
+    await worker.run(stop_event)
 
-    logger.info("✓ Worker ready. Waiting for portrait jobs...")
 
-    try:
-        channel.start_consuming()
-    except KeyboardInterrupt:
-        logger.info("Worker interrupted")
-        channel.stop_consuming()
-    finally:
-        connection.close()
-        logger.info("Worker shutdown complete")
+def start_worker():
+    """Start the portrait generation worker."""
+    logger.info("Starting portrait generation worker...")
+    asyncio.run(run_worker())
+    logger.info("Worker shutdown complete")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,255 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from utils.logger import logger
+from config.settings import get_settings
+from exceptions.image_generation import ImageJobRejectedError
+
+settings = get_settings()
+
+DEGRADE_MODES = ("off", "reduce", "skip")
+
+
+class ImagePriority(IntEnum):
+    """Priority classes for image backend calls (lower value runs first)."""
+
+    PORTRAIT = 0  # A user is looking at the character card
+    WORLD_SCENE = 1
+
+
+# Prometheus metrics for the image job scheduler
+image_queue_depth_gauge = Gauge(
+    "loresmith_image_queue_depth",
+    "Image jobs waiting for a backend slot",
+    ["priority"],
+)
+
+image_queue_wait_histogram = Histogram(
+    "loresmith_image_queue_wait_seconds",
+    "Time an image job waited for a backend slot",
+    ["priority"],
+    buckets=(0.01, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+image_jobs_scheduled_counter = Counter(
+    "loresmith_image_jobs_scheduled_total",
+    "Image jobs by scheduling outcome",
+    ["priority", "outcome"],  # full, degraded, rejected, shed
+)
+
+image_slots_in_use_gauge = Gauge(
+    "loresmith_image_backend_slots_in_use",
+    "Image backend calls currently running",
+)
+
+image_degraded_gauge = Gauge(
+    "loresmith_image_degraded",
+    "1 while the image backlog is above the degrade threshold",
+)
+
+
+def degrade_dimensions(width: int, height: int, steps: int) -> tuple[int, int, int]:
+    """
+    Reduced (width, height, steps) for degraded mode.
+
+    Sizes are scaled by IMAGE_DEGRADED_SCALE and rounded down to a multiple of
+    64, as diffusion models expect; steps are capped at IMAGE_DEGRADED_STEPS.
+    """
+    scale = settings.IMAGE_DEGRADED_SCALE
+    return (
+        max(64, int(width * scale) // 64 * 64),
+        max(64, int(height * scale) // 64 * 64),
+        min(steps, settings.IMAGE_DEGRADED_STEPS),
+    )
+
+
+class ImageJobScheduler:
+    """
+    Admission control and ordering for image backend calls.
+
+    At most `slots` calls run at once. Waiting jobs are served by priority
+    class, then round-robin across users within a class, so one user's burst
+    of portraits can't starve everyone else. Each class has a queue depth
+    limit beyond which new jobs are rejected (ImageJobRejectedError).
+
+    When the backlog (jobs waiting here plus `external_backlog`, e.g. the
+    broker queue depth) reaches `degrade_backlog`, degrade mode kicks in:
+    'reduce' runs jobs with fewer steps and a lower resolution, 'skip' also
+    sheds jobs below the top priority class.
+    """
+
+    def __init__(
+        self,
+        slots: int,
+        max_depth: dict[ImagePriority, int],
+        degrade_backlog: int,
+        degrade_mode: str = "reduce",
+    ):
+        self._slots = max(slots, 1)
+        self._max_depth = max_depth
+        self._degrade_backlog = degrade_backlog
+        self._degrade_mode = degrade_mode
+        self._running = 0
+        self._waiting: dict[ImagePriority, OrderedDict[str, deque[asyncio.Future]]] = {
+            priority: OrderedDict() for priority in ImagePriority
+        }
+        self._depth = {priority: 0 for priority in ImagePriority}
+        self.external_backlog = 0
+
+    @property
+    def waiting(self) -> int:
+        return sum(self._depth.values())
+
+    @property
+    def backlog(self) -> int:
+        return self.waiting + self.external_backlog
+
+    def _is_degraded(self) -> bool:
+        degraded = self._degrade_mode != "off" and self.backlog >= self._degrade_backlog
+        image_degraded_gauge.set(1 if degraded else 0)
+        return degraded
+
+    def _reject(self, priority: ImagePriority, outcome: str, reason: str):
+        image_jobs_scheduled_counter.labels(
+            priority=priority.name.lower(), outcome=outcome
+        ).inc()
+        logger.warning(f"Image job {outcome} ({priority.name.lower()}): {reason}")
+        raise ImageJobRejectedError(reason)
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: ImagePriority, user_id: str = ""
+    ) -> AsyncIterator[bool]:
+        """
+        Wait for a backend slot and hold it for the duration of the block.
+
+        Yields whether the job should run degraded.
+
+        Raises:
+            ImageJobRejectedError: Queue for this class is full, or the job was
+                shed in 'skip' degrade mode
+        """
+        label = priority.name.lower()
+        if self._depth[priority] >= self._max_depth[priority]:
+            self._reject(priority, "rejected", f"{label} queue is full")
+        if (
+            self._degrade_mode == "skip"
+            and priority != min(ImagePriority)
+            and self._is_degraded()
+        ):
+            self._reject(priority, "shed", f"backlog of {self.backlog} jobs")
+
+        start_time = time.perf_counter()
+        if self._running < self._slots and not self.waiting:
+            self._running += 1
+        else:
+            await self._wait(priority, user_id)
+        image_queue_wait_histogram.labels(priority=label).observe(
+            time.perf_counter() - start_time
+        )
+        image_slots_in_use_gauge.set(self._running)
+
+        degraded = self._is_degraded()
+        image_jobs_scheduled_counter.labels(
+            priority=label, outcome="degraded" if degraded else "full"
+        ).inc()
+        try:
+            yield degraded
+        finally:
+            self._release()
+
+    async def _wait(self, priority: ImagePriority, user_id: str):
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiting[priority].setdefault(user_id, deque()).append(future)
+        self._depth[priority] += 1
+        image_queue_depth_gauge.labels(priority=priority.name.lower()).set(
+            self._depth[priority]
+        )
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted a slot just as we were cancelled, pass it on
+                self._release()
+            else:
+                self._remove(priority, user_id, future)
+            raise
+
+    def _remove(self, priority: ImagePriority, user_id: str, future: asyncio.Future):
+        queue = self._waiting[priority].get(user_id)
+        if queue and future in queue:
+            queue.remove(future)
+            if not queue:
+                del self._waiting[priority][user_id]
+            self._depth[priority] -= 1
+            image_queue_depth_gauge.labels(priority=priority.name.lower()).set(
+                self._depth[priority]
+            )
+
+    def _release(self):
+        """Hand the slot to the next waiting job, or free it."""
+        for priority in ImagePriority:
+            users = self._waiting[priority]
+            if not users:
+                continue
+
+            # Round-robin: take the first user's oldest job, then move them last
+            user_id, queue = next(iter(users.items()))
+            future = queue.popleft()
+            if queue:
+                users.move_to_end(user_id)
+            else:
+                del users[user_id]
+            self._depth[priority] -= 1
+            image_queue_depth_gauge.labels(priority=priority.name.lower()).set(
+                self._depth[priority]
+            )
+            future.set_result(None)
+            return
+
+        self._running -= 1
+        image_slots_in_use_gauge.set(self._running)
+
+
+def create_image_scheduler(slots: int) -> ImageJobScheduler:
+    """Build a scheduler from the IMAGE_QUEUE_* and IMAGE_DEGRADE_* settings."""
+    if settings.IMAGE_DEGRADE_MODE not in DEGRADE_MODES:
+        logger.warning(
+            f"Unknown IMAGE_DEGRADE_MODE '{settings.IMAGE_DEGRADE_MODE}', "
+            "image jobs will not be degraded"
+        )
+
+    return ImageJobScheduler(
+        slots=slots,
+        max_depth={
+            ImagePriority.PORTRAIT: settings.IMAGE_QUEUE_MAX_DEPTH_PORTRAIT,
+            ImagePriority.WORLD_SCENE: settings.IMAGE_QUEUE_MAX_DEPTH_WORLD_SCENE,
+        },
+        degrade_backlog=settings.IMAGE_DEGRADE_BACKLOG,
+        degrade_mode=(
+            settings.IMAGE_DEGRADE_MODE
+            if settings.IMAGE_DEGRADE_MODE in DEGRADE_MODES
+            else "off"
+        ),
+    )
+
+
+# Global scheduler instance (created lazily) for image calls made in this process
+_scheduler: ImageJobScheduler | None = None
+
+
+def get_image_scheduler() -> ImageJobScheduler:
+    """Get the process-wide image job scheduler (IMAGE_BACKEND_CONCURRENCY slots)."""
+    global _scheduler
+
+    if _scheduler is None:
+        _scheduler = create_image_scheduler(settings.IMAGE_BACKEND_CONCURRENCY)
+
+    return _scheduler
@@ -0,0 +1,160 @@
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import Image, features
+
+from config.settings import get_settings
+from utils.logger import logger
+
+settings = get_settings()
+
+FORMATS = {
+    # name: (Pillow format, file extension, content type)
+    "webp": ("WEBP", "webp", "image/webp"),
+    "avif": ("AVIF", "avif", "image/avif"),
+}
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """One encoded rendition of an image."""
+
+    name: str  # "webp", "avif", "webp_256", ...
+    key_suffix: str  # Appended to the original key's stem: ".webp", "_256.webp"
+    content_type: str
+    data: bytes
+
+
+@lru_cache()
+def parse_variant_formats(value: str) -> tuple[str, ...]:
+    """
+    Parse IMAGE_VARIANT_FORMATS into supported format names.
+
+    Unknown formats, and AVIF when Pillow was built without it, are skipped
+    with a warning instead of failing every upload.
+    """
+    formats = []
+    for name in (part.strip().lower() for part in value.split(",")):
+        if not name:
+            continue
+        if name not in FORMATS:
+            logger.warning(f"Ignoring unknown image variant format: {name}")
+            continue
+        if not features.check(name):
+            logger.warning(f"Pillow has no {name} support, skipping variant")
+            continue
+        formats.append(name)
+    return tuple(formats)
+
+
+@lru_cache()
+def parse_thumbnail_sizes(value: str) -> tuple[int, ...]:
+    """Parse IMAGE_THUMBNAIL_SIZES ("256,512") into longest-edge sizes."""
+    return tuple(sorted({int(part) for part in value.split(",") if part.strip()}))
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+    pillow_format = FORMATS[fmt][0]
+    buffer = io.BytesIO()
+    image.save(buffer, format=pillow_format, quality=quality)
+    return buffer.getvalue()
+
+
+def encode_variants(
+    image_data: bytes,
+    formats: tuple[str, ...],
+    thumbnail_sizes: tuple[int, ...],
+    qualities: dict[str, int],
+) -> list[ImageVariant]:
+    """
+    Encode an image into every format plus downscaled thumbnails.
+
+    Thumbnails keep the aspect ratio (`size` is the longest edge), are never
+    upscaled and use the first format. CPU-bound: run through transcode_image
+    so it stays off the event loop.
+    """
+    if not formats:
+        return []
+
+    with Image.open(io.BytesIO(image_data)) as source:
+        image = source.convert("RGBA" if source.mode in ("RGBA", "LA", "P") else "RGB")
+
+    variants = []
+    for fmt in formats:
+        _, extension, content_type = FORMATS[fmt]
+        variants.append(
+            ImageVariant(
+                name=fmt,
+                key_suffix=f".{extension}",
+                content_type=content_type,
+                data=_encode(image, fmt, qualities[fmt]),
+            )
+        )
+
+    thumbnail_format = formats[0]
+    _, extension, content_type = FORMATS[thumbnail_format]
+    for size in thumbnail_sizes:
+        if size >= max(image.size):
+            continue
+        thumbnail = image.copy()
+        thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+        variants.append(
+            ImageVariant(
+                name=f"{thumbnail_format}_{size}",
+                key_suffix=f"_{size}.{extension}",
+                content_type=content_type,
+                data=_encode(thumbnail, thumbnail_format, qualities[thumbnail_format]),
+            )
+        )
+
+    return variants
+
+
+# Global process pool (created lazily). Spawned rather than forked so workers
+# don't inherit the gRPC server's threads.
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_transcode_executor() -> ProcessPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_TRANSCODE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    return _executor
+
+
+async def transcode_image(image_data: bytes) -> list[ImageVariant]:
+    """
+    Encode the configured variants (IMAGE_VARIANT_FORMATS and
+    IMAGE_THUMBNAIL_SIZES) of an image in the transcode process pool.
+    """
+    formats = parse_variant_formats(settings.IMAGE_VARIANT_FORMATS)
+    if not formats:
+        return []
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_transcode_executor(),
+        encode_variants,
+        image_data,
+        formats,
+        parse_thumbnail_sizes(settings.IMAGE_THUMBNAIL_SIZES),
+        {"webp": settings.IMAGE_WEBP_QUALITY, "avif": settings.IMAGE_AVIF_QUALITY},
+    )
+
+
+def close_transcode_executor():
+    """Shut down the transcode process pool (call on shutdown)."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+    _executor = None
@@ -1,5 +1,10 @@
 from utils.logger import logger
 from config.settings import get_settings
+from services.image_gen.scheduler import (
+    ImageJobScheduler,
+    ImagePriority,
+    get_image_scheduler,
+)
 from .prompt_builder import build_world_scene_prompt
 from .providers import generate_world_via_automatic1111, generate_world_via_replicate
 
@@ -12,6 +17,8 @@ async def generate_world_image(
     theme: str,
     setting_description: str = "",
     use_replicate: bool = False,
+    user_id: str = "",
+    scheduler: ImageJobScheduler | None = None,
 ) -> str:
     """
     Generate a world scene/environment image based on world story.
@@ -22,11 +29,14 @@ async def generate_world_image(
         theme: World theme (fantasy, cyberpunk, etc.)
         setting_description: Optional specific setting description
         use_replicate: If True, use Replicate API. Otherwise use Automatic1111.
+        user_id: Fairness key for image scheduling
+        scheduler: Scheduler to queue on (default: this process's scheduler)
 
     Returns:
         Base64 encoded image string
 
     Raises:
+        ImageJobRejectedError: Image backlog too large, try again later
         Exception if generation fails
     """
     logger.info(f"Generating world image for '{world_title}' (theme: {theme})")
@@ -40,20 +50,25 @@ async def generate_world_image(
 
     logger.info(f"World scene prompt: {positive_prompt[:150]}...")
 
-    if use_replicate:
-        image_base64 = await generate_world_via_replicate(
-            prompt=positive_prompt,
-            negative_prompt=negative_prompt,
-            width=1024,
-            height=768,  # Landscape aspect ratio for world scenes
-        )
-    else:
-        image_base64 = await generate_world_via_automatic1111(
-            prompt=positive_prompt,
-            negative_prompt=negative_prompt,
-            width=1024,
-            height=768,
-        )
+    # World scenes queue behind portraits for the image backend
+    scheduler = scheduler or get_image_scheduler()
+    async with scheduler.slot(ImagePriority.WORLD_SCENE, user_id) as degraded:
+        if use_replicate:
+            image_base64 = await generate_world_via_replicate(
+                prompt=positive_prompt,
+                negative_prompt=negative_prompt,
+                width=1024,
+                height=768,  # Landscape aspect ratio for world scenes
+                degraded=degraded,
+            )
+        else:
+            image_base64 = await generate_world_via_automatic1111(
+                prompt=positive_prompt,
+                negative_prompt=negative_prompt,
+                width=1024,
+                height=768,
+                degraded=degraded,
+            )
 
     logger.info(f"Successfully generated world image for '{world_title}'")
     return image_base64
@@ -0,0 +1,110 @@
+import json
+
+from utils.logger import logger
+from services.redis import get_redis_client
+from services.rabbitmq import get_publisher
+
+WORLD_IMAGE_QUEUE = "world_image_generation"
+
+WORLD_IMAGE_JOB_KEY_PREFIX = "world_image_job:"
+WORLD_IMAGE_JOB_TTL_SECONDS = 3600
+
+# Job states, in the order a job goes through them
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+def _world_image_job_key(job_id: str) -> str:
+    return f"{WORLD_IMAGE_JOB_KEY_PREFIX}{job_id}"
+
+
+def build_world_image_job(
+    job_id: str,
+    world_title: str,
+    full_story: str,
+    theme: str,
+    setting_description: str = "",
+    use_replicate: bool = False,
+    world_id: int = 0,
+    user_id: str = "",
+) -> dict:
+    """
+    Build the RabbitMQ payload for a world image generation job.
+
+    With a `world_id` the worker uploads the image to R2 and the job result is
+    its URL; without one the result is the raw image bytes.
+    """
+    return {
+        "job_id": job_id,
+        "world_title": world_title,
+        "full_story": full_story,
+        "theme": theme,
+        "setting_description": setting_description,
+        "use_replicate": use_replicate,
+        "world_id": world_id,
+        "user_id": user_id,
+    }
+
+
+async def update_world_image_job(job_id: str, **fields: str | bytes):
+    """
+    Update fields of a world image job's Redis hash and refresh its TTL.
+
+    The hash (world_image_job:{job_id}) holds `status` plus, once finished,
+    `image` (raw bytes) or `image_url`/`variant_urls` (JSON), or `error`.
+    """
+    try:
+        client = get_redis_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(_world_image_job_key(job_id), mapping=fields)  # type: ignore[arg-type]
+            pipe.expire(_world_image_job_key(job_id), WORLD_IMAGE_JOB_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Failed to update world image job {job_id} in Redis: {e}")
+        raise
+
+
+async def get_world_image_job(job_id: str) -> dict | None:
+    """
+    Retrieve a world image job's state from Redis.
+
+    Returns None for unknown (or expired) jobs, otherwise a dict with status,
+    image (bytes or None), image_url, variant_urls and error.
+    """
+    try:
+        client = get_redis_client()
+        fields = await client.hgetall(_world_image_job_key(job_id))  # type: ignore[misc]
+    except Exception as e:
+        logger.error(f"Failed to get world image job {job_id} from Redis: {e}")
+        raise
+
+    if not fields:
+        return None
+
+    def text(name: str) -> str:
+        return fields.get(name.encode(), b"").decode("utf-8")
+
+    return {
+        "status": text("status"),
+        "image": fields.get(b"image"),
+        "image_url": text("image_url"),
+        "variant_urls": json.loads(text("variant_urls") or "{}"),
+        "error": text("error"),
+    }
+
+
+async def enqueue_world_image_job(job: dict):
+    """Record a world image job as queued and publish it to RabbitMQ."""
+    await update_world_image_job(job["job_id"], status=JOB_QUEUED)
+
+    try:
+        await get_publisher().publish(WORLD_IMAGE_QUEUE, job)
+        logger.info(f"Published world image job {job['job_id']}")
+    except Exception as e:
+        logger.error(f"Failed to publish world image job: {e}", exc_info=True)
+        await update_world_image_job(
+            job["job_id"], status=JOB_FAILED, error=f"Failed to enqueue: {e}"
+        )
+        raise
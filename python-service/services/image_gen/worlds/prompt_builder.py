@@ -1,6 +1,6 @@
 import random
 from utils.logger import logger
-from services.llm_client import get_llm
+from services.llm_client import get_llm, llm_step
 
 
 async def extract_visual_elements(full_story: str, theme: str) -> str:
@@ -32,8 +32,10 @@ Example: "ancient stone ruins with overgrown vines, misty atmosphere, golden sun
 """
 
     try:
-        llm = get_llm(max_tokens=300, temperature=0.3)
-        response = await llm.ainvoke(extraction_prompt)
+        llm = get_llm(max_tokens=300, temperature=0.3, tier="structured")
+        response = await llm.ainvoke(
+            extraction_prompt, config=llm_step("world_image", "prompt_extraction")
+        )
         visual_description = str(response.content).strip()
         logger.info(f"Extracted visual elements: {visual_description[:100]}...")
         return visual_description
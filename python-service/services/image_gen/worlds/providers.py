@@ -5,9 +5,13 @@ import base64
 
 from utils.logger import logger
 from config.settings import get_settings
+from services.http_session import http_request
+from services.image_gen.scheduler import degrade_dimensions
 
 settings = get_settings()
 
+AUTOMATIC1111_WORLD_TIMEOUT_SECONDS = 120  # 2 min
+
 try:
     import replicate
 
@@ -21,6 +25,7 @@ async def generate_world_via_automatic1111(
     negative_prompt: str,
     width: int = 1024,
     height: int = 768,
+    degraded: bool = False,
 ) -> str:
     """
     Generate world scene image via local Automatic1111 API.
@@ -33,6 +38,7 @@ async def generate_world_via_automatic1111(
         negative_prompt: Negative prompt
         width: Image width (default 1024 for landscape)
         height: Image height (default 768 for landscape)
+        degraded: Use fewer steps and a lower resolution (backlog is high)
 
     Returns:
         Base64 encoded image string
@@ -41,10 +47,14 @@ async def generate_world_via_automatic1111(
     if not api_url:
         raise ValueError("AUTOMATIC1111_URL not configured")
 
+    steps = 20
+    if degraded:
+        width, height, steps = degrade_dimensions(width, height, steps)
+
     payload = {
         "prompt": prompt,
         "negative_prompt": negative_prompt,
-        "steps": 20,
+        "steps": steps,
         "cfg_scale": 7.0,
         "width": width,
         "height": height,
@@ -54,21 +64,23 @@ async def generate_world_via_automatic1111(
 
     logger.info(f"Generating world image ({width}x{height}) via Automatic1111...")
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{api_url}/sdapi/v1/txt2img", json=payload
-        ) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise Exception(f"Automatic1111 API error: {error_text}")
+    async with http_request(
+        "POST",
+        f"{api_url}/sdapi/v1/txt2img",
+        json=payload,
+        timeout=aiohttp.ClientTimeout(total=AUTOMATIC1111_WORLD_TIMEOUT_SECONDS),
+    ) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise Exception(f"Automatic1111 API error: {error_text}")
 
-            result = await response.json()
-            if not result.get("images") or len(result["images"]) == 0:
-                raise Exception("No images returned from Automatic1111")
+        result = await response.json()
+        if not result.get("images") or len(result["images"]) == 0:
+            raise Exception("No images returned from Automatic1111")
 
-            image_base64 = result["images"][0]
-            logger.info("World image generated successfully via Automatic1111")
-            return image_base64
+        image_base64 = result["images"][0]
+        logger.info("World image generated successfully via Automatic1111")
+        return image_base64
 
 
 async def generate_world_via_replicate(
@@ -76,6 +88,7 @@ async def generate_world_via_replicate(
     negative_prompt: str,
     width: int = 1024,
     height: int = 768,
+    degraded: bool = False,
 ) -> str:
     """
     Generate world scene image via Replicate API.
@@ -89,6 +102,7 @@ async def generate_world_via_replicate(
         negative_prompt: Negative prompt
         width: Image width
         height: Image height
+        degraded: Use fewer steps and a lower resolution (backlog is high)
 
     Returns:
         Base64 encoded image string
@@ -101,6 +115,10 @@ async def generate_world_via_replicate(
 
     os.environ["REPLICATE_API_TOKEN"] = settings.REPLICATE_API_TOKEN
 
+    steps = 40
+    if degraded:
+        width, height, steps = degrade_dimensions(width, height, steps)
+
     logger.info(f"Generating world image ({width}x{height}) via Replicate...")
 
     # TODO: Switch to a landscape/environment-specific model in production
@@ -113,7 +131,7 @@ async def generate_world_via_replicate(
             "negative_prompt": negative_prompt,
             "width": width,
             "height": height,
-            "num_inference_steps": 40,
+            "num_inference_steps": steps,
             "guidance_scale": 7.5,
             "scheduler": "DPMSolverMultistep",
         },
@@ -134,13 +152,12 @@ async def generate_world_via_replicate(
     image_url = extract_url(output)
 
     # Download and convert to base64
-    async with aiohttp.ClientSession() as session:
-        async with session.get(image_url) as response:
-            if response.status != 200:
-                raise Exception(f"Failed to download image: HTTP {response.status}")
+    async with http_request("GET", image_url) as response:
+        if response.status != 200:
+            raise Exception(f"Failed to download image: HTTP {response.status}")
 
-            image_bytes = await response.read()
-            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+        image_bytes = await response.read()
+        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
 
     logger.info("World image generated successfully via Replicate")
     return image_base64
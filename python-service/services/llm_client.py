@@ -1,18 +1,27 @@
-from typing import cast
+import json
+import time
+from typing import Any, cast
+from uuid import UUID
+
 from dotenv import load_dotenv
-from pydantic import SecretStr
+from pydantic import SecretStr, ValidationError
 
 from langchain_openai import ChatOpenAI
 from langchain_ollama import ChatOllama
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.callbacks import Callbacks
+from langchain_core.outputs import LLMResult
+from langchain_core.callbacks import BaseCallbackHandler, Callbacks
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import RunnableConfig, RunnableWithFallbacks
 
-from prometheus_client import Counter
+from prometheus_client import Counter, Histogram
 
 from langfuse import Langfuse
 from langfuse.langchain import CallbackHandler
 
 from config.settings import get_settings
+from services.fake_llm import FAKE_MODEL_NAME, FakeChatModel
+from services.grpc_metrics import add_rpc_time
 from utils.logger import logger
 
 load_dotenv()
@@ -27,6 +36,8 @@ if settings.AI_PROVIDER == "local":
     logger.info(
         f"Using local Ollama model: {settings.LOCAL_MODEL} at {settings.OLLAMA_URL}"
     )
+elif settings.AI_PROVIDER == "fake":
+    logger.info("Using fake LLM (deterministic offline outputs)")
 else:
     logger.info(f"Using OpenRouter API with model: {settings.OPENROUTER_MODEL}")
 
@@ -60,35 +71,350 @@ ai_generation_failure_counter = Counter(
     ["model", "error_type"],
 )
 
+# Per-step metrics, labelled by chain (e.g. "character"), step (e.g.
+# "appearance") and model; see llm_step()
+llm_step_duration_histogram = Histogram(
+    "loresmith_llm_step_duration_seconds",
+    "Time per chain step, from prompt formatting to parsed output",
+    ["chain", "step", "model"],
+    buckets=(0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60, 120),
+)
+
+llm_step_tokens_histogram = Histogram(
+    "loresmith_llm_step_tokens",
+    "Tokens per chain step LLM call",
+    ["chain", "step", "model", "type"],  # type: prompt, completion
+    buckets=(16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192),
+)
+
+llm_step_failures_counter = Counter(
+    "loresmith_llm_step_failures_total",
+    "Chain steps that failed",
+    ["chain", "step", "model", "error_type"],  # error_type: parse, llm, other
+)
+
+# Per-tier metrics (see get_llm()), per model call; tokens are what's billed
+llm_tier_duration_histogram = Histogram(
+    "loresmith_llm_tier_duration_seconds",
+    "Time per LLM call, by model tier",
+    ["tier", "model"],
+    buckets=(0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60, 120),
+)
+
+llm_tier_tokens_counter = Counter(
+    "loresmith_llm_tier_tokens_total",
+    "Tokens used by LLM calls, by model tier",
+    ["tier", "model", "type"],  # type: prompt, completion
+)
+
+llm_tier_failures_counter = Counter(
+    "loresmith_llm_tier_failures_total",
+    "LLM calls that failed, by model tier (retried on the next tier if enabled)",
+    ["tier", "model"],
+)
+
+_PARSE_ERRORS = (OutputParserException, ValidationError, json.JSONDecodeError)
+
+# Cheapest first: a failed step falls back to the next tier's model
+LLM_TIERS = ("short", "structured", "long")
+
+
+class LlmTimingHandler(BaseCallbackHandler):
+    """Add the time spent in LLM calls to the RPC being handled."""
+
+    run_inline = True  # Called in the caller's context, where the RPC's timings are
+
+    def __init__(self):
+        self._started: dict[UUID, float] = {}
+
+    def on_llm_start(
+        self, serialized: dict, prompts: list, *, run_id: UUID, **kwargs: Any
+    ):
+        self._started[run_id] = time.perf_counter()
+
+    def on_chat_model_start(
+        self, serialized: dict, messages: list, *, run_id: UUID, **kwargs: Any
+    ):
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any):
+        self._finish(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._finish(run_id)
+
+    def _finish(self, run_id: UUID):
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            add_rpc_time("llm", time.perf_counter() - started)
+
+
+llm_timing_handler = LlmTimingHandler()
+
+
+class LlmStepMetricsHandler(BaseCallbackHandler):
+    """
+    Record latency, tokens and failures of one chain step invocation.
+
+    Created per invocation by llm_step(). The first run it sees (the chain,
+    or the model when invoked directly) is the step; its end or error closes
+    the step. Structured output that fails to parse counts as a parse
+    failure, including a None result.
+    """
+
+    run_inline = True
+
+    def __init__(self, chain: str, step: str):
+        self._chain = chain
+        self._step = step
+        self._model: str | None = None
+        self._root: UUID | None = None
+        self._started = 0.0
+        self._llm_failed = False
+
+    def _labels(self) -> dict[str, str]:
+        return {
+            "chain": self._chain,
+            "step": self._step,
+            "model": self._model or get_model_name(),
+        }
+
+    def _start(self, run_id: UUID):
+        if self._root is None:
+            self._root = run_id
+            self._started = time.perf_counter()
+
+    def _end(self, run_id: UUID, error_type: str | None):
+        if run_id != self._root:
+            return
+        labels = self._labels()
+        llm_step_duration_histogram.labels(**labels).observe(
+            time.perf_counter() - self._started
+        )
+        if error_type:
+            llm_step_failures_counter.labels(**labels, error_type=error_type).inc()
+
+    def on_chain_start(self, serialized: Any, inputs: Any, *, run_id: UUID, **kwargs):
+        self._start(run_id)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, "parse" if outputs is None else None)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        if isinstance(error, _PARSE_ERRORS):
+            error_type = "parse"
+        else:
+            error_type = "llm" if self._llm_failed else "other"
+        self._end(run_id, error_type)
+
+    def on_llm_start(self, serialized: Any, prompts: list, *, run_id: UUID, **kwargs):
+        self._model_started(run_id, kwargs)
+
+    def on_chat_model_start(
+        self, serialized: Any, messages: list, *, run_id: UUID, **kwargs: Any
+    ):
+        self._model_started(run_id, kwargs)
+
+    def _model_started(self, run_id: UUID, kwargs: dict[str, Any]):
+        metadata = kwargs.get("metadata") or {}
+        params = kwargs.get("invocation_params") or {}
+        self._model = (
+            metadata.get("ls_model_name")
+            or params.get("model")
+            or params.get("model_name")
+            or self._model
+        )
+        self._start(run_id)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        prompt_tokens, completion_tokens = _token_usage(response)
+        labels = self._labels()
+        if prompt_tokens:
+            llm_step_tokens_histogram.labels(**labels, type="prompt").observe(
+                prompt_tokens
+            )
+        if completion_tokens:
+            llm_step_tokens_histogram.labels(**labels, type="completion").observe(
+                completion_tokens
+            )
+        self._end(run_id, None)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._llm_failed = True
+        self._end(run_id, "llm")
+
+
+class LlmTierMetricsHandler(BaseCallbackHandler):
+    """Record latency, tokens and failures of model calls on one tier."""
+
+    run_inline = True
+
+    def __init__(self, tier: str):
+        self._tier = tier
+        self._started: dict[UUID, tuple[float, str]] = {}
+
+    def on_llm_start(self, serialized: Any, prompts: list, *, run_id: UUID, **kwargs):
+        self._model_started(run_id, kwargs)
+
+    def on_chat_model_start(
+        self, serialized: Any, messages: list, *, run_id: UUID, **kwargs: Any
+    ):
+        self._model_started(run_id, kwargs)
+
+    def _model_started(self, run_id: UUID, kwargs: dict[str, Any]):
+        metadata = kwargs.get("metadata") or {}
+        params = kwargs.get("invocation_params") or {}
+        model = (
+            metadata.get("ls_model_name")
+            or params.get("model")
+            or params.get("model_name")
+            or get_model_name()
+        )
+        self._started[run_id] = (time.perf_counter(), model)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        start, model = started
+        llm_tier_duration_histogram.labels(tier=self._tier, model=model).observe(
+            time.perf_counter() - start
+        )
+        prompt_tokens, completion_tokens = _token_usage(response)
+        llm_tier_tokens_counter.labels(tier=self._tier, model=model, type="prompt").inc(
+            prompt_tokens
+        )
+        llm_tier_tokens_counter.labels(
+            tier=self._tier, model=model, type="completion"
+        ).inc(completion_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        _, model = started
+        llm_tier_failures_counter.labels(tier=self._tier, model=model).inc()
+        logger.warning(f"LLM call on the {self._tier} tier ({model}) failed: {error}")
+
+
+_tier_metrics_handlers = {tier: LlmTierMetricsHandler(tier) for tier in LLM_TIERS}
+
+
+def _token_usage(response: LLMResult) -> tuple[int, int]:
+    """Prompt and completion tokens of an LLM call, 0 when not reported."""
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    return token_usage.get("prompt_tokens", 0), token_usage.get("completion_tokens", 0)
+
+
+def llm_step(chain: str, step: str) -> RunnableConfig:
+    """
+    Config for invoking one chain step, so it is measured as `chain`/`step`.
+
+    Usage:
+        await name_chain.ainvoke(inputs, config=llm_step("setting", "name"))
+    """
+    return {
+        "run_name": f"{chain}_{step}",
+        "callbacks": [LlmStepMetricsHandler(chain, step)],
+    }
+
+
+def get_tier_model(tier: str) -> str:
+    """
+    Model serving a tier on the current provider.
+
+    Tiers are set per provider ({PROVIDER}_MODEL_SHORT/_STRUCTURED/_LONG);
+    an unset tier uses the provider's main model.
+    """
+    if tier not in LLM_TIERS:
+        raise ValueError(f"Invalid LLM tier: '{tier}'. Must be one of {LLM_TIERS}")
+
+    provider = settings.AI_PROVIDER.lower()
+    if provider == "local":
+        return getattr(settings, f"LOCAL_MODEL_{tier.upper()}") or settings.LOCAL_MODEL
+    elif provider == "fake":
+        return FAKE_MODEL_NAME
+    else:
+        return (
+            getattr(settings, f"OPENROUTER_MODEL_{tier.upper()}")
+            or settings.OPENROUTER_MODEL
+        )
+
 
 def get_llm(
     max_tokens: int = 500,
     temperature: float = 0.8,
     model: str | None = None,
-) -> BaseChatModel:
+    tier: str = "long",
+) -> BaseChatModel | RunnableWithFallbacks:
     """
     Create a LangChain LLM instance based on AI_PROVIDER environment variable.
 
+    Chain steps declare a tier, so short outputs don't need the slowest model:
+    'short' for names and picks from a list, 'structured' for JSON fields and
+    short paragraphs, 'long' for prose. With LLM_TIER_FALLBACK, a failed call
+    (or unparseable structured output) is retried on the next tier's model.
+
     Args:
         max_tokens: Maximum tokens to generate (default: 500)
         temperature: Sampling temperature 0.0-1.0 (default: 0.8)
-        model: Optional model override (defaults to env var)
+        model: Optional model override (disables tier routing and fallback)
+        tier: Model tier, one of LLM_TIERS (default: 'long', the main model)
 
     Returns:
-        A LangChain BaseChatModel (ChatOpenAI or ChatOllama)
+        A LangChain chat model (ChatOpenAI, ChatOllama or FakeChatModel),
+        wrapped with its fallback models when there are any
 
     Raises:
         ValueError: If configuration is invalid or required env vars are missing
     """
+    if model:
+        return _create_llm(max_tokens, temperature, model, tier)
+
+    model = get_tier_model(tier)
+    llm = _create_llm(max_tokens, temperature, model, tier)
+    if not settings.LLM_TIER_FALLBACK:
+        return llm
+
+    fallbacks: dict[str, str] = {}  # model -> tier
+    for next_tier in LLM_TIERS[LLM_TIERS.index(tier) + 1 :]:
+        next_model = get_tier_model(next_tier)
+        if next_model != model:
+            fallbacks.setdefault(next_model, next_tier)
+    if not fallbacks:
+        return llm
+
+    return llm.with_fallbacks(
+        [
+            _create_llm(max_tokens, temperature, next_model, next_tier)
+            for next_model, next_tier in fallbacks.items()
+        ]
+    )
+
+
+def _create_llm(
+    max_tokens: int, temperature: float, model_name: str, tier: str
+) -> BaseChatModel:
     provider = settings.AI_PROVIDER.lower()
 
     callbacks: Callbacks = cast(
-        Callbacks, [langfuse_handler] if langfuse_handler else []
+        Callbacks,
+        (
+            [llm_timing_handler, _tier_metrics_handlers[tier], langfuse_handler]
+            if langfuse_handler
+            else [llm_timing_handler, _tier_metrics_handlers[tier]]
+        ),
     )
 
     if provider == "local":
-        model_name = model or settings.LOCAL_MODEL
-
         logger.debug(
             f"Creating Ollama LLM: model={model_name}, "
             f"base_url={settings.OLLAMA_URL}, max_tokens={max_tokens}"
@@ -102,6 +428,9 @@ def get_llm(
             callbacks=callbacks,
         )
 
+    elif provider == "fake":
+        return FakeChatModel(max_tokens=max_tokens, callbacks=callbacks)
+
     elif provider == "openrouter":
         if not settings.OPENROUTER_API_KEY:
             raise ValueError(
@@ -109,8 +438,6 @@ def get_llm(
                 "AI_PROVIDER is set to 'openrouter'"
             )
 
-        model_name = model or settings.OPENROUTER_MODEL
-
         logger.debug(
             f"Creating OpenRouter LLM: model={model_name}, "
             f"max_tokens={max_tokens}, temperature={temperature}"
@@ -129,7 +456,7 @@ def get_llm(
 
     else:
         raise ValueError(
-            f"Invalid AI_PROVIDER: '{provider}'. Must be 'local' or 'openrouter'"
+            f"Invalid AI_PROVIDER: '{provider}'. Must be 'local', 'openrouter' or 'fake'"
         )
 
 
@@ -140,8 +467,10 @@ def get_model_name() -> str:
     Returns:
         Model identifier string (e.g., "llama3.1:8b" or "openai/gpt-4o-mini")
     """
-    if settings.AI_PROVIDER.lower() == "ollama":
+    if settings.AI_PROVIDER.lower() == "local":
         return settings.LOCAL_MODEL
+    elif settings.AI_PROVIDER.lower() == "fake":
+        return FAKE_MODEL_NAME
     else:
         return settings.OPENROUTER_MODEL
 
@@ -0,0 +1,253 @@
+import io
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import BotoCoreError, ClientError
+from boto3.exceptions import S3UploadFailedError
+from prometheus_client import Counter, Histogram
+
+from utils.logger import logger
+from config.settings import get_settings
+
+settings = get_settings()
+
+MB = 1024 * 1024
+
+# Prometheus metrics for R2 uploads
+r2_upload_duration_histogram = Histogram(
+    "loresmith_r2_upload_duration_seconds",
+    "Time to upload one object to R2 (including time queued for an upload slot)",
+    ["image_type"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+r2_upload_bytes_counter = Counter(
+    "loresmith_r2_upload_bytes_total",
+    "Bytes uploaded to R2",
+    ["image_type"],
+)
+
+r2_upload_failure_counter = Counter(
+    "loresmith_r2_upload_failures_total",
+    "Failed R2 uploads",
+    ["image_type"],
+)
+
+# Values of the image_type label; anything else (it can come from a client) is
+# counted as "other" to keep the label's cardinality bounded
+METRIC_IMAGE_TYPES = frozenset({"image", "portrait", "card", "world_scene"})
+
+
+def _metric_image_type(image_type: str) -> str:
+    return image_type if image_type in METRIC_IMAGE_TYPES else "other"
+
+
+# Initialize R2 client (S3-compatible). boto3 clients are thread-safe; size its
+# connection pool for every upload slot plus their multipart part threads.
+s3_client = None
+if settings.AWS_ACCESS_KEY_ID and settings.AWS_ENDPOINT_URL:
+    s3_client = boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_ENDPOINT_URL,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name="auto",  # R2 uses 'auto' as region
+        config=BotoConfig(
+            max_pool_connections=settings.R2_UPLOAD_CONCURRENCY
+            * settings.R2_MULTIPART_CONCURRENCY
+        ),
+    )
+
+# Objects above the threshold are sent as a multipart upload, parts in parallel
+transfer_config = TransferConfig(
+    multipart_threshold=settings.R2_MULTIPART_THRESHOLD_MB * MB,
+    multipart_chunksize=settings.R2_MULTIPART_CHUNK_SIZE_MB * MB,
+    max_concurrency=settings.R2_MULTIPART_CONCURRENCY,
+)
+
+# boto3 is blocking, so uploads run on a bounded pool instead of the event loop
+_upload_executor = ThreadPoolExecutor(
+    max_workers=settings.R2_UPLOAD_CONCURRENCY, thread_name_prefix="r2-upload"
+)
+
+
+async def upload_object(
+    bucket: str,
+    key: str,
+    data: bytes,
+    content_type: str = "image/png",
+    image_type: str = "image",
+):
+    """
+    Upload bytes to R2 without blocking the event loop.
+
+    At most R2_UPLOAD_CONCURRENCY uploads run at once; further calls wait for a
+    free slot. Large objects go through a multipart upload.
+
+    Args:
+        bucket: Target bucket
+        key: Object key
+        data: Object contents
+        content_type: Content-Type stored with the object
+        image_type: Label for the upload metrics (unknown types count as "other")
+
+    Raises:
+        Exception: If R2 is not configured or the upload fails
+    """
+    if not s3_client:
+        raise Exception("R2 client not initialized. Check AWS credentials in .env")
+
+    image_type = _metric_image_type(image_type)
+    start_time = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(
+            _upload_executor,
+            partial(
+                s3_client.upload_fileobj,
+                io.BytesIO(data),
+                bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=transfer_config,
+            ),
+        )
+    except (ClientError, BotoCoreError, S3UploadFailedError) as e:
+        r2_upload_failure_counter.labels(image_type=image_type).inc()
+        logger.error(f"Failed to upload to R2: {e}")
+        raise Exception(f"R2 upload failed: {e}")
+
+    r2_upload_duration_histogram.labels(image_type=image_type).observe(
+        time.perf_counter() - start_time
+    )
+    r2_upload_bytes_counter.labels(image_type=image_type).inc(len(data))
+
+
+async def _run_upload_call(func, **kwargs):
+    """Run one blocking S3 API call on the upload pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_upload_executor, partial(func, **kwargs))
+
+
+async def upload_stream(
+    bucket: str,
+    key: str,
+    chunks: AsyncIterator[bytes],
+    content_type: str = "image/png",
+    image_type: str = "image",
+) -> int:
+    """
+    Upload an object to R2 from a stream of byte chunks.
+
+    Chunks are packed into R2_MULTIPART_CHUNK_SIZE_MB parts and each part is
+    uploaded while the next one is received, so at most two parts are held in
+    memory regardless of object size. Objects that fit in a single part are
+    sent with one put_object.
+
+    Returns:
+        Number of bytes uploaded
+
+    Raises:
+        Exception: If R2 is not configured or the upload fails. Errors raised
+            while reading `chunks` are re-raised as is, after aborting the upload.
+    """
+    client = s3_client
+    if not client:
+        raise Exception("R2 client not initialized. Check AWS credentials in .env")
+
+    image_type = _metric_image_type(image_type)
+    part_size = settings.R2_MULTIPART_CHUNK_SIZE_MB * MB
+    start_time = time.perf_counter()
+    buffer = bytearray()
+    total_bytes = 0
+    upload_id: str | None = None
+    parts: list[dict] = []
+    pending_part: asyncio.Task | None = None
+
+    async def upload_part(part_number: int, body: bytes) -> dict:
+        response = await _run_upload_call(
+            client.upload_part,
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    async def flush_part():
+        nonlocal upload_id, pending_part
+        if upload_id is None:
+            response = await _run_upload_call(
+                client.create_multipart_upload,
+                Bucket=bucket,
+                Key=key,
+                ContentType=content_type,
+            )
+            upload_id = response["UploadId"]
+        if pending_part is not None:
+            parts.append(await pending_part)
+
+        body = bytes(buffer[:part_size])
+        del buffer[:part_size]
+        pending_part = asyncio.create_task(upload_part(len(parts) + 1, body))
+
+    try:
+        async for chunk in chunks:
+            buffer.extend(chunk)
+            total_bytes += len(chunk)
+            # Keep the last part in the buffer so it can be sent on completion
+            while len(buffer) > part_size:
+                await flush_part()
+
+        if upload_id is None:
+            await _run_upload_call(
+                client.put_object,
+                Bucket=bucket,
+                Key=key,
+                Body=bytes(buffer),
+                ContentType=content_type,
+            )
+        else:
+            await flush_part()
+            parts.append(await pending_part)  # type: ignore[misc]
+            pending_part = None
+            await _run_upload_call(
+                client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+
+    except Exception as e:
+        r2_upload_failure_counter.labels(image_type=image_type).inc()
+        if pending_part is not None:
+            pending_part.cancel()
+        if upload_id is not None:
+            try:
+                await _run_upload_call(
+                    client.abort_multipart_upload,
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            except Exception as abort_error:
+                logger.warning(f"Failed to abort multipart upload: {abort_error}")
+        if isinstance(e, (ClientError, BotoCoreError)):
+            logger.error(f"Failed to stream upload to R2: {e}")
+            raise Exception(f"R2 upload failed: {e}")
+        # Errors raised by the chunk source propagate unchanged
+        raise
+
+    r2_upload_duration_histogram.labels(image_type=image_type).observe(
+        time.perf_counter() - start_time
+    )
+    r2_upload_bytes_counter.labels(image_type=image_type).inc(total_bytes)
+    return total_bytes
@@ -1,5 +1,14 @@
 import os
+import json
+import asyncio
+from typing import Any, Awaitable, Callable
+
 import pika
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
+
+from utils.logger import logger
 
 
 def get_rabbitmq_connection():
@@ -16,3 +25,135 @@ def get_rabbitmq_connection():
         blocked_connection_timeout=300,
     )
     return pika.BlockingConnection(parameters)
+
+
+async def connect_rabbitmq_robust() -> AbstractRobustConnection:
+    """Create an asyncio RabbitMQ connection that reconnects automatically."""
+    return await aio_pika.connect_robust(
+        host=os.getenv("RABBITMQ_HOST", "rabbitmq"),
+        port=int(os.getenv("RABBITMQ_PORT", "5672")),
+        login=os.getenv("RABBITMQ_USER", "loresmith"),
+        password=os.getenv("RABBITMQ_PASS", "loresmith"),
+        heartbeat=600,
+    )
+
+
+class AsyncRabbitMQPublisher:
+    """
+    Long-lived asyncio publisher for RabbitMQ.
+
+    Keeps one robust connection open (re-established automatically after
+    broker restarts) and a small pool of channels with publisher confirms,
+    so publishing never opens a TCP/AMQP handshake on the request path.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[
+            [], Awaitable[AbstractRobustConnection]
+        ] = connect_rabbitmq_robust,
+        channel_pool_size: int = 4,
+    ):
+        """
+        Args:
+            connection_factory: Async callable returning a connection. Override to
+                publish against an in-process AMQP stand-in.
+            channel_pool_size: Maximum number of channels kept open for publishing.
+        """
+        self._connection_factory = connection_factory
+        self._channel_pool_size = channel_pool_size
+        self._connection: AbstractRobustConnection | None = None
+        self._channel_pool: Pool[AbstractChannel] | None = None
+        self._declared_queues: set[str] = set()
+        self._connection_lock = asyncio.Lock()
+
+    async def _get_connection(self) -> AbstractRobustConnection:
+        async with self._connection_lock:
+            if self._connection is None or self._connection.is_closed:
+                logger.info("Opening RabbitMQ publisher connection...")
+                self._connection = await self._connection_factory()
+                self._declared_queues.clear()
+            return self._connection
+
+    async def _create_channel(self) -> AbstractChannel:
+        connection = await self._get_connection()
+        return await connection.channel(publisher_confirms=True)
+
+    def _get_channel_pool(self) -> Pool[AbstractChannel]:
+        if self._channel_pool is None:
+            self._channel_pool = Pool(
+                self._create_channel, max_size=self._channel_pool_size
+            )
+        return self._channel_pool
+
+    async def publish(self, queue_name: str, payload: dict[str, Any]):
+        """Publish one JSON payload to a durable queue and await its confirm."""
+        await self.publish_batch(queue_name, [payload])
+
+    async def publish_batch(self, queue_name: str, payloads: list[dict[str, Any]]):
+        """
+        Publish JSON payloads to a durable queue in one go.
+
+        All messages are sent on the same channel and their publisher confirms
+        are awaited together, so the call returns once the broker has accepted
+        every message (or raises if any was rejected).
+        """
+        if not payloads:
+            return
+
+        async with self._get_channel_pool().acquire() as channel:
+            # The pool hands back channels as released; one the broker closed
+            # (e.g. after a failed publish) is reopened before use
+            if channel.is_closed:
+                await channel.reopen()
+
+            if queue_name not in self._declared_queues:
+                await channel.declare_queue(queue_name, durable=True)
+                self._declared_queues.add(queue_name)
+
+            await asyncio.gather(
+                *(
+                    channel.default_exchange.publish(
+                        aio_pika.Message(
+                            body=json.dumps(payload).encode(),
+                            content_type="application/json",
+                            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                        ),
+                        routing_key=queue_name,
+                    )
+                    for payload in payloads
+                )
+            )
+
+    async def close(self):
+        """Close pooled channels and the connection."""
+        if self._channel_pool is not None:
+            await self._channel_pool.close()
+            self._channel_pool = None
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+        self._connection = None
+        logger.info("RabbitMQ publisher closed")
+
+
+# Global publisher instance (created lazily on the running event loop)
+_publisher: AsyncRabbitMQPublisher | None = None
+
+
+def get_publisher() -> AsyncRabbitMQPublisher:
+    """Get the shared RabbitMQ publisher for this process."""
+    global _publisher
+
+    if _publisher is None:
+        _publisher = AsyncRabbitMQPublisher()
+
+    return _publisher
+
+
+async def close_publisher():
+    """Close the shared publisher (call on server shutdown)."""
+    global _publisher
+
+    if _publisher is not None:
+        await _publisher.close()
+        _publisher = None
@@ -1,13 +1,39 @@
 import os
-import redis
 
+import redis.asyncio as redis
 
-def get_redis_client() -> redis.Redis:
-    """Get Redis client instance."""
-    return redis.Redis(
-        host=os.getenv('REDIS_HOST', 'redis'),
-        port=int(os.getenv('REDIS_PORT', '6379')),
+
+def create_redis_pool() -> redis.ConnectionPool:
+    """Create the Redis connection pool shared by the process."""
+    return redis.ConnectionPool(
+        host=os.getenv("REDIS_HOST", "redis"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "20")),
         decode_responses=False,
         socket_connect_timeout=5,
-        socket_timeout=5
+        socket_timeout=5,
+        health_check_interval=30,
     )
+
+
+# Global client instance (created lazily, bound to the running event loop)
+_redis_client: redis.Redis | None = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Get the shared async Redis client (one connection pool per process)."""
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = redis.Redis(connection_pool=create_redis_pool())
+
+    return _redis_client
+
+
+async def close_redis_client():
+    """Close the shared client and disconnect its pool (call on shutdown)."""
+    global _redis_client
+
+    if _redis_client is not None:
+        await _redis_client.aclose(close_connection_pool=True)
+        _redis_client = None
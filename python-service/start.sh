@@ -9,4 +9,7 @@ echo "Starting gRPC server..."
 python lore_servicer.py &
 SERVER_PID=$!
 
+# Pass stop signals on and let both drain in-flight work before exiting
+trap 'kill -TERM $WORKER_PID $SERVER_PID 2>/dev/null; wait $WORKER_PID $SERVER_PID || true; exit 0' TERM INT
+
 wait $WORKER_PID $SERVER_PID
@@ -0,0 +1,80 @@
+"""The indexed catalogue against plain scans of the flaw templates and traits."""
+
+import itertools
+import random
+
+import pytest
+
+from generate.chains.character import catalogue
+from generate.chains.character.flaw_templates import FLAW_TEMPLATES
+from generate.chains.character.traits import (
+    PersonalityTrait,
+    are_traits_compatible,
+    get_trait_list_for_prompt,
+)
+
+UNKNOWN = ["", "not_a_flaw", "MISSING_EYE", "missing_eye "]
+CATEGORIES = sorted({flaw["category"] for flaw in FLAW_TEMPLATES})
+
+
+def scan_flaw_by_id(flaw_id: str):
+    return next((flaw for flaw in FLAW_TEMPLATES if flaw["id"] == flaw_id), None)
+
+
+def scan_valid_selection(selection: list[PersonalityTrait]) -> bool:
+    return len(selection) == 3 and all(
+        are_traits_compatible(first, second)
+        for first, second in itertools.combinations(selection, 2)
+    )
+
+
+@pytest.mark.parametrize("flaw_id", list(catalogue.FLAW_IDS) + UNKNOWN)
+def test_flaw_by_id(flaw_id):
+    assert catalogue.get_flaw_by_id(flaw_id) is scan_flaw_by_id(flaw_id)
+
+
+@pytest.mark.parametrize("category", CATEGORIES + UNKNOWN)
+def test_flaws_by_category(category):
+    flaws = catalogue.get_flaws_by_category(category)
+
+    assert flaws == [flaw for flaw in FLAW_TEMPLATES if flaw["category"] == category]
+    assert isinstance(flaws, list)
+
+
+@pytest.mark.parametrize("count", [0, 1, 10, len(FLAW_TEMPLATES), 100])
+def test_random_flaw_ids_follow_the_seed(count):
+    random.seed(count)
+    expected = [
+        flaw["id"]
+        for flaw in random.sample(FLAW_TEMPLATES, min(count, len(FLAW_TEMPLATES)))
+    ]
+    random.seed(count)
+
+    assert catalogue.get_random_flaw_ids(count) == expected
+
+
+def test_trait_names_and_prompt():
+    assert catalogue.TRAIT_NAMES == {trait.value for trait in PersonalityTrait}
+    assert catalogue.TRAIT_PROMPT == get_trait_list_for_prompt()
+
+
+def test_trait_compatibility():
+    for first, second in itertools.product(PersonalityTrait, repeat=2):
+        assert catalogue.are_traits_compatible(first, second) == (
+            are_traits_compatible(first, second)
+        ), (first, second)
+
+
+def test_every_trait_selection():
+    all_traits = list(PersonalityTrait)
+    selections = [list(s) for s in itertools.product(all_traits, repeat=3)] + [
+        [],
+        all_traits[:1],
+        all_traits[:2],
+        all_traits[:4],
+    ]
+
+    for selection in selections:
+        assert catalogue.validate_trait_selection(selection) == (
+            scan_valid_selection(selection)
+        ), selection
@@ -0,0 +1,52 @@
+"""Full story mode selection and the A/B metrics."""
+
+import asyncio
+
+import pytest
+
+from constants.themes import Theme
+from generate.chains import full_story
+from generate.models.selected_lore_pieces import SelectedLorePieces
+
+
+def samples(mode: str) -> float:
+    return full_story.full_story_duration_histogram.labels(mode=mode)._sum.get()
+
+
+def count(metric) -> float:
+    return metric._value.get()
+
+
+@pytest.fixture
+def stub_chains(monkeypatch):
+    """Combined fails after 50 ms; chained succeeds immediately."""
+
+    async def combined(story_inputs):
+        await asyncio.sleep(0.05)
+        raise ValueError("unparseable")
+
+    async def chained(story_inputs):
+        return "story", "title", "description"
+
+    monkeypatch.setattr(full_story, "_generate_combined", combined)
+    monkeypatch.setattr(full_story, "_generate_chained", chained)
+
+
+def test_chained_is_the_default():
+    assert full_story.settings.FULL_STORY_MODE == "chained"
+
+
+def test_fallback_is_recorded_under_combined(stub_chains, monkeypatch):
+    monkeypatch.setattr(full_story.settings, "FULL_STORY_MODE", "combined")
+    combined, chained = samples("combined"), samples("chained")
+    fallbacks = count(full_story.full_story_fallback_counter)
+
+    story = asyncio.run(
+        full_story.generate_full_story(SelectedLorePieces(), Theme.fantasy)
+    )
+
+    assert story.content == "story"
+    # The whole request, failed attempt included, counts against combined
+    assert samples("combined") - combined >= 0.05
+    assert samples("chained") == chained
+    assert count(full_story.full_story_fallback_counter) == fallbacks + 1
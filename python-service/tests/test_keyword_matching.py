@@ -0,0 +1,80 @@
+"""Keyword extraction for portrait prompts: gender, skill visuals, features."""
+
+import pytest
+
+from generate.chains.character.appearance_tracker import extract_appearance_features
+from services.image_gen.portraits.prompt_builder import (
+    extract_gender,
+    get_skill_visuals,
+)
+
+SWORD = "sword sheathed at hip or back"
+BOW = "quiver strap visible over shoulder, bow visible"
+GUN = "holstered weapon at hip, ammunition belt"
+FIRE = "red and orange robes, flame motifs on clothing"
+HEALING = (
+    "healing pouches on belt, herbs visible, white robes, medical bag, "
+    "staff with healing symbols"
+)
+DARK = "dark robes, skull motifs, shadow aesthetic"
+MAGIC = "mystical robes, arcane symbols on clothing, magical staff"
+WOOD = "tool belt, woodworking tools, practical work clothes"
+
+
+@pytest.mark.parametrize(
+    "appearance, gender",
+    [
+        ("A tall woman with silver hair", "female"),
+        ("A wiry man with a crooked nose", "male"),
+        ("She keeps her blade close", "female"),
+        ("He hides his scars", "male"),
+        ("A female mechanic", "female"),  # "male" inside "female" doesn't count
+        ("A woman and a man", "neutral"),
+        ("Hooded figure, face hidden", "neutral"),
+        ("The herald, there at the heath", "neutral"),  # no "her"/"he" words
+    ],
+)
+def test_extract_gender(appearance, gender):
+    assert extract_gender(appearance) == gender
+
+
+@pytest.mark.parametrize(
+    "skills, visuals",
+    [
+        (["Swordsmanship"], [SWORD]),
+        (["Longsword Fighting"], [SWORD]),
+        (["Archery", "Crossbow Marksmanship"], [BOW, BOW]),
+        (["Firearms"], [GUN]),  # Firearms before fire magic
+        (["Sharpshooting"], [GUN]),
+        (["Pyromancy", "Healing Arts", "Necromancy"], [FIRE, HEALING, DARK]),
+        (["Spellcasting"], [MAGIC]),
+        (["Woodworking"], [WOOD]),
+        (["Persuasion", "Leadership"], []),
+        (["Justice", "Balance", "Forecasting"], []),  # "ice", "lance", "cast"
+        (["Shadow Magic"], [DARK]),  # Necromancy group wins over stealth
+    ],
+)
+def test_get_skill_visuals(skills, visuals):
+    assert get_skill_visuals(skills) == visuals
+
+
+@pytest.mark.parametrize(
+    "appearance, features",
+    [
+        (
+            "Scarred cheek and a neon tattoo on the neck",
+            ["scar", "tattoo", "neon tattoo"],
+        ),
+        (
+            "Wears goggles and a top hat, braided beard",
+            ["goggles", "top hat", "braid", "beard"],
+        ),
+        ("A woolen scarf and a cane", ["cane"]),  # "scarf" isn't a scar
+        (
+            "Bald, clean-shaven, with a facial implant",
+            ["implant", "facial implant", "bald", "clean-shaven"],
+        ),
+    ],
+)
+def test_extract_appearance_features(appearance, features):
+    assert extract_appearance_features(appearance) == features
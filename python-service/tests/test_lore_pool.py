@@ -0,0 +1,76 @@
+"""Lore pool stocking and refills."""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+import services.redis as redis_service
+from generate import lore_pool
+from generate.models.lore_piece import LorePiece
+from generate.orchestrators.orchestrator_lore_variants import _PrioritySlots
+from services import grpc_metrics
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Pool on fakeredis with instant stub chains; returns the themes generated for."""
+    monkeypatch.setattr(redis_service, "_redis_client", fakeredis.FakeAsyncRedis())
+    monkeypatch.setattr(lore_pool.settings, "LORE_POOL_ENABLED", True)
+    monkeypatch.setattr(lore_pool.settings, "LORE_POOL_TARGET", 1)
+    generated = []
+
+    def stub(kind: str):
+        async def generate(theme):
+            generated.append(theme.value)
+            return LorePiece.model_validate(
+                {"name": kind, "description": "", "type": kind, "details": {}}
+            )
+
+        return generate
+
+    for kind in lore_pool.POOLED_KINDS:
+        monkeypatch.setitem(lore_pool.POOLED_KINDS, kind, stub(kind[:-1]))
+    return generated
+
+
+def refill_until_full() -> int:
+    async def run():
+        slots = _PrioritySlots(1)
+        refills = 0
+        while await lore_pool._refill_once(slots):
+            refills += 1
+        return refills
+
+    return asyncio.run(run())
+
+
+def test_unknown_themes_are_skipped(pool, monkeypatch):
+    monkeypatch.setattr(
+        lore_pool.settings, "LORE_POOL_THEMES", "fantasy, ,fantsy,cyberpunk,"
+    )
+
+    assert lore_pool._pool_themes() == ["fantasy", "cyberpunk"]
+    # One piece of each kind for both valid themes, then nothing left to do
+    assert refill_until_full() == 6
+    assert sorted(set(pool)) == ["cyberpunk", "fantasy"]
+
+
+def test_pooled_pieces_are_served_oldest_first(pool, monkeypatch):
+    monkeypatch.setattr(lore_pool.settings, "LORE_POOL_THEMES", "steampunk")
+    monkeypatch.setattr(lore_pool.settings, "LORE_POOL_TARGET", 2)
+    refill_until_full()
+
+    pieces = asyncio.run(lore_pool.take_from_pool("factions", "steampunk", 3))
+
+    assert [piece.type for piece in pieces] == ["faction", "faction"]
+
+
+@pytest.mark.parametrize(
+    "method, pauses", [("GenerateAll", True), ("GenerateEmbedding", False)]
+)
+def test_refills_pause_only_for_generation_rpcs(pool, monkeypatch, method, pauses):
+    monkeypatch.setattr(lore_pool.settings, "LORE_POOL_THEMES", "fantasy")
+    monkeypatch.setitem(grpc_metrics._in_flight, method, 1)
+
+    assert (refill_until_full() == 0) == pauses
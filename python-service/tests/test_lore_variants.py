@@ -0,0 +1,61 @@
+"""GenerateAll's pipelined lore generation."""
+
+import asyncio
+
+import pytest
+
+from constants.themes import Theme
+from generate.models.lore_piece import LorePiece
+from generate.orchestrators import orchestrator_lore_variants as orchestrator
+
+
+@pytest.fixture
+def stub_generation(monkeypatch):
+    """Instant stub chains; publishing portraits takes 50 ms, like a broker."""
+    published: list[list[LorePiece]] = []
+
+    def stub(kind: str, delay: float):
+        async def generate(theme, **kwargs):
+            await asyncio.sleep(delay)
+            return LorePiece.model_validate(
+                {"name": kind, "description": "", "type": kind, "details": {}}
+            )
+
+        return generate
+
+    async def publish(characters, theme, user_id=""):
+        await asyncio.sleep(0.05)
+        published.append(characters)
+
+    async def empty_pool(kind, theme, count):
+        return []
+
+    # Characters finish last, as they usually do
+    monkeypatch.setattr(orchestrator, "generate_character", stub("character", 0.03))
+    monkeypatch.setattr(orchestrator, "generate_faction", stub("faction", 0))
+    monkeypatch.setattr(orchestrator, "generate_setting", stub("setting", 0))
+    monkeypatch.setattr(orchestrator, "generate_event", stub("event", 0))
+    monkeypatch.setattr(orchestrator, "generate_relic", stub("relic", 0))
+    monkeypatch.setattr(orchestrator, "publish_character_portraits", publish)
+    monkeypatch.setattr(orchestrator, "take_from_pool", empty_pool)
+    return published
+
+
+def test_portraits_are_published_before_the_stream_ends(stub_generation):
+    async def run():
+        return [
+            piece async for piece in orchestrator.stream_lore_variants(3, Theme.fantasy)
+        ]
+
+    pieces = asyncio.run(run())
+
+    assert len(pieces) == 15
+    assert [len(characters) for characters in stub_generation] == [3]
+
+
+def test_bundle_has_every_piece_in_order(stub_generation):
+    bundle = asyncio.run(orchestrator.generate_lore_variants(2, Theme.fantasy))
+
+    assert [piece.type for piece in bundle.characters] == ["character"] * 2
+    assert [piece.type for piece in bundle.relics] == ["relic"] * 2
+    assert len(stub_generation) == 1
@@ -0,0 +1,155 @@
+"""R2 uploads (single, multipart, streamed and batched) against moto's S3."""
+
+import asyncio
+import base64
+import io
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+from PIL import Image
+
+import lore_pb2
+from config.settings import get_settings
+from lore_servicer import LoreServicer
+from services import object_storage
+from services.object_storage import MB, upload_object, upload_stream
+
+BUCKET = "loresmith-test"
+PUBLIC_URL = "https://images.example.com"
+
+settings = get_settings()
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """A moto S3 bucket behind the R2 client, portraits and world images in it."""
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        client = boto3.client(
+            "s3",
+            region_name="us-east-1",
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+        )
+        client.create_bucket(Bucket=BUCKET)
+        monkeypatch.setattr(object_storage, "s3_client", client)
+        for name, value in {
+            "R2_PORTRAITS_BUCKET_NAME": BUCKET,
+            "R2_PORTRAITS_PUBLIC_URL": PUBLIC_URL,
+            "R2_WORLD_IMAGES_BUCKET_NAME": BUCKET,
+            "R2_WORLD_IMAGES_PUBLIC_URL": PUBLIC_URL,
+        }.items():
+            monkeypatch.setattr(settings, name, value)
+        yield client
+
+
+def read_object(s3, key: str) -> bytes:
+    return s3.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+
+
+async def chunked(data: bytes, chunk_size: int = MB):
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+def png_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), "teal").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_upload_object_multipart(s3):
+    data = os.urandom(settings.R2_MULTIPART_THRESHOLD_MB * MB + 1)
+
+    asyncio.run(upload_object(BUCKET, "worlds/1/scene.png", data))
+
+    head = s3.head_object(Bucket=BUCKET, Key="worlds/1/scene.png")
+    assert read_object(s3, "worlds/1/scene.png") == data
+    assert head["ContentType"] == "image/png"
+    # Multipart uploads get an ETag with the part count
+    assert head["ETag"].strip('"').endswith("-2")
+
+
+def test_upload_stream_multipart(s3):
+    data = os.urandom(2 * settings.R2_MULTIPART_CHUNK_SIZE_MB * MB + 3 * MB)
+
+    size = asyncio.run(upload_stream(BUCKET, "portraits/1/a.png", chunked(data)))
+
+    assert size == len(data)
+    assert read_object(s3, "portraits/1/a.png") == data
+    head = s3.head_object(Bucket=BUCKET, Key="portraits/1/a.png")
+    assert head["ETag"].strip('"').endswith("-3")
+
+
+def test_upload_stream_single_part(s3):
+    data = os.urandom(3 * MB)
+
+    size = asyncio.run(upload_stream(BUCKET, "portraits/1/b.png", chunked(data)))
+
+    assert size == len(data)
+    assert read_object(s3, "portraits/1/b.png") == data
+    assert s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+
+
+def test_upload_stream_aborts_when_the_source_fails(s3):
+    part_size = settings.R2_MULTIPART_CHUNK_SIZE_MB * MB
+
+    async def failing_chunks():
+        yield os.urandom(part_size + MB)
+        raise ValueError("client went away")
+
+    with pytest.raises(ValueError, match="client went away"):
+        asyncio.run(upload_stream(BUCKET, "portraits/1/c.png", failing_chunks()))
+
+    assert s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+    assert s3.list_objects_v2(Bucket=BUCKET).get("KeyCount") == 0
+
+
+def test_upload_images_batch_reports_each_image(s3):
+    image = png_bytes()
+    request = lore_pb2.UploadImagesBatchRequest(
+        images=[
+            lore_pb2.UploadImageRequest(
+                image_base64=base64.b64encode(image).decode(),
+                world_id=7,
+                character_id="hero",
+                image_type="portrait",
+            ),
+            lore_pb2.UploadImageRequest(
+                image_base64=base64.b64encode(image).decode(),
+                world_id=7,
+                character_id="world",
+                image_type="world_scene",
+            ),
+            lore_pb2.UploadImageRequest(world_id=7, character_id="broken"),
+        ]
+    )
+
+    response = asyncio.run(LoreServicer().UploadImagesBatch(request, context=None))
+
+    hero, scene, broken = response.results
+    assert hero.image_url == f"{PUBLIC_URL}/portraits/7/hero_portrait.png"
+    assert scene.image_url == f"{PUBLIC_URL}/worlds/7/scene.png"
+    assert not hero.error and not scene.error
+    assert read_object(s3, "portraits/7/hero_portrait.png") == image
+    assert read_object(s3, "worlds/7/scene.png") == image
+    for name, url in hero.variant_urls.items():
+        assert read_object(s3, url.removeprefix(f"{PUBLIC_URL}/")), name
+
+    assert broken.character_id == "broken"
+    assert not broken.image_url
+    assert "image_base64" in broken.error
+
+
+def test_unknown_image_types_share_one_metric_label(s3):
+    asyncio.run(upload_object(BUCKET, "x.png", b"x", image_type="../../anything"))
+
+    labels = {
+        sample.labels["image_type"]
+        for metric in object_storage.r2_upload_bytes_counter.collect()
+        for sample in metric.samples
+    }
+    assert "other" in labels
+    assert "../../anything" not in labels
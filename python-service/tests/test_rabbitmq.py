@@ -0,0 +1,128 @@
+"""Async publisher against an in-process stand-in for the AMQP connection."""
+
+import asyncio
+import json
+
+import pytest
+from aio_pika.exceptions import ChannelInvalidStateError, DeliveryError
+from pamqp.commands import Basic
+
+from services.rabbitmq import AsyncRabbitMQPublisher
+
+
+class FakeExchange:
+    def __init__(self, channel: "FakeChannel"):
+        self.channel = channel
+
+    async def publish(self, message, routing_key: str):
+        if self.channel.is_closed:
+            raise ChannelInvalidStateError("channel is closed")
+        await asyncio.sleep(0)
+        payload = json.loads(message.body)
+        if payload in self.channel.connection.nack:
+            # The broker nacks the message and closes the channel
+            self.channel.is_closed = True
+            raise DeliveryError(None, Basic.Nack())
+        self.channel.connection.published.append((routing_key, payload))
+
+
+class FakeChannel:
+    def __init__(self, connection: "FakeConnection", publisher_confirms: bool):
+        self.connection = connection
+        self.publisher_confirms = publisher_confirms
+        self.is_closed = False
+        self.reopened = 0
+        self.default_exchange = FakeExchange(self)
+
+    async def declare_queue(self, name: str, durable: bool = False):
+        self.connection.declared.append((name, durable))
+
+    async def reopen(self):
+        self.is_closed = False
+        self.reopened += 1
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.is_closed = False
+        self.channels: list[FakeChannel] = []
+        self.published: list[tuple[str, dict]] = []
+        self.declared: list[tuple[str, bool]] = []
+        self.nack: list[dict] = []
+
+    async def channel(self, publisher_confirms: bool = True) -> FakeChannel:
+        channel = FakeChannel(self, publisher_confirms)
+        self.channels.append(channel)
+        return channel
+
+    async def close(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def connection() -> FakeConnection:
+    return FakeConnection()
+
+
+@pytest.fixture
+def publisher(connection):
+    async def connect():
+        return connection
+
+    return AsyncRabbitMQPublisher(connection_factory=connect, channel_pool_size=2)
+
+
+def test_publish_declares_queue_once(publisher, connection):
+    async def run():
+        await publisher.publish("jobs", {"id": 1})
+        await publisher.publish("jobs", {"id": 2})
+        await publisher.close()
+
+    asyncio.run(run())
+
+    assert connection.published == [("jobs", {"id": 1}), ("jobs", {"id": 2})]
+    assert connection.declared == [("jobs", True)]
+    assert len(connection.channels) == 1
+    assert connection.channels[0].publisher_confirms
+    assert connection.is_closed
+
+
+def test_publish_batch_sends_every_payload_on_one_channel(publisher, connection):
+    payloads = [{"id": i} for i in range(5)]
+
+    async def run():
+        await publisher.publish_batch("jobs", payloads)
+        await publisher.publish_batch("jobs", [])
+
+    asyncio.run(run())
+
+    assert [payload for _, payload in connection.published] == payloads
+    assert len(connection.channels) == 1
+
+
+def test_publish_batch_raises_on_nack(publisher, connection):
+    connection.nack.append({"id": 1})
+
+    async def run():
+        await publisher.publish_batch("jobs", [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    with pytest.raises(DeliveryError):
+        asyncio.run(run())
+
+
+def test_closed_channel_is_reopened_and_reused(publisher, connection):
+    connection.nack.append({"id": "bad"})
+
+    async def run():
+        with pytest.raises(DeliveryError):
+            await publisher.publish("jobs", {"id": "bad"})
+        await publisher.publish("jobs", {"id": "good"})
+
+    asyncio.run(run())
+
+    assert len(connection.channels) == 1
+    assert connection.channels[0].reopened == 1
+    assert connection.published == [("jobs", {"id": "good"})]
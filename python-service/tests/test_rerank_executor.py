@@ -0,0 +1,70 @@
+"""Rerank pool: budgets and recovery from a dead worker."""
+
+import asyncio
+import os
+
+import pytest
+
+from search import rerank_executor
+
+WORLDS = [
+    {"title": "low", "relevance": 0.1},
+    {"title": "high", "relevance": 0.9},
+    {"title": "mid", "relevance": 0.5},
+]
+
+
+def no_models():
+    pass
+
+
+def crash(*args):
+    os._exit(1)
+
+
+def fuse(worlds, query):
+    return worlds
+
+
+def dartboard(query, worlds, *args):
+    return list(reversed(worlds))
+
+
+def titles(worlds: list[dict]) -> list[str]:
+    return [world["title"] for world in worlds]
+
+
+def outcome_count(outcome: str) -> float:
+    return rerank_executor.rerank_requests_counter.labels(outcome=outcome)._value.get()
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    monkeypatch.setattr(rerank_executor.settings, "RERANK_EXECUTOR", "process")
+    monkeypatch.setattr(rerank_executor.settings, "RERANK_WORKERS", 1)
+    monkeypatch.setattr(rerank_executor.settings, "RERANK_BUDGET_MS", 30000)
+    monkeypatch.setattr(rerank_executor, "_load_models", no_models)
+    rerank_executor.close_rerank_executor()
+    yield
+    rerank_executor.close_rerank_executor()
+
+
+def test_a_dead_worker_falls_back_and_replaces_the_pool(process_pool, monkeypatch):
+    monkeypatch.setattr(rerank_executor, "fuse_search_results", crash)
+    errors = outcome_count("error")
+    full = outcome_count("full")
+
+    reranked = asyncio.run(rerank_executor.rerank_worlds("query", WORLDS))
+
+    assert titles(reranked) == ["high", "mid", "low"]
+    assert outcome_count("error") == errors + 1
+    assert outcome_count("full") == full
+    assert rerank_executor._executor is None
+
+    monkeypatch.setattr(rerank_executor, "fuse_search_results", fuse)
+    monkeypatch.setattr(rerank_executor, "dartboard_rerank", dartboard)
+
+    reranked = asyncio.run(rerank_executor.rerank_worlds("query", WORLDS))
+
+    assert titles(reranked) == ["mid", "high", "low"]
+    assert outcome_count("full") == full + 1
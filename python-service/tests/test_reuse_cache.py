@@ -0,0 +1,59 @@
+"""Portrait reuse cache: signatures and the per-signature cap."""
+
+import asyncio
+import io
+
+import fakeredis
+import pytest
+from PIL import Image
+
+import services.redis as redis_service
+from config.settings import get_settings
+from services.image_gen.portraits.reuse_cache import (
+    _reuse_key,
+    portrait_signature,
+    remember_portrait,
+)
+
+settings = get_settings()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(redis_service, "_redis_client", client)
+    return client
+
+
+def png_bytes(color: tuple[int, int, int]) -> bytes:
+    image = Image.new("RGB", (32, 32), color)
+    # A colour-dependent pattern, so each image gets its own perceptual hash
+    for x in range(32):
+        for y in range(32):
+            image.putpixel((x, y), tuple((c + x * y) % 256 for c in color))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_signature_ignores_wording():
+    a = portrait_signature("A tall man with a scar and goggles", "Steampunk", None)
+    b = portrait_signature("Goggles, a scar; he is a tall man", "steampunk", [])
+    c = portrait_signature("A tall woman with a scar and goggles", "steampunk", [])
+
+    assert a == b
+    assert a != c
+
+
+@pytest.mark.parametrize("phash", [False, True])
+def test_concurrent_workers_stay_under_the_cap(redis, monkeypatch, phash):
+    monkeypatch.setattr(settings, "PORTRAIT_REUSE_MAX_PER_SIGNATURE", 2)
+    monkeypatch.setattr(settings, "PORTRAIT_REUSE_PHASH_ENABLED", phash)
+    monkeypatch.setattr(settings, "PORTRAIT_REUSE_PHASH_MAX_DISTANCE", 0)
+    images = [png_bytes((i * 40, 255 - i * 30, i * 17)) for i in range(6)]
+
+    async def run():
+        await asyncio.gather(*(remember_portrait("sig", image) for image in images))
+        return await redis.hlen(_reuse_key("sig"))
+
+    assert 1 <= asyncio.run(run()) <= 2
@@ -0,0 +1,30 @@
+"""Worker supervisor: giving up on a worker that keeps crashing."""
+
+import signal
+import sys
+
+import pytest
+
+
+def crash_on_start(worker_index: int):
+    sys.exit(3)
+
+
+@pytest.fixture
+def restore_signals():
+    handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    yield
+    for sig, handler in handlers.items():
+        signal.signal(sig, handler)
+
+
+def test_exits_non_zero_after_repeated_fast_failures(monkeypatch, restore_signals):
+    # Imported here so the spawned workers only load this module.
+    import lore_servicer
+
+    monkeypatch.setattr(
+        lore_servicer.settings, "GRPC_WORKER_RESTART_BACKOFF_SECONDS", 0.01
+    )
+    monkeypatch.setattr(lore_servicer.settings, "GRPC_WORKER_MAX_FAST_FAILURES", 3)
+
+    assert lore_servicer.serve_workers(1, target=crash_on_start) == 1
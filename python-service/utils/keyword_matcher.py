@@ -0,0 +1,116 @@
+"""Match many keywords against a piece of text in a single regex pass."""
+
+import re
+from itertools import groupby
+from typing import Iterable, Mapping
+
+
+def _literal_regex(literal: str) -> str:
+    """Escaped keyword text; spaces match any run of whitespace."""
+    return re.escape(literal).replace(r"\ ", r"\s+")
+
+
+def _ending_regex(keyword: str) -> str:
+    """
+    What may follow a keyword.
+
+    Keywords match whole words (plus a plural "s"/"es") by default. A trailing
+    "*" lets the word continue ("heal*" matches "healing"); a leading "*" lets
+    it start mid-word ("*sword" matches "longsword").
+    """
+    return r"\w*" if keyword.endswith("*") else r"(?:e?s)?\b"
+
+
+def _keyword_regex(keyword: str) -> str:
+    start = "" if keyword.startswith("*") else r"\b"
+    return start + _literal_regex(keyword.strip("*")) + _ending_regex(keyword)
+
+
+class KeywordMatcher:
+    """
+    Find which groups of keywords occur in a text.
+
+    Built once from {label: keywords}; all keywords are compiled into one
+    regex with a named group each, so a lookup is a single pass over the
+    text whatever the number of keywords. Longer keywords win where several
+    match at the same spot, and the shorter keywords they contain ("tattoo"
+    in "neon tattoo") are still reported. Labels come back in the order they
+    were declared, which lets callers treat them as priorities.
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        self.groups = {label: tuple(keywords) for label, keywords in groups.items()}
+        self._label_order = {label: index for index, label in enumerate(groups)}
+        self._keyword_labels: dict[str, list[str]] = {}
+        for label, keywords in self.groups.items():
+            for keyword in keywords:
+                self._keyword_labels.setdefault(keyword, []).append(label)
+
+        keywords = sorted(
+            self._keyword_labels,
+            key=lambda keyword: (keyword.strip("*")[0], -len(keyword.strip("*"))),
+        )
+        self._group_keywords = {f"k{i}": keyword for i, keyword in enumerate(keywords)}
+        self._pattern = re.compile(self._build_pattern())
+
+        # Keywords found inside each keyword, since the regex only reports the
+        # longest match at each position
+        patterns = {
+            keyword: re.compile(_keyword_regex(keyword)) for keyword in keywords
+        }
+        self._implied = {
+            group: [
+                other
+                for other in keywords
+                if other == keyword or patterns[other].search(keyword.strip("*"))
+            ]
+            for group, keyword in self._group_keywords.items()
+        }
+
+    def _build_pattern(self) -> str:
+        """
+        One alternation for all keywords, branching on the first character.
+
+        Word-start keywords sit behind a single \\b and a branch per first
+        character, so most positions in the text are rejected after a check
+        or two instead of trying every keyword.
+        """
+        word_start = [
+            (group, keyword)
+            for group, keyword in self._group_keywords.items()
+            if not keyword.startswith("*")
+        ]
+        branches = []
+        for first_char, alternatives in groupby(
+            word_start, key=lambda alternative: alternative[1][0]
+        ):
+            rest = "|".join(
+                f"(?P<{group}>"
+                f"{_literal_regex(keyword.rstrip('*')[1:])}{_ending_regex(keyword)})"
+                for group, keyword in alternatives
+            )
+            branches.append(f"{re.escape(first_char)}(?:{rest})")
+
+        pattern = rf"\b(?:{'|'.join(branches)})"
+        for group, keyword in self._group_keywords.items():
+            if keyword.startswith("*"):
+                pattern += f"|(?P<{group}>{_keyword_regex(keyword)})"
+        return pattern
+
+    def find(self, text: str) -> dict[str, set[str]]:
+        """Map each label found in the text to the keywords that matched it."""
+        found: dict[str, set[str]] = {}
+        for match in self._pattern.finditer(text.lower()):
+            for keyword in self._implied[match.lastgroup]:  # type: ignore[index]
+                for label in self._keyword_labels[keyword]:
+                    found.setdefault(label, set()).add(keyword)
+
+        return dict(sorted(found.items(), key=lambda item: self._label_order[item[0]]))
+
+    def labels(self, text: str) -> list[str]:
+        """Labels found in the text, in declaration order."""
+        return list(self.find(text))
+
+    def first(self, text: str) -> str | None:
+        """The earliest declared label found in the text, if any."""
+        return next(iter(self.find(text)), None)